@@ -1,20 +1,200 @@
 #!/usr/bin/env python3
 
 import ezdxf
+import hashlib
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 from datetime import datetime
 
+from recorrido_dxf import LectorDXF, VisitanteDXF
+
+VERSION_INDICE = 1
+
+# Tipos de entidad agrupados como en el análisis de geometría
+GRUPOS_GEOMETRIA = {
+    'lineas': ('LINE',),
+    'arcos': ('ARC',),
+    'circulos': ('CIRCLE',),
+    'polilineas': ('LWPOLYLINE', 'POLYLINE'),
+    'splines': ('SPLINE',),
+    'textos': ('TEXT', 'MTEXT'),
+}
+
+
+_ATRIBUTOS_PUNTO: Dict[str, Tuple[str, ...]] = {}
+
+
+def _puntos_referencia(entidad) -> List[Tuple[float, float]]:
+    """Puntos start/end/center de la entidad (los que usa la caja envolvente del plano)."""
+    tipo = entidad.dxftype()
+    atributos = _ATRIBUTOS_PUNTO.get(tipo)
+    if atributos is None:
+        atributos = _ATRIBUTOS_PUNTO[tipo] = tuple(
+            a for a in ('start', 'end', 'center') if entidad.dxf.is_supported(a)
+        )
+    puntos = []
+    try:
+        for attr in atributos:
+            punto = getattr(entidad.dxf, attr)
+            puntos.append((punto.x, punto.y))
+    except Exception:
+        pass
+    return puntos
+
+
+@dataclass
+class IndiceCapas:
+    """
+    Índice de un plano DXF construido en una sola pasada por el espacio modelo.
+
+    Attributes:
+        huella: SHA-256 del archivo DXF indexado
+        capas_definidas: Capas de la tabla LAYER
+        entidades: capa → tipo DXF → handles
+        bbox_capas: capa → [min_x, min_y, max_x, max_y] (None si la capa no tiene puntos)
+    """
+
+    huella: str
+    capas_definidas: List[str] = field(default_factory=list)
+    entidades: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    bbox_capas: Dict[str, Optional[List[float]]] = field(default_factory=dict)
+    version: int = VERSION_INDICE
+
+    @classmethod
+    def construir(cls, doc, huella: str) -> 'IndiceCapas':
+        """Índice a partir de un documento ya cargado con ezdxf.readfile."""
+        indice = cls(huella=huella, capas_definidas=[layer.dxf.name for layer in doc.layers])
+        for entidad in doc.modelspace():
+            indice.agregar(entidad)
+        return indice
+
+    @classmethod
+    def desde_archivo(cls, ruta: Path, huella: str) -> 'IndiceCapas':
+        """Índice leyendo el DXF en streaming, sin cargar el documento completo."""
+        with LectorDXF(ruta) as lector:
+            indice = cls(huella=huella, capas_definidas=list(lector.capas()))
+            lector.recorrer([_VisitanteIndice(indice)])
+        return indice
+
+    def agregar(self, entidad) -> None:
+        capa = entidad.dxf.layer
+        self.entidades.setdefault(capa, {}).setdefault(entidad.dxftype(), []).append(entidad.dxf.handle)
+        caja = self.bbox_capas.setdefault(capa, None)
+        for x, y in _puntos_referencia(entidad):
+            if caja is None:
+                caja = self.bbox_capas[capa] = [x, y, x, y]
+            else:
+                caja[0], caja[1] = min(caja[0], x), min(caja[1], y)
+                caja[2], caja[3] = max(caja[2], x), max(caja[3], y)
+
+    def contar(self, capa: Optional[str] = None, tipos: Optional[Tuple[str, ...]] = None) -> int:
+        """Número de entidades de una capa (o de todas) y, opcionalmente, de ciertos tipos."""
+        capas = [self.entidades.get(capa, {})] if capa is not None else list(self.entidades.values())
+        return sum(
+            len(handles)
+            for por_tipo in capas
+            for tipo, handles in por_tipo.items()
+            if tipos is None or tipo in tipos
+        )
+
+    def tipos(self, capa: str) -> List[str]:
+        return sorted(self.entidades.get(capa, {}))
+
+    def conteo_tipos(self) -> Dict[str, int]:
+        conteo: Dict[str, int] = {}
+        for por_tipo in self.entidades.values():
+            for tipo, handles in por_tipo.items():
+                conteo[tipo] = conteo.get(tipo, 0) + len(handles)
+        return conteo
+
+    def bbox(self) -> Optional[List[float]]:
+        """Caja envolvente de todas las capas."""
+        cajas = [c for c in self.bbox_capas.values() if c is not None]
+        if not cajas:
+            return None
+        return [
+            min(c[0] for c in cajas), min(c[1] for c in cajas),
+            max(c[2] for c in cajas), max(c[3] for c in cajas),
+        ]
+
+    def guardar(self, ruta: Path) -> None:
+        ruta.write_text(json.dumps(asdict(self), ensure_ascii=False), encoding='utf-8')
+
+    @classmethod
+    def cargar(cls, ruta: Path, huella: str) -> Optional['IndiceCapas']:
+        """Índice guardado si corresponde al mismo archivo (misma huella y versión)."""
+        try:
+            datos = json.loads(ruta.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if datos.get('huella') != huella or datos.get('version') != VERSION_INDICE:
+            return None
+        return cls(**datos)
+
+
+class _VisitanteIndice(VisitanteDXF):
+    def __init__(self, indice: IndiceCapas):
+        self.indice = indice
+
+    def visitar(self, entidad) -> None:
+        self.indice.agregar(entidad)
+
+
+def huella_dxf(ruta: Path) -> str:
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def ruta_cache_indice(archivo: Path) -> Path:
+    """Índice junto al DXF, como archivo oculto: .<nombre>.indice.json"""
+    return archivo.with_name(f".{archivo.name}.indice.json")
+
+
 class AnalizadorPlanoCuaderna:
     
-    def __init__(self, archivo_dxf: str):
+    def __init__(self, archivo_dxf: str, usar_cache: bool = True, streaming: bool = True):
+        """
+        Args:
+            archivo_dxf: Plano DXF a analizar
+            usar_cache: Reutilizar el índice guardado si el archivo no ha cambiado
+                (el DXF sólo se lee cuando hay que reconstruir el índice)
+            streaming: Construir el índice leyendo el DXF entidad a entidad
+                (memoria constante); False lo construye con ezdxf.readfile
+        """
         self.archivo = Path(archivo_dxf)
-        self.doc = ezdxf.readfile(str(self.archivo))
-        self.msp = self.doc.modelspace()
+        self._doc = None
         self.errores = []
         self.advertencias = []
         self.info = []
+
+        huella = huella_dxf(self.archivo)
+        cache = ruta_cache_indice(self.archivo)
+        self.indice = IndiceCapas.cargar(cache, huella) if usar_cache else None
+        if self.indice is None:
+            if streaming:
+                self.indice = IndiceCapas.desde_archivo(self.archivo, huella)
+            else:
+                self.indice = IndiceCapas.construir(self.doc, huella)
+            if usar_cache:
+                try:
+                    self.indice.guardar(cache)
+                except OSError:
+                    pass  # directorio de sólo lectura: se analiza igualmente
+
+    @property
+    def doc(self):
+        if self._doc is None:
+            self._doc = ezdxf.readfile(str(self.archivo))
+        return self._doc
+
+    @property
+    def msp(self):
+        return self.doc.modelspace()
         
     def analizar_completo(self) -> Dict:
         print("=" * 80)
@@ -62,19 +242,19 @@ class AnalizadorPlanoCuaderna:
             'EJES'
         ]
         
-        capas_encontradas = [layer.dxf.name for layer in self.doc.layers]
+        capas_encontradas = set(self.indice.capas_definidas)
         capas_info = {}
         
         for capa in capas_esperadas:
             if capa in capas_encontradas:
-                entidades = [e for e in self.msp if e.dxf.layer == capa]
+                n = self.indice.contar(capa)
                 capas_info[capa] = {
                     'existe': True,
-                    'entidades': len(entidades),
-                    'tipos': list(set([e.dxftype() for e in entidades]))
+                    'entidades': n,
+                    'tipos': self.indice.tipos(capa)
                 }
-                print(f"  ✓ {capa}: {len(entidades)} entidades")
-                self.info.append(f"Capa {capa} encontrada con {len(entidades)} entidades")
+                print(f"  ✓ {capa}: {n} entidades")
+                self.info.append(f"Capa {capa} encontrada con {n} entidades")
             else:
                 capas_info[capa] = {'existe': False, 'entidades': 0, 'tipos': []}
                 print(f"  ⚠ {capa}: NO ENCONTRADA")
@@ -87,32 +267,12 @@ class AnalizadorPlanoCuaderna:
         print("2. ANÁLISIS DE GEOMETRÍA")
         print("-" * 80)
         
+        conteo = self.indice.conteo_tipos()
         geometria = {
-            'lineas': 0,
-            'arcos': 0,
-            'circulos': 0,
-            'polilineas': 0,
-            'splines': 0,
-            'textos': 0,
-            'cotas': 0
+            grupo: sum(conteo.get(t, 0) for t in tipos)
+            for grupo, tipos in GRUPOS_GEOMETRIA.items()
         }
-        
-        for entidad in self.msp:
-            tipo = entidad.dxftype()
-            if tipo == 'LINE':
-                geometria['lineas'] += 1
-            elif tipo == 'ARC':
-                geometria['arcos'] += 1
-            elif tipo == 'CIRCLE':
-                geometria['circulos'] += 1
-            elif tipo in ['LWPOLYLINE', 'POLYLINE']:
-                geometria['polilineas'] += 1
-            elif tipo == 'SPLINE':
-                geometria['splines'] += 1
-            elif tipo == 'TEXT' or tipo == 'MTEXT':
-                geometria['textos'] += 1
-            elif tipo.startswith('DIMENSION'):
-                geometria['cotas'] += 1
+        geometria['cotas'] = sum(n for t, n in conteo.items() if t.startswith('DIMENSION'))
         
         print(f"  Líneas: {geometria['lineas']}")
         print(f"  Arcos: {geometria['arcos']}")
@@ -150,11 +310,11 @@ class AnalizadorPlanoCuaderna:
         return estructura
     
     def verificar_capa(self, nombre_capa: str) -> Dict:
-        entidades = [e for e in self.msp if e.dxf.layer == nombre_capa]
+        n = self.indice.contar(nombre_capa)
         return {
-            'existe': len(entidades) > 0,
-            'entidades': len(entidades),
-            'tipos': list(set([e.dxftype() for e in entidades]))
+            'existe': n > 0,
+            'entidades': n,
+            'tipos': self.indice.tipos(nombre_capa)
         }
     
     def extraer_dimensiones(self) -> Dict:
@@ -187,37 +347,15 @@ class AnalizadorPlanoCuaderna:
         return dimensiones
     
     def calcular_bbox(self) -> Dict:
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        for entidad in self.msp:
-            try:
-                if hasattr(entidad, 'dxf') and hasattr(entidad.dxf, 'start'):
-                    min_x = min(min_x, entidad.dxf.start.x)
-                    min_y = min(min_y, entidad.dxf.start.y)
-                    max_x = max(max_x, entidad.dxf.start.x)
-                    max_y = max(max_y, entidad.dxf.start.y)
-                if hasattr(entidad, 'dxf') and hasattr(entidad.dxf, 'end'):
-                    min_x = min(min_x, entidad.dxf.end.x)
-                    min_y = min(min_y, entidad.dxf.end.y)
-                    max_x = max(max_x, entidad.dxf.end.x)
-                    max_y = max(max_y, entidad.dxf.end.y)
-                if hasattr(entidad, 'dxf') and hasattr(entidad.dxf, 'center'):
-                    min_x = min(min_x, entidad.dxf.center.x)
-                    min_y = min(min_y, entidad.dxf.center.y)
-                    max_x = max(max_x, entidad.dxf.center.x)
-                    max_y = max(max_y, entidad.dxf.center.y)
-            except:
-                pass
-        
-        if min_x == float('inf'):
+        caja = self.indice.bbox()
+        if caja is None:
             return None
         
         return {
-            'min_x': round(min_x, 3),
-            'min_y': round(min_y, 3),
-            'max_x': round(max_x, 3),
-            'max_y': round(max_y, 3)
+            'min_x': round(caja[0], 3),
+            'min_y': round(caja[1], 3),
+            'max_x': round(caja[2], 3),
+            'max_y': round(caja[3], 3)
         }
     
     def imprimir_resumen(self, resultado: Dict):
@@ -1,15 +1,18 @@
 """
 Validación detallada - Verifica colores por entidad
+
+Lectura en streaming (recorrido_dxf): histograma de colores y muestra de
+textos en una sola pasada.
 """
-import ezdxf
+import sys
 from pathlib import Path
-from collections import Counter
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-DXF_FILE = PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
+from recorrido_dxf import HistogramaColores, MuestraTextos, recorrer_modelspace
 
-doc = ezdxf.readfile(DXF_FILE)
-msp = doc.modelspace()
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DXF_FILE = Path(sys.argv[1]) if len(sys.argv) > 1 else (
+    PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
+)
 
 print("=" * 80)
 print("   ANÁLISIS DETALLADO DE COLORES POR ENTIDAD")
@@ -17,28 +20,10 @@ print("=" * 80)
 print()
 
 # Analizar colores de entidades
-entity_colors = Counter()
-text_entities = []
-
-for entity in msp:
-    etype = entity.dxftype()
-    layer = entity.dxf.layer
-    
-    # Obtener color de la entidad
-    if hasattr(entity.dxf, 'color'):
-        color = entity.dxf.color
-    else:
-        color = "N/A"
-    
-    entity_colors[(etype, layer, color)] += 1
-    
-    if etype == "TEXT":
-        text_entities.append({
-            'text': entity.dxf.text[:30] if len(entity.dxf.text) > 30 else entity.dxf.text,
-            'layer': layer,
-            'color': color,
-            'pos': (entity.dxf.insert.x, entity.dxf.insert.y)
-        })
+histograma, textos = HistogramaColores(), MuestraTextos(limite=10)
+recorrer_modelspace(DXF_FILE, [histograma, textos])
+entity_colors = histograma.resultado()
+text_entities = textos.resultado()
 
 print("📊 ENTIDADES POR TIPO, CAPA Y COLOR:")
 print("-" * 80)
@@ -58,5 +43,5 @@ for i, txt in enumerate(text_entities[:10], 1):
 
 print()
 print("=" * 80)
-print(f"✅ Total entidades TEXT analizadas: {len(text_entities)}")
+print(f"✅ Total entidades TEXT analizadas: {textos.total}")
 print("=" * 80)
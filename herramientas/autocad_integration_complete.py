@@ -39,11 +39,14 @@ except ImportError:
 try:
     import ezdxf
     from ezdxf.enums import TextEntityAlignment
+    from utils_dxf import nuevo_documento
     DXF_AVAILABLE = True
 except ImportError:
     DXF_AVAILABLE = False
     print("⚠️  ezdxf no disponible. Instalar con: pip install ezdxf")
 
+from maxsurf_integration.autocad_integration.plantillas import CONJUNTOS_CAPAS
+
 
 @dataclass
 class MotorConfig:
@@ -102,17 +105,10 @@ class AutoCADIntegration:
             else:
                 raise RuntimeError("No hay soporte COM ni ezdxf disponible")
         
-        # Configuración de capas estándar
+        # Capas estándar: las del conjunto "integracion_completa" de las plantillas DXF
         self.capas = {
-            'EJES': {'color': 1, 'descripcion': 'Ejes de referencia'},
-            'ESTRUCTURA': {'color': 2, 'descripcion': 'Estructura del buque'},
-            'MAQUINAS': {'color': 3, 'descripcion': 'Equipos de máquinas'},
-            'TANQUES': {'color': 4, 'descripcion': 'Tanques'},
-            'MAMPAROS': {'color': 5, 'descripcion': 'Mamparos'},
-            'CUBIERTAS': {'color': 6, 'descripcion': 'Cubiertas'},
-            'COTAS': {'color': 7, 'descripcion': 'Acotación'},
-            'TEXTO': {'color': 8, 'descripcion': 'Textos y anotaciones'},
-            'EQUIPOS': {'color': 9, 'descripcion': 'Equipos auxiliares'},
+            nombre: {'color': estilo.color, 'tipo_linea': estilo.tipo_linea}
+            for nombre, estilo in CONJUNTOS_CAPAS["integracion_completa"].items()
         }
         
         print(f"🔧 Modo de integración: {self.modo.upper()}")
@@ -203,12 +199,9 @@ class AutoCADIntegration:
         doble_costado = datos_buque.get('estructura', {}).get('doble_costado_m', 1.80)
         
         # Crear documento DXF
-        doc = ezdxf.new('R2010')
+        doc = nuevo_documento("integracion_completa")
         msp = doc.modelspace()
         
-        # Crear capas
-        self.crear_capas(doc)
-        
         # Escala del plano
         escala = 1.0  # 1:1 en metros
         
@@ -522,12 +515,9 @@ class AutoCADIntegration:
         comp = datos_buque.get('compartimentacion', {})
         
         # Crear documento DXF
-        doc = ezdxf.new('R2010')
+        doc = nuevo_documento("integracion_completa")
         msp = doc.modelspace()
         
-        # Crear capas
-        self.crear_capas(doc)
-        
         escala = 1.0
         
         print(f"\n📐 Dimensiones principales:")
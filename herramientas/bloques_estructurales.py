@@ -0,0 +1,204 @@
+"""Biblioteca de bloques DXF para elementos estructurales repetidos.
+
+Varengas, cuadernas, baos y longitudinales se repiten cientos o miles de
+veces en un plano estructural con la misma sección. En lugar de emitir sus
+líneas y polilíneas en cada posición, cada perfil se define una sola vez como
+BLOCK (en metros, con el punto base en el pie del alma o en el centro del
+marcador) y se coloca con INSERT (posición, escala y rotación).
+
+Los bloques se identifican por sus dimensiones en mm, de modo que dos
+llamadas con el mismo perfil reutilizan la misma definición.
+
+Ejemplo:
+    lib = biblioteca(doc)
+    varenga = lib.perfil_t(largo=1.1, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02)
+    lib.insertar(msp, varenga, (y, z))
+    serie_cuadernas(msp, cuaderna, FRAMES_DF["x_m"], z=1.2)
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Iterable, List, Sequence, Tuple
+
+Punto = Tuple[float, float]
+
+_BIBLIOTECAS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _mm(valor: float) -> int:
+    return int(round(valor * 1000))
+
+
+class BibliotecaBloques:
+    """Definiciones de bloques de perfiles estructurales de un documento DXF."""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def _definir(self, nombre: str):
+        """Devuelve (bloque, nuevo); `nuevo` es False si ya existía en el documento."""
+        if nombre in self.doc.blocks:
+            return self.doc.blocks.get(nombre), False
+        return self.doc.blocks.new(name=nombre), True
+
+    # ------------------------------------------------------------------
+    def perfil_t(
+        self,
+        largo: float,
+        alma_esp: float,
+        ala_ancho: float,
+        ala_esp: float,
+        ala: str = "arriba",
+        capa: str = "ESTRUCTURA_PRIMARIA",
+        grosor: int = 25,
+    ) -> str:
+        """Perfil en T visto de frente: alma vertical de `largo` y ala en un extremo.
+
+        Punto base: pie del alma (centro). Sirve para varengas y cuadernas
+        (`ala="arriba"`) y para baos (`ala="abajo"`, perfil T invertido).
+
+        Returns:
+            Nombre del bloque
+        """
+        if ala not in ("arriba", "abajo"):
+            raise ValueError(f"ala debe ser 'arriba' o 'abajo': {ala}")
+        nombre = (
+            f"PERFIL_T_{ala.upper()}_{_mm(largo)}_{_mm(alma_esp)}_"
+            f"{_mm(ala_ancho)}X{_mm(ala_esp)}_{capa}_{grosor}"
+        )
+        bloque, nuevo = self._definir(nombre)
+        if nuevo:
+            attribs = {"layer": capa, "lineweight": grosor}
+            self._alma(bloque, largo, alma_esp, attribs)
+            z_ala, signo = (largo, -1.0) if ala == "arriba" else (0.0, 1.0)
+            bloque.add_lwpolyline(
+                [
+                    (-ala_ancho / 2, z_ala),
+                    (-ala_ancho / 2, z_ala + signo * ala_esp),
+                    (ala_ancho / 2, z_ala + signo * ala_esp),
+                    (ala_ancho / 2, z_ala),
+                ],
+                dxfattribs=attribs,
+            )
+        return nombre
+
+    def alma(self, largo: float, alma_esp: float, capa: str = "ESTRUCTURA_PRIMARIA", grosor: int = 25) -> str:
+        """Alma sin ala (dos líneas paralelas) de `largo`, vertical; punto base en el pie."""
+        nombre = f"ALMA_{_mm(largo)}_{_mm(alma_esp)}_{capa}_{grosor}"
+        bloque, nuevo = self._definir(nombre)
+        if nuevo:
+            self._alma(bloque, largo, alma_esp, {"layer": capa, "lineweight": grosor})
+        return nombre
+
+    def marcador_longitudinal(
+        self,
+        alto: float,
+        ancho: float = 0.10,
+        capa: str = "ESTRUCTURA_SECUNDARIA",
+        grosor: int = 15,
+    ) -> str:
+        """Rectángulo que representa un longitudinal visto de frente; punto base en su centro."""
+        nombre = f"LONGITUDINAL_{_mm(ancho)}X{_mm(alto)}_{capa}_{grosor}"
+        bloque, nuevo = self._definir(nombre)
+        if nuevo:
+            a, h = ancho / 2, alto / 2
+            bloque.add_lwpolyline(
+                [(-a, -h), (a, -h), (a, h), (-a, h), (-a, -h)],
+                dxfattribs={"layer": capa, "lineweight": grosor},
+            )
+        return nombre
+
+    @staticmethod
+    def _alma(bloque, largo: float, alma_esp: float, attribs: dict) -> None:
+        for x in (-alma_esp / 2, alma_esp / 2):
+            bloque.add_line((x, 0.0), (x, largo), dxfattribs=attribs)
+
+    # ------------------------------------------------------------------
+    def insertar(
+        self,
+        layout,
+        nombre: str,
+        punto: Punto,
+        rotacion: float = 0.0,
+        escala: float | Tuple[float, float] = 1.0,
+        capa: str | None = None,
+    ):
+        """Coloca un bloque (INSERT) en `punto` con rotación (grados) y escala."""
+        sx, sy = (escala, escala) if isinstance(escala, (int, float)) else escala
+        attribs = {"rotation": float(rotacion), "xscale": float(sx), "yscale": float(sy)}
+        attribs["layer"] = capa or self._capa(nombre)
+        return layout.add_blockref(nombre, (float(punto[0]), float(punto[1])), dxfattribs=attribs)
+
+    def serie(
+        self,
+        layout,
+        nombre: str,
+        puntos: Iterable[Punto],
+        rotacion: float = 0.0,
+        escala: float | Tuple[float, float] = 1.0,
+    ) -> List:
+        """Coloca el mismo bloque en cada punto (una entidad INSERT por elemento)."""
+        capa = self._capa(nombre)
+        return [self.insertar(layout, nombre, p, rotacion, escala, capa) for p in puntos]
+
+    def _capa(self, nombre: str) -> str:
+        for entidad in self.doc.blocks.get(nombre):
+            return entidad.dxf.layer
+        return "0"
+
+
+def biblioteca(doc) -> BibliotecaBloques:
+    """Biblioteca asociada a `doc` (una por documento, compartida entre funciones de dibujo)."""
+    lib = _BIBLIOTECAS.get(doc)
+    if lib is None:
+        lib = _BIBLIOTECAS[doc] = BibliotecaBloques(doc)
+    return lib
+
+
+def posiciones_por_zonas(zonas: Sequence[Tuple[float, float, float]]) -> List[float]:
+    """Posiciones de cuadernas a partir de zonas (inicio, fin, separación).
+
+    Las zonas se encadenan: cada una empieza en la última posición de la
+    anterior, como en la cadena de cuadernas de popa, zona central y proa.
+    """
+    posiciones: List[float] = []
+    for inicio, fin, separacion in zonas:
+        if separacion <= 0:
+            raise ValueError("La separación debe ser positiva")
+        x = posiciones[-1] if posiciones else float(inicio)
+        if not posiciones:
+            posiciones.append(x)
+        n = int(round((fin - x) / separacion))
+        posiciones.extend(x + i * separacion for i in range(1, n + 1))
+    return posiciones
+
+
+def serie_cuadernas(
+    layout,
+    nombre: str,
+    posiciones_x: Iterable[float],
+    z: float = 0.0,
+    rotacion: float = 0.0,
+) -> List:
+    """Cuadernas (o baos, varengas...) a lo largo de la eslora: un INSERT por posición x."""
+    return biblioteca(layout.doc).serie(layout, nombre, ((x, z) for x in posiciones_x), rotacion)
+
+
+def serie_longitudinales(
+    layout,
+    nombre: str,
+    posiciones: Iterable[float],
+    fijo: float = 0.0,
+    transversal: bool = True,
+) -> List:
+    """Longitudinales repartidos en una sección.
+
+    Args:
+        posiciones: Coordenadas a lo largo del panel (manga o altura)
+        fijo: Coordenada constante del panel (altura del fondo o manga del costado)
+        transversal: True para paneles horizontales (fondo, cubierta: se varía y);
+            False para costados (se varía z)
+    """
+    puntos = ((p, fijo) for p in posiciones) if transversal else ((fijo, p) for p in posiciones)
+    return biblioteca(layout.doc).serie(layout, nombre, puntos)
@@ -11,14 +11,20 @@ Fuentes:
 - Wärtsilä Technical Papers - SFOC curves for 26 engine series
 - CAT 3512C Technical Data Sheet
 - ISO 3046-1: Reciprocating internal combustion engines - Performance
+
+Las versiones `*_batch` aceptan arrays (una fila por punto de operación) y
+sirven para tablas velocidad-potencia-consumo y simulaciones de travesía.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import math
 
+import numpy as np
+import pandas as pd
+
 
 @dataclass
 class MotorPrincipal:
@@ -44,26 +50,25 @@ class MotorPrincipal:
                 90: 185.0,
                 100: 192.0,  # MCR - ligero aumento por límites térmicos
             }
+        self.compilar_curva()
+    
+    def compilar_curva(self) -> None:
+        """Ordenar la curva SFOC en arrays para np.interp (llamar si se modifica sfoc_curve)."""
+        cargas = sorted(self.sfoc_curve)
+        self._curva_cargas = np.array(cargas, dtype=float)
+        self._curva_sfoc = np.array([self.sfoc_curve[c] for c in cargas], dtype=float)
     
     def calcular_sfoc(self, carga_porcentaje: float) -> float:
         """Calcula SFOC interpolado para cualquier carga."""
-        if carga_porcentaje <= 0:
-            return self.sfoc_curve[25]
-        if carga_porcentaje >= 100:
-            return self.sfoc_curve[100]
-        
-        # Interpolación lineal entre puntos conocidos
-        cargas_ordenadas = sorted(self.sfoc_curve.keys())
-        for i in range(len(cargas_ordenadas) - 1):
-            c1, c2 = cargas_ordenadas[i], cargas_ordenadas[i + 1]
-            if c1 <= carga_porcentaje <= c2:
-                # Interpolación lineal
-                sfoc1 = self.sfoc_curve[c1]
-                sfoc2 = self.sfoc_curve[c2]
-                factor = (carga_porcentaje - c1) / (c2 - c1)
-                return sfoc1 + (sfoc2 - sfoc1) * factor
-        
-        return self.sfoc_curve[85]  # Fallback al punto óptimo
+        return float(self.calcular_sfoc_batch(carga_porcentaje))
+    
+    def calcular_sfoc_batch(self, cargas_porcentaje) -> np.ndarray:
+        """
+        SFOC interpolado para un array de cargas.
+        
+        Fuera de la curva se toma el valor del extremo (carga mínima o MCR).
+        """
+        return np.interp(cargas_porcentaje, self._curva_cargas, self._curva_sfoc)
     
     def consumo_horario(
         self,
@@ -85,6 +90,18 @@ class MotorPrincipal:
         
         # Consumo = Potencia (kW) × SFOC (g/kWh) / 1000 (conversión a kg)
         return (potencia_efectiva * sfoc_real) / 1000.0
+    
+    def consumo_horario_batch(
+        self,
+        cargas_porcentaje,
+        factor_degradacion=1.00,
+        factor_ambiental=1.00,
+    ) -> np.ndarray:
+        """Consumo horario (kg/h) para arrays de carga y factores."""
+        cargas = np.asarray(cargas_porcentaje, dtype=float)
+        potencia_efectiva = self.potencia_mcr_kw * (cargas / 100.0)
+        sfoc_real = self.calcular_sfoc_batch(cargas) * factor_degradacion * factor_ambiental
+        return (potencia_efectiva * sfoc_real) / 1000.0
 
 
 @dataclass
@@ -120,6 +137,85 @@ class GeneradorAuxiliar:
         
         sfoc_real = sfoc_ajustado * factor_degradacion
         return (potencia_efectiva * sfoc_real) / 1000.0
+    
+    # Tramos de la curva simplificada CAT: <60%, 60-80%, >=80%
+    _UMBRALES_CARGA = np.array([60.0, 80.0])
+    _FACTORES_SFOC = np.array([1.04, 1.00, 1.02])
+    
+    def consumo_horario_batch(self, cargas_porcentaje, factor_degradacion=1.00) -> np.ndarray:
+        """Consumo horario (kg/h) para un array de cargas, mismos tramos que `consumo_horario`."""
+        cargas = np.asarray(cargas_porcentaje, dtype=float)
+        tramo = np.searchsorted(self._UMBRALES_CARGA, cargas, side="right")
+        sfoc_real = self.sfoc_nominal_g_kwh * self._FACTORES_SFOC[tramo] * factor_degradacion
+        return (self.potencia_nominal_kw * (cargas / 100.0) * sfoc_real) / 1000.0
+
+
+# Demanda eléctrica típica por modo de operación (kW), grupos mínimos en línea
+# y velocidad media (kn) con la que se estima la carga del motor principal
+MODOS_OPERACION = {
+    "navegacion": {"demanda_kw": 600.0, "n_min": 1, "velocidad_kn": 14.5},
+    "maniobra": {"demanda_kw": 850.0, "n_min": 2, "velocidad_kn": 6.0},  # hélice de proa, redundancia
+    "puerto": {"demanda_kw": 200.0, "n_min": 1, "velocidad_kn": 0.0},
+}
+
+
+@dataclass
+class DespachoGeneradores:
+    """
+    Número de grupos en línea y carga de cada uno de mínimo consumo.
+    
+    Los grupos son iguales y se reparten la demanda a partes iguales; para
+    cada demanda se evalúan todas las opciones (1..n_instalados) a la vez y
+    se elige la de menor consumo que respeta la carga máxima, la carga
+    mínima (si es posible) y los grupos mínimos del modo.
+    """
+    
+    generador: GeneradorAuxiliar = None
+    n_instalados: int = 3
+    carga_min_pct: float = 30.0
+    carga_max_pct: float = 90.0
+    factor_degradacion: float = 1.01
+    
+    def __post_init__(self):
+        if self.generador is None:
+            self.generador = GeneradorAuxiliar()
+    
+    def despachar(self, demanda_kw, n_min=1) -> Dict[str, np.ndarray]:
+        """
+        Despacho óptimo para un array de demandas.
+        
+        Args:
+            demanda_kw: Demanda eléctrica (kW), escalar o array
+            n_min: Grupos mínimos en línea (escalar o array)
+            
+        Returns:
+            Dict de arrays: n_generadores, carga_pct, consumo_kg_h,
+            sfoc_g_kwh y sobrecarga (demanda por encima de la capacidad)
+        """
+        demanda, n_min = np.broadcast_arrays(np.asarray(demanda_kw, dtype=float), np.asarray(n_min))
+        k = np.arange(1, self.n_instalados + 1)
+        carga = demanda[..., None] / (k * self.generador.potencia_nominal_kw) * 100.0
+        consumo = k * self.generador.consumo_horario_batch(carga, self.factor_degradacion)
+        
+        admisible = (carga <= self.carga_max_pct) & (k >= n_min[..., None])
+        factible = admisible & (carga >= self.carga_min_pct)
+        # Con demanda baja se relaja la carga mínima; con demanda excesiva, todos en línea
+        factible = np.where(factible.any(axis=-1, keepdims=True), factible, admisible)
+        sobrecarga = ~factible.any(axis=-1)
+        factible[..., -1] |= sobrecarga
+        
+        elegido = np.argmin(np.where(factible, consumo, np.inf), axis=-1)[..., None]
+        carga_sel = np.take_along_axis(carga, elegido, -1)[..., 0]
+        consumo_sel = np.take_along_axis(consumo, elegido, -1)[..., 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sfoc = np.where(demanda > 0, consumo_sel * 1000.0 / demanda, np.nan)
+        return {
+            "n_generadores": k[elegido[..., 0]],
+            "carga_pct": carga_sel,
+            "consumo_kg_h": consumo_sel,
+            "sfoc_g_kwh": sfoc,
+            "sobrecarga": sobrecarga,
+        }
 
 
 class FactoresAmbientales:
@@ -170,15 +266,55 @@ class FactoresAmbientales:
             return 1.12
         else:
             return 1.20
+    
+    # Versiones vectorizadas (mismos límites y tramos que las escalares)
+    _UMBRALES_OLA_M = np.array([1.0, 2.5, 4.0])
+    _FACTORES_OLA = np.array([1.00, 1.05, 1.12, 1.20])
+    
+    @staticmethod
+    def correccion_temperatura_batch(temp_ambiente_c, temp_referencia_c: float = 25.0) -> np.ndarray:
+        """Corrección por temperatura para un array de temperaturas."""
+        delta_temp = np.asarray(temp_ambiente_c, dtype=float) - temp_referencia_c
+        return np.clip(1.0 + (delta_temp / 10.0) * 0.01, 0.95, 1.10)
+    
+    @staticmethod
+    def correccion_fouling_batch(meses_desde_limpieza) -> np.ndarray:
+        """Degradación por fouling para un array de meses desde la limpieza."""
+        return 1.0 + np.minimum(np.asarray(meses_desde_limpieza, dtype=float) * 0.005, 0.10)
+    
+    @classmethod
+    def correccion_estado_mar_batch(cls, altura_ola_m) -> np.ndarray:
+        """Penalización por estado del mar para un array de alturas de ola."""
+        tramo = np.searchsorted(cls._UMBRALES_OLA_M, np.asarray(altura_ola_m, dtype=float), side="right")
+        return cls._FACTORES_OLA[tramo]
 
 
 class CalculadorConsumo:
     """Calculadora integrada de consumos de combustible."""
     
-    def __init__(self):
+    def __init__(self, modelo_resistencia=None, despacho: Optional[DespachoGeneradores] = None):
+        """
+        Args:
+            modelo_resistencia: Objeto con `potencia_freno_kw(velocidad_kn)`
+                (p. ej. maxsurf_integration.hull_design.ModeloResistencia);
+                sin él, la carga del motor sigue la ley cúbica de la velocidad
+            despacho: Reparto de carga entre generadores (por defecto, 3
+                grupos iguales al generador auxiliar)
+        """
         self.motor_principal = MotorPrincipal()
         self.generador = GeneradorAuxiliar()
         self.factores = FactoresAmbientales()
+        self.modelo_resistencia = modelo_resistencia
+        self.despacho = despacho or DespachoGeneradores(self.generador)
+    
+    def carga_motor(self, velocidad_kn, velocidad_servicio_kn: float = 14.5):
+        """Carga del motor principal (% MCR) para la velocidad (escalar o array)."""
+        if self.modelo_resistencia is not None:
+            potencia_kw = self.modelo_resistencia.potencia_freno_kw(velocidad_kn)
+            return np.minimum(100.0, 100.0 * potencia_kw / self.motor_principal.potencia_mcr_kw)
+        # Cúbica aproximadamente: 85% a velocidad de servicio
+        factor_vel = (np.asarray(velocidad_kn, dtype=float) / velocidad_servicio_kn) ** 3
+        return np.minimum(100.0, factor_vel * 85.0)
     
     def consumo_navegacion(
         self,
@@ -187,16 +323,19 @@ class CalculadorConsumo:
         temp_ambiente_c: float = 25.0,
         meses_desde_limpieza: int = 6,
         altura_ola_m: float = 1.5,
+        demanda_electrica_kw: Optional[float] = None,
     ) -> Dict[str, float]:
         """
         Calcula consumo total en navegación.
         
+        Con `demanda_electrica_kw` los generadores se despachan de forma
+        óptima; sin ella, 2 grupos al 60%.
+        
         Returns:
             Dict con consumo_motor_kg_h, consumo_gen_kg_h, consumo_total_kg_h
         """
-        # Estimar carga del motor según velocidad (cúbica aproximadamente)
-        factor_vel = (velocidad_kn / velocidad_servicio_kn) ** 3
-        carga_motor = min(100.0, factor_vel * 85.0)  # 85% a velocidad servicio
+        # Estimar carga del motor según velocidad
+        carga_motor = float(self.carga_motor(velocidad_kn, velocidad_servicio_kn))
         
         # Factores ambientales
         f_temp = self.factores.correccion_temperatura(temp_ambiente_c)
@@ -212,10 +351,13 @@ class CalculadorConsumo:
             factor_ambiental=factor_total,
         )
         
-        # Generadores (2 operando @ 60% carga típico)
-        consumo_gen1 = self.generador.consumo_horario(60.0, factor_degradacion=1.01)
-        consumo_gen2 = self.generador.consumo_horario(60.0, factor_degradacion=1.01)
-        consumo_gen_total = consumo_gen1 + consumo_gen2
+        if demanda_electrica_kw is not None:
+            consumo_gen_total = float(self.despacho.despachar(demanda_electrica_kw)["consumo_kg_h"])
+        else:
+            # Generadores (2 operando @ 60% carga típico)
+            consumo_gen1 = self.generador.consumo_horario(60.0, factor_degradacion=1.01)
+            consumo_gen2 = self.generador.consumo_horario(60.0, factor_degradacion=1.01)
+            consumo_gen_total = consumo_gen1 + consumo_gen2
         
         return {
             "velocidad_kn": velocidad_kn,
@@ -228,15 +370,140 @@ class CalculadorConsumo:
             ),
         }
     
-    def consumo_puerto(self, horas: float = 24.0) -> Dict[str, float]:
-        """Calcula consumo en puerto (solo generadores)."""
-        # 1 generador @ 40% carga
-        consumo_gen_horario = self.generador.consumo_horario(40.0)
+    def consumo_navegacion_batch(
+        self,
+        velocidades,
+        temps=25.0,
+        fouling=6,
+        olas=1.5,
+        velocidad_servicio_kn: float = 14.5,
+        factor_degradacion=1.02,
+        demanda_electrica_kw=None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Consumo en navegación para muchos puntos de operación a la vez.
+        
+        Mismo modelo que `consumo_navegacion`, sin redondeo.
+        
+        Args:
+            velocidades: Velocidades (kn)
+            temps: Temperaturas ambiente (°C)
+            fouling: Meses desde la última limpieza del casco
+            olas: Alturas de ola (m)
+            velocidad_servicio_kn: Velocidad de servicio (85% MCR)
+            factor_degradacion: Degradación del motor principal (escalar o array)
+            demanda_electrica_kw: Demanda eléctrica para el despacho óptimo
+                de generadores (por defecto, 2 grupos al 60%)
+            
+        Returns:
+            Dict de columnas (arrays con la forma común de las entradas):
+            velocidad_kn, carga_motor_pct, consumo_motor_kg_h,
+            consumo_generadores_kg_h, consumo_total_kg_h, sfoc_efectivo_g_kwh
+        """
+        v, t, m, h = np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (velocidades, temps, fouling, olas))
+        )
+        carga_motor = self.carga_motor(v, velocidad_servicio_kn)
+        
+        factor_total = (
+            self.factores.correccion_temperatura_batch(t)
+            * self.factores.correccion_fouling_batch(m)
+            * self.factores.correccion_estado_mar_batch(h)
+        )
+        consumo_motor = self.motor_principal.consumo_horario_batch(
+            carga_motor, factor_degradacion=factor_degradacion, factor_ambiental=factor_total
+        )
+        
+        if demanda_electrica_kw is not None:
+            consumo_gen_total = np.broadcast_to(
+                self.despacho.despachar(demanda_electrica_kw)["consumo_kg_h"], v.shape
+            ).astype(float)
+        else:
+            # Generadores (2 operando @ 60% carga típico)
+            consumo_gen_total = np.full_like(v, 2.0 * self.generador.consumo_horario(60.0, factor_degradacion=1.01))
+        
+        potencia_kw = self.motor_principal.potencia_mcr_kw * carga_motor / 100.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sfoc_efectivo = np.where(potencia_kw > 0, consumo_motor * 1000.0 / potencia_kw, np.nan)
+        
+        return {
+            "velocidad_kn": v,
+            "carga_motor_pct": carga_motor,
+            "consumo_motor_kg_h": consumo_motor,
+            "consumo_generadores_kg_h": consumo_gen_total,
+            "consumo_total_kg_h": consumo_motor + consumo_gen_total,
+            "sfoc_efectivo_g_kwh": sfoc_efectivo,
+        }
+    
+    def consumo_perfil_operativo(self, perfil: pd.DataFrame) -> pd.DataFrame:
+        """
+        Consumo de un perfil operativo completo (p. ej. un año) en una pasada.
+        
+        Args:
+            perfil: Una fila por periodo con columnas 'modo' (clave de
+                MODOS_OPERACION) y 'horas'; opcionales 'demanda_kw', 'n_min',
+                'velocidad_kn', 'temp_ambiente_c', 'meses_desde_limpieza' y
+                'altura_ola_m' (las columnas ausentes o vacías toman el valor
+                del modo)
+        
+        Returns:
+            El perfil con el despacho de generadores, el consumo del motor
+            principal y el consumo con la regla fija actual (2 grupos al 60%
+            navegando, 1 al 40% parado) para comparar
+        """
+        df = perfil.copy()
+        modos = df["modo"].map(MODOS_OPERACION)
+        if modos.isna().any():
+            raise ValueError(f"Modos desconocidos: {sorted(set(df['modo'][modos.isna()]))}")
+        for columna in ("demanda_kw", "n_min", "velocidad_kn"):
+            por_modo = pd.Series([m[columna] for m in modos], index=df.index)
+            df[columna] = df[columna].fillna(por_modo) if columna in df else por_modo
+        
+        despacho = self.despacho.despachar(df["demanda_kw"].to_numpy(), df["n_min"].to_numpy())
+        v = df["velocidad_kn"].to_numpy(dtype=float)
+        motor = self.consumo_navegacion_batch(
+            v,
+            df.get("temp_ambiente_c", 25.0),
+            df.get("meses_desde_limpieza", 6),
+            df.get("altura_ola_m", 1.5),
+        )["consumo_motor_kg_h"]
+        horas = df["horas"].to_numpy(dtype=float)
+        
+        df["n_generadores"] = despacho["n_generadores"]
+        df["carga_generadores_pct"] = despacho["carga_pct"]
+        df["sobrecarga"] = despacho["sobrecarga"]
+        df["consumo_motor_kg"] = np.where(v > 0, motor, 0.0) * horas
+        df["consumo_generadores_kg"] = despacho["consumo_kg_h"] * horas
+        regla_fija = np.where(
+            v > 0,
+            2.0 * self.generador.consumo_horario(60.0, factor_degradacion=1.01),
+            self.generador.consumo_horario(40.0),
+        )
+        df["consumo_generadores_regla_fija_kg"] = regla_fija * horas
+        df["consumo_total_kg"] = df["consumo_motor_kg"] + df["consumo_generadores_kg"]
+        return df
+    
+    def consumo_puerto(self, horas: float = 24.0, demanda_electrica_kw: Optional[float] = None) -> Dict[str, float]:
+        """
+        Calcula consumo en puerto (solo generadores).
+        
+        Con `demanda_electrica_kw` los generadores se despachan de forma
+        óptima; sin ella, 1 grupo al 40%.
+        """
+        if demanda_electrica_kw is not None:
+            despacho = self.despacho.despachar(demanda_electrica_kw)
+            n_generadores = int(despacho["n_generadores"])
+            carga_pct = round(float(despacho["carga_pct"]), 1)
+            consumo_gen_horario = float(despacho["consumo_kg_h"])
+        else:
+            # 1 generador @ 40% carga
+            n_generadores, carga_pct = 1, 40.0
+            consumo_gen_horario = self.generador.consumo_horario(40.0)
         consumo_total = consumo_gen_horario * horas
         
         return {
-            "generadores_operando": 1,
-            "carga_pct": 40.0,
+            "generadores_operando": n_generadores,
+            "carga_pct": carga_pct,
             "consumo_horario_kg_h": round(consumo_gen_horario, 2),
             "consumo_total_kg": round(consumo_total, 2),
         }
@@ -314,6 +581,17 @@ def generar_tabla_consumos() -> str:
     output.append(f"Consumo horario: {puerto['consumo_horario_kg_h']} kg/h")
     output.append(f"Consumo 24h: {puerto['consumo_total_kg']} kg")
     
+    output.append("")
+    output.append("DESPACHO DE GENERADORES (mínimo consumo):")
+    output.append("-" * 80)
+    output.append(f"{'Modo':<12} {'Demanda(kW)':>12} {'Grupos':>7} {'Carga(%)':>10} {'Gen(kg/h)':>11}")
+    for modo, datos in MODOS_OPERACION.items():
+        despacho = calc.despacho.despachar(datos["demanda_kw"], datos["n_min"])
+        output.append(
+            f"{modo:<12} {datos['demanda_kw']:>12.0f} {int(despacho['n_generadores']):>7d} "
+            f"{float(despacho['carga_pct']):>10.1f} {float(despacho['consumo_kg_h']):>11.2f}"
+        )
+    
     output.append("")
     output.append("AUTONOMÍA ESTIMADA:")
     output.append("-" * 80)
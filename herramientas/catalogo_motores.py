@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Catálogo columnar de motores con índices ordenados
+--------------------------------------------------
+
+`ENGINE_LIBRARY` y `engine_configurations.json` son diccionarios pequeños
+que se consultan por clave. Este módulo carga catálogos completos de
+fabricantes (CSV con miles de variantes) en columnas NumPy y mantiene un
+índice ordenado (argsort) por potencia, RPM, dimensiones, huella y SFOC.
+Cada condición de rango se resuelve con dos búsquedas binarias
+(`searchsorted`, O(log n)); la condición más selectiva fija los candidatos
+y el resto se comprueba sólo sobre ellos.
+
+Los motores encontrados se convierten en `EngineConfiguration` y se
+registran en `EngineRoomDesigner` para usarlos con `insert_main_engine`.
+`filtrar_por_sala` criba el catálogo con la envolvente de la cámara de
+máquinas de `CADIntegrationConfig.engine_room_limits`.
+
+Columnas del CSV (los nombres pueden mapearse con --columnas):
+- model, manufacturer, power_kw, rpm, length_m, width_m (obligatorias)
+- height_m, weight_tons, sfoc_g_kwh, cylinders, foundation_thickness_mm,
+  foundation_reinforcement, foundation_bolts, key (opcionales)
+
+Uso rápido:
+  python herramientas/catalogo_motores.py catalogo_fabricante.csv \
+    --potencia 5000 9000 --largo-max 9 --sfoc-max 190 --sala
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+COLUMNAS_NUMERICAS = (
+    "power_kw", "rpm", "cylinders", "length_m", "width_m", "height_m",
+    "weight_tons", "sfoc_g_kwh", "foundation_thickness_mm",
+)
+COLUMNAS_TEXTO = ("key", "model", "manufacturer", "foundation_reinforcement", "foundation_bolts")
+COLUMNAS_OBLIGATORIAS = ("model", "manufacturer", "power_kw", "rpm", "length_m", "width_m")
+INDICES = ("power_kw", "rpm", "length_m", "width_m", "height_m", "huella_m2", "sfoc_g_kwh", "weight_tons")
+
+Rango = Tuple[Optional[float], Optional[float]]
+
+
+class CatalogoMotores:
+    """
+    Catálogo de motores en columnas con índices ordenados.
+
+    Ejemplo:
+        cat = CatalogoMotores.desde_csv("catalogo_fabricante.csv")
+        df = cat.consultar(power_kw=(5000, 9000), length_m=(None, 9.0), sfoc_g_kwh=(None, 190))
+        cat.registrar_en(designer, df["key"])
+    """
+
+    def __init__(self, datos: pd.DataFrame):
+        """
+        Args:
+            datos: Una fila por motor con las columnas del docstring del módulo
+        """
+        faltan = [c for c in COLUMNAS_OBLIGATORIAS if c not in datos]
+        if faltan:
+            raise ValueError(f"Faltan columnas en el catálogo: {faltan}")
+
+        self.columnas: Dict[str, np.ndarray] = {}
+        for c in COLUMNAS_NUMERICAS:
+            valores = datos[c] if c in datos else np.nan
+            self.columnas[c] = pd.to_numeric(pd.Series(valores, index=datos.index), errors="coerce").to_numpy(float)
+        for c in COLUMNAS_TEXTO[1:]:
+            valores = datos[c] if c in datos else ""
+            self.columnas[c] = pd.Series(valores, index=datos.index).fillna("").astype(str).to_numpy(object)
+        self.columnas["huella_m2"] = self.columnas["length_m"] * self.columnas["width_m"]
+        self.columnas["key"] = self._claves(datos)
+        self._posicion = {k: i for i, k in enumerate(self.columnas["key"])}
+
+        # Índice: permutación que ordena la columna y valores ya ordenados (NaN al final)
+        self.indices: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        for c in INDICES:
+            orden = np.argsort(self.columnas[c], kind="stable")
+            valores = self.columnas[c][orden]
+            self.indices[c] = (orden, valores, int(np.count_nonzero(~np.isnan(valores))))
+
+    def _claves(self, datos: pd.DataFrame) -> np.ndarray:
+        """Clave única por motor: columna 'key' o FABRICANTE_MODELO (+ sufijo si se repite)."""
+        if "key" in datos:
+            base = datos["key"].astype(str)
+        else:
+            fabricante = pd.Series(self.columnas["manufacturer"]).str.split().str[0].fillna("")
+            base = (
+                (fabricante + "_" + pd.Series(self.columnas["model"]))
+                .str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+                .str.upper().str.replace(r"[^0-9A-Z_\-]+", "", regex=True)
+            )
+        base = base.reset_index(drop=True)
+        repeticion = base.groupby(base).cumcount()
+        claves = base.where(repeticion == 0, base + "_" + (repeticion + 1).astype(str))
+        return claves.to_numpy(object)
+
+    def __len__(self) -> int:
+        return len(self.columnas["key"])
+
+    # ----- Carga -----
+
+    @classmethod
+    def desde_csv(
+        cls,
+        rutas: Union[str, Path, Iterable[Union[str, Path]]],
+        columnas: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> "CatalogoMotores":
+        """
+        Cargar uno o varios CSV de fabricantes.
+
+        Args:
+            rutas: Archivo o lista de archivos
+            columnas: Renombrado {columna del archivo: columna esperada}
+            **kwargs: Argumentos adicionales de pandas.read_csv (sep, decimal...)
+        """
+        if isinstance(rutas, (str, Path)):
+            rutas = [rutas]
+        tablas = [pd.read_csv(r, **kwargs).rename(columns=columnas or {}) for r in rutas]
+        return cls(pd.concat(tablas, ignore_index=True))
+
+    @classmethod
+    def desde_biblioteca(cls, biblioteca: Optional[Dict] = None) -> "CatalogoMotores":
+        """Catálogo a partir de un dict {clave: EngineConfiguration} (por defecto ENGINE_LIBRARY)."""
+        if biblioteca is None:
+            from integracion_autocad_motores import ENGINE_LIBRARY
+            biblioteca = ENGINE_LIBRARY
+        filas = [{"key": k, **{c: getattr(cfg, c) for c in COLUMNAS_NUMERICAS + COLUMNAS_TEXTO[1:]}}
+                 for k, cfg in biblioteca.items()]
+        return cls(pd.DataFrame(filas))
+
+    @classmethod
+    def desde_json(cls, ruta: Union[str, Path]) -> "CatalogoMotores":
+        """Catálogo a partir de `engine_configurations.json` (export_engine_config_to_json)."""
+        datos = json.loads(Path(ruta).read_text(encoding="utf-8"))
+        filas = []
+        for clave, d in datos.items():
+            dimensiones = d.get("dimensions_m", {})
+            fundacion = d.get("foundation", {})
+            filas.append({
+                "key": clave,
+                **{c: d.get(c) for c in ("model", "manufacturer", "power_kw", "rpm", "cylinders",
+                                          "weight_tons", "sfoc_g_kwh")},
+                "length_m": dimensiones.get("length"),
+                "width_m": dimensiones.get("width"),
+                "height_m": dimensiones.get("height"),
+                "foundation_thickness_mm": fundacion.get("thickness_mm"),
+                "foundation_reinforcement": fundacion.get("reinforcement"),
+                "foundation_bolts": fundacion.get("bolts"),
+            })
+        return cls(pd.DataFrame(filas))
+
+    # ----- Consultas -----
+
+    def rango(self, columna: str, minimo: Optional[float] = None, maximo: Optional[float] = None) -> np.ndarray:
+        """
+        Posiciones de los motores con minimo <= columna <= maximo.
+
+        Dos búsquedas binarias sobre el índice ordenado; los valores que
+        faltan (NaN) nunca cumplen la condición.
+        """
+        inicio, fin = self._limites(columna, (minimo, maximo))
+        return self.indices[columna][0][inicio:fin]
+
+    def _limites(self, columna: str, rango: Rango) -> Tuple[int, int]:
+        _, valores, n_validos = self.indices[columna]
+        minimo, maximo = rango
+        inicio = 0 if minimo is None else int(np.searchsorted(valores[:n_validos], minimo, side="left"))
+        fin = n_validos if maximo is None else int(np.searchsorted(valores[:n_validos], maximo, side="right"))
+        return inicio, max(inicio, fin)
+
+    def buscar(self, **filtros: Rango) -> np.ndarray:
+        """
+        Posiciones de los motores que cumplen todas las condiciones de rango.
+
+        Args:
+            **filtros: columna=(minimo, maximo); None deja el extremo abierto.
+                Las columnas indexadas se resuelven con el índice; el resto
+                (p. ej. 'cylinders') se comprueba sobre los candidatos
+
+        Returns:
+            Posiciones ordenadas por la columna más selectiva
+        """
+        indexados = {c: r for c, r in filtros.items() if c in self.indices}
+        if not indexados:
+            candidatos = np.arange(len(self))
+        else:
+            limites = {c: self._limites(c, r) for c, r in indexados.items()}
+            guia = min(limites, key=lambda c: limites[c][1] - limites[c][0])
+            inicio, fin = limites[guia]
+            candidatos = self.indices[guia][0][inicio:fin]
+            filtros = {c: r for c, r in filtros.items() if c != guia}
+
+        for columna, (minimo, maximo) in filtros.items():
+            if candidatos.size == 0:
+                break
+            valores = self.columnas[columna][candidatos]
+            mascara = ~np.isnan(valores)
+            if minimo is not None:
+                mascara &= valores >= minimo
+            if maximo is not None:
+                mascara &= valores <= maximo
+            candidatos = candidatos[mascara]
+        return candidatos
+
+    def consultar(self, ordenar_por: Optional[str] = None, **filtros: Rango) -> pd.DataFrame:
+        """
+        Motores que cumplen los filtros como DataFrame.
+
+        Ejemplo:
+            cat.consultar(power_kw=(5000, 9000), length_m=(None, 9), sfoc_g_kwh=(None, 190))
+        """
+        df = self.tabla(self.buscar(**filtros))
+        if ordenar_por:
+            df = df.sort_values(ordenar_por, kind="stable", ignore_index=True)
+        return df
+
+    def tabla(self, posiciones: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """Filas del catálogo (todas si no se indican posiciones)."""
+        if posiciones is None:
+            posiciones = np.arange(len(self))
+        posiciones = np.asarray(posiciones, dtype=int)
+        columnas = ("key",) + COLUMNAS_TEXTO[1:3] + COLUMNAS_NUMERICAS + ("huella_m2",) + COLUMNAS_TEXTO[3:]
+        return pd.DataFrame({c: self.columnas[c][posiciones] for c in columnas})
+
+    def filtrar_por_sala(
+        self,
+        config=None,
+        holgura_m: float = 1.0,
+        altura_doble_fondo_m: float = 1.2,
+        manga_util: float = 0.6,
+        **filtros: Rango,
+    ) -> pd.DataFrame:
+        """
+        Motores que caben en la cámara de máquinas.
+
+        La eslora disponible sale de `config.engine_room_limits`, la manga
+        útil de `fallback_hull_data['beam']` y la altura del puntal menos
+        el doble fondo, descontando una holgura de mantenimiento en cada
+        extremo.
+
+        Args:
+            config: CADIntegrationConfig (por defecto load_config())
+            holgura_m: Holgura de mantenimiento por lado (m)
+            altura_doble_fondo_m: Altura del doble fondo (m)
+            manga_util: Fracción de la manga disponible en el polín del motor
+            **filtros: Condiciones adicionales (ver `buscar`); en length_m,
+                width_m y height_m se combinan con la envolvente (el máximo
+                más restrictivo)
+        """
+        if config is None:
+            from maxsurf_integration.workflows import load_config
+            config = load_config()
+        inicio, fin = config.engine_room_limits
+        casco = config.fallback_hull_data
+        envolvente = {
+            "length_m": (None, (fin - inicio) - 2.0 * holgura_m),
+            "width_m": (None, casco["beam"] * manga_util - 2.0 * holgura_m),
+            "height_m": (None, casco["depth"] - altura_doble_fondo_m - holgura_m),
+        }
+        # Un filtro del usuario sobre una dimensión sólo puede estrechar la envolvente
+        for columna, (minimo, maximo) in envolvente.items():
+            if columna in filtros:
+                minimo_usuario, maximo_usuario = filtros[columna]
+                maximos = [m for m in (maximo, maximo_usuario) if m is not None]
+                filtros[columna] = (minimo_usuario, min(maximos) if maximos else None)
+        return self.consultar(**{**envolvente, **filtros})
+
+    # ----- Integración con EngineRoomDesigner -----
+
+    def configuracion(self, clave: str):
+        """EngineConfiguration de un motor del catálogo."""
+        from integracion_autocad_motores import EngineConfiguration
+
+        i = self._posicion[clave]
+        c = self.columnas
+
+        def numero(nombre, defecto=0.0):
+            valor = c[nombre][i]
+            return defecto if np.isnan(valor) else float(valor)
+
+        return EngineConfiguration(
+            model=c["model"][i],
+            manufacturer=c["manufacturer"][i],
+            power_kw=numero("power_kw"),
+            rpm=numero("rpm"),
+            cylinders=int(numero("cylinders")),
+            length_m=numero("length_m"),
+            width_m=numero("width_m"),
+            height_m=numero("height_m"),
+            weight_tons=numero("weight_tons"),
+            sfoc_g_kwh=numero("sfoc_g_kwh"),
+            foundation_thickness_mm=numero("foundation_thickness_mm"),
+            foundation_reinforcement=c["foundation_reinforcement"][i],
+            foundation_bolts=c["foundation_bolts"][i],
+        )
+
+    def registrar_en(self, designer, claves: Iterable[str]) -> Dict:
+        """
+        Añadir motores del catálogo a un EngineRoomDesigner.
+
+        Después, `designer.insert_main_engine(clave, posicion)` acepta
+        cualquiera de las claves registradas.
+
+        Returns:
+            Dict {clave: EngineConfiguration} registrado
+        """
+        configuraciones = {str(k): self.configuracion(str(k)) for k in claves}
+        designer.register_engines(configuraciones)
+        return configuraciones
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Consultas sobre catálogos de motores de fabricantes")
+    ap.add_argument('catalogos', nargs='*', help='CSV de fabricantes (por defecto engine_configurations.json)')
+    ap.add_argument('--columnas', default=None, help='JSON {columna_archivo: columna_esperada}')
+    ap.add_argument('--potencia', type=float, nargs=2, default=None, metavar=('MIN', 'MAX'), help='Potencia (kW)')
+    ap.add_argument('--rpm', type=float, nargs=2, default=None, metavar=('MIN', 'MAX'), help='Régimen (rpm)')
+    ap.add_argument('--largo-max', type=float, default=None, help='Longitud máxima (m)')
+    ap.add_argument('--ancho-max', type=float, default=None, help='Anchura máxima (m)')
+    ap.add_argument('--sfoc-max', type=float, default=None, help='SFOC máximo (g/kWh)')
+    ap.add_argument('--sala', action='store_true', help='Cribar con la envolvente de la cámara de máquinas')
+    ap.add_argument('--salida', default=None, help='CSV con los motores encontrados')
+    args = ap.parse_args()
+
+    if args.catalogos:
+        cat = CatalogoMotores.desde_csv(
+            args.catalogos, columnas=json.loads(args.columnas) if args.columnas else None
+        )
+    else:
+        cat = CatalogoMotores.desde_json(Path(__file__).resolve().parents[1] / "engine_configurations.json")
+
+    filtros: Dict[str, Rango] = {}
+    if args.potencia:
+        filtros["power_kw"] = tuple(args.potencia)
+    if args.rpm:
+        filtros["rpm"] = tuple(args.rpm)
+    if args.largo_max is not None:
+        filtros["length_m"] = (None, args.largo_max)
+    if args.ancho_max is not None:
+        filtros["width_m"] = (None, args.ancho_max)
+    if args.sfoc_max is not None:
+        filtros["sfoc_g_kwh"] = (None, args.sfoc_max)
+
+    df = cat.filtrar_por_sala(**filtros) if args.sala else cat.consultar(**filtros)
+    df = df.sort_values("sfoc_g_kwh", kind="stable")
+    print(f"{len(df)} de {len(cat)} motores cumplen los filtros")
+    print(df.head(20).to_string(index=False))
+    if args.salida:
+        df.to_csv(args.salida, index=False)
+        print(f'Resultados: {args.salida}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reconstrucción incremental de planos, figuras e informes
+--------------------------------------------------------
+
+Cada script generador reescribe todas sus salidas aunque sólo haya cambiado
+un volumen de tanque en otro plano. Este script registra los generadores en
+un `GrafoConstruccion` (maxsurf_integration.workflows) y sólo vuelve a
+ejecutar los que tienen salidas obsoletas.
+
+Entradas de cada artefacto (su huella SHA-256 se guarda en
+salidas/.estado_construccion.json):
+- el código del generador, que contiene las dimensiones y parámetros del
+  buque de ese plano, y los módulos compartidos que importa (utils_dxf...);
+- el JSON de resumen de la disposición (sólo para la disposición general);
+- las salidas de los artefactos de los que depende (p. ej. el PNG del plano
+  longitudinal depende de su DXF).
+
+Uso rápido:
+  python herramientas/construir_planos.py                 # sólo lo obsoleto
+  python herramientas/construir_planos.py --listar        # qué se regeneraría y por qué
+  python herramientas/construir_planos.py camara_maquinas --forzar
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+HERRAMIENTAS = Path(__file__).resolve().parent
+PROJECT_ROOT = HERRAMIENTAS.parent
+if str(HERRAMIENTAS) not in sys.path:
+    sys.path.insert(0, str(HERRAMIENTAS))
+
+from maxsurf_integration.workflows.construccion_incremental import Artefacto, GrafoConstruccion
+
+SALIDAS = PROJECT_ROOT / "salidas"
+DISPOSICION = SALIDAS / "disposicion_general"
+ESTADO = SALIDAS / ".estado_construccion.json"
+
+UTILS_DXF = HERRAMIENTAS / "utils_dxf.py"
+PLANTILLAS_DXF = HERRAMIENTAS / "maxsurf_integration" / "autocad_integration" / "plantillas.py"
+RESUMENES_JSON = [
+    SALIDAS / "ENTREGA 3 v4" / "Resumen_Disposicion.json",
+    DISPOSICION / "resumen_disposicion_actualizado.json",
+]
+
+
+def ejecutar_script(nombre: str) -> None:
+    """Ejecuta un generador de herramientas/ desde la raíz del proyecto (rutas relativas incluidas)."""
+    subprocess.run([sys.executable, str(HERRAMIENTAS / nombre)], cwd=PROJECT_ROOT, check=True)
+
+
+def _script(nombre: str, salidas, extra=(), depende_de=(), artefacto: Optional[str] = None) -> Artefacto:
+    return Artefacto(
+        nombre=artefacto or Path(nombre).stem,
+        salidas=list(salidas),
+        entradas=[HERRAMIENTAS / nombre, *extra],
+        construir=partial(ejecutar_script, nombre),
+        depende_de=tuple(depende_de),
+    )
+
+
+def crear_grafo(estado: Path = ESTADO) -> GrafoConstruccion:
+    """Grafo con los planos DXF, figuras PNG y PDF del proyecto."""
+    entrega3 = SALIDAS / "ENTREGA 3"
+    figuras = [
+        "distribucion_longitudinal.png",
+        "tanques_consumo.png",
+        "capacidad_bodegas.png",
+        "curva_gz.png",
+        "bodyplan.png",
+        "perfil.png",
+        "curva_desplazamiento.png",
+        "balance_combustible.png",
+    ]
+    paquete = HERRAMIENTAS / "maxsurf_integration"
+
+    grafo = GrafoConstruccion(estado)
+    grafo.agregar(_script(
+        "generar_corte_transversal_detallado.py",
+        [
+            entrega3 / "Corte_Transversal_Cuaderna_Maestra_Detallado.dxf",
+            entrega3 / "Dimensiones_Estructurales_Detalladas.csv",
+            entrega3 / "Guia_Corte_Transversal.md",
+        ],
+        extra=[UTILS_DXF, PLANTILLAS_DXF, HERRAMIENTAS / "bloques_estructurales.py"],
+        artefacto="corte_transversal",
+    ))
+    grafo.agregar(_script(
+        "generar_plano_longitudinal_detallado.py",
+        [DISPOSICION / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"],
+        extra=[UTILS_DXF, PLANTILLAS_DXF],
+        artefacto="plano_longitudinal",
+    ))
+    grafo.agregar(_script(
+        "exportar_dxf_a_png.py",
+        [DISPOSICION / "Plano_Longitudinal_Sala_Maquinas_Detallado.png"],
+        extra=[HERRAMIENTAS / "maxsurf_integration" / "visualization" / "raster_dxf.py"],
+        depende_de=["plano_longitudinal"],
+        artefacto="plano_longitudinal_png",
+    ))
+    grafo.agregar(_script(
+        "generar_vista_camara_maquinas.py",
+        [DISPOSICION / "Camara_Maquinas_Multivista.dxf"],
+        extra=[UTILS_DXF, PLANTILLAS_DXF],
+        artefacto="camara_maquinas",
+    ))
+    grafo.agregar(_script(
+        "generar_disposicion_general.py",
+        [
+            DISPOSICION / "distribucion_longitudinal.dxf",
+            DISPOSICION / "disposicion_general.pdf",
+            SALIDAS / "ENTREGA 3 v4" / "Informe_Disposicion_General.pdf",
+            *(DISPOSICION / f for f in figuras),
+        ],
+        extra=[
+            *RESUMENES_JSON,
+            paquete / "reports" / "report_generator.py",
+            paquete / "visualization" / "plots.py",
+            paquete / "autocad_integration" / "planificador.py",
+        ],
+        artefacto="disposicion_general",
+    ))
+    return grafo
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Regenera sólo los planos, figuras e informes obsoletos")
+    ap.add_argument('objetivos', nargs='*', help='Artefactos a construir (por defecto, todos)')
+    ap.add_argument('--forzar', action='store_true', help='Regenerar aunque estén al día')
+    ap.add_argument('--listar', action='store_true', help='Mostrar los artefactos obsoletos sin construir')
+    ap.add_argument('--estado', default=str(ESTADO), help='JSON de huellas de la última construcción')
+    args = ap.parse_args()
+
+    grafo = crear_grafo(Path(args.estado))
+    objetivos = args.objetivos or None
+    if args.listar:
+        obsoletos = grafo.obsoletos(objetivos)
+        for nombre in grafo.orden(objetivos):
+            print(f"{nombre:24s} {obsoletos.get(nombre, 'al día')}")
+        return
+
+    for nombre, estado in grafo.construir(objetivos, forzar=args.forzar).items():
+        print(f"{nombre:24s} {estado}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Consumo de travesía a partir de series temporales de meteorología y velocidad
+-----------------------------------------------------------------------------
+
+Lee series largas (CSV o Parquet, horarias o de 10 minutos) por bloques y,
+para cada registro, aplica el modelo de `calculos_combustible_optimizados`
+(carga del motor por velocidad, correcciones ISO 3046-1 de temperatura,
+fouling y estado de la mar, generadores) de forma vectorizada. Emite el
+combustible acumulado, el ROB (combustible a bordo) y la autonomía restante
+al régimen actual sin cargar la serie completa en memoria: entre bloques
+sólo se arrastran el último instante, el consumo acumulado y la distancia.
+
+Columnas de entrada (los nombres pueden mapearse con --columnas):
+- tiempo                  Fecha y hora del registro (opcional con --dt-min)
+- velocidad_kn            Velocidad sobre el agua (kn); < 0.5 kn = puerto
+- temp_ambiente_c         Temperatura ambiente (°C), opcional
+- altura_ola_m            Altura significativa de ola (m), opcional
+- meses_desde_limpieza    Opcional; si falta se deriva de --fecha-limpieza
+
+Cada registro cubre el intervalo desde el registro anterior (el primero,
+el paso nominal --dt-min).
+
+Uso rápido:
+  python herramientas/consumo_series_meteorologicas.py hindcast_2015_2024.parquet \
+    --salida salidas/consumo_ruta.parquet --rob-inicial-t 320 --fecha-limpieza 2014-06-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from calculos_combustible_optimizados import CalculadorConsumo
+
+COLUMNAS_ENTRADA = ("tiempo", "velocidad_kn", "temp_ambiente_c", "altura_ola_m", "meses_desde_limpieza")
+VELOCIDAD_PUERTO_KN = 0.5
+DIAS_POR_MES = 30.4375
+
+
+class ConsumoSeriesTemporales:
+    """
+    Procesador por bloques de series de meteorología y velocidad.
+
+    Ejemplo:
+        proc = ConsumoSeriesTemporales(rob_inicial_t=320.0, fecha_limpieza="2014-06-01")
+        for bloque in proc.bloques("hindcast.csv"):
+            ...
+        proc.resumen()
+    """
+
+    def __init__(
+        self,
+        rob_inicial_t: float,
+        reserva_t: float = 0.0,
+        dt_min: float = 60.0,
+        temp_ambiente_c: float = 25.0,
+        altura_ola_m: float = 1.5,
+        meses_desde_limpieza: float = 6.0,
+        fecha_limpieza: Optional[str] = None,
+        velocidad_servicio_kn: float = 14.5,
+        columnas: Optional[Dict[str, str]] = None,
+        calculador: Optional[CalculadorConsumo] = None,
+    ):
+        """
+        Args:
+            rob_inicial_t: Combustible a bordo al inicio de la serie (t)
+            reserva_t: Reserva no utilizable para la autonomía (t)
+            dt_min: Paso nominal de la serie (min), usado sin columna tiempo
+            temp_ambiente_c, altura_ola_m, meses_desde_limpieza: Valores
+                constantes para las columnas que falten
+            fecha_limpieza: Última limpieza del casco; con columna tiempo,
+                el fouling se calcula registro a registro
+            velocidad_servicio_kn: Velocidad a 85% MCR
+            columnas: Renombrado {columna del archivo: columna esperada}
+            calculador: Calculador de consumos (por defecto CalculadorConsumo)
+        """
+        self.calculador = calculador or CalculadorConsumo()
+        self.rob_inicial_t = rob_inicial_t
+        self.reserva_t = reserva_t
+        self.dt_h = dt_min / 60.0
+        self.constantes = {
+            "temp_ambiente_c": temp_ambiente_c,
+            "altura_ola_m": altura_ola_m,
+            "meses_desde_limpieza": meses_desde_limpieza,
+        }
+        self.fecha_limpieza = pd.Timestamp(fecha_limpieza) if fecha_limpieza else None
+        self.velocidad_servicio_kn = velocidad_servicio_kn
+        self.columnas = columnas or {}
+        # 1 generador @ 40% en puerto, como CalculadorConsumo.consumo_puerto
+        self.consumo_puerto_kg_h = self.calculador.generador.consumo_horario(40.0)
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Volver al estado inicial (antes del primer bloque)."""
+        self._ultimo_tiempo = None
+        self._horas = 0.0
+        self._distancia_nm = 0.0
+        self._consumo_kg = 0.0
+        self._filas = 0
+        self._agotamiento = None
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def leer_bloques(self, ruta, filas_por_bloque: int = 500_000) -> Iterator[pd.DataFrame]:
+        """Leer CSV o Parquet por bloques con las columnas ya renombradas."""
+        ruta = Path(ruta)
+        if ruta.suffix.lower() in (".parquet", ".pq"):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Leer Parquet requiere pyarrow (pip install pyarrow)") from e
+            archivo = pq.ParquetFile(ruta)
+            for lote in archivo.iter_batches(batch_size=filas_por_bloque):
+                yield lote.to_pandas().rename(columns=self.columnas)
+        else:
+            for bloque in pd.read_csv(ruta, chunksize=filas_por_bloque):
+                yield bloque.rename(columns=self.columnas)
+
+    # ------------------------------------------------------------------
+    # Cálculo
+    # ------------------------------------------------------------------
+    def procesar_bloque(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcular consumo, acumulados y autonomía de un bloque.
+
+        Actualiza el estado arrastrado al bloque siguiente.
+
+        Args:
+            df: Bloque con (al menos) la columna velocidad_kn
+
+        Returns:
+            DataFrame con una fila por registro
+        """
+        n = len(df)
+        velocidad = df["velocidad_kn"].to_numpy(dtype=float)
+
+        if "tiempo" in df:
+            tiempo = pd.to_datetime(df["tiempo"]).to_numpy()
+            previo = np.empty_like(tiempo)
+            previo[1:] = tiempo[:-1]
+            previo[0] = tiempo[0] - np.timedelta64(int(self.dt_h * 3.6e12), "ns") \
+                if self._ultimo_tiempo is None else self._ultimo_tiempo
+            dt_h = (tiempo - previo) / np.timedelta64(1, "h")
+            self._ultimo_tiempo = tiempo[-1]
+        else:
+            tiempo = None
+            dt_h = np.full(n, self.dt_h)
+
+        def _columna(nombre):
+            if nombre in df:
+                return df[nombre].to_numpy(dtype=float)
+            if nombre == "meses_desde_limpieza" and tiempo is not None and self.fecha_limpieza is not None:
+                dias = (tiempo - self.fecha_limpieza.to_datetime64()) / np.timedelta64(1, "D")
+                return np.maximum(dias, 0.0) / DIAS_POR_MES
+            return self.constantes[nombre]
+
+        nav = self.calculador.consumo_navegacion_batch(
+            velocidad,
+            _columna("temp_ambiente_c"),
+            _columna("meses_desde_limpieza"),
+            _columna("altura_ola_m"),
+            velocidad_servicio_kn=self.velocidad_servicio_kn,
+        )
+        en_puerto = velocidad < VELOCIDAD_PUERTO_KN
+        consumo_kg_h = np.where(en_puerto, self.consumo_puerto_kg_h, nav["consumo_total_kg_h"])
+
+        consumo_kg = self._consumo_kg + np.cumsum(consumo_kg_h * dt_h)
+        horas = self._horas + np.cumsum(dt_h)
+        distancia = self._distancia_nm + np.cumsum(np.where(en_puerto, 0.0, velocidad) * dt_h)
+        rob_t = self.rob_inicial_t - consumo_kg / 1000.0
+        util_t = np.maximum(rob_t - self.reserva_t, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            autonomia_h = util_t * 1000.0 / consumo_kg_h
+            autonomia_nm = np.where(en_puerto, np.nan, autonomia_h * velocidad)
+
+        if self._agotamiento is None and n:
+            agotado = np.flatnonzero(util_t <= 0.0)
+            if agotado.size:
+                k = agotado[0]
+                self._agotamiento = {
+                    "hora": float(horas[k]),
+                    "tiempo": str(pd.Timestamp(tiempo[k])) if tiempo is not None else None,
+                    "distancia_nm": float(distancia[k]),
+                }
+
+        if n:
+            self._consumo_kg = float(consumo_kg[-1])
+            self._horas = float(horas[-1])
+            self._distancia_nm = float(distancia[-1])
+            self._filas += n
+
+        salida = {
+            "horas": horas,
+            "distancia_nm": distancia,
+            "carga_motor_pct": np.where(en_puerto, 0.0, nav["carga_motor_pct"]),
+            "consumo_kg_h": consumo_kg_h,
+            "consumo_acumulado_t": consumo_kg / 1000.0,
+            "rob_t": rob_t,
+            "autonomia_h": autonomia_h,
+            "autonomia_nm": autonomia_nm,
+        }
+        if tiempo is not None:
+            salida = {"tiempo": tiempo, **salida}
+        return pd.DataFrame(salida)
+
+    def bloques(self, ruta, filas_por_bloque: int = 500_000) -> Iterator[pd.DataFrame]:
+        """Procesar el archivo bloque a bloque (generador de resultados)."""
+        self.reiniciar()
+        for df in self.leer_bloques(ruta, filas_por_bloque):
+            yield self.procesar_bloque(df)
+
+    def procesar(self, ruta, salida=None, filas_por_bloque: int = 500_000) -> Dict:
+        """
+        Procesar el archivo completo y, opcionalmente, escribir los resultados.
+
+        Args:
+            ruta: Serie de entrada (CSV o Parquet)
+            salida: Archivo de resultados (CSV o Parquet); None para sólo resumen
+            filas_por_bloque: Registros leídos por bloque
+
+        Returns:
+            Dict de resumen (ver `resumen`)
+        """
+        escritor = None
+        salida = Path(salida) if salida else None
+        try:
+            for i, resultado in enumerate(self.bloques(ruta, filas_por_bloque)):
+                if salida is None:
+                    continue
+                if salida.suffix.lower() in (".parquet", ".pq"):
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    tabla = pa.Table.from_pandas(resultado, preserve_index=False)
+                    if escritor is None:
+                        escritor = pq.ParquetWriter(salida, tabla.schema)
+                    escritor.write_table(tabla)
+                else:
+                    resultado.to_csv(salida, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        finally:
+            if escritor is not None:
+                escritor.close()
+        return self.resumen()
+
+    def resumen(self) -> Dict:
+        """Totales de lo procesado hasta ahora."""
+        rob = self.rob_inicial_t - self._consumo_kg / 1000.0
+        return {
+            "registros": self._filas,
+            "horas": round(self._horas, 2),
+            "distancia_nm": round(self._distancia_nm, 1),
+            "consumo_total_t": round(self._consumo_kg / 1000.0, 3),
+            "rob_final_t": round(rob, 3),
+            "consumo_medio_kg_h": round(self._consumo_kg / self._horas, 2) if self._horas else None,
+            "agotamiento": self._agotamiento,
+        }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Consumo de travesía desde series meteorológicas (por bloques)")
+    ap.add_argument('entrada', help='Serie temporal CSV o Parquet')
+    ap.add_argument('--salida', default=None, help='Resultados por registro (CSV o Parquet)')
+    ap.add_argument('--rob-inicial-t', type=float, required=True, help='Combustible a bordo al inicio (t)')
+    ap.add_argument('--reserva-t', type=float, default=0.0, help='Reserva no utilizable (t)')
+    ap.add_argument('--dt-min', type=float, default=60.0, help='Paso nominal de la serie (min)')
+    ap.add_argument('--fecha-limpieza', default=None, help='Última limpieza del casco (AAAA-MM-DD)')
+    ap.add_argument('--meses-desde-limpieza', type=float, default=6.0, help='Fouling constante si no hay fecha')
+    ap.add_argument('--bloque', type=int, default=500_000, help='Registros por bloque')
+    ap.add_argument('--columnas', default=None, help='JSON {columna_archivo: columna_esperada}')
+    args = ap.parse_args()
+
+    proc = ConsumoSeriesTemporales(
+        rob_inicial_t=args.rob_inicial_t,
+        reserva_t=args.reserva_t,
+        dt_min=args.dt_min,
+        meses_desde_limpieza=args.meses_desde_limpieza,
+        fecha_limpieza=args.fecha_limpieza,
+        columnas=json.loads(args.columnas) if args.columnas else None,
+    )
+    resumen = proc.procesar(args.entrada, args.salida, filas_por_bloque=args.bloque)
+    print(json.dumps(resumen, indent=2, ensure_ascii=False))
+    if args.salida:
+        print(f'Resultados: {args.salida}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,66 +1,91 @@
 """
 Exportador de DXF a formato imagen PNG
 Para visualizar el plano sin necesidad de visor CAD
+
+El plano se rasteriza por teselas en paralelo (RasterizadorDXF de
+maxsurf_integration.visualization). Sin argumentos exporta el plano
+longitudinal detallado de la sala de máquinas, como hasta ahora.
+
+Uso rápido:
+  python herramientas/exportar_dxf_a_png.py
+  python herramientas/exportar_dxf_a_png.py plano.dxf --formato pdf
+  python herramientas/exportar_dxf_a_png.py plano.dxf --formato xyz --salida teselas/plano
+  python herramientas/exportar_dxf_a_png.py --todos      # vistas previas de salidas/ (sólo las obsoletas)
 """
-import ezdxf
-from ezdxf.addons.drawing import RenderContext, Frontend
-from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
-import matplotlib.pyplot as plt
+import argparse
+import sys
+import time
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
+HERRAMIENTAS = Path(__file__).resolve().parent
+PROJECT_ROOT = HERRAMIENTAS.parent
+if str(HERRAMIENTAS) not in sys.path:
+    sys.path.insert(0, str(HERRAMIENTAS))
+
+from maxsurf_integration.visualization.raster_dxf import RasterizadorDXF, previsualizar_directorio
+
 DXF_FILE = PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
 PNG_FILE = PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.png"
+PREVIEWS_DIR = PROJECT_ROOT / "salidas" / "previews"
 
-print("=" * 80)
-print("   EXPORTANDO DXF A PNG PARA VISUALIZACIÓN")
-print("=" * 80)
-print()
 
-try:
-    # Leer DXF
-    print(f"📖 Leyendo: {DXF_FILE.name}")
-    doc = ezdxf.readfile(DXF_FILE)
-    msp = doc.modelspace()
-    
-    # Contar entidades
-    total = sum(1 for _ in msp)
-    print(f"✓ Total de entidades: {total}")
-    
-    # Configurar renderizado
-    print("🎨 Configurando renderizado...")
-    fig = plt.figure(figsize=(24, 10), dpi=150)
-    ax = fig.add_axes([0, 0, 1, 1])
-    ctx = RenderContext(doc)
-    out = MatplotlibBackend(ax)
-    
-    # Renderizar
-    print("🖼️  Renderizando plano...")
-    Frontend(ctx, out).draw_layout(msp, finalize=True)
-    
-    # Ajustar vista
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Guardar PNG
-    print(f"💾 Guardando imagen: {PNG_FILE.name}")
-    fig.savefig(PNG_FILE, dpi=150, bbox_inches='tight', pad_inches=0.1, 
-                facecolor='white', edgecolor='none')
-    plt.close()
-    
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Rasteriza planos DXF a PNG, PDF o pirámide de teselas XYZ")
+    ap.add_argument('dxf', nargs='?', default=str(DXF_FILE), help='Plano DXF (por defecto, el longitudinal detallado)')
+    ap.add_argument('--salida', help='Archivo (png/pdf) o directorio (xyz) de salida')
+    ap.add_argument('--formato', choices=['png', 'pdf', 'xyz'], default='png')
+    ap.add_argument('--ancho', type=int, default=None, help='Ancho de la imagen en píxeles (3600; 1600 con --todos)')
+    ap.add_argument('--procesos', type=int, default=None, help='Procesos en paralelo (por defecto, núcleos)')
+    ap.add_argument('--todos', action='store_true', help='Vistas previas de todos los DXF de salidas/')
+    ap.add_argument('--forzar', action='store_true', help='Con --todos, regenerar también las vistas al día')
+    args = ap.parse_args()
+
+    print("=" * 80)
+    print("   EXPORTANDO DXF A IMAGEN PARA VISUALIZACIÓN")
+    print("=" * 80)
+    print()
+    inicio = time.perf_counter()
+
+    if args.todos:
+        destino = Path(args.salida) if args.salida else PREVIEWS_DIR
+        generadas = previsualizar_directorio(
+            PROJECT_ROOT / "salidas", destino, ancho_px=args.ancho or 1600,
+            procesos=args.procesos, forzar=args.forzar,
+        )
+        for dxf, png in generadas.items():
+            print(f"✓ {Path(dxf).name} → {Path(png).relative_to(destino)}")
+        print(f"\n✅ {len(generadas)} vistas previas actualizadas en {destino} ({time.perf_counter() - inicio:.1f} s)")
+        return
+
+    dxf = Path(args.dxf)
+    if args.salida:
+        salida = Path(args.salida)
+    elif dxf == DXF_FILE and args.formato == 'png':
+        salida = PNG_FILE
+    else:
+        salida = dxf.with_suffix('' if args.formato == 'xyz' else f'.{args.formato}')
+
+    print(f"📖 Leyendo: {dxf.name}")
+    rast = RasterizadorDXF(dxf, ancho_px=args.ancho or 3600, procesos=args.procesos)
+    print(f"✓ Total de entidades: {len(rast.cajas)}")
+    print(f"🖼️  Renderizando {len(rast.teselas())} teselas de {rast.tesela_px} px...")
+    if args.formato == 'png':
+        rast.guardar_png(salida)
+    elif args.formato == 'pdf':
+        rast.guardar_pdf(salida)
+    else:
+        n = rast.guardar_xyz(salida)
+        print(f"✓ {n} teselas XYZ")
+
     print()
     print("=" * 80)
     print("✅ IMAGEN GENERADA EXITOSAMENTE")
     print("=" * 80)
     print()
-    print(f"📁 Archivo PNG: {PNG_FILE}")
-    print(f"📏 Resolución: 3600x1500 píxeles (aprox)")
+    print(f"📁 Salida: {salida}")
+    print(f"📏 Resolución: {rast.ancho_px}x{rast.alto_px} píxeles ({time.perf_counter() - inicio:.1f} s)")
     print()
-    print("💡 Abrir imagen:")
-    print(f"   open '{PNG_FILE}'")
-    print()
-    
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
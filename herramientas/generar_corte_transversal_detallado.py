@@ -16,7 +16,8 @@ import math
 from pathlib import Path
 import csv
 
-from utils_dxf import save_dxf_with_extents
+from bloques_estructurales import biblioteca
+from utils_dxf import nuevo_documento, save_dxf_with_extents
 
 # === CONFIGURACIÓN DE SALIDA ===
 OUTPUT_DIR = Path("salidas/ENTREGA 3")
@@ -98,30 +99,6 @@ def ensure_dependencies() -> None:
         )
 
 
-def create_layers(doc) -> None:
-    """Crea las capas (layers) para organizar el dibujo"""
-    layers_config = [
-        ("CASCO_EXTERIOR", 7, "Continuous"),      # Blanco - Forro exterior
-        ("ESTRUCTURA_PRIMARIA", 1, "Continuous"), # Rojo - Estructura principal
-        ("ESTRUCTURA_SECUNDARIA", 3, "Continuous"),# Verde - Longitudinales
-        ("MAMPAROS", 5, "Continuous"),            # Azul - Mamparos internos
-        ("TANQUES", 4, "Continuous"),             # Cyan - Límites de tanques
-        ("LINEA_AGUA", 6, "DASHED"),              # Magenta - Línea de flotación
-        ("COTAS", 2, "Continuous"),               # Amarillo - Dimensiones
-        ("TEXTO", 8, "Continuous"),               # Gris - Etiquetas
-        ("EJES", 9, "CENTER"),                    # Gris claro - Ejes de referencia
-    ]
-    
-    for name, color, linetype in layers_config:
-        if name not in doc.layers:
-            layer = doc.layers.add(name)
-            layer.color = color
-            try:
-                layer.dxf.linetype = linetype
-            except:
-                pass  # Algunos tipos de línea pueden no estar disponibles
-
-
 def draw_reference_lines(msp, ship: ShipDimensions) -> None:
     """Dibuja las líneas de referencia: base line, centerline, waterline"""
     
@@ -361,45 +338,18 @@ def draw_double_bottom(msp, ship: ShipDimensions, scant: StructuralScantlings) -
 
 def draw_floor_section(msp, y_center, z_bottom, z_top, height, 
                       web_thick, flange_width, flange_thick):
-    """Dibuja el perfil de una varenga (perfil T o bulbo)"""
-    
-    # Alma de la varenga (web)
-    msp.add_line(
-        (y_center - web_thick/2, z_bottom),
-        (y_center - web_thick/2, z_top),
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 30}
-    )
-    msp.add_line(
-        (y_center + web_thick/2, z_bottom),
-        (y_center + web_thick/2, z_top),
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 30}
-    )
-    
-    # Ala superior (flange)
-    msp.add_lwpolyline(
-        [
-            (y_center - flange_width/2, z_top),
-            (y_center - flange_width/2, z_top - flange_thick),
-            (y_center + flange_width/2, z_top - flange_thick),
-            (y_center + flange_width/2, z_top),
-        ],
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 30}
-    )
+    """Coloca el perfil de una varenga (perfil T) como bloque"""
+    lib = biblioteca(msp.doc)
+    bloque = lib.perfil_t(z_top - z_bottom, web_thick, flange_width, flange_thick,
+                          ala="arriba", capa="ESTRUCTURA_PRIMARIA", grosor=30)
+    lib.insertar(msp, bloque, (y_center, z_bottom))
 
 
 def draw_longitudinal_marker(msp, y_pos, z_pos, size):
-    """Dibuja un marcador para longitudinales (vista de frente)"""
-    # Dibujar como un pequeño rectángulo que representa el perfil del longitudinal
-    msp.add_lwpolyline(
-        [
-            (y_pos - 0.05, z_pos - size/2),
-            (y_pos + 0.05, z_pos - size/2),
-            (y_pos + 0.05, z_pos + size/2),
-            (y_pos - 0.05, z_pos + size/2),
-            (y_pos - 0.05, z_pos - size/2),
-        ],
-        dxfattribs={"layer": "ESTRUCTURA_SECUNDARIA", "lineweight": 15}
-    )
+    """Coloca un marcador de longitudinal (vista de frente) como bloque"""
+    lib = biblioteca(msp.doc)
+    bloque = lib.marcador_longitudinal(size, ancho=0.10, capa="ESTRUCTURA_SECUNDARIA", grosor=15)
+    lib.insertar(msp, bloque, (y_pos, z_pos))
 
 
 def draw_double_sides(msp, ship: ShipDimensions, scant: StructuralScantlings) -> None:
@@ -471,43 +421,16 @@ def draw_double_sides(msp, ship: ShipDimensions, scant: StructuralScantlings) ->
 
 def draw_frame_section(msp, y_pos, z_pos, height, web_thick, 
                       flange_width, flange_thick, orientation="vertical"):
-    """Dibuja el perfil de una cuaderna transversal"""
-    
+    """Coloca el perfil de una cuaderna transversal como bloque"""
+    lib = biblioteca(msp.doc)
     if orientation == "vertical":
-        # Alma vertical
-        msp.add_line(
-            (y_pos - web_thick/2, z_pos),
-            (y_pos - web_thick/2, z_pos + height),
-            dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-        )
-        msp.add_line(
-            (y_pos + web_thick/2, z_pos),
-            (y_pos + web_thick/2, z_pos + height),
-            dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-        )
-        
-        # Ala superior
-        msp.add_lwpolyline(
-            [
-                (y_pos - flange_width/2, z_pos + height),
-                (y_pos - flange_width/2, z_pos + height - flange_thick),
-                (y_pos + flange_width/2, z_pos + height - flange_thick),
-                (y_pos + flange_width/2, z_pos + height),
-            ],
-            dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-        )
+        bloque = lib.perfil_t(height, web_thick, flange_width, flange_thick,
+                              ala="arriba", capa="ESTRUCTURA_PRIMARIA", grosor=25)
+        lib.insertar(msp, bloque, (y_pos, z_pos))
     else:  # horizontal
-        # Alma horizontal (para perfiles en costados)
-        msp.add_line(
-            (y_pos, z_pos - web_thick/2),
-            (y_pos + height, z_pos - web_thick/2),
-            dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-        )
-        msp.add_line(
-            (y_pos, z_pos + web_thick/2),
-            (y_pos + height, z_pos + web_thick/2),
-            dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-        )
+        # Alma horizontal (perfiles en costados): el alma vertical girada -90°
+        bloque = lib.alma(height, web_thick, capa="ESTRUCTURA_PRIMARIA", grosor=25)
+        lib.insertar(msp, bloque, (y_pos, z_pos), rotacion=-90.0)
 
 
 def draw_deck_structure(msp, ship: ShipDimensions, scant: StructuralScantlings) -> None:
@@ -535,32 +458,11 @@ def draw_deck_structure(msp, ship: ShipDimensions, scant: StructuralScantlings)
 
 def draw_deck_beam(msp, y_center, z_top, height, web_thick, 
                   flange_width, flange_thick):
-    """Dibuja un bao de cubierta (perfil T invertido)"""
-    
-    z_bottom = z_top - height
-    
-    # Alma vertical
-    msp.add_line(
-        (y_center - web_thick/2, z_bottom),
-        (y_center - web_thick/2, z_top),
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-    )
-    msp.add_line(
-        (y_center + web_thick/2, z_bottom),
-        (y_center + web_thick/2, z_top),
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-    )
-    
-    # Ala inferior (flange en la parte inferior del bao)
-    msp.add_lwpolyline(
-        [
-            (y_center - flange_width/2, z_bottom),
-            (y_center - flange_width/2, z_bottom + flange_thick),
-            (y_center + flange_width/2, z_bottom + flange_thick),
-            (y_center + flange_width/2, z_bottom),
-        ],
-        dxfattribs={"layer": "ESTRUCTURA_PRIMARIA", "lineweight": 25}
-    )
+    """Coloca un bao de cubierta (perfil T invertido) como bloque"""
+    lib = biblioteca(msp.doc)
+    bloque = lib.perfil_t(height, web_thick, flange_width, flange_thick,
+                          ala="abajo", capa="ESTRUCTURA_PRIMARIA", grosor=25)
+    lib.insertar(msp, bloque, (y_center, z_top - height))
 
 
 def draw_tanks_compartments(msp, ship: ShipDimensions) -> None:
@@ -779,11 +681,8 @@ def generate_dxf_plan() -> None:
     # Crear directorio de salida
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Crear nuevo documento DXF
-    doc = ezdxf.new("R2010", setup=True)
-    
-    # Crear capas
-    create_layers(doc)
+    # Documento desde la plantilla con las capas del corte transversal
+    doc = nuevo_documento("corte_transversal")
     
     # Obtener espacio de modelo
     msp = doc.modelspace()
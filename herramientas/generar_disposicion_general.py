@@ -1533,8 +1533,13 @@ def preparar_entrega(
     (ENTREGA_DIR / "README.md").write_text("\n".join(readme_lines), encoding="utf-8")
 
 
-def main() -> None:
-    guardar_tablas()
+def main(procesos: int | None = None) -> None:
+    """Genera tablas, figuras y DXF en paralelo y después el PDF y la entrega.
+
+    Args:
+        procesos: Procesos del pool (por defecto, núcleos disponibles; 1 = en serie)
+    """
+    from maxsurf_integration.autocad_integration.planificador import PlanificadorPlanos
 
     figures = {
         "layout": OUTPUT_DIR / "distribucion_longitudinal.png",
@@ -1546,15 +1551,19 @@ def main() -> None:
         "displacement": OUTPUT_DIR / "curva_desplazamiento.png",
         "fuel_balance": OUTPUT_DIR / "balance_combustible.png",
     }
-
-    grafico_disposicion_longitudinal(figures["layout"])
-    grafico_capacidad_tanques(figures["tanks"])
-    grafico_carga_objetivo(figures["cargo"])
-    grafico_balance_combustible(figures["fuel_balance"])
-    generar_graficos_maxsurf(figures)
-
     dxf_path = OUTPUT_DIR / "distribucion_longitudinal.dxf"
-    generar_dxf_disposicion(dxf_path)
+
+    # Tablas, figuras y DXF son independientes entre sí; el PDF y la entrega
+    # leen lo que éstas dejan en OUTPUT_DIR.
+    plan = PlanificadorPlanos(procesos)
+    plan.agregar("tablas", guardar_tablas)
+    plan.agregar("layout", grafico_disposicion_longitudinal, figures["layout"])
+    plan.agregar("tanks", grafico_capacidad_tanques, figures["tanks"])
+    plan.agregar("cargo", grafico_carga_objetivo, figures["cargo"])
+    plan.agregar("fuel_balance", grafico_balance_combustible, figures["fuel_balance"])
+    plan.agregar("maxsurf", generar_graficos_maxsurf, figures)
+    plan.agregar("dxf", generar_dxf_disposicion, dxf_path)
+    plan.ejecutar()
 
     pdf_path, tabla_registro, figura_registro = ensamblar_pdf(figures)
     preparar_entrega(pdf_path, dxf_path, tabla_registro, figura_registro)
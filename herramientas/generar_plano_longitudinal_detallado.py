@@ -24,10 +24,9 @@ from typing import Sequence
 import math
 
 import ezdxf
-from ezdxf import units
 from ezdxf.enums import TextEntityAlignment
 
-from utils_dxf import save_dxf_with_extents
+from utils_dxf import nuevo_documento, save_dxf_with_extents
 
 
 # ===== CONFIGURACIÓN DEL PROYECTO =====
@@ -148,52 +147,6 @@ def _add_text(
         entity.dxf.rotation = rotation
 
 
-def _create_layers(doc: ezdxf.EzdxfDocument) -> None:
-    """Crea capas profesionales optimizadas para visibilidad."""
-    layers = {
-        # Capas estructurales
-        "CASCO": (1, "Continuous", 50),  # (color, linetype, lineweight)
-        "ESTRUCTURA": (3, "Continuous", 35),
-        "MAMPAROS": (3, "Continuous", 40),
-        "CUBIERTAS": (4, "Continuous", 30),
-        "REFUERZOS": (5, "Continuous", 18),  # CAMBIADO de 8 a 5 (cyan) - MÁS VISIBLE
-        # Propulsión
-        "EJE_PROPULSOR": (1, "CENTER", 35),
-        "HELICE": (2, "Continuous", 40),
-        "TIMON": (6, "Continuous", 35),
-        "BOCINA": (5, "Continuous", 25),
-        # Equipos
-        "MOTOR_PRINCIPAL": (2, "Continuous", 40),
-        "FUNDACION_MOTOR": (9, "Continuous", 25),  # CAMBIADO de 8 a 9 (gris claro) - MÁS VISIBLE
-        "GENERADORES": (6, "Continuous", 30),
-        "EQUIPOS_AUX": (5, "Continuous", 20),
-        # Tanques
-        "DOBLE_FONDO": (30, "Continuous", 25),
-        "TANQUES_SERVICIO": (40, "DASHED", 20),
-        "TANQUES_WING": (40, "DASHED", 18),
-        # Sistemas
-        "TUBERIAS": (4, "DASHED", 13),
-        "VENTILACION": (6, "DASHED", 13),  # CAMBIADO de 7 a 6 (magenta) - MÁS VISIBLE
-        # Anotaciones - ROJO PARA MÁXIMA VISIBILIDAD
-        "TEXTOS": (1, "Continuous", 13),  # ROJO - visible en blanco y oscuro
-        "COTAS": (1, "Continuous", 13),   # ROJO
-        "LEYENDA": (1, "Continuous", 13), # ROJO
-        "EJES": (9, "CENTER", 13),  # CAMBIADO de 8 a 9 (gris claro) - MÁS VISIBLE
-        "SECCION_TRANSVERSAL": (1, "Continuous", 25),
-    }
-    
-    for name, (color, linetype, lineweight) in layers.items():
-        if name in doc.layers:
-            try:
-                doc.layers.remove(name)
-            except:
-                pass
-        layer = doc.layers.add(name=name)
-        layer.color = color
-        layer.dxf.linetype = linetype
-        layer.dxf.lineweight = lineweight
-
-
 def draw_detailed_hull_profile(msp: ezdxf.layouts.Modelspace) -> None:
     """Dibuja perfil detallado del casco con doble fondo estructurado."""
     # Línea base (quilla)
@@ -739,13 +692,10 @@ def main() -> None:
     print("=" * 80)
     print()
     
-    doc = ezdxf.new("R2010", setup=True)
-    doc.units = units.M
+    print("📐 Documento con capas profesionales desde la plantilla...")
+    doc = nuevo_documento("sala_maquinas_detallado")
     msp = doc.modelspace()
     
-    print("📐 Creando capas profesionales...")
-    _create_layers(doc)
-    
     print("🚢 Dibujando perfil detallado del casco...")
     draw_detailed_hull_profile(msp)
     
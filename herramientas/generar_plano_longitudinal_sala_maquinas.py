@@ -21,10 +21,9 @@ from pathlib import Path
 from typing import Sequence
 
 import ezdxf
-from ezdxf import units
 from ezdxf.enums import TextEntityAlignment
 
-from utils_dxf import save_dxf_with_extents
+from utils_dxf import nuevo_documento, save_dxf_with_extents
 
 
 # ===== CONFIGURACIÓN DEL PROYECTO =====
@@ -117,38 +116,6 @@ def _add_dimension(
     )
 
 
-def _create_layers(doc: ezdxf.EzdxfDocument) -> None:
-    """Crea las capas profesionales según estándares navales."""
-    layers = {
-        # Capas estructurales - colores oscuros y visibles
-        "CASCO": 1,  # Rojo - contorno del casco
-        "ESTRUCTURA": 3,  # Verde - mamparos y refuerzos
-        "CUBIERTAS": 4,  # Cian - cubiertas
-        # Capas de equipos
-        "MOTOR_PRINCIPAL": 2,  # Amarillo - motor diesel
-        "GENERADORES": 6,  # Magenta - generadores auxiliares
-        "EQUIPOS_AUX": 5,  # Azul - equipos auxiliares
-        # Capas de tanques
-        "TANQUES_DB": 30,  # Naranja - doble fondo
-        "TANQUES_WING": 40,  # Verde claro - tanques laterales
-        # Capas de anotación - negro para máxima visibilidad
-        "TEXTOS": 0,  # Negro - etiquetas
-        "COTAS": 0,  # Negro - dimensiones
-        "LEYENDA": 0,  # Negro - leyenda
-        "EJES": 8,  # Gris oscuro - líneas de referencia
-    }
-    for name, color in layers.items():
-        # Eliminar capa si existe para recrearla con color correcto
-        if name in doc.layers:
-            try:
-                doc.layers.remove(name)
-            except:
-                pass
-        # Crear capa con color especificado
-        layer = doc.layers.add(name=name)
-        layer.color = color
-
-
 def draw_hull_profile(msp: ezdxf.layouts.Modelspace) -> None:
     """Dibuja el perfil del casco en la sala de máquinas."""
     # Línea base (quilla)
@@ -555,13 +522,10 @@ def main() -> None:
     print()
 
     # Crear documento DXF
-    doc = ezdxf.new("R2010")
-    doc.units = units.M
+    print("📐 Documento con capas profesionales desde la plantilla...")
+    doc = nuevo_documento("sala_maquinas")
     msp = doc.modelspace()
 
-    print("📐 Creando capas profesionales...")
-    _create_layers(doc)
-
     print("🚢 Dibujando perfil del casco...")
     draw_hull_profile(msp)
 
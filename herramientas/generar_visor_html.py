@@ -1,10 +1,13 @@
 """
 Generador de vista HTML/SVG del plano
 Crea una página HTML interactiva para visualizar el plano sin visor CAD
+
+El SVG se emite en streaming (recorrido_dxf.EmisorSVG): una sola pasada por
+el espacio modelo, sin cargar el documento ni el SVG completo en memoria.
 """
-import ezdxf
 from pathlib import Path
-import math
+
+from recorrido_dxf import ConteoTipos, EmisorSVG, LectorDXF
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DXF_FILE = PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
@@ -38,41 +41,17 @@ print("   GENERANDO VISOR HTML DEL PLANO")
 print("=" * 80)
 print()
 
-doc = ezdxf.readfile(DXF_FILE)
-msp = doc.modelspace()
-
-# Calcular extensión
-min_x = min_y = float('inf')
-max_x = max_y = float('-inf')
+svg_width = 1800
+margin = 5
 
-for entity in msp:
-    try:
-        if entity.dxftype() == 'LINE':
-            min_x = min(min_x, entity.dxf.start.x, entity.dxf.end.x)
-            max_x = max(max_x, entity.dxf.start.x, entity.dxf.end.x)
-            min_y = min(min_y, entity.dxf.start.y, entity.dxf.end.y)
-            max_y = max(max_y, entity.dxf.start.y, entity.dxf.end.y)
-        elif entity.dxftype() == 'CIRCLE':
-            min_x = min(min_x, entity.dxf.center.x - entity.dxf.radius)
-            max_x = max(max_x, entity.dxf.center.x + entity.dxf.radius)
-            min_y = min(min_y, entity.dxf.center.y - entity.dxf.radius)
-            max_y = max(max_y, entity.dxf.center.y + entity.dxf.radius)
-        elif entity.dxftype() == 'LWPOLYLINE':
-            for point in entity.get_points():
-                min_x = min(min_x, point[0])
-                max_x = max(max_x, point[0])
-                min_y = min(min_y, point[1])
-                max_y = max(max_y, point[1])
-    except:
-        pass
+with LectorDXF(DXF_FILE) as lector:
+    emisor, tipos = EmisorSVG(aci_to_rgb, grosor_px=1.5, escala_texto=0.7), ConteoTipos()
+    lector.recorrer([emisor, tipos])
 
+entity_count = emisor.resultado()
+min_x, min_y, max_x, max_y = emisor.caja.resultado() or (0.0, 0.0, 0.0, 0.0)
 width = max_x - min_x
 height = max_y - min_y
-margin = 5
-
-# Escala SVG
-svg_width = 1800
-svg_height = int(svg_width * height / width) if width > 0 else 600
 scale = svg_width / (width + 2 * margin) if width > 0 else 1
 
 print(f"📐 Extensión del plano:")
@@ -81,65 +60,7 @@ print(f"   Y: {min_y:.2f} a {max_y:.2f} m (alto: {height:.2f} m)")
 print(f"   Escala SVG: {scale:.2f} píxeles/metro")
 print()
 
-def transform_y(y):
-    """Invertir Y para coordenadas SVG (origen arriba-izquierda)."""
-    return (max_y - y + margin) * scale
-
-def transform_x(x):
-    """Transformar X para coordenadas SVG."""
-    return (x - min_x + margin) * scale
-
-# Generar SVG
-svg_lines = []
-svg_lines.append(f'<svg width="{svg_width}" height="{svg_height}" xmlns="http://www.w3.org/2000/svg">')
-svg_lines.append('<rect width="100%" height="100%" fill="white"/>')
-
-entity_count = 0
-
-# Dibujar entidades
-for entity in msp:
-    try:
-        # Obtener color
-        color = entity.dxf.color if hasattr(entity.dxf, 'color') else 256
-        stroke = aci_to_rgb(color)
-        
-        if entity.dxftype() == 'LINE':
-            x1, y1 = transform_x(entity.dxf.start.x), transform_y(entity.dxf.start.y)
-            x2, y2 = transform_x(entity.dxf.end.x), transform_y(entity.dxf.end.y)
-            svg_lines.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{stroke}" stroke-width="1.5"/>')
-            entity_count += 1
-            
-        elif entity.dxftype() == 'CIRCLE':
-            cx, cy = transform_x(entity.dxf.center.x), transform_y(entity.dxf.center.y)
-            r = entity.dxf.radius * scale
-            svg_lines.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" stroke="{stroke}" stroke-width="1.5" fill="none"/>')
-            entity_count += 1
-            
-        elif entity.dxftype() == 'LWPOLYLINE':
-            points = entity.get_points()
-            if len(points) >= 2:
-                path = f'M {transform_x(points[0][0])} {transform_y(points[0][1])}'
-                for point in points[1:]:
-                    path += f' L {transform_x(point[0])} {transform_y(point[1])}'
-                if entity.closed:
-                    path += ' Z'
-                svg_lines.append(f'<path d="{path}" stroke="{stroke}" stroke-width="1.5" fill="none"/>')
-                entity_count += 1
-                
-        elif entity.dxftype() == 'TEXT':
-            x, y = transform_x(entity.dxf.insert.x), transform_y(entity.dxf.insert.y)
-            text = entity.dxf.text
-            height = entity.dxf.height * scale * 0.7  # Factor de escala para texto
-            svg_lines.append(f'<text x="{x}" y="{y}" font-size="{height}" fill="{stroke}" font-family="Arial">{text}</text>')
-            entity_count += 1
-            
-    except Exception as e:
-        print(f"⚠️  Error procesando {entity.dxftype()}: {e}")
-        continue
-
-svg_lines.append('</svg>')
-
-print(f"✓ Procesadas {entity_count} entidades de {sum(1 for _ in msp)} totales")
+print(f"✓ Procesadas {entity_count} entidades de {sum(tipos.resultado().values())} totales")
 print()
 
 # Generar HTML
@@ -222,7 +143,7 @@ html = f"""<!DOCTYPE html>
         </div>
         
         <div class="svg-container">
-            {''.join(svg_lines)}
+            {{svg}}
         </div>
         
         <div class="legend">
@@ -271,9 +192,12 @@ html = f"""<!DOCTYPE html>
 </body>
 </html>"""
 
-# Guardar HTML
+# Guardar HTML (el SVG se copia desde el archivo temporal del emisor)
+html_antes, html_despues = html.split('{svg}')
 with open(HTML_FILE, 'w', encoding='utf-8') as f:
-    f.write(html)
+    f.write(html_antes)
+    emisor.escribir(f, ancho_px=svg_width, margen=margin)
+    f.write(html_despues)
 
 print("=" * 80)
 print("✅ VISOR HTML GENERADO EXITOSAMENTE")
@@ -6,10 +6,9 @@ from pathlib import Path
 from typing import Iterable, Sequence
 
 import ezdxf
-from ezdxf import units
 from ezdxf.enums import TextEntityAlignment
 
-from utils_dxf import save_dxf_with_extents
+from utils_dxf import nuevo_documento, save_dxf_with_extents
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -85,21 +84,6 @@ def _add_text(
     msp.add_text(text, dxfattribs={"height": height, "layer": layer}).set_placement(position, align=align)
 
 
-def _create_layers(doc: ezdxf.EzdxfDocument) -> None:
-    layers = {
-        "CASCO": 1,
-        "ESTRUCTURA": 2,
-        "TANQUES": 3,
-        "EQUIPOS": 4,
-        "TEXTOS": 7,
-        "DIMENSIONES": 140,
-        "LEYENDA": 30,
-    }
-    for name, color in layers.items():
-        if name not in doc.layers:
-            doc.layers.add(name=name, color=color)
-
-
 def _lwpolyline(
     msp: ezdxf.layouts.Modelspace,
     points: Iterable[tuple[float, float]],
@@ -390,9 +374,7 @@ def _add_legend(msp: ezdxf.layouts.Modelspace) -> None:
 
 
 def build_dxf_engine_room() -> Path:
-    doc = ezdxf.new("R2010")
-    doc.units = units.M
-    _create_layers(doc)
+    doc = nuevo_documento("camara_multivista")
     msp = doc.modelspace()
 
     _draw_plan_view(msp)
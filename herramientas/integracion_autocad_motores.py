@@ -268,7 +268,17 @@ class EngineRoomDesigner:
     
     def __init__(self):
         self.autocad = AutoCADEngineIntegration()
-        self.engine_configs = ENGINE_LIBRARY
+        self.engine_configs = dict(ENGINE_LIBRARY)
+    
+    def register_engines(self, configs: Dict[str, EngineConfiguration]) -> None:
+        """
+        Añade motores (p. ej. de `catalogo_motores.CatalogoMotores`) a los
+        disponibles para insert_main_engine.
+        
+        Args:
+            configs: Dict {clave: EngineConfiguration}
+        """
+        self.engine_configs.update(configs)
         
     def setup_layers(self) -> None:
         """Crea capas estándar para sala de máquinas."""
@@ -346,6 +356,54 @@ class EngineRoomDesigner:
             text_pos = (x, y, z + config.height_m + 0.5 + i * 0.3)
             self.autocad.add_text(text, text_pos, height=0.25, layer="TEXTOS")
     
+    def auto_layout(
+        self,
+        main_engine_model: str,
+        generator_model: str,
+        room_length: float,
+        room_beam: float,
+        n_generators: int = 3,
+        tanks: Optional[List] = None,
+        seed: Optional[int] = 0,
+    ):
+        """
+        Disposición optimizada de la sala a partir de las huellas de la biblioteca.
+        
+        Args:
+            main_engine_model: Clave del motor principal
+            generator_model: Clave de los generadores
+            room_length: Longitud sala (m); el eje sale por x = room_length
+            room_beam: Manga útil de la sala (m)
+            n_generators: Número de generadores
+            tanks: Lista de Equipo adicionales (por defecto, tanques de
+                servicio y sedimentación de FO)
+            seed: Semilla del recocido simulado
+            
+        Returns:
+            ResultadoSalaMaquinas en coordenadas locales de la sala
+        """
+        from maxsurf_integration.optimization import Equipo, OptimizadorSalaMaquinas, equipos_por_defecto
+        
+        equipment = [
+            Equipo.desde_motor(
+                self.engine_configs[main_engine_model], tipo="motor_principal",
+                holgura_m=1.0, z_m=1.5, y_fijo_m=0.0,
+            )
+        ]
+        equipment += [
+            Equipo.desde_motor(
+                self.engine_configs[generator_model], nombre=f"GEN {i + 1}",
+                holgura_m=0.8, z_m=1.2, rotable=True,
+            )
+            for i in range(n_generators)
+        ]
+        if tanks is None:
+            tanks = [e for e in equipos_por_defecto() if e.tipo == "tanque"]
+        equipment += list(tanks)
+        
+        room = (0.0, -room_beam / 2.0, room_length, room_beam / 2.0)
+        return OptimizadorSalaMaquinas(equipment, room).optimizar(semilla=seed)
+    
     def generate_complete_engine_room(
         self,
         main_engine_model: str,
@@ -353,6 +411,7 @@ class EngineRoomDesigner:
         room_length: float,
         room_beam: float,
         room_height: float,
+        layout=None,
     ) -> Dict:
         """
         Genera sala de máquinas completa.
@@ -363,6 +422,8 @@ class EngineRoomDesigner:
             room_length: Longitud sala (m)
             room_beam: Manga sala (m)
             room_height: Altura sala (m)
+            layout: ResultadoSalaMaquinas (maxsurf_integration.optimization);
+                sin él se usan las posiciones fijas por defecto
             
         Returns:
             Dict con resumen de elementos creados
@@ -378,24 +439,41 @@ class EngineRoomDesigner:
         print("📐 Creando capas...")
         self.setup_layers()
         
+        # Posiciones: disposición optimizada (coordenadas locales de la sala) o fijas
+        if layout is not None:
+            positions = layout.posiciones(origen_x=layout.sala[0])
+            main_engine_pos = next(positions[e.nombre] for e in layout.equipos if e.tipo == "motor_principal")
+            generator_pos = [positions[e.nombre] for e in layout.equipos if e.tipo == "generador"]
+            tank_pos = {e.nombre: positions[e.nombre] for e in layout.equipos if e.tipo == "tanque"}
+        else:
+            main_engine_pos = (room_length * 0.3, 0.0, 1.5)
+            generator_pos = [(room_length * 0.15 + i * 4.5, -3.0, 1.2) for i in range(3)]
+            tank_pos = {}
+        
         # 2. Insertar motor principal
         print(f"\n⚙️  Insertando motor principal: {main_engine_model}")
-        main_engine_pos = (room_length * 0.3, 0.0, 1.5)
         self.insert_main_engine(main_engine_model, main_engine_pos)
         
         # 3. Insertar generadores
         print(f"\n🔌 Insertando generadores: {generator_model}")
-        for i in range(3):
-            gen_pos = (room_length * 0.15 + i * 4.5, -3.0, 1.2)
+        for gen_pos in generator_pos:
             self.insert_main_engine(generator_model, gen_pos)
         
+        for name, pos in tank_pos.items():
+            self.autocad.add_text(name, pos, height=0.25, layer="TANQUES")
+        
         # 4. Resumen
         summary = {
             "main_engine": self.engine_configs[main_engine_model],
             "generators": {
                 "model": generator_model,
-                "count": 3,
-                "total_power_kw": self.engine_configs[generator_model].power_kw * 3,
+                "count": len(generator_pos),
+                "total_power_kw": self.engine_configs[generator_model].power_kw * len(generator_pos),
+            },
+            "positions": {
+                "main_engine": main_engine_pos,
+                "generators": generator_pos,
+                "tanks": tank_pos,
             },
             "room_dimensions": {
                 "length_m": room_length,
@@ -408,7 +486,7 @@ class EngineRoomDesigner:
         print("✅ SALA DE MÁQUINAS GENERADA EXITOSAMENTE")
         print("=" * 70)
         print(f"\nMotor principal: {main_engine_model} ({summary['main_engine'].power_kw} kW)")
-        print(f"Generadores: 3x {generator_model} ({summary['generators']['total_power_kw']} kW total)")
+        print(f"Generadores: {len(generator_pos)}x {generator_model} ({summary['generators']['total_power_kw']} kW total)")
         
         return summary
 
@@ -469,13 +547,15 @@ def main():
     # Si estamos en Windows con AutoCAD
     designer = EngineRoomDesigner()
     
-    # Ejemplo: Crear sala de máquinas
+    # Ejemplo: Crear sala de máquinas con disposición optimizada
+    layout = designer.auto_layout("MAN_6S50ME-C", "CAT_3512C", room_length=15.0, room_beam=15.99 - 2 * 1.8)
     summary = designer.generate_complete_engine_room(
         main_engine_model="MAN_6S50ME-C",
         generator_model="CAT_3512C",
         room_length=15.0,
         room_beam=15.99,
         room_height=7.90,
+        layout=layout,
     )
     
     print("\n📋 Resumen generado:")
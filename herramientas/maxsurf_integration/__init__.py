@@ -19,14 +19,36 @@ Fecha: 2 de noviembre de 2025
 __version__ = "1.0.0"
 __author__ = "Proyecto Final - Diseño Naval"
 
-from .maxsurf_connector import MaxsurfConnector
-from .hull_design.hull_designer import HullDesigner
-from .stability.stability_analyzer import StabilityAnalyzer
-from .tanks.tank_designer import TankDesigner
-from .reports.report_generator import ReportGenerator
+import importlib
+
+# Las clases principales se importan al primer acceso: así los submódulos
+# ligeros (p. ej. autocad_integration.plantillas, que usan todos los
+# generadores de planos) no arrastran pandas ni el resto del paquete.
+_EXPORTACIONES = {
+    'MaxsurfConnector': '.maxsurf_connector',
+    'HullDesigner': '.hull_design.hull_designer',
+    'StabilityAnalyzer': '.stability.stability_analyzer',
+    'TankDesigner': '.tanks.tank_designer',
+    'ReportGenerator': '.reports.report_generator',
+}
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTACIONES.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo, __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTACIONES))
+
 
 def _cli_ping():
     """CLI mínima: informa backend y una hidro estática simple."""
+    from .maxsurf_connector import MaxsurfConnector
     c = MaxsurfConnector(visible=False)
     ok = c.connect()
     print({
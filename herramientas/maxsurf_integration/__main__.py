@@ -6,7 +6,8 @@ import sys
 
 from .maxsurf_connector import MaxsurfConnector
 from .optimization import GridSearchOptimizer
-from .autocad_integration.generador_planos_auto import GeneradorPlanosAuto
+from .autocad_integration.generador_planos_auto import GeneradorPlanosAuto, crear_plano
+from .autocad_integration.planificador import PlanificadorPlanos
 from .workflows.base_ship import ParametrosBuqueBase, generar_buque_base
 from .workflows.windows_bundle import ejecutar_bundle_windows
 from .workflows.auto_base import generar_planos_informacion_base, DEFAULT_DIR_NAME
@@ -138,6 +139,34 @@ def cmd_auto_base(args: argparse.Namespace) -> int:
     return 0
 
 
+def regla_interferencia(texto: str) -> tuple:
+    """Convierte CAPA_A:CAPA_B o CAPA_A:CAPA_B:lineas en (capa_a, capa_b, macizo)."""
+    capas = texto.split(":")
+    if len(capas) not in (2, 3) or not all(capas[:2]) or capas[2:] not in ([], ["lineas"]):
+        raise argparse.ArgumentTypeError(f"regla '{texto}' no válida: se espera CAPA_A:CAPA_B o CAPA_A:CAPA_B:lineas")
+    return capas[0], capas[1], len(capas) == 2
+
+
+def cmd_interferencias(args: argparse.Namespace) -> int:
+    from .autocad_integration.interferencias import REGLAS_POR_DEFECTO, detectar_interferencias
+
+    reglas = args.regla or REGLAS_POR_DEFECTO
+    informes = [
+        detectar_interferencias(
+            dxf, reglas, celda_m=args.celda, tolerancia_m=args.tolerancia,
+            duplicadas=not args.sin_duplicadas, textos=not args.sin_textos,
+        ).a_dict()
+        for dxf in args.dxf
+    ]
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(informes, f, ensure_ascii=False, indent=2)
+    for informe in informes:
+        print(f"{informe['ruta']}: {informe['entidades']} entidades, {informe['resumen'] or 'sin interferencias'}")
+    hay = any(informe["interferencias"] for informe in informes)
+    return 1 if args.estricto and hay else 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="python -m maxsurf_integration", description="CLI para integrações com Maxsurf")
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -200,8 +229,21 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--B", type=float, default=7.0, help="Manga (m)")
     sp.add_argument("--T", type=float, default=2.0, help="Calado (m)")
     sp.add_argument("--out", type=str, default=None, help="Diretório de saída")
+    sp.add_argument("--procesos", type=int, default=None, help="Processos para gerar os planos em paralelo (1 = em série)")
     sp.set_defaults(func=cmd_autocad)
 
+    sp = sub.add_parser("interferencias", help="Detecta choques entre capas, líneas duplicadas y textos solapados en planos DXF")
+    sp.add_argument("dxf", nargs="+", help="Planos DXF a revisar")
+    sp.add_argument("--regla", action="append", default=None, type=regla_interferencia,
+                    help="Pareja de capas CAPA_A:CAPA_B (CAPA_A:CAPA_B:lineas = sólo las líneas de B); sustituye a las reglas por defecto")
+    sp.add_argument("--celda", type=float, default=None, help="Lado de celda del índice espacial (m; por defecto automático)")
+    sp.add_argument("--tolerancia", type=float, default=1e-3, help="Longitud mínima de choque o duplicado (m)")
+    sp.add_argument("--sin-duplicadas", action="store_true", help="No buscar líneas duplicadas")
+    sp.add_argument("--sin-textos", action="store_true", help="No buscar textos solapados")
+    sp.add_argument("--json", type=str, default=None, help="Guardar el informe completo en JSON")
+    sp.add_argument("--estricto", action="store_true", help="Salir con código 1 si hay interferencias")
+    sp.set_defaults(func=cmd_interferencias)
+
     return p
 
 
@@ -230,13 +272,14 @@ def cmd_autocad(args: argparse.Namespace) -> int:
         print(path)
         return 0
     elif args.action == "all":
-        gen = tool.generador
-        res = {
-            "construction": gen.crear_plano_construccion(eslora=args.L, manga=args.B, escala=1.25, out_dir=out_dir),
-            "lines": gen.crear_plano_lineas(eslora=args.L, manga=args.B, calado=args.T, out_dir=out_dir),
-            "frames": gen.crear_plano_cuadernas(eslora=args.L, manga=args.B, out_dir=out_dir),
-        }
-        print(res)
+        plan = PlanificadorPlanos(args.procesos)
+        plan.agregar("construction", crear_plano, "crear_plano_construccion",
+                     dict(eslora=args.L, manga=args.B, escala=1.25, out_dir=out_dir))
+        plan.agregar("lines", crear_plano, "crear_plano_lineas",
+                     dict(eslora=args.L, manga=args.B, calado=args.T, out_dir=out_dir))
+        plan.agregar("frames", crear_plano, "crear_plano_cuadernas",
+                     dict(eslora=args.L, manga=args.B, out_dir=out_dir))
+        print(plan.ejecutar())
         return 0
     return 1
 
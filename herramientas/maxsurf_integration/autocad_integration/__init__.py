@@ -4,4 +4,14 @@ __all__ = [
     "GeneradorPlanosNavales",
     "GeneradorPlanosAuto",
     "ConfiguradorEstilos",
+    "PlanificadorPlanos",
+    "TareaPlano",
+    "CachePlantillas",
+    "EstiloCapa",
+    "nuevo_documento",
+    "DetectorInterferencias",
+    "InformeInterferencias",
+    "Interferencia",
+    "ReglaChoque",
+    "detectar_interferencias",
 ]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict
 
+from .plantillas import CONJUNTOS_CAPAS
+
 try:
     import win32com.client  # type: ignore
 except Exception:  # pragma: no cover
@@ -18,6 +20,7 @@ class ConfiguradorEstilos:
             "C-CUAD": "Cuadernas",
             "C-LFLOT": "Líneas de flotación",
             "C-PERF": "Perfiles longitudinales",
+            "C-DIAG": "Diagonales",
             "C-COTA": "Cotaciones",
             "C-STR": "Estructura",
             "C-REF": "Refuerzos",
@@ -38,14 +41,4 @@ class ConfiguradorEstilos:
 
     @staticmethod
     def _colores_por_tipo() -> Dict[str, int]:
-        return {
-            "C-CASC": 1,
-            "C-CUAD": 2,
-            "C-LFLOT": 3,
-            "C-PERF": 4,
-            "C-COTA": 5,
-            "C-STR": 6,
-            "C-REF": 7,
-            "C-TEXT": 8,
-            "C-SIMB": 9,
-        }
+        return {capa: estilo.color for capa, estilo in CONJUNTOS_CAPAS["naval"].items()}
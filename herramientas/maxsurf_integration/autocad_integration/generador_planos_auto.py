@@ -1,40 +1,46 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from maxsurf_integration.autocad_integration.planificador import PlanificadorPlanos
 from maxsurf_integration.autocad_integration.planos_navales import GeneradorPlanosNavales
 
 
+def crear_plano(metodo: str, kwargs: Dict[str, Any]) -> str:
+    """Genera un plano con un GeneradorPlanosNavales propio (apto para un proceso del pool)."""
+    return getattr(GeneradorPlanosNavales(), metodo)(**kwargs)
+
+
 class GeneradorPlanosAuto:
     def __init__(self):
         self.generador = GeneradorPlanosNavales()
 
-    def generar_planos_completos(self, parametros_barco: Dict[str, Any], out_dir: str | Path = "./salidas/autocad") -> Dict[str, str]:
+    def generar_planos_completos(
+        self,
+        parametros_barco: Dict[str, Any],
+        out_dir: str | Path = "./salidas/autocad",
+        procesos: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Genera los planos de construcción, líneas y cuadernas.
+
+        Los planos son independientes y cada uno se genera en su propio proceso
+        (`procesos=1` para generarlos en serie).
+        """
+        eslora = float(parametros_barco.get("eslora_total", 20.0))
+        manga = float(parametros_barco.get("manga_maxima", 5.0))
+        calado = float(parametros_barco.get("calado", parametros_barco.get("calado_diseño", 2.0)))
         self.generador.conectar_autocad()
-        rutas: Dict[str, str] = {}
-        rutas["plano_construccion"] = self.generador.crear_plano_construccion(
-            eslora=float(parametros_barco.get("eslora_total", 20.0)),
-            manga=float(parametros_barco.get("manga_maxima", 5.0)),
-            escala=1.25,
-            out_dir=out_dir,
-        )
-        rutas["plano_lineas"] = self.generador.crear_plano_lineas(
-            eslora=float(parametros_barco.get("eslora_total", 20.0)),
-            manga=float(parametros_barco.get("manga_maxima", 5.0)),
-            calado=float(parametros_barco.get("calado", parametros_barco.get("calado_diseño", 2.0))),
-            escala=1.0,
-            out_dir=out_dir,
-        )
-        rutas["plano_cuadernas"] = self.generador.crear_plano_cuadernas(
-            eslora=float(parametros_barco.get("eslora_total", 20.0)),
-            manga=float(parametros_barco.get("manga_maxima", 5.0)),
-            escala=1.0,
-            n_estaciones=11,
-            out_dir=out_dir,
-        )
+
+        plan = PlanificadorPlanos(procesos)
+        plan.agregar("plano_construccion", crear_plano, "crear_plano_construccion",
+                     dict(eslora=eslora, manga=manga, escala=1.25, out_dir=out_dir))
+        plan.agregar("plano_lineas", crear_plano, "crear_plano_lineas",
+                     dict(eslora=eslora, manga=manga, calado=calado, escala=1.0, out_dir=out_dir))
+        plan.agregar("plano_cuadernas", crear_plano, "crear_plano_cuadernas",
+                     dict(eslora=eslora, manga=manga, escala=1.0, n_estaciones=11, out_dir=out_dir))
         # Extensible: agregar plano de estructura, etc.
-        return rutas
+        return plan.ejecutar()
 
 
 if __name__ == "__main__":
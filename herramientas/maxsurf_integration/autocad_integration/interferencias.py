@@ -0,0 +1,463 @@
+"""Detección de interferencias geométricas entre capas de un plano DXF.
+
+Comprueba tres tipos de defecto de dibujo:
+
+- **choque**: contornos de capas que no deben solaparse (equipos contra
+  estructura, máquinas contra tanques...) que se interpenetran; entre dos
+  contornos cerrados se mide el área común y entre un contorno y una línea
+  abierta la longitud de línea que pasa por el interior del contorno;
+- **duplicada**: tramos de línea colineales que se solapan (la misma línea
+  dibujada dos veces, o una más corta encima de otra) en dos entidades, o
+  repetidos dentro de una misma;
+- **texto**: textos atravesados por geometría o montados sobre otro texto.
+
+Comparar todas las parejas de entidades es O(n²) e inviable en planos
+reales. Cada capa tiene su propio índice de rejilla uniforme
+(`IndiceRejilla`, el de la disposición de la sala de máquinas) con las cajas
+envolventes de sus entidades, y sólo se comprueba la geometría exacta de las
+parejas que comparten celda. Los tramos duplicados se buscan del mismo modo,
+con una rejilla de tramos en lugar de entidades.
+
+Las entidades se reducen a polilíneas con `ezdxf.path` (arcos y curvas
+aplanados), los bloques se explotan con `virtual_entities()` y los textos se
+representan por su caja envolvente.
+
+Ejemplo:
+    informe = detectar_interferencias("salidas/autocad/sala_maquinas_grupo9.dxf")
+    print(informe.resumen())
+"""
+
+from __future__ import annotations
+
+import statistics
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import ezdxf
+    from ezdxf import bbox as ez_bbox
+    from ezdxf import path as ez_path
+    from ezdxf.math import Vec2, area, is_convex_polygon_2d
+    from ezdxf.math.clipping import (
+        ConcaveClippingPolygon2d,
+        ConvexClippingPolygon2d,
+        has_clockwise_orientation,
+        is_point_in_polygon_2d,
+    )
+except Exception:  # pragma: no cover
+    ezdxf = None  # type: ignore
+
+from ..optimization.disposicion_sala_maquinas import Caja, IndiceRejilla
+
+TIPOS_TEXTO = frozenset({"TEXT", "MTEXT", "ATTRIB"})
+
+
+@dataclass(frozen=True)
+class ReglaChoque:
+    """Pareja de capas que no deben interpenetrarse.
+
+    Con `macizo=False` de la capa B sólo cuentan sus líneas y no el interior
+    de sus contornos: un contorno de ESTRUCTURA o MAMPAROS suele ser el límite
+    de un local y los equipos dentro de él no chocan con nada.
+    """
+
+    capa_a: str
+    capa_b: str
+    macizo: bool = True
+
+
+# Las reglas cuyas capas no existen en el plano se ignoran, así que una misma
+# lista sirve para los planos de autocad_integration_complete
+# ("integracion_completa") y para el longitudinal de la sala de máquinas
+# ("sala_maquinas"). En las vistas longitudinales los equipos de distintas
+# bandas se proyectan unos sobre otros, por eso no se cruzan equipos entre sí.
+REGLAS_POR_DEFECTO: Tuple[ReglaChoque, ...] = (
+    ReglaChoque("EQUIPOS", "ESTRUCTURA", macizo=False),
+    ReglaChoque("MAQUINAS", "ESTRUCTURA", macizo=False),
+    ReglaChoque("EQUIPOS", "MAMPAROS", macizo=False),
+    ReglaChoque("MAQUINAS", "MAMPAROS", macizo=False),
+    ReglaChoque("EQUIPOS", "MAQUINAS"),
+    ReglaChoque("EQUIPOS", "TANQUES"),
+    ReglaChoque("MAQUINAS", "TANQUES"),
+    ReglaChoque("MOTOR_PRINCIPAL", "ESTRUCTURA", macizo=False),
+    ReglaChoque("GENERADORES", "ESTRUCTURA", macizo=False),
+    ReglaChoque("MOTOR_PRINCIPAL", "TANQUES_DB"),
+    ReglaChoque("GENERADORES", "TANQUES_DB"),
+    ReglaChoque("EQUIPOS_AUX", "TANQUES_DB"),
+)
+
+Regla = Union[ReglaChoque, Tuple[str, str], Tuple[str, str, bool]]
+
+
+@dataclass
+class Forma:
+    """Entidad reducida a una polilínea plana (cerrada = contorno)."""
+
+    handle: str
+    capa: str
+    tipo: str
+    vertices: List["Vec2"]
+    cerrada: bool
+    caja: Caja
+    texto: bool = False
+
+    @property
+    def tramos(self) -> Iterator[Tuple["Vec2", "Vec2"]]:
+        v = self.vertices
+        extremos = zip(v, v[1:] + v[:1]) if self.cerrada else zip(v, v[1:])
+        return ((a, b) for a, b in extremos if not a.isclose(b))
+
+
+@dataclass
+class Interferencia:
+    """Defecto encontrado entre dos entidades.
+
+    `magnitud` es el área común (m²) entre contornos y entre textos, y la
+    longitud (m) de línea dentro del contorno o del texto o coincidente en los
+    demás casos.
+    """
+
+    tipo: str  # 'choque', 'duplicada', 'texto_sobre_geometria', 'texto_sobre_texto'
+    capa_a: str
+    handle_a: str
+    capa_b: str
+    handle_b: str
+    magnitud: float
+    punto: Tuple[float, float]
+
+
+@dataclass
+class InformeInterferencias:
+    """Interferencias de un plano."""
+
+    ruta: Optional[str]
+    entidades: int
+    interferencias: List[Interferencia] = field(default_factory=list)
+
+    def de_tipo(self, tipo: str) -> List[Interferencia]:
+        return [i for i in self.interferencias if i.tipo == tipo]
+
+    def resumen(self) -> Dict[str, int]:
+        """Número de interferencias por tipo."""
+        conteo: Dict[str, int] = defaultdict(int)
+        for i in self.interferencias:
+            conteo[i.tipo] += 1
+        return dict(conteo)
+
+    def a_dict(self) -> Dict[str, object]:
+        return {
+            "ruta": self.ruta,
+            "entidades": self.entidades,
+            "resumen": self.resumen(),
+            "interferencias": [asdict(i) for i in self.interferencias],
+        }
+
+
+def _caja(vertices: Sequence["Vec2"]) -> Caja:
+    xs = [v.x for v in vertices]
+    ys = [v.y for v in vertices]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _entidades_planas(entidades: Iterable, capa_bloque: Optional[str] = None) -> Iterator[Tuple[object, str, str]]:
+    """(entidad, capa, handle) con los INSERT explotados recursivamente."""
+    for e in entidades:
+        capa = e.dxf.layer
+        if capa_bloque is not None and capa == "0":
+            capa = capa_bloque
+        if e.dxftype() == "INSERT":
+            for sub, capa_sub, _ in _entidades_planas(e.virtual_entities(), capa):
+                yield sub, capa_sub, e.dxf.handle
+        else:
+            yield e, capa, e.dxf.handle or ""
+
+
+def extraer_formas(entidades: Iterable, tolerancia_m: float = 1e-3) -> List[Forma]:
+    """
+    Reduce las entidades a formas planas.
+
+    Args:
+        entidades: Entidades DXF (espacio modelo o lista)
+        tolerancia_m: Distancia máxima de aplanado de arcos y curvas (m)
+
+    Returns:
+        Lista de formas (las entidades sin geometría, como cotas, se omiten)
+    """
+    formas: List[Forma] = []
+    for e, capa, handle in _entidades_planas(entidades):
+        tipo = e.dxftype()
+        if tipo in TIPOS_TEXTO:
+            caja = ez_bbox.extents([e])
+            if not caja.has_data:
+                continue
+            (x0, y0), (x1, y1) = caja.extmin.vec2, caja.extmax.vec2
+            vertices = [Vec2(x0, y0), Vec2(x1, y0), Vec2(x1, y1), Vec2(x0, y1)]
+            formas.append(Forma(handle, capa, tipo, vertices, True, (x0, y0, x1, y1), texto=True))
+            continue
+        try:
+            trayectoria = ez_path.make_path(e)
+        except TypeError:
+            continue
+        for sub in trayectoria.sub_paths():
+            vertices = [Vec2(p) for p in sub.flattening(tolerancia_m)]
+            if len(vertices) < 2:
+                continue
+            cerrada = sub.is_closed and len(vertices) > 3
+            if cerrada:
+                vertices = vertices[:-1]
+                if abs(area(vertices)) <= tolerancia_m ** 2:
+                    cerrada = False
+                elif has_clockwise_orientation(vertices):
+                    vertices.reverse()
+            formas.append(Forma(handle, capa, tipo, vertices, cerrada, _caja(vertices)))
+    return formas
+
+
+def _cajas_se_tocan(a: Caja, b: Caja) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _longitud_dentro(contorno: Sequence["Vec2"], recorte, tramos: Iterable[Tuple["Vec2", "Vec2"]]) -> Tuple[float, Optional["Vec2"]]:
+    """Longitud de los tramos estrictamente dentro del contorno (los que van por el borde no cuentan)."""
+    total, punto = 0.0, None
+    for a, b in tramos:
+        for p, q in recorte.clip_line(a, b):
+            medio = p.lerp(q)
+            if is_point_in_polygon_2d(medio, contorno) == 1:
+                total += p.distance(q)
+                punto = punto or medio
+    return total, punto
+
+
+def _solape_colineal(a: "Vec2", b: "Vec2", c: "Vec2", d: "Vec2", tol: float) -> Tuple[float, Optional["Vec2"]]:
+    """Longitud y punto medio del tramo común de a-b y c-d si son colineales; (0, None) si no lo son o no se solapan."""
+    largo = a.distance(b)
+    u = (b - a) / largo
+    if abs(u.det(c - a)) > tol or abs(u.det(d - a)) > tol:
+        return 0.0, None
+    pc, pd = u.dot(c - a), u.dot(d - a)
+    desde, hasta = max(0.0, min(pc, pd)), min(largo, max(pc, pd))
+    if hasta - desde <= tol:
+        return 0.0, None
+    return hasta - desde, a + u * ((desde + hasta) / 2)
+
+
+class DetectorInterferencias:
+    """
+    Formas de un plano indexadas por capa en rejillas uniformes.
+
+    Args:
+        entidades: Entidades DXF (p. ej. `doc.modelspace()`)
+        celda_m: Lado de celda de los índices (None = mediana del lado mayor de las cajas)
+        tolerancia_m: Longitud mínima de un choque o duplicado y distancia máxima entre tramos colineales (m)
+        tolerancia_area_m2: Área mínima de un solape entre contornos (m²)
+    """
+
+    def __init__(
+        self,
+        entidades: Iterable,
+        celda_m: Optional[float] = None,
+        tolerancia_m: float = 1e-3,
+        tolerancia_area_m2: float = 1e-4,
+    ):
+        if ezdxf is None:
+            raise RuntimeError("ezdxf no disponible para analizar DXF")
+        self.tolerancia_m = tolerancia_m
+        self.tolerancia_area_m2 = tolerancia_area_m2
+        self.formas = extraer_formas(entidades, tolerancia_m)
+        if celda_m is None:
+            lados = [max(f.caja[2] - f.caja[0], f.caja[3] - f.caja[1]) for f in self.formas]
+            celda_m = max(statistics.median(lados), 10 * tolerancia_m) if lados else 1.0
+        self.celda_m = celda_m
+        self.por_capa: Dict[str, List[int]] = defaultdict(list)
+        self.indices: Dict[str, IndiceRejilla] = {}
+        self.textos: List[int] = []
+        self.indice_textos = IndiceRejilla(celda_m)
+        for i, forma in enumerate(self.formas):
+            if forma.texto:
+                self.textos.append(i)
+                self.indice_textos.insertar(i, forma.caja)
+            else:
+                self.por_capa[forma.capa].append(i)
+                self.indices.setdefault(forma.capa, IndiceRejilla(celda_m)).insertar(i, forma.caja)
+        self._recortes: Dict[int, object] = {}
+
+    def _recorte(self, i: int):
+        recorte = self._recortes.get(i)
+        if recorte is None:
+            vertices = self.formas[i].vertices
+            clase = ConvexClippingPolygon2d if is_convex_polygon_2d(vertices) else ConcaveClippingPolygon2d
+            recorte = self._recortes[i] = clase(vertices)
+        return recorte
+
+    def _interpenetracion(self, i: int, j: int, macizo: bool = True) -> Tuple[float, Optional["Vec2"]]:
+        """Área común (dos contornos) o longitud de línea dentro del contorno; (0, None) si no hay.
+
+        Con `macizo=False` la forma j cuenta sólo como líneas.
+        """
+        a, b = self.formas[i], self.formas[j]
+        if not macizo:
+            if not a.cerrada:
+                return 0.0, None
+            longitud, punto = _longitud_dentro(a.vertices, self._recorte(i), b.tramos)
+            return (longitud, punto) if longitud > self.tolerancia_m else (0.0, None)
+        if a.cerrada and b.cerrada:
+            if isinstance(self._recorte(i), ConvexClippingPolygon2d):
+                i, j, a, b = j, i, b, a
+            piezas = [p for p in self._recorte(j).clip_polygon(a.vertices) if len(p) > 2]
+            comun = float(sum(abs(area(p)) for p in piezas))
+            if comun <= self.tolerancia_area_m2:
+                return 0.0, None
+            return comun, Vec2.sum(piezas[0]) / len(piezas[0])
+        if b.cerrada:
+            i, j, a, b = j, i, b, a
+        if not a.cerrada:
+            return 0.0, None
+        longitud, punto = _longitud_dentro(a.vertices, self._recorte(i), b.tramos)
+        return (longitud, punto) if longitud > self.tolerancia_m else (0.0, None)
+
+    def _interferencia(self, tipo: str, i: int, j: int, magnitud: float, punto: "Vec2") -> Interferencia:
+        a, b = self.formas[i], self.formas[j]
+        return Interferencia(tipo, a.capa, a.handle, b.capa, b.handle, magnitud, (punto.x, punto.y))
+
+    def _vecinos(self, i: int, indice: IndiceRejilla) -> List[int]:
+        """Formas del índice cuya caja toca la de la forma i (sin incluirla)."""
+        caja = self.formas[i].caja
+        return sorted(j for j in indice.candidatos(caja) if j != i and _cajas_se_tocan(caja, self.formas[j].caja))
+
+    def choques(self, reglas: Iterable[Regla] = REGLAS_POR_DEFECTO) -> List[Interferencia]:
+        """
+        Interpenetraciones entre las capas de cada regla.
+
+        Args:
+            reglas: ReglaChoque o tuplas (capa_a, capa_b[, macizo]); con
+                capa_a == capa_b se comprueba la capa consigo misma
+
+        Returns:
+            Choques encontrados (uno por pareja de entidades)
+        """
+        resultado: List[Interferencia] = []
+        vistos = set()
+        for regla in reglas:
+            if not isinstance(regla, ReglaChoque):
+                regla = ReglaChoque(*regla)
+            indice_b = self.indices.get(regla.capa_b)
+            if indice_b is None:
+                continue
+            for i in self.por_capa.get(regla.capa_a, ()):
+                for j in self._vecinos(i, indice_b):
+                    par = (min(i, j), max(i, j))
+                    if par in vistos:
+                        continue
+                    vistos.add(par)
+                    magnitud, punto = self._interpenetracion(i, j, regla.macizo)
+                    if punto is not None:
+                        resultado.append(self._interferencia("choque", i, j, magnitud, punto))
+        return resultado
+
+    def duplicadas(self) -> List[Interferencia]:
+        """
+        Tramos coincidentes: colineales (a menos de la tolerancia) y solapados en más de la tolerancia.
+
+        Cada tramo se compara con los anteriores que comparten celda en un
+        índice de rejilla de tramos y se asigna al primero con el que se
+        solapa, así una línea repetida tres veces da dos duplicados y no tres.
+
+        Returns:
+            Una interferencia por pareja de entidades, con la longitud coincidente total
+        """
+        tol = self.tolerancia_m
+        indice = IndiceRejilla(self.celda_m)
+        tramos: List[Tuple[int, "Vec2", "Vec2", Caja]] = []
+        coincidente: Dict[Tuple[int, int], List] = {}
+        for i, forma in enumerate(self.formas):
+            if forma.texto:
+                continue
+            for a, b in forma.tramos:
+                caja = (min(a.x, b.x) - tol, min(a.y, b.y) - tol, max(a.x, b.x) + tol, max(a.y, b.y) + tol)
+                for k in sorted(indice.candidatos(caja)):
+                    j, c, d, caja_k = tramos[k]
+                    if not _cajas_se_tocan(caja, caja_k):
+                        continue
+                    longitud, punto = _solape_colineal(c, d, a, b, tol)
+                    if punto is not None:
+                        acumulado = coincidente.setdefault((j, i), [0.0, punto])
+                        acumulado[0] += longitud
+                        break
+                indice.insertar(len(tramos), caja)
+                tramos.append((i, a, b, caja))
+        return [self._interferencia("duplicada", j, i, longitud, punto) for (j, i), (longitud, punto) in coincidente.items()]
+
+    def textos_solapados(self) -> List[Interferencia]:
+        """
+        Textos atravesados por geometría (de cualquier capa) o solapados con otro texto.
+
+        Returns:
+            Interferencias 'texto_sobre_geometria' y 'texto_sobre_texto'
+        """
+        resultado: List[Interferencia] = []
+        for i in self.textos:
+            texto = self.formas[i]
+            recorte = self._recorte(i)
+            for indice in self.indices.values():
+                for j in self._vecinos(i, indice):
+                    longitud, punto = _longitud_dentro(texto.vertices, recorte, self.formas[j].tramos)
+                    if longitud > self.tolerancia_m:
+                        resultado.append(self._interferencia("texto_sobre_geometria", i, j, longitud, punto))
+            for j in self._vecinos(i, self.indice_textos):
+                if j > i:
+                    magnitud, punto = self._interpenetracion(i, j)
+                    if punto is not None:
+                        resultado.append(self._interferencia("texto_sobre_texto", i, j, magnitud, punto))
+        return resultado
+
+    def informe(
+        self,
+        reglas: Iterable[Regla] = REGLAS_POR_DEFECTO,
+        duplicadas: bool = True,
+        textos: bool = True,
+        ruta: Optional[str] = None,
+    ) -> InformeInterferencias:
+        """Informe con los choques de las reglas y, opcionalmente, duplicados y textos."""
+        interferencias = self.choques(reglas)
+        if duplicadas:
+            interferencias += self.duplicadas()
+        if textos:
+            interferencias += self.textos_solapados()
+        return InformeInterferencias(ruta, len(self.formas), interferencias)
+
+
+def detectar_interferencias(
+    dxf: Union[str, Path, object],
+    reglas: Iterable[Regla] = REGLAS_POR_DEFECTO,
+    celda_m: Optional[float] = None,
+    tolerancia_m: float = 1e-3,
+    tolerancia_area_m2: float = 1e-4,
+    duplicadas: bool = True,
+    textos: bool = True,
+) -> InformeInterferencias:
+    """
+    Detecta choques entre capas, tramos duplicados y textos solapados de un plano.
+
+    Args:
+        dxf: Ruta del DXF o documento ezdxf ya cargado
+        reglas: Reglas de choque (ReglaChoque o tuplas (capa_a, capa_b[, macizo]))
+        celda_m: Lado de celda de los índices de rejilla (None = automático)
+        tolerancia_m: Longitud mínima de un choque o duplicado (m)
+        tolerancia_area_m2: Área mínima de un solape entre contornos (m²)
+        duplicadas: Buscar tramos duplicados
+        textos: Buscar textos solapados
+
+    Returns:
+        InformeInterferencias
+    """
+    if ezdxf is None:
+        raise RuntimeError("ezdxf no disponible para analizar DXF")
+    ruta = None
+    if isinstance(dxf, (str, Path)):
+        ruta = str(dxf)
+        dxf = ezdxf.readfile(ruta)
+    detector = DetectorInterferencias(dxf.modelspace(), celda_m, tolerancia_m, tolerancia_area_m2)
+    return detector.informe(reglas, duplicadas, textos, ruta)
@@ -0,0 +1,66 @@
+"""Planificador de generación de planos y figuras en paralelo.
+
+Cada plano (DXF) o figura es una tarea independiente: una función de nivel
+de módulo que crea su propio documento y lo guarda. El planificador reparte
+las tareas en un pool de procesos y devuelve un dict {nombre: resultado} en
+el orden en que se añadieron, igual que la versión en serie.
+
+Las funciones y sus argumentos deben poder serializarse (pickle): funciones
+de módulo, rutas, números y dicts simples.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class TareaPlano:
+    """Una tarea: función(*args, **kwargs) -> resultado (normalmente una ruta)."""
+
+    nombre: str
+    funcion: Callable[..., Any]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class PlanificadorPlanos:
+    """Ejecuta tareas de generación de planos en serie o en un pool de procesos.
+
+    Ejemplo:
+        plan = PlanificadorPlanos()
+        plan.agregar("lines", crear_plano, "crear_plano_lineas", {"eslora": 30.0, ...})
+        rutas = plan.ejecutar()
+    """
+
+    def __init__(self, procesos: Optional[int] = None):
+        """
+        Args:
+            procesos: Procesos del pool (por defecto, núcleos disponibles);
+                1 ejecuta en serie en el proceso actual
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tareas: List[TareaPlano] = []
+
+    def agregar(self, nombre: str, funcion: Callable[..., Any], *args: Any, **kwargs: Any) -> "PlanificadorPlanos":
+        if any(t.nombre == nombre for t in self.tareas):
+            raise ValueError(f"Tarea duplicada: {nombre}")
+        self.tareas.append(TareaPlano(nombre, funcion, args, kwargs))
+        return self
+
+    def ejecutar(self) -> Dict[str, Any]:
+        """Ejecutar todas las tareas y devolver {nombre: resultado}.
+
+        Si una tarea falla se propaga su excepción (tras terminar las que ya
+        estaban en marcha).
+        """
+        n = min(self.procesos, len(self.tareas))
+        if n <= 1:
+            return {t.nombre: t.funcion(*t.args, **t.kwargs) for t in self.tareas}
+
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            futuros = {t.nombre: pool.submit(t.funcion, *t.args, **t.kwargs) for t in self.tareas}
+            return {nombre: futuro.result() for nombre, futuro in futuros.items()}
@@ -17,6 +17,8 @@ try:
 except Exception:  # pragma: no cover
     ezdxf = None  # type: ignore
 
+from maxsurf_integration.autocad_integration.plantillas import nuevo_documento
+
 
 class GeneradorPlanosNavales:
     """Integración AutoCAD con fallback DXF local (ezdxf) para macOS.
@@ -53,7 +55,7 @@ class GeneradorPlanosNavales:
         # Si no hay Maxsurf real, Crear DXF dummy con capa y texto
         if ezdxf is None:
             raise RuntimeError("ezdxf no disponible para generar DXF")
-        doc = ezdxf.new("R2010")
+        doc = nuevo_documento("naval")
         msp = doc.modelspace()
         msp.add_text(f"Vista {vista} exportada", dxfattribs={"height": 0.35})
         doc.saveas(dxf_path)
@@ -66,7 +68,7 @@ class GeneradorPlanosNavales:
         dxf_path = out_dir / "plano_construccion.dxf"
         if ezdxf is None:
             raise RuntimeError("ezdxf no disponible para generar DXF")
-        doc = ezdxf.new("R2010")
+        doc = nuevo_documento("naval")
         msp = doc.modelspace()
         # Perfil: cubierta y quilla
         self._crear_linea(msp, (0, 0), (eslora * escala, 0), layer="C-CUBIERTA")
@@ -79,52 +81,53 @@ class GeneradorPlanosNavales:
         return str(dxf_path)
 
     # -------- Plano de líneas (perfil, planta, sección maestra) --------
-    def crear_plano_lineas(self, eslora: float, manga: float, calado: float, escala: float = 1.0, out_dir: str | Path = "./salidas/autocad") -> str:
+    def crear_plano_lineas(
+        self,
+        eslora: float,
+        manga: float,
+        calado: float,
+        escala: float = 1.0,
+        out_dir: str | Path = "./salidas/autocad",
+        offsets: Any | None = None,
+        puntal: float | None = None,
+        curvas: str = "spline",
+        n_estaciones: int = 21,
+    ) -> str:
+        """Plano de formas (perfil, semimangas y caja de cuadernas) desde la superficie del casco.
+
+        Args:
+            offsets: `TablaOffsets` o `SuperficieBSpline`; por defecto, offsets
+                paramétricos con los coeficientes del buque de referencia
+            puntal: Altura hasta la que se trazan las secciones (por defecto 1.27·T,
+                la relación D/T del buque de referencia)
+            curvas: "spline" o "polilinea"
+            n_estaciones: Estaciones equiespaciadas entre perpendiculares
+        """
+        from maxsurf_integration.hull_design.offsets import TablaOffsets
+        from maxsurf_integration.hull_design.plano_lineas import MotorLineas, SuperficieBSpline
+
         out_dir = Path(out_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
         dxf_path = out_dir / "plano_lineas.dxf"
         if ezdxf is None:
             raise RuntimeError("ezdxf no disponible para generar DXF")
-        doc = ezdxf.new("R2010")
+        if offsets is None:
+            tabla = TablaOffsets.desde_parametros(
+                lpp_m=eslora, manga_m=manga, calado_diseno_m=calado, puntal_m=puntal or 1.27 * calado
+            )
+            try:
+                offsets = SuperficieBSpline.desde_offsets(tabla)
+            except ImportError:  # sin scipy: interpolación bilineal de la tabla
+                offsets = tabla
+        plano = MotorLineas(offsets).calcular(
+            estaciones=n_estaciones,
+            lineas_agua=[calado * f for f in (0.1, 0.25, 0.5, 0.75, 1.0)],
+            diagonales=[(0.9 * calado, 40.0), (0.6 * calado, 25.0)],
+        )
+
+        doc = nuevo_documento("naval")
         msp = doc.modelspace()
-        # Perfil: línea de flotación curva suave (parábola simple)
-        puntos_lf = []
-        for i in range(21):
-            x = (i / 20) * eslora * escala
-            y = calado * escala * (1 - ((x - (eslora * escala) / 2) / ((eslora * escala) / 2)) ** 2)
-            puntos_lf.append((x, y))
-        msp.add_lwpolyline(puntos_lf, dxfattribs={"layer": "C-LFLOT"})
-        # Líneas de agua adicionales (0.25T, 0.5T, 0.75T)
-        for frac in (0.25, 0.5, 0.75):
-            y = calado * escala * frac
-            self._crear_linea(msp, (0, y), (eslora * escala, y), layer="C-WATER")
-        # Planta: contorno elíptico simple
-        rx = (eslora * escala) / 2
-        ry = (manga * escala) / 2
-        msp.add_ellipse(center=(rx, 0), major_axis=(rx, 0), ratio=ry / rx if rx else 1.0, dxfattribs={"layer": "C-PLANTA"})
-        # Buttocks (±0.25B)
-        for sign in (-1, 1):
-            yb = sign * (manga * escala * 0.25)
-            self._crear_linea(msp, (0, yb), (eslora * escala, yb), layer="C-BUTT")
-        # Sección maestra: semielipse (polilínea) centrada en x = cx
-        cx = eslora * escala * 0.5
-        semi = []
-        for i in range(0, 181, 6):
-            ang = i * 3.14159265 / 180.0
-            px = cx + (manga * escala / 2.0) * ( (i - 90) / 90.0 ) * 0.0  # simplificación: eje vertical
-            py = (calado * escala) * ( (i) / 180.0 )
-            semi.append((px, py))
-        # Columna central para altura máxima (referencia)
-        self._crear_linea(msp, (cx, 0), (cx, calado * escala), layer="C-SECCION")
-        # Diagonales cruzadas alrededor de la sección
-        diag_w = manga * escala * 0.4
-        self._crear_linea(msp, (cx - diag_w, 0), (cx + diag_w, calado * escala), layer="C-DIAG")
-        self._crear_linea(msp, (cx - diag_w, calado * escala), (cx + diag_w, 0), layer="C-DIAG")
-        # Cuadernas como rejilla en perfil
-        for estacion in [i / 10 for i in range(11)]:
-            x = estacion * eslora * escala
-            self._crear_linea(msp, (x, -0.1 * escala), (x, calado * escala), layer="C-CUAD")
-        # Anotaciones básicas
+        plano.a_dxf(msp, escala=escala, curvas=curvas)
         try:
             msp.add_text(
                 f"Plano de Líneas (L={eslora}m, B={manga}m, T={calado}m)",
@@ -142,7 +145,7 @@ class GeneradorPlanosNavales:
         dxf_path = out_dir / "plano_cuadernas.dxf"
         if ezdxf is None:
             raise RuntimeError("ezdxf no disponible para generar DXF")
-        doc = ezdxf.new("R2010")
+        doc = nuevo_documento("naval")
         msp = doc.modelspace()
         # Rejilla de estaciones
         for i in range(n_estaciones):
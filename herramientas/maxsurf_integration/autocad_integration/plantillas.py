@@ -0,0 +1,168 @@
+"""Plantillas de documento DXF compartidas por los generadores de planos.
+
+Todos los planos parten del mismo documento canónico: R2010 en metros con
+los recursos estándar de ezdxf (tipos de línea, estilos de texto y de cota,
+`ezdxf.new(setup=True)`) más el juego de capas de su familia de planos.
+Las capas de cada familia se definen una sola vez en `CONJUNTOS_CAPAS`.
+
+Cada plantilla (conjunto de capas + versión DXF) se construye la primera vez
+que se pide, se serializa en memoria con pickle y los documentos siguientes
+son copias independientes obtenidas al deserializarla, bastante más rápido
+que repetir `ezdxf.new(setup=True)` y la creación de capas.
+
+Ejemplo:
+    doc = nuevo_documento("corte_transversal")
+    msp = doc.modelspace()
+"""
+
+from __future__ import annotations
+
+import pickle
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+try:
+    import ezdxf
+    from ezdxf import units as ez_units
+    from ezdxf.tools import juliandate
+except Exception:  # pragma: no cover
+    ezdxf = None  # type: ignore
+
+
+@dataclass(frozen=True)
+class EstiloCapa:
+    """Color ACI, tipo de línea y grosor (centésimas de mm; None = por defecto)."""
+
+    color: int = 7
+    tipo_linea: str = "Continuous"
+    grosor: Optional[int] = None
+
+
+def _capas(**capas: Union[int, Tuple]) -> Dict[str, EstiloCapa]:
+    return {
+        nombre: EstiloCapa(v) if isinstance(v, int) else EstiloCapa(*v)
+        for nombre, v in capas.items()
+    }
+
+
+# Capas por familia de planos (una única fuente de verdad)
+CONJUNTOS_CAPAS: Dict[str, Dict[str, EstiloCapa]] = {
+    # GeneradorPlanosNavales / ConfiguradorEstilos
+    "naval": _capas(**{
+        "C-CASC": 1, "C-CUAD": 2, "C-LFLOT": 3, "C-PERF": 4, "C-DIAG": 30, "C-COTA": 5,
+        "C-STR": 6, "C-REF": 7, "C-TEXT": 8, "C-SIMB": 9,
+    }),
+    # generar_corte_transversal_detallado
+    "corte_transversal": _capas(
+        CASCO_EXTERIOR=7, ESTRUCTURA_PRIMARIA=1, ESTRUCTURA_SECUNDARIA=3, MAMPAROS=5,
+        TANQUES=4, LINEA_AGUA=(6, "DASHED"), COTAS=2, TEXTO=8, EJES=(9, "CENTER"),
+    ),
+    # generar_plano_longitudinal_detallado
+    "sala_maquinas_detallado": _capas(
+        CASCO=(1, "Continuous", 50), ESTRUCTURA=(3, "Continuous", 35),
+        MAMPAROS=(3, "Continuous", 40), CUBIERTAS=(4, "Continuous", 30),
+        REFUERZOS=(5, "Continuous", 18), EJE_PROPULSOR=(1, "CENTER", 35),
+        HELICE=(2, "Continuous", 40), TIMON=(6, "Continuous", 35), BOCINA=(5, "Continuous", 25),
+        MOTOR_PRINCIPAL=(2, "Continuous", 40), FUNDACION_MOTOR=(9, "Continuous", 25),
+        GENERADORES=(6, "Continuous", 30), EQUIPOS_AUX=(5, "Continuous", 20),
+        DOBLE_FONDO=(30, "Continuous", 25), TANQUES_SERVICIO=(40, "DASHED", 20),
+        TANQUES_WING=(40, "DASHED", 18), TUBERIAS=(4, "DASHED", 13),
+        VENTILACION=(6, "DASHED", 13), TEXTOS=(1, "Continuous", 13), COTAS=(1, "Continuous", 13),
+        LEYENDA=(1, "Continuous", 13), EJES=(9, "CENTER", 13),
+        SECCION_TRANSVERSAL=(1, "Continuous", 25),
+    ),
+    # generar_plano_longitudinal_sala_maquinas
+    "sala_maquinas": _capas(
+        CASCO=1, ESTRUCTURA=3, CUBIERTAS=4, MOTOR_PRINCIPAL=2, GENERADORES=6, EQUIPOS_AUX=5,
+        TANQUES_DB=30, TANQUES_WING=40, TEXTOS=0, COTAS=0, LEYENDA=0, EJES=8,
+    ),
+    # generar_vista_camara_maquinas
+    "camara_multivista": _capas(
+        CASCO=1, ESTRUCTURA=2, TANQUES=3, EQUIPOS=4, TEXTOS=7, DIMENSIONES=140, LEYENDA=30,
+    ),
+    # autocad_integration_complete.AutoCADIntegration
+    "integracion_completa": _capas(
+        EJES=1, ESTRUCTURA=2, MAQUINAS=3, TANQUES=4, MAMPAROS=5, CUBIERTAS=6, COTAS=7,
+        TEXTO=8, EQUIPOS=9,
+    ),
+    # workflows.cad_pipeline.build_dxf_from_cad_systems
+    "cad_pipeline": _capas(
+        CASCO=1, ESTRUCTURA=3, MAQUINAS=2, TANQUES=6, EQUIPOS=5, TEXTOS=4, COTAS=7,
+    ),
+}
+
+
+class CachePlantillas:
+    """Plantillas DXF serializadas por (conjunto de capas, versión DXF)."""
+
+    def __init__(self):
+        self._serializadas: Dict[tuple, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._serializadas)
+
+    def limpiar(self) -> None:
+        self._serializadas.clear()
+
+    @staticmethod
+    def construir(capas: Mapping[str, EstiloCapa], dxfversion: str = "R2010"):
+        """Construir desde cero el documento canónico con las capas dadas."""
+        if ezdxf is None:
+            raise RuntimeError("ezdxf no disponible para generar DXF")
+        doc = ezdxf.new(dxfversion, setup=True)
+        doc.units = ez_units.M
+        doc.header["$INSUNITS"] = ez_units.M
+        doc.header["$MEASUREMENT"] = 1
+        for nombre, estilo in capas.items():
+            capa = doc.layers.add(nombre, color=estilo.color)
+            if estilo.tipo_linea in doc.linetypes:
+                capa.dxf.linetype = estilo.tipo_linea
+            if estilo.grosor is not None:
+                capa.dxf.lineweight = estilo.grosor
+        return doc
+
+    def documento(
+        self,
+        conjunto: Optional[str] = None,
+        capas: Optional[Mapping[str, EstiloCapa]] = None,
+        dxfversion: str = "R2010",
+    ):
+        """
+        Documento nuevo copiado de la plantilla (construida en la primera llamada).
+
+        Args:
+            conjunto: Nombre en `CONJUNTOS_CAPAS` (None = sin capas propias)
+            capas: Capas adicionales {nombre: EstiloCapa} (prevalecen sobre el conjunto)
+            dxfversion: Versión DXF
+
+        Returns:
+            ezdxf Drawing independiente
+        """
+        if conjunto is not None and conjunto not in CONJUNTOS_CAPAS:
+            raise KeyError(f"Conjunto de capas desconocido: {conjunto}")
+        todas = dict(CONJUNTOS_CAPAS.get(conjunto, {}))
+        todas.update(capas or {})
+        clave = (dxfversion, tuple(sorted(todas.items())))
+        datos = self._serializadas.get(clave)
+        if datos is None:
+            datos = pickle.dumps(self.construir(todas, dxfversion), protocol=pickle.HIGHEST_PROTOCOL)
+            self._serializadas[clave] = datos
+        doc = pickle.loads(datos)
+        # Metadatos propios de cada documento, como en ezdxf.new()
+        doc.header["$TDCREATE"] = juliandate(datetime.now())
+        doc.reset_fingerprint_guid()
+        doc.reset_version_guid()
+        return doc
+
+
+CACHE = CachePlantillas()
+
+
+def nuevo_documento(
+    conjunto: Optional[str] = None,
+    capas: Optional[Mapping[str, EstiloCapa]] = None,
+    dxfversion: str = "R2010",
+):
+    """Documento DXF canónico (metros, recursos estándar y capas del conjunto) desde la caché."""
+    return CACHE.documento(conjunto, capas, dxfversion)
@@ -1,4 +1,20 @@
 """Hull Design Module"""
 from .hull_designer import HullDesigner
+from .offsets import TablaOffsets
+from .plano_lineas import MotorLineas, PlanoLineas, SuperficieBSpline
+from .resistencia import ModeloResistencia, ParametrosCasco, resistencia_holtrop
+from .helice import ResultadoHelice, SelectorHelice, coeficientes_kt_kq
 
-__all__ = ['HullDesigner']
+__all__ = [
+    'HullDesigner',
+    'TablaOffsets',
+    'MotorLineas',
+    'PlanoLineas',
+    'SuperficieBSpline',
+    'ModeloResistencia',
+    'ParametrosCasco',
+    'resistencia_holtrop',
+    'ResultadoHelice',
+    'SelectorHelice',
+    'coeficientes_kt_kq',
+]
@@ -0,0 +1,270 @@
+"""
+Selección de hélice (serie B de Wageningen)
+===========================================
+
+Polinomios KT y KQ de la serie B (Oosterveld y van Oossanen, 1975; Rn =
+2·10⁶, sin corrección por Reynolds):
+
+    KT = Σ C_i · J^s_i · (P/D)^t_i · (AE/A0)^u_i · Z^v_i     (39 términos)
+    KQ = Σ C_i · J^s_i · (P/D)^t_i · (AE/A0)^u_i · Z^v_i     (47 términos)
+
+Los coeficientes se agrupan en un tensor (s, t, u, v) y toda la malla
+(diámetro × P/D × AE/A0 × palas × rpm) se evalúa con un único `einsum`
+sobre las potencias de cada eje, sin bucles por candidato.
+
+El empuje necesario sale del modelo de resistencia (RT / (1 − t)) y la
+velocidad de avance de la estela (Va = V · (1 − w)). La cavitación se
+comprueba con el criterio de Keller:
+
+    (AE/A0)_min = (1.3 + 0.3·Z) · T / ((p0 − pv) · D²) + k
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .resistencia import KN_A_MS, RHO_AGUA_MAR, GRAVEDAD, ModeloResistencia, ParametrosCasco
+
+# (C, s, t, u, v): J^s · (P/D)^t · (AE/A0)^u · Z^v
+_TERMINOS_KT = (
+    (0.00880496, 0, 0, 0, 0), (-0.204554, 1, 0, 0, 0), (0.166351, 0, 1, 0, 0),
+    (0.158114, 0, 2, 0, 0), (-0.147581, 2, 0, 1, 0), (-0.481497, 1, 1, 1, 0),
+    (0.415437, 0, 2, 1, 0), (0.0144043, 0, 0, 0, 1), (-0.0530054, 2, 0, 0, 1),
+    (0.0143481, 0, 1, 0, 1), (0.0606826, 1, 1, 0, 1), (-0.0125894, 0, 0, 1, 1),
+    (0.0109689, 1, 0, 1, 1), (-0.133698, 0, 3, 0, 0), (0.00638407, 0, 6, 0, 0),
+    (-0.00132718, 2, 6, 0, 0), (0.168496, 3, 0, 1, 0), (-0.0507214, 0, 0, 2, 0),
+    (0.0854559, 2, 0, 2, 0), (-0.0504475, 3, 0, 2, 0), (0.010465, 1, 6, 2, 0),
+    (-0.00648272, 2, 6, 2, 0), (-0.00841728, 0, 3, 0, 1), (0.0168424, 1, 3, 0, 1),
+    (-0.00102296, 3, 3, 0, 1), (-0.0317791, 0, 3, 1, 1), (0.018604, 1, 0, 2, 1),
+    (-0.00410798, 0, 2, 2, 1), (-0.000606848, 0, 0, 0, 2), (-0.0049819, 1, 0, 0, 2),
+    (0.0025983, 2, 0, 0, 2), (-0.000560528, 3, 0, 0, 2), (-0.00163652, 1, 2, 0, 2),
+    (-0.000328787, 1, 6, 0, 2), (0.000116502, 2, 6, 0, 2), (0.000690904, 0, 0, 1, 2),
+    (0.00421749, 0, 3, 1, 2), (0.0000565229, 3, 6, 1, 2), (-0.00146564, 0, 3, 2, 2),
+)
+_TERMINOS_KQ = (
+    (0.00379368, 0, 0, 0, 0), (0.00886523, 2, 0, 0, 0), (-0.032241, 1, 1, 0, 0),
+    (0.00344778, 0, 2, 0, 0), (-0.0408811, 0, 1, 1, 0), (-0.108009, 1, 1, 1, 0),
+    (-0.0885381, 2, 1, 1, 0), (0.188561, 0, 2, 1, 0), (-0.00370871, 1, 0, 0, 1),
+    (0.00513696, 0, 1, 0, 1), (0.0209449, 1, 1, 0, 1), (0.00474319, 2, 1, 0, 1),
+    (-0.00723408, 2, 0, 1, 1), (0.00438388, 1, 1, 1, 1), (-0.0269403, 0, 2, 1, 1),
+    (0.0558082, 3, 0, 1, 0), (0.0161886, 0, 3, 1, 0), (0.00318086, 1, 3, 1, 0),
+    (0.015896, 0, 0, 2, 0), (0.0471729, 1, 0, 2, 0), (0.0196283, 3, 0, 2, 0),
+    (-0.0502782, 0, 1, 2, 0), (-0.030055, 3, 1, 2, 0), (0.0417122, 2, 2, 2, 0),
+    (-0.0397722, 0, 3, 2, 0), (-0.00350024, 0, 6, 2, 0), (-0.0106854, 3, 0, 0, 1),
+    (0.00110903, 3, 3, 0, 1), (-0.000313912, 0, 6, 0, 1), (0.0035985, 3, 0, 1, 1),
+    (-0.00142121, 0, 6, 1, 1), (-0.00383637, 1, 0, 2, 1), (0.0126803, 0, 2, 2, 1),
+    (-0.00318278, 2, 3, 2, 1), (0.00334268, 0, 6, 2, 1), (-0.00183491, 1, 1, 0, 2),
+    (0.000112451, 3, 2, 0, 2), (-0.0000297228, 3, 6, 0, 2), (0.000269551, 1, 0, 1, 2),
+    (0.00083265, 2, 0, 1, 2), (0.00155334, 0, 2, 1, 2), (0.000302683, 0, 6, 1, 2),
+    (-0.0001843, 0, 0, 2, 2), (-0.000425399, 0, 3, 2, 2), (0.0000869243, 3, 3, 2, 2),
+    (-0.0004659, 0, 6, 2, 2), (0.0000554194, 1, 6, 2, 2),
+)
+
+PRESION_ATMOSFERICA_PA = 101325.0
+PRESION_VAPOR_PA = 1700.0  # agua de mar a 15 °C
+
+
+def _tensor(terminos) -> np.ndarray:
+    k = np.zeros((4, 7, 3, 3))
+    for c, s, t, u, v in terminos:
+        k[s, t, u, v] += c
+    return k
+
+
+_K_KT = _tensor(_TERMINOS_KT)
+_K_KQ = _tensor(_TERMINOS_KQ)
+
+
+def _potencias(x, n: int) -> np.ndarray:
+    """Array (n, *x.shape) con x⁰ … x^(n-1)."""
+    x = np.asarray(x, dtype=float)
+    return x[None, ...] ** np.arange(n).reshape((n,) + (1,) * x.ndim)
+
+
+def coeficientes_kt_kq(j, paso_diametro, area_expandida, palas) -> Dict[str, np.ndarray]:
+    """
+    KT, KQ y η0 de la serie B para entradas con broadcasting.
+
+    Args:
+        j: Grado de avance J = Va / (n·D)
+        paso_diametro: P/D
+        area_expandida: AE/A0
+        palas: Número de palas Z
+
+    Returns:
+        Dict con 'kt', 'kq' y 'eta_0'
+    """
+    j, p, a, z = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (j, paso_diametro, area_expandida, palas)))
+    jp, pp, ap, zp = _potencias(j, 4), _potencias(p, 7), _potencias(a, 3), _potencias(z, 3)
+    kt = np.einsum("stuv,s...,t...,u...,v...->...", _K_KT, jp, pp, ap, zp, optimize=True)
+    kq = np.einsum("stuv,s...,t...,u...,v...->...", _K_KQ, jp, pp, ap, zp, optimize=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = np.where((kt > 0) & (kq > 0), j * kt / (2.0 * np.pi * kq), 0.0)
+    return {"kt": kt, "kq": kq, "eta_0": eta}
+
+
+@dataclass
+class ResultadoHelice:
+    """Hélice seleccionada y alternativas."""
+
+    helice: Dict[str, float]
+    alternativas: pd.DataFrame
+    n_evaluadas: int
+    n_factibles: int
+
+
+class SelectorHelice:
+    """
+    Búsqueda de la hélice B-series de máximo rendimiento para un motor.
+
+    Ejemplo:
+        selector = SelectorHelice.desde_motor("MAN_6S50ME-C")
+        res = selector.seleccionar(14.5)
+        res.helice['diametro_m'], res.helice['eta_0']
+    """
+
+    def __init__(
+        self,
+        potencia_motor_kw: float,
+        rpm_motor: float,
+        modelo: Optional[ModeloResistencia] = None,
+        fraccion_potencia: float = 0.90,
+        eta_transmision: float = 0.98,
+        margen_empuje: float = 0.15,
+        diametro_max_m: Optional[float] = None,
+        inmersion_eje_m: Optional[float] = None,
+        k_keller: float = 0.2,
+    ):
+        """
+        Args:
+            potencia_motor_kw: Potencia MCR del motor
+            rpm_motor: rpm a MCR (accionamiento directo)
+            modelo: Modelo de resistencia (por defecto, Buque 9 de
+                datos_buque_correctos)
+            fraccion_potencia: Fracción de MCR en el punto de diseño
+            eta_transmision: Rendimiento de la línea de ejes
+            margen_empuje: Margen de mar sobre el empuje necesario
+            diametro_max_m: Diámetro máximo (por defecto 0.75·T)
+            inmersion_eje_m: Inmersión del eje (por defecto T − 0.55·D)
+            k_keller: Constante de Keller (0.2 una hélice, 0.1 dos hélices)
+        """
+        self.modelo = modelo or ModeloResistencia(ParametrosCasco.desde_datos_buque())
+        self.potencia_motor_kw = potencia_motor_kw
+        self.rpm_motor = rpm_motor
+        self.fraccion_potencia = fraccion_potencia
+        self.eta_transmision = eta_transmision
+        self.margen_empuje = margen_empuje
+        calado = float(np.asarray(self.modelo.casco.calado_m))
+        self.calado_m = calado
+        self.diametro_max_m = diametro_max_m or 0.75 * calado
+        self.inmersion_eje_m = inmersion_eje_m
+        self.k_keller = k_keller
+
+    @classmethod
+    def desde_motor(cls, clave: str = "MAN_6S50ME-C", **kwargs) -> "SelectorHelice":
+        """Motor de `integracion_autocad_motores.ENGINE_LIBRARY`."""
+        from integracion_autocad_motores import ENGINE_LIBRARY
+        motor = ENGINE_LIBRARY[clave]
+        return cls(motor.power_kw, motor.rpm, **kwargs)
+
+    def seleccionar(
+        self,
+        velocidad_kn: float,
+        diametros_m: Optional[Sequence[float]] = None,
+        pasos_diametro: Optional[Sequence[float]] = None,
+        areas_expandidas: Optional[Sequence[float]] = None,
+        palas: Sequence[int] = (3, 4, 5, 6),
+        rpms: Optional[Sequence[float]] = None,
+        tolerancia_empuje: float = 0.05,
+        n_alternativas: int = 10,
+    ) -> ResultadoHelice:
+        """
+        Evaluar la malla completa y elegir la hélice de máximo η0.
+
+        Factibles: empuje entre el necesario y (1 + tolerancia) veces el
+        necesario, potencia entregada dentro de la disponible a esas rpm
+        (proporcional a las rpm) y AE/A0 ≥ mínimo de Keller.
+
+        Args:
+            velocidad_kn: Velocidad de proyecto
+            diametros_m, pasos_diametro, areas_expandidas, palas, rpms: Ejes
+                de la malla (por defecto 0.5·T–D máx., 0.5–1.4, 0.30–1.05,
+                3–6 palas y 85–100% de las rpm del motor)
+            tolerancia_empuje: Exceso admisible de empuje
+            n_alternativas: Filas de la tabla de alternativas
+
+        Returns:
+            ResultadoHelice
+        """
+        d = np.asarray(diametros_m if diametros_m is not None
+                       else np.linspace(0.5 * self.calado_m, self.diametro_max_m, 40), dtype=float)
+        pd_ = np.asarray(pasos_diametro if pasos_diametro is not None else np.linspace(0.5, 1.4, 46), dtype=float)
+        ae = np.asarray(areas_expandidas if areas_expandidas is not None else np.linspace(0.30, 1.05, 16), dtype=float)
+        z = np.asarray(palas, dtype=float)
+        rpm = np.asarray(rpms if rpms is not None else self.rpm_motor * np.linspace(0.85, 1.0, 16), dtype=float)
+
+        r = self.modelo.potencia(velocidad_kn)
+        rt = float(r["rt_kn"])
+        empuje_req = rt * (1.0 + self.margen_empuje) / (1.0 - float(r["deduccion_empuje"]))
+        va = velocidad_kn * KN_A_MS * (1.0 - float(r["estela"]))
+        rho = RHO_AGUA_MAR * 1000.0
+        n = rpm / 60.0
+
+        # Malla (D, P/D, AE/A0, Z, rpm): J depende de D y rpm
+        j = va / (n[None, :] * d[:, None])  # (D, rpm)
+        jp = _potencias(j, 4)
+        pp, ap, zp = _potencias(pd_, 7), _potencias(ae, 3), _potencias(z, 3)
+        kt = np.einsum("stuv,sdr,tp,ua,vz->dpazr", _K_KT, jp, pp, ap, zp, optimize=True)
+        kq = np.einsum("stuv,sdr,tp,ua,vz->dpazr", _K_KQ, jp, pp, ap, zp, optimize=True)
+
+        D = d[:, None, None, None, None]
+        N = n[None, None, None, None, :]
+        J = j[:, None, None, None, :]
+        empuje = kt * rho * N**2 * D**4 / 1000.0  # kN
+        potencia_entregada = 2.0 * np.pi * N * kq * rho * N**2 * D**5 / 1000.0  # kW
+        disponible = self.potencia_motor_kw * self.fraccion_potencia * (N / (self.rpm_motor / 60.0)) * self.eta_transmision
+
+        inmersion = self.inmersion_eje_m if self.inmersion_eje_m is not None else self.calado_m - 0.55 * D
+        p0 = PRESION_ATMOSFERICA_PA + rho * GRAVEDAD * inmersion
+        Z = z[None, None, None, :, None]
+        ae_keller = (1.3 + 0.3 * Z) * empuje * 1000.0 / ((p0 - PRESION_VAPOR_PA) * D**2) + self.k_keller
+        AE = ae[None, None, :, None, None]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eta = np.where((kt > 0) & (kq > 0), J * kt / (2.0 * np.pi * kq), 0.0)
+        factible = (
+            (empuje >= empuje_req) & (empuje <= empuje_req * (1.0 + tolerancia_empuje))
+            & (potencia_entregada <= disponible) & (AE >= ae_keller) & (kq > 0)
+        )
+        puntuacion = np.where(factible, eta, -np.inf)
+        n_factibles = int(factible.sum())
+
+        orden = np.argsort(puntuacion, axis=None)[::-1][:max(1, n_alternativas)]
+        orden = orden[np.isfinite(puntuacion.ravel()[orden])]
+        idx = np.unravel_index(orden, kt.shape)
+        eta_h, eta_r = float(r["eta_h"]), float(r["eta_r"])
+        bc = lambda x: np.broadcast_to(x, kt.shape)[idx]  # noqa: E731
+        alternativas = pd.DataFrame({
+            "diametro_m": d[idx[0]],
+            "paso_diametro": pd_[idx[1]],
+            "area_expandida": ae[idx[2]],
+            "palas": z[idx[3]].astype(int),
+            "rpm": rpm[idx[4]],
+            "j": j[idx[0], idx[4]],
+            "kt": kt[idx],
+            "kq": kq[idx],
+            "eta_0": eta[idx],
+            "eta_d": eta[idx] * eta_h * eta_r,
+            "empuje_kn": empuje[idx],
+            "empuje_necesario_kn": empuje_req,
+            "potencia_entregada_kw": potencia_entregada[idx],
+            "potencia_freno_kw": potencia_entregada[idx] / self.eta_transmision,
+            "ae_a0_keller": bc(ae_keller),
+            "cumple_cavitacion": ae[idx[2]] >= bc(ae_keller),
+        })
+        helice = alternativas.iloc[0].to_dict() if len(alternativas) else {}
+        return ResultadoHelice(helice, alternativas, int(kt.size), n_factibles)
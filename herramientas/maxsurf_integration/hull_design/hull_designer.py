@@ -9,7 +9,7 @@ Características:
     - Creación de cascos paramétricos
     - Modificación de dimensiones principales
     - Cálculo de coeficientes de forma
-    - Optimización de formas
+    - Optimización de formas (resistencia Holtrop–Mennen)
 """
 
 import logging
@@ -17,6 +17,10 @@ from typing import Dict, List, Optional, Tuple
 import json
 from pathlib import Path
 
+import numpy as np
+
+from .resistencia import ModeloResistencia, ParametrosCasco
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +41,7 @@ class HullDesigner:
         """
         self.maxsurf = maxsurf_connector
         self.parametros_actuales = {}
+        self.resultado_velocidad: Dict[str, float] = {}
         
         logger.info("🚢 Hull Designer inicializado")
     
@@ -251,12 +256,27 @@ class HullDesigner:
             logger.error(f"❌ Error modificando dimensión: {e}")
             return False
     
-    def optimizar_para_velocidad(self, velocidad_objetivo: float) -> bool:
+    def optimizar_para_velocidad(
+        self,
+        velocidad_objetivo: float,
+        potencia_disponible_kw: Optional[float] = None,
+        variacion: float = 0.08,
+        n_variantes: int = 61,
+    ) -> bool:
         """
         Optimizar forma del casco para velocidad objetivo.
         
+        Busca, a desplazamiento y calado constantes, la combinación de
+        eslora, manga y Cb (dentro de ±variacion de la eslora y la manga
+        actuales) con menor potencia al freno Holtrop–Mennen a la velocidad
+        objetivo. Todas las variantes se evalúan en un solo lote.
+        
         Args:
             velocidad_objetivo: Velocidad en nudos
+            potencia_disponible_kw: Potencia al freno disponible; si la
+                mejor variante la supera no se modifica el casco
+            variacion: Variación relativa admisible de eslora y manga
+            n_variantes: Puntos de la malla en eslora y en Cb
             
         Returns:
             bool: True si se optimizó correctamente
@@ -264,10 +284,55 @@ class HullDesigner:
         logger.info(f"🚀 Optimizando para velocidad: {velocidad_objetivo} kn")
         
         try:
-            # Implementar lógica de optimización
-            # Esto requiere análisis iterativo de resistencia
-            logger.warning("⚠️  Optimización de velocidad en desarrollo")
-            return False
+            p = self.parametros_actuales
+            lpp = p.get('Lpp', p.get('LOA', 97.7) * 0.97 if 'LOA' in p else 96.2)
+            manga, calado, cb = p.get('beam', 14.3), p.get('draft', 5.8), p.get('Cb', 0.703)
+            volumen = cb * lpp * manga * calado
+            
+            # Malla eslora × Cb; la manga resulta del desplazamiento constante
+            eslora = lpp * np.linspace(1 - variacion, 1 + variacion, n_variantes)[:, None]
+            cbs = np.linspace(max(0.5, cb - 0.08), min(0.85, cb + 0.08), n_variantes)[None, :]
+            mangas = volumen / (cbs * eslora * calado)
+            casco = ParametrosCasco(lpp_m=eslora, manga_m=mangas, calado_m=calado, cb=cbs)
+            pb = ModeloResistencia(casco).potencia_freno_kw(velocidad_objetivo)
+            pb = np.where(np.abs(mangas / manga - 1.0) <= variacion, pb, np.inf)
+            
+            i, j = np.unravel_index(np.argmin(pb), pb.shape)
+            pb_actual = float(ModeloResistencia(
+                ParametrosCasco(lpp_m=lpp, manga_m=manga, calado_m=calado, cb=cb)
+            ).potencia_freno_kw(velocidad_objetivo))
+            self.resultado_velocidad = {
+                'velocidad_kn': velocidad_objetivo,
+                'potencia_inicial_kw': pb_actual,
+                'potencia_optima_kw': float(pb[i, j]),
+                'Lpp': float(eslora[i, 0]),
+                'beam': float(mangas[i, j]),
+                'Cb': float(cbs[0, j]),
+            }
+            logger.info(
+                f"   Pb {pb_actual:.0f} kW → {pb[i, j]:.0f} kW "
+                f"(Lpp={eslora[i, 0]:.2f} m, B={mangas[i, j]:.2f} m, Cb={cbs[0, j]:.3f})"
+            )
+            if potencia_disponible_kw is not None and pb[i, j] > potencia_disponible_kw:
+                logger.warning(
+                    f"⚠️  Potencia necesaria {pb[i, j]:.0f} kW > disponible {potencia_disponible_kw:.0f} kW"
+                )
+                return False
+            
+            nuevos = {
+                **p,
+                'Lpp': round(float(eslora[i, 0]), 3),
+                'beam': round(float(mangas[i, j]), 3),
+                'draft': calado,
+                'Cb': round(float(cbs[0, j]), 4),
+            }
+            nuevos['LOA'] = round(p.get('LOA', lpp / 0.97) * nuevos['Lpp'] / lpp, 3)
+            nuevos.pop('Cp', None)
+            self._set_principal_dimensions(nuevos)
+            self._adjust_hull_form(nuevos)
+            self.parametros_actuales = nuevos
+            logger.info("✅ Casco optimizado para la velocidad objetivo")
+            return True
         except Exception as e:
             logger.error(f"❌ Error en optimización: {e}")
             return False
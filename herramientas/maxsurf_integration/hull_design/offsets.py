@@ -0,0 +1,173 @@
+"""
+Tabla de offsets del casco
+==========================
+
+Semimangas de trazado tabuladas por estación (x desde la PP de popa) y
+línea de agua (z desde la línea base). Puede leerse de una exportación de
+Maxsurf en CSV o generarse de forma paramétrica a partir de las dimensiones
+principales cuando no se dispone del modelo.
+
+Forma paramétrica:
+
+    y(x, z) = B/2 · w(x, z) · s(z)
+    s(z)    = sección maestra: fondo plano, pantoque de radio R y costado vertical
+    w(x, z) = 1 − |2x/L − 1|^p(z),     p = c / (1 − c)
+    c(z)    = c0 + (Cwp − c0) · z/T    (z ≤ T)
+
+La sección maestra tiene coeficiente Cm (R² = (1 − Cm)·B·T / (2·(1 − π/4))),
+la flotación de proyecto reproduce Cwp y c0 se elige para que el volumen a
+calado de proyecto reproduzca Cb; las líneas de agua bajas son más finas, de
+modo que las secciones de los extremos se afinan hacia la quilla. Por encima
+del calado de proyecto el costado es vertical.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class TablaOffsets:
+    """Semimangas (estaciones × líneas de agua) del casco."""
+
+    x_m: np.ndarray
+    z_m: np.ndarray
+    semimanga_m: np.ndarray
+
+    def __post_init__(self):
+        self.x_m = np.asarray(self.x_m, dtype=float)
+        self.z_m = np.asarray(self.z_m, dtype=float)
+        self.semimanga_m = np.asarray(self.semimanga_m, dtype=float)
+        if self.semimanga_m.shape != (len(self.x_m), len(self.z_m)):
+            raise ValueError(
+                f"semimanga_m debe tener forma {(len(self.x_m), len(self.z_m))}, "
+                f"recibida {self.semimanga_m.shape}"
+            )
+
+    @property
+    def lpp_m(self) -> float:
+        return float(self.x_m[-1] - self.x_m[0])
+
+    @classmethod
+    def desde_parametros(
+        cls,
+        lpp_m: float = 105.2,
+        manga_m: float = 15.99,
+        calado_diseno_m: float = 6.20,
+        puntal_m: float = 7.90,
+        cb: float = 0.7252,
+        cwp: float = 0.879,
+        cm: float = 0.98,
+        n_estaciones: int = 41,
+        n_lineas: int = 80,
+    ) -> "TablaOffsets":
+        """
+        Generar offsets paramétricos desde dimensiones principales.
+
+        Args:
+            lpp_m: Eslora entre perpendiculares (m)
+            manga_m: Manga de trazado (m)
+            calado_diseno_m: Calado al que corresponden Cb y Cwp (m)
+            puntal_m: Puntal; última línea de agua (m)
+            cb: Coeficiente de bloque a calado de proyecto
+            cwp: Coeficiente de flotación a calado de proyecto
+            cm: Coeficiente de la sección maestra (fija el radio del pantoque)
+            n_estaciones: Número de estaciones entre PP
+            n_lineas: Número de líneas de agua entre base y cubierta
+
+        Returns:
+            TablaOffsets
+        """
+        radio = cls.radio_pantoque(manga_m, calado_diseno_m, cm)
+        if radio > min(0.5 * manga_m, calado_diseno_m):
+            raise ValueError("Cm demasiado bajo: el pantoque no cabe en la sección")
+        x = np.linspace(0.0, lpp_m, n_estaciones)
+        z = np.linspace(0.0, puntal_m, n_lineas)
+
+        # c0 tal que Cb = mean(s·c) bajo la flotación de proyecto (c lineal en z)
+        zt = (np.arange(2000) + 0.5) / 2000 * calado_diseno_m
+        st = cls._seccion_maestra(zt, manga_m, radio)
+        i0 = st.mean()
+        i1 = (st * zt).mean() / calado_diseno_m
+        c0 = (cb - cwp * i1) / (i0 - i1)
+        if not 0.0 < c0 <= cwp:
+            raise ValueError(
+                f"Cb = {cb} no es alcanzable con Cwp = {cwp} y Cm = {cm} (c0 = {c0:.3f})"
+            )
+
+        c = c0 + (cwp - c0) * np.minimum(z / calado_diseno_m, 1.0)
+        p = c / (1.0 - c)
+        w = 1.0 - np.abs(2.0 * x[:, None] / lpp_m - 1.0) ** p[None, :]
+        s = cls._seccion_maestra(z, manga_m, radio)
+        return cls(x_m=x, z_m=z, semimanga_m=0.5 * manga_m * w * s[None, :])
+
+    @staticmethod
+    def radio_pantoque(manga_m: float, calado_m: float, cm: float) -> float:
+        """Radio del pantoque (m) de la sección maestra con coeficiente Cm."""
+        return float(np.sqrt(max(1.0 - cm, 0.0) * manga_m * calado_m / (2.0 * (1.0 - np.pi / 4.0))))
+
+    @staticmethod
+    def _seccion_maestra(z: np.ndarray, manga_m: float, radio: float) -> np.ndarray:
+        """Semimanga relativa de la sección maestra (fondo plano y pantoque circular)."""
+        b = 0.5 * manga_m
+        if radio <= 0.0:
+            return np.ones_like(z)
+        dz = np.clip(radio - z, 0.0, radio)
+        return (b - radio + np.sqrt(radio**2 - dz**2)) / b
+
+    @classmethod
+    def desde_csv(cls, ruta: Union[str, Path]) -> "TablaOffsets":
+        """
+        Leer offsets en formato largo (columnas x_m, z_m, semimanga_m), como
+        los exporta la tabla de offsets de Maxsurf.
+        """
+        df = pd.read_csv(ruta)
+        tabla = df.pivot_table(index="x_m", columns="z_m", values="semimanga_m")
+        tabla = tabla.sort_index().sort_index(axis=1).interpolate(axis=1).fillna(0.0)
+        return cls(
+            x_m=tabla.index.to_numpy(),
+            z_m=tabla.columns.to_numpy(),
+            semimanga_m=tabla.to_numpy(),
+        )
+
+    def semimanga(self, x, z) -> np.ndarray:
+        """Semimanga interpolada bilinealmente en (x, z) (arrays difundibles)."""
+        x, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(z, dtype=float))
+        fx = np.interp(x, self.x_m, np.arange(len(self.x_m)))
+        fz = np.interp(z, self.z_m, np.arange(len(self.z_m)))
+        i = np.minimum(fx.astype(int), len(self.x_m) - 2)
+        j = np.minimum(fz.astype(int), len(self.z_m) - 2)
+        u, v = fx - i, fz - j
+        t = self.semimanga_m
+        return (
+            t[i, j] * (1 - u) * (1 - v) + t[i + 1, j] * u * (1 - v)
+            + t[i, j + 1] * (1 - u) * v + t[i + 1, j + 1] * u * v
+        )
+
+    def altura_minima(self, x, y_abs) -> np.ndarray:
+        """
+        Altura sobre la base a partir de la cual cada punto (x, |y|) de la
+        malla queda dentro del casco (inf si nunca lo está). Supone
+        semimangas no decrecientes con z en cada estación.
+
+        Args:
+            x: Coordenadas longitudinales (m desde PP de popa)
+            y_abs: Distancias a crujía (m)
+
+        Returns:
+            Matriz (len(x) × len(y_abs))
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y_abs = np.abs(np.atleast_1d(np.asarray(y_abs, dtype=float)))
+        z = np.linspace(self.z_m[0], self.z_m[-1], 4 * len(self.z_m))
+        perfiles = np.maximum.accumulate(self.semimanga(x[:, None], z[None, :]), axis=1)
+        altura = np.empty((len(x), len(y_abs)))
+        for i, perfil in enumerate(perfiles):
+            altura[i] = np.interp(y_abs, perfil, z)
+            altura[i, y_abs > perfil[-1]] = np.inf
+        return altura
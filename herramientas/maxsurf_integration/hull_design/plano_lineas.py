@@ -0,0 +1,308 @@
+"""
+Plano de formas (líneas) a partir de la superficie del casco
+============================================================
+
+Las curvas del plano de formas son intersecciones de planos con la
+superficie del casco y(x, z) (semimanga en función de la abscisa desde la PP
+de popa y la altura sobre la base):
+
+- Secciones (estaciones): planos x = cte → y(z) en una fila de la malla.
+- Líneas de agua: planos z = cte → y(x) en una columna.
+- Longitudinales (buttocks): planos y = cte → z(x), inversa de cada sección
+  (las semimangas se hacen monótonas en z con un máximo acumulado).
+- Diagonales: planos que pasan por (y=0, z0) con inclinación θ → distancia s
+  a lo largo de la diagonal donde y(x, z0 − s·sinθ) = s·cosθ.
+
+Todas se calculan evaluando la superficie en una malla (x × z) con NumPy,
+sin bucles por estación, así que cientos de secciones cuestan milisegundos
+y el plano puede regenerarse dentro de un bucle de optimización.
+
+La superficie puede ser una `TablaOffsets` (interpolación bilineal) o una
+`SuperficieBSpline` ajustada a la tabla (B-spline bicúbica, curvas suaves).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .offsets import TablaOffsets
+
+
+class SuperficieBSpline:
+    """Superficie B-spline y(x, z) ajustada a una tabla de offsets (scipy)."""
+
+    def __init__(self, x_m, z_m, semimanga_m, suavizado: float = 0.0, grado: int = 3):
+        """
+        Args:
+            x_m: Abscisas de las estaciones (m)
+            z_m: Alturas de las líneas de agua (m)
+            semimanga_m: Semimangas (len(x_m) × len(z_m))
+            suavizado: Factor de alisado de `RectBivariateSpline` (0 = interpolante)
+            grado: Grado en x y z (3 = bicúbica)
+        """
+        from scipy.interpolate import RectBivariateSpline
+
+        self.x_m = np.asarray(x_m, dtype=float)
+        self.z_m = np.asarray(z_m, dtype=float)
+        semimanga_m = np.asarray(semimanga_m, dtype=float)
+        self._max = float(semimanga_m.max())
+        self._spline = RectBivariateSpline(self.x_m, self.z_m, semimanga_m, kx=grado, ky=grado, s=suavizado)
+
+    @classmethod
+    def desde_offsets(cls, tabla: TablaOffsets, suavizado: float = 0.0, grado: int = 3) -> "SuperficieBSpline":
+        return cls(tabla.x_m, tabla.z_m, tabla.semimanga_m, suavizado=suavizado, grado=grado)
+
+    @property
+    def lpp_m(self) -> float:
+        return float(self.x_m[-1] - self.x_m[0])
+
+    def semimanga(self, x, z) -> np.ndarray:
+        """Semimanga en (x, z) (arrays difundibles), recortada a [0, máx. de la tabla]."""
+        x, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(z, dtype=float))
+        x = np.clip(x, self.x_m[0], self.x_m[-1])
+        z = np.clip(z, self.z_m[0], self.z_m[-1])
+        y = self._spline.ev(x.ravel(), z.ravel()).reshape(x.shape)
+        return np.clip(y, 0.0, self._max)
+
+
+@dataclass
+class PlanoLineas:
+    """Curvas del plano de formas sobre mallas x (eslora) y z (puntal).
+
+    Attributes:
+        x_m: Malla longitudinal (m desde PP de popa)
+        z_m: Malla vertical (m sobre la base)
+        estaciones_x: Abscisas de las secciones
+        secciones: Semimangas de cada sección en z_m (n_estaciones × len(z_m))
+        lineas_agua_z: Alturas de las líneas de agua
+        lineas_agua: Semimangas de cada línea de agua en x_m (n × len(x_m))
+        longitudinales_y: Distancias a crujía de los longitudinales
+        longitudinales: Altura z de cada longitudinal en x_m (NaN fuera del casco)
+        diagonales: (z0, ángulo en grados) de cada diagonal
+        diagonales_s: Distancia a lo largo de cada diagonal en x_m (NaN fuera del casco)
+    """
+
+    x_m: np.ndarray
+    z_m: np.ndarray
+    estaciones_x: np.ndarray
+    secciones: np.ndarray
+    lineas_agua_z: np.ndarray
+    lineas_agua: np.ndarray
+    longitudinales_y: np.ndarray
+    longitudinales: np.ndarray
+    diagonales: List[Tuple[float, float]] = field(default_factory=list)
+    diagonales_s: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))
+
+    @property
+    def lpp_m(self) -> float:
+        return float(self.x_m[-1] - self.x_m[0])
+
+    @property
+    def semimanga_max_m(self) -> float:
+        return float(max(self.secciones.max(initial=0.0), self.lineas_agua.max(initial=0.0)))
+
+    def a_dxf(self, layout, origen: Tuple[float, float] = (0.0, 0.0), escala: float = 1.0,
+              curvas: str = "spline", separacion_m: float = 5.0) -> None:
+        """
+        Dibuja perfil, planta (semimangas) y caja de cuadernas en un layout.
+
+        Perfil en `origen`; la planta debajo (líneas de agua por encima de
+        crujía, diagonales desarrolladas por debajo) y la caja de cuadernas a
+        la derecha (popa a la izquierda de crujía, proa a la derecha).
+
+        Args:
+            layout: Layout de ezdxf (p. ej. modelspace)
+            origen: Posición de la PP de popa / línea base del perfil
+            escala: Factor de escala del dibujo
+            curvas: "spline" (SPLINE por puntos de paso) o "polilinea" (LWPOLYLINE)
+            separacion_m: Separación entre vistas (m de dibujo)
+        """
+        if curvas not in ("spline", "polilinea"):
+            raise ValueError(f"curvas debe ser 'spline' o 'polilinea': {curvas}")
+        ox, oz = origen
+        k = escala
+        x0 = float(self.x_m[0])
+        z_top = float(self.z_m[-1])
+        b2 = self.semimanga_max_m
+        sep = separacion_m
+
+        def X(x):
+            return ox + (np.asarray(x) - x0) * k
+
+        def curva(xs, ys, capa: str) -> None:
+            for xs_t, ys_t in _tramos(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)):
+                puntos = list(zip(xs_t.tolist(), ys_t.tolist()))
+                if curvas == "spline" and len(puntos) >= 4:
+                    layout.add_spline(puntos, dxfattribs={"layer": capa})
+                elif len(puntos) >= 2:
+                    layout.add_lwpolyline(puntos, dxfattribs={"layer": capa})
+
+        def linea(p0, p1, capa: str = "C-REF") -> None:
+            layout.add_line(p0, p1, dxfattribs={"layer": capa})
+
+        # --- Perfil (x, z) ---
+        linea((X(x0), oz), (X(self.x_m[-1]), oz))
+        for xs in self.estaciones_x:
+            linea((X(xs), oz), (X(xs), oz + z_top * k))
+        for zw in self.lineas_agua_z:
+            linea((X(x0), oz + zw * k), (X(self.x_m[-1]), oz + zw * k))
+        for z_b in self.longitudinales:
+            curva(X(self.x_m), oz + z_b * k, "C-PERF")
+
+        # --- Planta de semimangas (x, y); diagonales desarrolladas bajo crujía ---
+        yc = oz - (sep + b2) * k
+        linea((X(x0), yc), (X(self.x_m[-1]), yc))
+        for xs in self.estaciones_x:
+            linea((X(xs), yc - b2 * k), (X(xs), yc + b2 * k))
+        for yb in self.longitudinales_y:
+            linea((X(x0), yc + yb * k), (X(self.x_m[-1]), yc + yb * k))
+        for y_w in self.lineas_agua:
+            curva(X(self.x_m), yc + y_w * k, "C-LFLOT")
+        for s_d in self.diagonales_s:
+            curva(X(self.x_m), yc - s_d * k, "C-DIAG")
+
+        # --- Caja de cuadernas (y, z) ---
+        xc = X(self.x_m[-1]) + (sep + b2) * k
+        linea((xc, oz), (xc, oz + z_top * k))
+        linea((xc - b2 * k, oz), (xc + b2 * k, oz))
+        for zw in self.lineas_agua_z:
+            linea((xc - b2 * k, oz + zw * k), (xc + b2 * k, oz + zw * k))
+        for yb in self.longitudinales_y:
+            for signo in (-1, 1):
+                linea((xc + signo * yb * k, oz), (xc + signo * yb * k, oz + z_top * k))
+        medio = x0 + self.lpp_m / 2
+        for xs, y_s in zip(self.estaciones_x, self.secciones):
+            if y_s.max() <= 1e-6:
+                continue
+            signo = -1.0 if xs < medio else 1.0
+            curva(xc + signo * y_s * k, oz + self.z_m * k, "C-CUAD")
+        for z0, ang in self.diagonales:
+            largo = b2 * 1.15 / max(math.cos(math.radians(ang)), 1e-6)
+            dy = largo * math.cos(math.radians(ang)) * k
+            dz = largo * math.sin(math.radians(ang)) * k
+            for signo in (-1, 1):
+                linea((xc, oz + z0 * k), (xc + signo * dy, oz + z0 * k - dz), "C-DIAG")
+
+
+class MotorLineas:
+    """Cálculo vectorizado de las curvas del plano de formas de una superficie."""
+
+    def __init__(self, superficie, resolucion: int = 200):
+        """
+        Args:
+            superficie: Objeto con `x_m`, `z_m` y `semimanga(x, z)` vectorizado
+                (`TablaOffsets` o `SuperficieBSpline`)
+            resolucion: Puntos por curva a lo largo de la eslora y del puntal
+        """
+        self.superficie = superficie
+        self.x = np.linspace(float(superficie.x_m[0]), float(superficie.x_m[-1]), resolucion)
+        self.z = np.linspace(float(superficie.z_m[0]), float(superficie.z_m[-1]), resolucion)
+
+    def secciones(self, x) -> np.ndarray:
+        """Semimangas de las secciones x en la malla z (len(x) × resolución)."""
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        return self.superficie.semimanga(x[:, None], self.z[None, :])
+
+    def lineas_agua(self, z) -> np.ndarray:
+        """Semimangas de las líneas de agua z en la malla x (len(z) × resolución)."""
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+        return self.superficie.semimanga(self.x[None, :], z[:, None])
+
+    def longitudinales(self, y) -> np.ndarray:
+        """Altura de los longitudinales y en la malla x (NaN donde el plano no corta el casco)."""
+        y = np.abs(np.atleast_1d(np.asarray(y, dtype=float)))
+        perfiles = np.maximum.accumulate(self.secciones(self.x), axis=1)  # (nx, nz), monótonas en z
+        nz = len(self.z)
+        # Primer índice de z en el que la sección alcanza y
+        i = (perfiles[:, None, :] < y[None, :, None]).sum(axis=2)  # (nx, ny)
+        fuera = i >= nz
+        i = np.clip(i, 1, nz - 1)
+        filas = np.arange(len(self.x))[:, None]
+        p0, p1 = perfiles[filas, i - 1], perfiles[filas, i]
+        z0, z1 = self.z[i - 1], self.z[i]
+        t = np.clip((y[None, :] - p0) / np.where(p1 > p0, p1 - p0, 1.0), 0.0, 1.0)
+        alt = z0 + t * (z1 - z0)
+        alt[fuera] = np.nan
+        return alt.T
+
+    def diagonales(self, diagonales: Sequence[Tuple[float, float]]) -> np.ndarray:
+        """Distancia s a lo largo de cada diagonal (z0, ángulo) en la malla x."""
+        if not diagonales:
+            return np.empty((0, len(self.x)))
+        res = np.empty((len(diagonales), len(self.x)))
+        for d, (z0, ang) in enumerate(diagonales):
+            c, s_ = math.cos(math.radians(ang)), math.sin(math.radians(ang))
+            s_max = max(self.superficie.semimanga(self.x, self.z[-1]).max() / max(c, 1e-6),
+                        (z0 - self.z[0]) / max(s_, 1e-6)) * 1.05
+            s = np.linspace(0.0, s_max, len(self.z))
+            z = z0 - s * s_
+            g = self.superficie.semimanga(self.x[:, None], np.maximum(z, self.z[0])[None, :]) - s * c
+            g = np.where(z[None, :] < self.z[0], -1.0, g)  # por debajo de la base: fuera del casco
+            # g decrece con s: primer cambio de signo
+            i = np.clip((g >= 0).sum(axis=1), 1, len(s) - 1)
+            filas = np.arange(len(self.x))
+            g0, g1 = g[filas, i - 1], g[filas, i]
+            t = np.clip(g0 / np.where(g0 > g1, g0 - g1, 1.0), 0.0, 1.0)
+            fila = s[i - 1] + t * (s[i] - s[i - 1])
+            fila[g[:, 0] <= 0] = np.nan  # la diagonal empieza fuera (extremos sin casco)
+            res[d] = fila
+        return res
+
+    def calcular(
+        self,
+        estaciones=21,
+        lineas_agua: Optional[Sequence[float]] = None,
+        longitudinales: Optional[Sequence[float]] = None,
+        diagonales: Optional[Sequence[Tuple[float, float]]] = None,
+    ) -> PlanoLineas:
+        """
+        Calcular todas las curvas del plano.
+
+        Args:
+            estaciones: Número de estaciones equiespaciadas entre PP o abscisas explícitas
+            lineas_agua: Alturas (por defecto 6 entre base y puntal)
+            longitudinales: Distancias a crujía (por defecto 1/4, 1/2 y 3/4 de la semimanga)
+            diagonales: Lista (z0, ángulo en grados) (por defecto, ninguna)
+
+        Returns:
+            PlanoLineas
+        """
+        if np.isscalar(estaciones):
+            estaciones_x = np.linspace(self.x[0], self.x[-1], int(estaciones))
+        else:
+            estaciones_x = np.asarray(estaciones, dtype=float)
+        if lineas_agua is None:
+            lineas_agua = np.linspace(self.z[0], self.z[-1], 8)[1:-1]
+        if longitudinales is None:
+            b2 = float(self.superficie.semimanga(self.x, self.z[-1]).max())
+            longitudinales = [0.25 * b2, 0.5 * b2, 0.75 * b2]
+        diagonales = list(diagonales or [])
+        return PlanoLineas(
+            x_m=self.x,
+            z_m=self.z,
+            estaciones_x=estaciones_x,
+            secciones=self.secciones(estaciones_x),
+            lineas_agua_z=np.asarray(lineas_agua, dtype=float),
+            lineas_agua=self.lineas_agua(lineas_agua),
+            longitudinales_y=np.asarray(longitudinales, dtype=float),
+            longitudinales=self.longitudinales(longitudinales),
+            diagonales=diagonales,
+            diagonales_s=self.diagonales(diagonales),
+        )
+
+
+def _tramos(xs: np.ndarray, ys: np.ndarray):
+    """Divide una curva en tramos continuos sin NaN."""
+    validos = np.isfinite(xs) & np.isfinite(ys)
+    if validos.all():
+        yield xs, ys
+        return
+    cortes = np.flatnonzero(np.diff(validos.astype(int)))
+    limites = np.concatenate(([0], cortes + 1, [len(xs)]))
+    for a, b in zip(limites[:-1], limites[1:]):
+        if validos[a]:
+            yield xs[a:b], ys[a:b]
@@ -0,0 +1,323 @@
+"""
+Resistencia al avance y potencia (Holtrop–Mennen)
+=================================================
+
+Método estadístico de Holtrop y Mennen (1982, revisión de 1984) para buques
+de desplazamiento:
+
+    RT = RF·(1+k1) + RAPP + RW + RB + RTR + RA
+
+con fricción ITTC-57, factor de forma, resistencia por olas (Fn < 0.4,
+Fn > 0.55 e interpolación intermedia), bulbo, espejo y correlación
+modelo-buque. La parte propulsiva (estela w, deducción de empuje t,
+rendimiento rotativo-relativo ηR) es la de buques de una hélice.
+
+Todo está vectorizado: cualquier parámetro del casco puede ser un array y se
+combina por broadcasting con el array de velocidades, de modo que una matriz
+(variantes de casco × velocidades) se evalúa de una vez.
+
+Unidades: m, m², kn, kN, kW. lcb en % de la eslora respecto a la sección
+media, positivo a proa.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+import numpy as np
+
+RHO_AGUA_MAR = 1.025  # t/m³
+NU_AGUA_MAR = 1.1883e-6  # m²/s (15 °C)
+GRAVEDAD = 9.81
+KN_A_MS = 0.514444
+
+
+@dataclass
+class ParametrosCasco:
+    """Dimensiones y coeficientes de forma (escalares o arrays)."""
+
+    lpp_m: float
+    manga_m: float
+    calado_m: float
+    cb: float
+    cm: float = 0.98
+    cwp: Optional[float] = None
+    lcb_pct: Optional[float] = None
+    eslora_flotacion_m: Optional[float] = None
+    area_bulbo_m2: float = 0.0
+    altura_bulbo_m: float = 0.0
+    area_espejo_m2: float = 0.0
+    c_popa: float = 0.0
+    superficie_apendices_m2: float = 0.0
+    k2_apendices: float = 1.5
+    diametro_helice_m: Optional[float] = None
+    area_expandida: float = 0.55
+
+    def completar(self) -> "ParametrosCasco":
+        """
+        Estimar los valores no indicados.
+
+        - L flotación = 1.02·Lpp
+        - Cwp = (1 + 2·Cb)/3
+        - lcb = 19.4·Cp − 13.5 (% L, estimación estadística)
+        - Diámetro de hélice = 0.7·T
+        """
+        cp = np.asarray(self.cb) / np.asarray(self.cm)
+        return replace(
+            self,
+            eslora_flotacion_m=1.02 * np.asarray(self.lpp_m)
+            if self.eslora_flotacion_m is None else self.eslora_flotacion_m,
+            cwp=(1.0 + 2.0 * np.asarray(self.cb)) / 3.0 if self.cwp is None else self.cwp,
+            lcb_pct=19.4 * cp - 13.5 if self.lcb_pct is None else self.lcb_pct,
+            diametro_helice_m=0.7 * np.asarray(self.calado_m)
+            if self.diametro_helice_m is None else self.diametro_helice_m,
+        )
+
+    @property
+    def volumen_m3(self):
+        return np.asarray(self.cb) * self.lpp_m * self.manga_m * self.calado_m
+
+    @classmethod
+    def desde_datos_buque(cls, datos: Optional[Dict] = None, **kwargs) -> "ParametrosCasco":
+        """
+        Casco del Buque 9 desde `datos_buque_correctos.DATOS_BUQUE_GRUPO9`.
+
+        Args:
+            datos: Dict con la estructura de DATOS_BUQUE_GRUPO9 (por defecto,
+                el del módulo datos_buque_correctos)
+            **kwargs: Campos que sustituyen a los leídos
+        """
+        if datos is None:
+            from datos_buque_correctos import obtener_datos_buque
+            datos = obtener_datos_buque()
+        dim = datos["dimensiones_principales"]
+        coef = datos["coeficientes_forma"]
+        base = dict(
+            lpp_m=dim["eslora_entre_perpendiculares_m"],
+            manga_m=dim["manga_m"],
+            calado_m=dim["calado_diseno_m"],
+            cb=coef["coeficiente_bloque"],
+            cm=coef.get("coeficiente_seccion_media", 0.98),
+            cwp=coef.get("coeficiente_flotacion", 0.879),
+        )
+        return cls(**{**base, **kwargs})
+
+    @classmethod
+    def desde_parametros_base(cls, parametros=None, cb: float = 0.7252, **kwargs) -> "ParametrosCasco":
+        """
+        Casco desde `workflows.base_ship.ParametrosBuqueBase`.
+
+        Args:
+            parametros: ParametrosBuqueBase (por defecto, el buque base)
+            cb: Coeficiente de bloque (ParametrosBuqueBase no lo incluye)
+            **kwargs: Campos adicionales de ParametrosCasco
+        """
+        if parametros is None:
+            from maxsurf_integration.workflows.base_ship import ParametrosBuqueBase
+            parametros = ParametrosBuqueBase()
+        datos = parametros.to_dict()
+        return cls(lpp_m=datos["lpp_m"], manga_m=datos["beam_m"], calado_m=datos["draft_m"], cb=cb, **kwargs)
+
+
+def resistencia_holtrop(velocidad_kn, casco: ParametrosCasco) -> Dict[str, np.ndarray]:
+    """
+    Resistencia total y factores propulsivos por Holtrop–Mennen.
+
+    Args:
+        velocidad_kn: Velocidad(es) en nudos; se combina por broadcasting
+            con los parámetros del casco
+        casco: Parámetros del casco (escalares o arrays)
+
+    Returns:
+        Dict de arrays: froude, rf_kn, rapp_kn, rw_kn, rb_kn, rtr_kn, ra_kn,
+        rt_kn, pe_kw, k1, cf, ca, estela, deduccion_empuje, eta_r, eta_h,
+        superficie_mojada_m2
+    """
+    c = casco.completar()
+    a = lambda x: np.asarray(x, dtype=float)  # noqa: E731
+    L, B, T = a(c.eslora_flotacion_m), a(c.manga_m), a(c.calado_m)
+    cb, cm, cwp, lcb = a(c.cb), a(c.cm), a(c.cwp), a(c.lcb_pct)
+    abt, hb, at = a(c.area_bulbo_m2), a(c.altura_bulbo_m), a(c.area_espejo_m2)
+    tf = T
+    cp = cb / cm
+    vol = cb * a(c.lpp_m) * B * T
+    rho = RHO_AGUA_MAR * 1000.0
+    V = a(velocidad_kn) * KN_A_MS
+    g = GRAVEDAD
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Fricción y factor de forma
+        lr = L * (1.0 - cp + 0.06 * cp * lcb / (4.0 * cp - 1.0))
+        c14 = 1.0 + 0.011 * a(c.c_popa)
+        k1 = 0.93 + 0.487118 * c14 * (B / L) ** 1.06806 * (T / L) ** 0.46106 \
+            * (L / lr) ** 0.121563 * (L**3 / vol) ** 0.36486 * (1.0 - cp) ** -0.604247 - 1.0
+        s = L * (2.0 * T + B) * np.sqrt(cm) * (
+            0.4530 + 0.4425 * cb - 0.2862 * cm - 0.003467 * B / T + 0.3696 * cwp
+        ) + 2.38 * abt / cb
+        q = 0.5 * rho * V**2 / 1000.0  # kN/m²
+        rn = np.maximum(V, 1e-6) * L / NU_AGUA_MAR
+        cf = 0.075 / (np.log10(rn) - 2.0) ** 2
+        rf = q * s * cf
+        rapp = q * a(c.superficie_apendices_m2) * a(c.k2_apendices) * cf
+
+        # Resistencia por formación de olas
+        fn = V / np.sqrt(g * L)
+        ie = 1.0 + 89.0 * np.exp(
+            -(L / B) ** 0.80856 * (1.0 - cwp) ** 0.30484 * (1.0 - cp - 0.0225 * lcb) ** 0.6367
+            * (lr / B) ** 0.34574 * (100.0 * vol / L**3) ** 0.16302
+        )
+        bl = B / L
+        c7 = np.where(bl < 0.11, 0.229577 * bl ** (1.0 / 3.0), np.where(bl < 0.25, bl, 0.5 - 0.0625 / bl))
+        c1 = 2223105.0 * c7**3.78613 * (T / B) ** 1.07961 * (90.0 - ie) ** -1.37565
+        c3 = np.where(abt > 0, 0.56 * abt**1.5 / (B * T * (0.31 * np.sqrt(abt) + tf - hb)), 0.0)
+        c2 = np.exp(-1.89 * np.sqrt(c3))
+        c5 = 1.0 - 0.8 * at / (B * T * cm)
+        lam = np.where(L / B < 12.0, 1.446 * cp - 0.03 * L / B, 1.446 * cp - 0.36)
+        c16 = np.where(cp < 0.8, 8.07981 * cp - 13.8673 * cp**2 + 6.984388 * cp**3, 1.73014 - 0.7067 * cp)
+        m1 = 0.0140407 * L / T - 1.75254 * vol ** (1.0 / 3.0) / L - 4.79323 * B / L - c16
+        esbeltez = L**3 / vol
+        c15 = np.where(
+            esbeltez < 512.0, -1.69385,
+            np.where(esbeltez < 1726.91, -1.69385 + (L / vol ** (1.0 / 3.0) - 8.0) / 2.36, 0.0),
+        )
+        c17 = 6919.3 * cm**-1.3346 * (vol / L**3) ** 2.00977 * (L / B - 2.0) ** 1.40692
+        m3 = -7.2035 * bl**0.326869 * (T / B) ** 0.605375
+        peso = vol * rho * g / 1000.0  # kN
+
+        def _rw(f, coef, m):
+            f = np.maximum(f, 1e-3)
+            m4 = c15 * 0.4 * np.exp(-0.034 * f**-3.29)
+            return coef * c2 * c5 * peso * np.exp(m * f**-0.9 + m4 * np.cos(lam * f**-2))
+
+        rw_a = _rw(fn, c1, m1)
+        rw_b = _rw(fn, c17, m3)
+        rw_04 = _rw(np.full_like(fn, 0.4), c1, m1)
+        rw_055 = _rw(np.full_like(fn, 0.55), c17, m3)
+        rw = np.where(fn <= 0.4, rw_a, np.where(fn >= 0.55, rw_b, rw_04 + (10.0 * fn - 4.0) * (rw_055 - rw_04) / 1.5))
+        rw = np.where(V > 0, rw, 0.0)
+
+        # Bulbo y espejo
+        pb = 0.56 * np.sqrt(abt) / (tf - 1.5 * hb)
+        fni = V / np.sqrt(g * (tf - hb - 0.25 * np.sqrt(abt)) + 0.15 * V**2)
+        rb = np.where(abt > 0, 0.11 * np.exp(-3.0 * pb**-2) * fni**3 * abt**1.5 * rho * g / 1000.0 / (1.0 + fni**2), 0.0)
+        fnt = V / np.sqrt(2.0 * g * at / (B + B * cwp))
+        c6 = np.where(fnt < 5.0, 0.2 * (1.0 - 0.2 * fnt), 0.0)
+        rtr = np.where(at > 0, q * at * c6, 0.0)
+
+        # Correlación modelo-buque
+        c4 = np.minimum(tf / L, 0.04)
+        ca = 0.006 * (L + 100.0) ** -0.16 - 0.00205 + 0.003 * np.sqrt(L / 7.5) * cb**4 * c2 * (0.04 - c4)
+        ra = q * s * ca
+
+        rt = rf * (1.0 + k1) + rapp + rw + rb + rtr + ra
+
+        # Factores propulsivos (una hélice, popa convencional)
+        d = a(c.diametro_helice_m)
+        c8 = np.where(B / T < 5.0, B * s / (L * d * T), s * (7.0 * B / T - 25.0) / (L * d * (B / T - 3.0)))
+        c9 = np.where(c8 < 28.0, c8, 32.0 - 16.0 / (c8 - 24.0))
+        c11 = np.where(T / d < 2.0, T / d, 0.0833333 * (T / d) ** 3 + 1.33333)
+        c19 = np.where(
+            cp < 0.7,
+            0.12997 / (0.95 - cb) - 0.11056 / (0.95 - cp),
+            0.18567 / (1.3571 - cm) - 0.71276 + 0.38648 * cp,
+        )
+        c20 = 1.0 + 0.015 * a(c.c_popa)
+        cp1 = 1.45 * cp - 0.315 - 0.0225 * lcb
+        cv = (1.0 + k1) * cf + ca
+        w = c9 * c20 * cv * L / T * (0.050776 + 0.93405 * c11 * cv / (1.0 - cp1)) \
+            + 0.27915 * c20 * np.sqrt(B / (L * (1.0 - cp1))) + c19 * c20
+        t = 0.25014 * bl**0.28956 * (np.sqrt(B * T) / d) ** 0.2624 \
+            / (1.0 - cp + 0.0225 * lcb) ** 0.01762 + 0.0015 * a(c.c_popa)
+        eta_r = 0.9922 - 0.05908 * a(c.area_expandida) + 0.07424 * (cp - 0.0225 * lcb)
+
+    return {
+        "froude": fn,
+        "rf_kn": rf,
+        "rapp_kn": rapp,
+        "rw_kn": rw,
+        "rb_kn": rb,
+        "rtr_kn": rtr,
+        "ra_kn": ra,
+        "rt_kn": rt,
+        "pe_kw": rt * V,
+        "k1": k1,
+        "cf": cf,
+        "ca": ca,
+        "estela": w,
+        "deduccion_empuje": t,
+        "eta_r": eta_r,
+        "eta_h": (1.0 - t) / (1.0 - w),
+        "superficie_mojada_m2": s,
+    }
+
+
+class ModeloResistencia:
+    """
+    Curva velocidad–potencia de un casco (o de un lote de variantes).
+
+    Ejemplo:
+        modelo = ModeloResistencia(ParametrosCasco.desde_datos_buque())
+        modelo.potencia_freno_kw(14.5)
+        modelo.velocidad_para_potencia(0.85 * 8500)
+    """
+
+    def __init__(
+        self,
+        casco: ParametrosCasco,
+        eta_helice: float = 0.60,
+        eta_transmision: float = 0.98,
+        margen_mar: float = 0.0,
+    ):
+        """
+        Args:
+            casco: Parámetros del casco
+            eta_helice: Rendimiento de la hélice en aguas libres η0 (sin
+                diseño de hélice se toma un valor típico)
+            eta_transmision: Rendimiento de la línea de ejes ηS
+            margen_mar: Margen de mar sobre la potencia (0.15 = 15%)
+        """
+        self.casco = casco
+        self.eta_helice = eta_helice
+        self.eta_transmision = eta_transmision
+        self.margen_mar = margen_mar
+
+    def potencia(self, velocidad_kn) -> Dict[str, np.ndarray]:
+        """
+        Resistencia, rendimientos y potencias.
+
+        Returns:
+            Dict de `resistencia_holtrop` más eta_d, pd_kw y pb_kw
+        """
+        r = resistencia_holtrop(velocidad_kn, self.casco)
+        eta_d = self.eta_helice * r["eta_h"] * r["eta_r"]
+        pd_kw = r["pe_kw"] / eta_d
+        return {
+            **r,
+            "eta_d": eta_d,
+            "pd_kw": pd_kw,
+            "pb_kw": pd_kw / self.eta_transmision * (1.0 + self.margen_mar),
+        }
+
+    def potencia_freno_kw(self, velocidad_kn) -> np.ndarray:
+        """Potencia al freno necesaria (kW)."""
+        return self.potencia(velocidad_kn)["pb_kw"]
+
+    def velocidad_para_potencia(self, potencia_kw, v_max_kn: float = 25.0) -> np.ndarray:
+        """Velocidad alcanzable con una potencia al freno dada (casco escalar)."""
+        v = np.linspace(0.5, v_max_kn, 500)
+        return np.interp(potencia_kw, self.potencia_freno_kw(v), v)
+
+    def __call__(self, velocidad_kn, meses_desde_limpieza=0.0, factor_mar=1.0) -> np.ndarray:
+        """
+        Potencia al freno con fouling y un factor de estado de la mar.
+
+        El fouling aumenta la resistencia de fricción un 1% por mes (máx.
+        25%). El factor de la mar lo aporta quien llama, p. ej.
+        `FactoresAmbientales.correccion_estado_mar_batch(altura_ola_m)`, para
+        no duplicar aquí su tabla de tramos.
+        """
+        r = self.potencia(velocidad_kn)
+        friccion = r["rf_kn"] * (1.0 + r["k1"])
+        aumento_fouling = 1.0 + friccion / r["rt_kn"] * np.minimum(0.01 * np.asarray(meses_desde_limpieza), 0.25)
+        return r["pb_kw"] * aumento_fouling * np.asarray(factor_mar, dtype=float)
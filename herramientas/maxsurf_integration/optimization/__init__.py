@@ -1,6 +1,30 @@
 from .grid_search import GridSearchOptimizer, OptimizationResult
+from .disposicion_tanques import (
+    CondicionCarga,
+    OptimizadorDisposicionTanques,
+    ResultadoDisposicion,
+    cadena_cuadernas,
+)
+from .disposicion_sala_maquinas import (
+    Equipo,
+    IndiceRejilla,
+    OptimizadorSalaMaquinas,
+    ResultadoSalaMaquinas,
+    equipos_por_defecto,
+    verificar_colisiones,
+)
 
 __all__ = [
     "GridSearchOptimizer",
     "OptimizationResult",
+    "CondicionCarga",
+    "OptimizadorDisposicionTanques",
+    "ResultadoDisposicion",
+    "cadena_cuadernas",
+    "Equipo",
+    "IndiceRejilla",
+    "OptimizadorSalaMaquinas",
+    "ResultadoSalaMaquinas",
+    "equipos_por_defecto",
+    "verificar_colisiones",
 ]
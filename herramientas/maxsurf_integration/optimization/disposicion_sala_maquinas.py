@@ -0,0 +1,437 @@
+"""
+Disposición automática de la cámara de máquinas
+===============================================
+
+Coloca en planta el motor principal, los grupos generadores y los tanques
+de servicio dentro de la cámara de máquinas (`engine_room_limits` de
+`CADIntegrationConfig`) a partir de las huellas de `MotorConfig` o
+`EngineConfiguration`.
+
+Cada equipo ocupa un rectángulo ampliado con su holgura de mantenimiento.
+Las colisiones se comprueban con un índice de rejilla uniforme: cada
+rectángulo se registra en las celdas que cubre y sólo se comparan los
+equipos que comparten celda, de modo que mover un equipo cuesta O(vecinos)
+y no O(n).
+
+La búsqueda es por recocido simulado: en cada paso se desplaza (o gira, o
+se intercambia con otro) un equipo, se recalcula sólo su contribución a la
+penalización y se acepta con el criterio de Metropolis. El objetivo suma:
+
+- solape entre equipos y salida de la sala (penalizados),
+- longitud de la línea de ejes (cara de popa del motor al mamparo del eje),
+- distancia de generadores y tanques al motor principal (tuberías y cables),
+- momento escorante de los pesos respecto a crujía.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Caja = Tuple[float, float, float, float]  # (x_min, y_min, x_max, y_max)
+
+
+@dataclass
+class Equipo:
+    """Equipo rectangular en planta (coordenadas del centro)."""
+
+    nombre: str
+    tipo: str  # 'motor_principal', 'generador', 'tanque', ...
+    largo_m: float
+    ancho_m: float
+    alto_m: float = 0.0
+    peso_t: float = 0.0
+    holgura_m: float = 0.6
+    z_m: float = 0.0
+    y_fijo_m: Optional[float] = None
+    rotable: bool = False
+    x_m: float = 0.0
+    y_m: float = 0.0
+    rotado: bool = False
+
+    @classmethod
+    def desde_motor(cls, motor, nombre: Optional[str] = None, tipo: str = "generador", **kwargs) -> "Equipo":
+        """
+        Equipo a partir de un MotorConfig (largo_m, ancho_m...) o un
+        EngineConfiguration (length_m, width_m...).
+        """
+        def atributo(*nombres, defecto=0.0):
+            for n in nombres:
+                if getattr(motor, n, None) is not None:
+                    return getattr(motor, n)
+            return defecto
+
+        return cls(
+            nombre=nombre or str(atributo("modelo", "model", defecto=tipo)),
+            tipo=tipo,
+            largo_m=float(atributo("largo_m", "length_m")),
+            ancho_m=float(atributo("ancho_m", "width_m")),
+            alto_m=float(atributo("alto_m", "height_m")),
+            peso_t=float(atributo("peso_ton", "weight_tons")),
+            **kwargs,
+        )
+
+    @property
+    def huella(self) -> Tuple[float, float]:
+        """(dimensión en x, dimensión en y) según el giro."""
+        return (self.ancho_m, self.largo_m) if self.rotado else (self.largo_m, self.ancho_m)
+
+    def caja(self) -> Caja:
+        dx, dy = self.huella
+        return (self.x_m - dx / 2, self.y_m - dy / 2, self.x_m + dx / 2, self.y_m + dy / 2)
+
+
+def equipos_por_defecto() -> List[Equipo]:
+    """Motor principal, 3 grupos CAT 3512C y tanques de servicio/sedimentación de FO."""
+    equipos = [Equipo("MOTOR 16V26", "motor_principal", 8.5, 3.2, 4.1, 98.0, holgura_m=1.0, z_m=1.5, y_fijo_m=0.0)]
+    equipos += [
+        Equipo(f"GEN {i}", "generador", 3.5, 1.8, 2.6, 12.5, holgura_m=0.8, z_m=1.2, rotable=True)
+        for i in range(1, 4)
+    ]
+    equipos += [
+        Equipo("TQ SERVICIO FO", "tanque", 2.5, 2.5, 5.0, 30.0, holgura_m=0.5, z_m=1.2),
+        Equipo("TQ SEDIMENTACION FO", "tanque", 2.5, 2.5, 5.0, 30.0, holgura_m=0.5, z_m=1.2),
+    ]
+    return equipos
+
+
+def _solape(a: Caja, b: Caja) -> float:
+    """Área de la intersección de dos cajas."""
+    dx = min(a[2], b[2]) - max(a[0], b[0])
+    dy = min(a[3], b[3]) - max(a[1], b[1])
+    return dx * dy if dx > 0 and dy > 0 else 0.0
+
+
+class IndiceRejilla:
+    """
+    Índice espacial de rejilla uniforme para cajas en planta.
+
+    Cada caja se registra en todas las celdas que toca; una consulta
+    devuelve los identificadores registrados en las celdas de la caja
+    consultada (candidatos a solape, a confirmar con la geometría).
+    """
+
+    def __init__(self, celda_m: float = 1.0):
+        self.celda_m = celda_m
+        self._celdas: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        self._cajas: Dict[int, Caja] = {}
+
+    def _rango(self, caja: Caja) -> Iterable[Tuple[int, int]]:
+        c = self.celda_m
+        i0, j0 = math.floor(caja[0] / c), math.floor(caja[1] / c)
+        i1, j1 = math.floor(caja[2] / c), math.floor(caja[3] / c)
+        return ((i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1))
+
+    def insertar(self, ident: int, caja: Caja) -> None:
+        self._cajas[ident] = caja
+        for celda in self._rango(caja):
+            self._celdas[celda].add(ident)
+
+    def eliminar(self, ident: int) -> None:
+        caja = self._cajas.pop(ident)
+        for celda in self._rango(caja):
+            self._celdas[celda].discard(ident)
+
+    def candidatos(self, caja: Caja) -> Set[int]:
+        encontrados: Set[int] = set()
+        for celda in self._rango(caja):
+            encontrados |= self._celdas.get(celda, set())
+        return encontrados
+
+    def solapes(self, caja: Caja, excluir: Iterable[int] = ()) -> Dict[int, float]:
+        """Identificador → área solapada con la caja (sólo solapes > 0)."""
+        excluidos = set(excluir)
+        resultado = {}
+        for j in self.candidatos(caja) - excluidos:
+            area = _solape(caja, self._cajas[j])
+            if area > 0.0:
+                resultado[j] = area
+        return resultado
+
+
+@dataclass
+class ResultadoSalaMaquinas:
+    """Disposición encontrada."""
+
+    equipos: List[Equipo]
+    sala: Caja
+    coste: float
+    colisiones: List[Tuple[str, str, float]] = field(default_factory=list)
+    fuera_de_sala: List[str] = field(default_factory=list)
+    historial: List[float] = field(default_factory=list)
+
+    @property
+    def valido(self) -> bool:
+        return not self.colisiones and not self.fuera_de_sala
+
+    def tabla(self) -> pd.DataFrame:
+        return pd.DataFrame([
+            {"nombre": e.nombre, "tipo": e.tipo, "x_m": e.x_m, "y_m": e.y_m, "z_m": e.z_m,
+             "largo_x_m": e.huella[0], "ancho_y_m": e.huella[1], "rotado": e.rotado}
+            for e in self.equipos
+        ])
+
+    def equipo(self, nombre: str) -> Equipo:
+        return next(e for e in self.equipos if e.nombre == nombre)
+
+    def posiciones(self, origen_x: float = 0.0) -> Dict[str, Tuple[float, float, float]]:
+        """Nombre → (x, y, z) del centro; origen_x = sala[0] da coordenadas locales."""
+        return {e.nombre: (e.x_m - origen_x, e.y_m, e.z_m) for e in self.equipos}
+
+
+class OptimizadorSalaMaquinas:
+    """
+    Recocido simulado de posiciones en planta.
+
+    Ejemplo:
+        opt = OptimizadorSalaMaquinas.desde_config(load_config(), equipos_por_defecto())
+        res = opt.optimizar(semilla=0)
+        res.posiciones()
+    """
+
+    def __init__(
+        self,
+        equipos: Sequence[Equipo],
+        sala: Caja,
+        x_eje_m: Optional[float] = None,
+        peso_colision: float = 1000.0,
+        peso_eje: float = 1.0,
+        peso_tuberias: float = 0.1,
+        peso_escora: float = 10.0,
+        celda_m: Optional[float] = None,
+    ):
+        """
+        Args:
+            equipos: Equipos a colocar (se copian)
+            sala: Caja útil de la sala (x_min, y_min, x_max, y_max)
+            x_eje_m: Mamparo por el que sale la línea de ejes (por defecto
+                el extremo de mayor x de la sala)
+            peso_colision: Penalización por m² de solape o fuera de sala
+            peso_eje: Peso de la longitud de la línea de ejes (por m)
+            peso_tuberias: Peso de la distancia de cada equipo al motor (por m)
+            peso_escora: Peso del desplazamiento transversal del c.d.g. (por m)
+            celda_m: Lado de celda del índice (por defecto, la mediana de
+                las huellas con holgura)
+        """
+        self.equipos = [replace(e) for e in equipos]
+        self.sala = tuple(float(v) for v in sala)
+        self.x_eje_m = self.sala[2] if x_eje_m is None else x_eje_m
+        self.pesos = (peso_colision, peso_eje, peso_tuberias, peso_escora)
+        self._motor = next((i for i, e in enumerate(self.equipos) if e.tipo == "motor_principal"), None)
+        if celda_m is None:
+            celda_m = float(np.median([max(e.largo_m, e.ancho_m) + e.holgura_m for e in self.equipos]))
+        self.celda_m = celda_m
+
+    @classmethod
+    def desde_config(
+        cls,
+        config,
+        equipos: Optional[Sequence[Equipo]] = None,
+        margen_costado_m: float = 1.8,
+        **kwargs,
+    ) -> "OptimizadorSalaMaquinas":
+        """
+        Sala a partir de CADIntegrationConfig: eslora entre engine_room_limits
+        y manga entre dobles costados.
+        """
+        inicio, fin = config.engine_room_limits
+        media_manga = config.fallback_hull_data["beam"] / 2.0 - margen_costado_m
+        return cls(equipos or equipos_por_defecto(), (inicio, -media_manga, fin, media_manga), **kwargs)
+
+    # ----- Coste -----
+
+    def _caja_holgura(self, i: int) -> Caja:
+        x0, y0, x1, y1 = self.equipos[i].caja()
+        h = self.equipos[i].holgura_m / 2.0
+        return (x0 - h, y0 - h, x1 + h, y1 + h)
+
+    def _fuera(self, caja: Caja) -> float:
+        """Área de la caja fuera de la sala."""
+        area = (caja[2] - caja[0]) * (caja[3] - caja[1])
+        return area - _solape(caja, self.sala)
+
+    def _coste_global(self) -> float:
+        """Términos que dependen de todos los equipos (O(n), sin geometría)."""
+        _, peso_eje, peso_tuberias, peso_escora = self.pesos
+        equipos = self.equipos
+        peso_total = sum(e.peso_t for e in equipos)
+        coste = peso_escora * abs(sum(e.peso_t * e.y_m for e in equipos)) / max(peso_total, 1e-9)
+        if self._motor is not None:
+            motor = equipos[self._motor]
+            cara_popa = motor.x_m + math.copysign(motor.huella[0] / 2, self.x_eje_m - motor.x_m)
+            coste += peso_eje * abs(self.x_eje_m - cara_popa)
+            coste += peso_tuberias * sum(abs(e.x_m - motor.x_m) + abs(e.y_m - motor.y_m) for e in equipos)
+        return coste
+
+    def _coste_local(self, indice: IndiceRejilla, movidos: Sequence[int]) -> float:
+        """Solapes y salida de sala de los equipos movidos (sin contar dos veces sus pares)."""
+        coste = 0.0
+        for k, i in enumerate(movidos):
+            caja = self._caja_holgura(i)
+            coste += self._fuera(caja)
+            coste += sum(indice.solapes(caja, excluir=movidos).values())
+            coste += sum(_solape(caja, self._caja_holgura(j)) for j in movidos[k + 1:])
+        return self.pesos[0] * coste
+
+    def coste(self) -> float:
+        """Coste total de la disposición actual."""
+        return self._penalizacion_total(self._indice()) + self._coste_global()
+
+    def _penalizacion_total(self, indice: IndiceRejilla) -> float:
+        total = 0.0
+        for i in range(len(self.equipos)):
+            caja = self._caja_holgura(i)
+            total += self._fuera(caja)
+            total += sum(a for j, a in indice.solapes(caja, excluir=[i]).items() if j > i)
+        return self.pesos[0] * total
+
+    def _indice(self) -> IndiceRejilla:
+        indice = IndiceRejilla(self.celda_m)
+        for i in range(len(self.equipos)):
+            indice.insertar(i, self._caja_holgura(i))
+        return indice
+
+    # ----- Búsqueda -----
+
+    def _limites(self, i: int) -> Tuple[float, float, float, float]:
+        """Rango admisible del centro para que la huella quede dentro de la sala."""
+        dx, dy = self.equipos[i].huella
+        x0, y0, x1, y1 = self.sala
+        return (x0 + dx / 2, x1 - dx / 2, y0 + dy / 2, y1 - dy / 2)
+
+    def _colocar(self, i: int, x: float, y: float) -> None:
+        e = self.equipos[i]
+        xmin, xmax, ymin, ymax = self._limites(i)
+        e.x_m = float(max(xmin, min(x, xmax)))
+        e.y_m = e.y_fijo_m if e.y_fijo_m is not None else float(max(ymin, min(y, ymax)))
+
+    def optimizar(
+        self,
+        n_iteraciones: int = 10000,
+        temperatura_inicial: float = 50.0,
+        temperatura_final: float = 0.01,
+        semilla: Optional[int] = None,
+    ) -> ResultadoSalaMaquinas:
+        """
+        Buscar la disposición de mínimo coste.
+
+        Args:
+            n_iteraciones: Movimientos propuestos
+            temperatura_inicial: Temperatura del recocido al empezar
+            temperatura_final: Temperatura al terminar (enfriamiento geométrico)
+            semilla: Semilla del generador aleatorio
+
+        Returns:
+            ResultadoSalaMaquinas con la mejor disposición
+        """
+        rng = np.random.default_rng(semilla)
+        n = len(self.equipos)
+        x0, y0, x1, y1 = self.sala
+        for i in range(n):
+            self._colocar(i, rng.uniform(x0, x1), rng.uniform(y0, y1))
+
+        indice = self._indice()
+        penalizacion = self._penalizacion_total(indice)
+        global_ = self._coste_global()
+        mejor_coste = penalizacion + global_
+        mejor = [replace(e) for e in self.equipos]
+        historial: List[float] = []
+        enfriamiento = (temperatura_final / temperatura_inicial) ** (1.0 / max(1, n_iteraciones - 1))
+        temperatura = temperatura_inicial
+        escala_paso = 0.25 * max(x1 - x0, y1 - y0)
+
+        for it in range(n_iteraciones):
+            movimiento = rng.random()
+            i = int(rng.integers(n))
+            if movimiento < 0.1 and n > 1:
+                j = int(rng.integers(n - 1))
+                movidos = [i, j + (j >= i)]
+            else:
+                movidos = [i]
+            anteriores = [(self.equipos[k].x_m, self.equipos[k].y_m, self.equipos[k].rotado) for k in movidos]
+
+            for k in movidos:
+                indice.eliminar(k)
+            local_antes = self._coste_local(indice, movidos)
+
+            if len(movidos) == 2:
+                (xa, ya, _), (xb, yb, _) = anteriores
+                self._colocar(movidos[0], xb, yb)
+                self._colocar(movidos[1], xa, ya)
+            elif movimiento < 0.2 and self.equipos[i].rotable:
+                self.equipos[i].rotado = not self.equipos[i].rotado
+                self._colocar(i, self.equipos[i].x_m, self.equipos[i].y_m)
+            else:
+                paso = escala_paso * max(temperatura / temperatura_inicial, 0.02)
+                self._colocar(i, self.equipos[i].x_m + rng.normal(0, paso), self.equipos[i].y_m + rng.normal(0, paso))
+
+            local_despues = self._coste_local(indice, movidos)
+            global_nuevo = self._coste_global()
+            delta = (local_despues - local_antes) + (global_nuevo - global_)
+
+            if delta <= 0 or rng.random() < math.exp(-delta / temperatura):
+                penalizacion += local_despues - local_antes
+                global_ = global_nuevo
+            else:
+                for k, (xa, ya, rot) in zip(movidos, anteriores):
+                    e = self.equipos[k]
+                    e.x_m, e.y_m, e.rotado = xa, ya, rot
+            for k in movidos:
+                indice.insertar(k, self._caja_holgura(k))
+
+            if penalizacion + global_ < mejor_coste - 1e-12:
+                mejor_coste = penalizacion + global_
+                mejor = [replace(e) for e in self.equipos]
+            if it % 500 == 0:
+                historial.append(mejor_coste)
+            temperatura *= enfriamiento
+
+        self.equipos = mejor
+        return self._resultado(historial)
+
+    def _resultado(self, historial: List[float]) -> ResultadoSalaMaquinas:
+        colisiones = verificar_colisiones(self.equipos, self.celda_m)
+        fuera = [e.nombre for e in self.equipos if self._fuera(e.caja()) > 1e-9]
+        res = ResultadoSalaMaquinas(
+            equipos=[replace(e) for e in self.equipos],
+            sala=self.sala,
+            coste=self.coste(),
+            colisiones=colisiones,
+            fuera_de_sala=fuera,
+            historial=historial,
+        )
+        if not res.valido:
+            logger.warning("⚠️  Disposición con colisiones: %s %s", colisiones, fuera)
+        return res
+
+
+def verificar_colisiones(
+    equipos: Sequence[Equipo], celda_m: float = 1.0, tolerancia_m2: float = 1e-6
+) -> List[Tuple[str, str, float]]:
+    """
+    Pares de equipos cuyas huellas con holgura se solapan.
+
+    Returns:
+        Lista (nombre_a, nombre_b, área solapada m²)
+    """
+    def caja(e: Equipo) -> Caja:
+        x0, y0, x1, y1 = e.caja()
+        h = e.holgura_m / 2.0
+        return (x0 - h, y0 - h, x1 + h, y1 + h)
+
+    indice = IndiceRejilla(celda_m)
+    colisiones = []
+    for i, e in enumerate(equipos):
+        for j, area in sorted(indice.solapes(caja(e)).items()):
+            if area > tolerancia_m2:
+                colisiones.append((equipos[j].nombre, e.nombre, area))
+        indice.insertar(i, caja(e))
+    return colisiones
@@ -0,0 +1,544 @@
+"""
+Optimización de la disposición de tanques
+=========================================
+
+Desplaza los límites longitudinales de los tanques (inicio_m / fin_m) sobre
+la cadena de cuadernas para cubrir el combustible requerido manteniendo
+trimado, KG y GM dentro de límites en todas las condiciones de carga
+(salida, llegada...).
+
+Los tanques cuyas secciones transversales se solapan no pueden solaparse
+en eslora. Cada tanque se modela como un prisma cuya sección (ancho × alto ×
+permeabilidad) no depende de la eslora, de modo que masa, momentos y
+superficie libre por metro de eslora se precalculan una vez con
+`MotorSuperficieLibre` y cada lote de disposiciones candidatas se evalúa con
+productos matriciales (candidatos × tanques) @ (tanques × condiciones) y una
+única interpolación en la `TablaHidrostatica`.
+
+La búsqueda es evolutiva sobre índices de cuaderna: población aleatoria
+dentro de los márgenes de cada límite, selección de la élite y mutaciones de
+pocas cuadernas, con penalización de las restricciones incumplidas.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from dataclasses import dataclass, field, is_dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from maxsurf_integration.stability.hidrostatica import TablaHidrostatica
+from maxsurf_integration.tanks.superficie_libre import GeometriaTanque, MotorSuperficieLibre
+
+logger = logging.getLogger(__name__)
+
+# Mamparos transversales de la disposición general (m desde PP de popa)
+MAMPAROS_M = (0.0, 8.2, 23.2, 99.2)
+
+# Solape transversal/vertical por debajo del cual dos tanques se consideran
+# adyacentes (comparten forro o mamparo) y no en conflicto
+TOLERANCIA_SOLAPE_M = 0.1
+
+
+@dataclass
+class TanqueAjustable:
+    """Tanque prismático cuyos extremos se apoyan en límites compartidos."""
+
+    nombre: str
+    tipo: str
+    borde_inicio: int
+    borde_fin: int
+    area_seccion_m2: float
+    alto_m: float
+    z_fondo_m: float = 0.0
+    y_centro_m: float = 0.0
+    ancho_m: float = 1.0
+    densidad_tm3: float = 1.0
+
+
+@dataclass
+class CondicionCarga:
+    """Condición de carga: llenado por tipo de tanque y pesos fijos."""
+
+    nombre: str
+    llenados: Dict[str, float]
+    peso_t: float = 0.0
+    kg_m: float = 0.0
+    lcg_m: float = 0.0
+
+
+CONDICIONES_POR_DEFECTO = (
+    CondicionCarga("Salida", {"fuel_oil": 0.98, "agua_dulce": 0.98, "lastre": 0.0}),
+    CondicionCarga("Llegada", {"fuel_oil": 0.10, "agua_dulce": 0.10, "lastre": 0.0}),
+)
+
+
+def cadena_cuadernas(
+    lpp_m: Optional[float] = None,
+    limite_popa_m: float = 8.2,
+    limite_proa_m: Optional[float] = None,
+    clara_central_m: float = 0.7,
+    clara_extremos_m: float = 0.6,
+) -> np.ndarray:
+    """
+    Posiciones de cuadernas desde la PP de popa.
+
+    Sin `lpp_m` se toma la cadena de `generar_disposicion_general.FRAMES_DF`;
+    si el módulo no está disponible, o para otra eslora, se genera con las
+    mismas claras (0.6 m en piques, 0.7 m en la zona central).
+    """
+    if lpp_m is None:
+        try:
+            import generar_disposicion_general as disposicion  # noqa: WPS433
+            return disposicion.FRAMES_DF["posicion_m"].to_numpy(dtype=float)
+        except Exception as e:  # dependencias de dibujo ausentes
+            logger.debug(f"Cadena de cuadernas paramétrica ({e})")
+            lpp_m = 105.2
+    if limite_proa_m is None:
+        limite_proa_m = lpp_m - 6.0
+    tramos = [
+        np.arange(0.0, limite_popa_m, clara_extremos_m),
+        np.arange(limite_popa_m, limite_proa_m, clara_central_m),
+        np.arange(limite_proa_m, lpp_m, clara_extremos_m),
+        [lpp_m],
+    ]
+    return np.unique(np.round(np.concatenate(tramos), 3))
+
+
+@dataclass
+class ResultadoDisposicion:
+    """Mejor disposición encontrada."""
+
+    bordes_m: np.ndarray
+    tanques: pd.DataFrame
+    condiciones: pd.DataFrame
+    capacidad_combustible_m3: float
+    requerido_m3: float
+    factible: bool
+    puntuacion: float
+    historial: List[float] = field(default_factory=list)
+
+    def limites(self) -> Dict[str, Tuple[float, float]]:
+        """Nombre de tanque → (inicio_m, fin_m)."""
+        return {
+            fila.nombre: (fila.inicio_m, fila.fin_m)
+            for fila in self.tanques.itertuples()
+        }
+
+
+class OptimizadorDisposicionTanques:
+    """
+    Optimizador vectorizado de límites de tanques sobre la cadena de cuadernas.
+
+    Ejemplo:
+        opt = OptimizadorDisposicionTanques.desde_disposicion(TANKS, ...)
+        res = opt.optimizar(requerido_m3=1020.0)
+        res.limites()
+    """
+
+    def __init__(
+        self,
+        tanques: Sequence[TanqueAjustable],
+        bordes_m: Sequence[float],
+        margenes_m: Sequence[Tuple[float, float]],
+        cuadernas_m: Sequence[float],
+        tabla: TablaHidrostatica,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        condiciones: Sequence[CondicionCarga] = CONDICIONES_POR_DEFECTO,
+        trimado_max_m: float = 1.0,
+        gm_min_m: float = 0.15,
+        kg_max_m: Optional[float] = None,
+        largo_min_m: float = 2.0,
+        tipo_combustible: str = "fuel_oil",
+    ):
+        """
+        Args:
+            tanques: Tanques con sus índices de límite inicial y final
+            bordes_m: Posición inicial de cada límite (m desde PP de popa)
+            margenes_m: (mínimo, máximo) admisible de cada límite; iguales
+                para límites fijos (mamparos)
+            cuadernas_m: Cadena de cuadernas sobre la que se ajustan límites
+            tabla: Tabla hidrostática del buque
+            desplazamiento_rosca_t, kg_rosca_m, lcg_rosca_m: Buque en rosca
+            condiciones: Condiciones de carga a verificar
+            trimado_max_m: |trimado| admisible en todas las condiciones
+            gm_min_m: GM corregido mínimo
+            kg_max_m: KG corregido máximo (None: sin límite)
+            largo_min_m: Eslora mínima de cada tanque
+            tipo_combustible: Tipo de los tanques que suman capacidad
+        """
+        self.tanques = list(tanques)
+        bordes = np.asarray(bordes_m, dtype=float)
+        margenes = np.asarray(margenes_m, dtype=float).reshape(len(bordes), 2)
+        fijos = margenes[:, 0] == margenes[:, 1]
+        # Los límites fijos (mamparos) se añaden a la cadena aunque no caigan en cuaderna
+        self.cuadernas = np.unique(np.concatenate([np.asarray(cuadernas_m, dtype=float), bordes[fijos]]))
+        self.tabla = tabla
+        self.rosca = (desplazamiento_rosca_t, kg_rosca_m, lcg_rosca_m)
+        self.condiciones = list(condiciones)
+        self.trimado_max_m = trimado_max_m
+        self.gm_min_m = gm_min_m
+        self.kg_max_m = kg_max_m
+        self.largo_min_m = largo_min_m
+
+        self.borde_inicial = np.round(self._posicion(bordes)).astype(int)
+        self.indice_min = np.minimum(np.ceil(self._posicion(margenes[:, 0]) - 1e-6), self.borde_inicial).astype(int)
+        self.indice_max = np.maximum(np.floor(self._posicion(margenes[:, 1]) + 1e-6), self.borde_inicial).astype(int)
+        self.indice_min[fijos] = self.indice_max[fijos] = self.borde_inicial[fijos]
+
+        self._i = np.array([t.borde_inicio for t in self.tanques])
+        self._f = np.array([t.borde_fin for t in self.tanques])
+        self._area = np.array([t.area_seccion_m2 for t in self.tanques])
+        self._es_combustible = np.array([t.tipo == tipo_combustible for t in self.tanques])
+        self._unitarios = self._precalcular_unitarios()
+        self._pares = self._pares_en_conflicto()
+
+    def _posicion(self, x_m: np.ndarray) -> np.ndarray:
+        """Índice fraccionario en la cadena de cuadernas."""
+        return np.interp(x_m, self.cuadernas, np.arange(len(self.cuadernas)))
+
+    def _pares_en_conflicto(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pares de tanques cuyas secciones se solapan (no pueden solaparse en eslora)."""
+        y0 = np.array([t.y_centro_m - t.ancho_m / 2 for t in self.tanques])
+        y1 = np.array([t.y_centro_m + t.ancho_m / 2 for t in self.tanques])
+        z0 = np.array([t.z_fondo_m for t in self.tanques])
+        z1 = z0 + np.array([t.alto_m for t in self.tanques])
+        solape_y = np.minimum(y1[:, None], y1[None, :]) - np.maximum(y0[:, None], y0[None, :]) > TOLERANCIA_SOLAPE_M
+        solape_z = np.minimum(z1[:, None], z1[None, :]) - np.maximum(z0[:, None], z0[None, :]) > TOLERANCIA_SOLAPE_M
+        return np.nonzero(np.triu(solape_y & solape_z, k=1))
+
+    def _precalcular_unitarios(self) -> Dict[str, np.ndarray]:
+        """Masa, momento vertical y FSM por metro de eslora (condiciones × tanques)."""
+        geometrias = [
+            GeometriaTanque(
+                nombre=t.nombre,
+                largo_m=1.0,
+                ancho_fondo_m=t.ancho_m,
+                alto_m=t.alto_m,
+                x_centro_m=0.0,
+                z_fondo_m=t.z_fondo_m,
+                y_centro_m=t.y_centro_m,
+                densidad_tm3=t.densidad_tm3,
+                permeabilidad=t.area_seccion_m2 / (t.ancho_m * t.alto_m),
+            )
+            for t in self.tanques
+        ]
+        motor = MotorSuperficieLibre(geometrias)
+        llenados = np.array([
+            [c.llenados.get(t.nombre, c.llenados.get(t.tipo, 0.0)) for t in self.tanques]
+            for c in self.condiciones
+        ])
+        por_tanque = motor.por_tanque(llenados)
+        return {
+            "masa": por_tanque["masa_t"],
+            "momento_z": por_tanque["masa_t"] * por_tanque["vcg_m"],
+            "fsm": por_tanque["fsm_tm"],
+            "momento_y": por_tanque["masa_t"] * np.array([t.y_centro_m for t in self.tanques]),
+        }
+
+    def evaluar(self, indices: np.ndarray, requerido_m3: float) -> Dict[str, np.ndarray]:
+        """
+        Evaluar un lote de disposiciones.
+
+        Args:
+            indices: Matriz (candidatos × límites) de índices de cuaderna
+            requerido_m3: Volumen de combustible requerido
+
+        Returns:
+            Dict con capacidad (candidatos,), trimado/kg/gm (candidatos ×
+            condiciones), violación y puntuación (candidatos,)
+        """
+        indices = np.atleast_2d(indices)
+        x = self.cuadernas[indices]
+        inicio, fin = x[:, self._i], x[:, self._f]
+        largo = fin - inicio
+        medio = 0.5 * (inicio + fin)
+        capacidad = (np.maximum(largo, 0.0) * self._area)[:, self._es_combustible].sum(axis=1)
+
+        u = self._unitarios
+        masa = largo @ u["masa"].T
+        mz = largo @ u["momento_z"].T
+        mx = (largo * medio) @ u["masa"].T
+        fsm = largo @ u["fsm"].T
+
+        d0, kg0, lcg0 = self.rosca
+        pesos = np.array([c.peso_t for c in self.condiciones])
+        desplazamiento = d0 + pesos + masa
+        kg_solido = (d0 * kg0 + pesos * np.array([c.kg_m for c in self.condiciones]) + mz) / desplazamiento
+        lcg = (d0 * lcg0 + pesos * np.array([c.lcg_m for c in self.condiciones]) + mx) / desplazamiento
+        kg = kg_solido + fsm / desplazamiento
+
+        eq = self.tabla.equilibrio(desplazamiento.ravel(), lcg.ravel())
+        trimado = eq["trimado_m"].reshape(desplazamiento.shape)
+        gm = eq["kmt_m"].reshape(desplazamiento.shape) - kg
+
+        violacion = (
+            np.maximum(0.0, requerido_m3 - capacidad) / requerido_m3
+            + np.maximum(0.0, np.abs(trimado) - self.trimado_max_m).max(axis=1) / self.trimado_max_m
+            + np.maximum(0.0, self.gm_min_m - gm).max(axis=1) / max(self.gm_min_m, 0.1)
+            + np.maximum(0.0, self.largo_min_m - largo).sum(axis=1) / self.largo_min_m
+        )
+        pi, pj = self._pares
+        if len(pi):
+            solape = np.minimum(fin[:, pi], fin[:, pj]) - np.maximum(inicio[:, pi], inicio[:, pj])
+            violacion = violacion + np.maximum(0.0, solape).sum(axis=1) / self.largo_min_m
+        if self.kg_max_m is not None:
+            violacion = violacion + np.maximum(0.0, kg - self.kg_max_m).max(axis=1) / self.kg_max_m
+        # Objetivo: mínimo exceso de capacidad (espacio perdido para carga) y trimado bajo
+        objetivo = (
+            np.maximum(0.0, capacidad - requerido_m3) / requerido_m3
+            + 0.1 * np.abs(trimado).mean(axis=1) / self.trimado_max_m
+        )
+        return {
+            "capacidad_m3": capacidad,
+            "desplazamiento_t": desplazamiento,
+            "trimado_m": trimado,
+            "kg_m": kg,
+            "gm_m": gm,
+            "violacion": violacion,
+            "puntuacion": objetivo + 100.0 * violacion,
+        }
+
+    def optimizar(
+        self,
+        requerido_m3: float,
+        n_candidatos: int = 2048,
+        n_iteraciones: int = 40,
+        fraccion_elite: float = 0.05,
+        semilla: Optional[int] = None,
+    ) -> ResultadoDisposicion:
+        """
+        Buscar la disposición de mínima puntuación.
+
+        Args:
+            requerido_m3: Volumen de combustible requerido (m³)
+            n_candidatos: Disposiciones evaluadas por iteración
+            n_iteraciones: Generaciones de la búsqueda evolutiva
+            fraccion_elite: Fracción de la población que se conserva
+            semilla: Semilla del generador aleatorio
+
+        Returns:
+            ResultadoDisposicion con la mejor disposición
+        """
+        rng = np.random.default_rng(semilla)
+        lo, hi = self.indice_min, self.indice_max
+        poblacion = rng.integers(lo, hi + 1, size=(n_candidatos, len(lo)))
+        poblacion[0] = self.borde_inicial
+        n_elite = max(2, int(fraccion_elite * n_candidatos))
+        historial: List[float] = []
+        paso = np.maximum(1.0, 0.25 * (hi - lo))
+
+        for it in range(n_iteraciones):
+            puntuacion = self.evaluar(poblacion, requerido_m3)["puntuacion"]
+            orden = np.argsort(puntuacion)
+            elite = poblacion[orden[:n_elite]]
+            historial.append(float(puntuacion[orden[0]]))
+            # Mutación con amplitud decreciente alrededor de la élite
+            escala = paso * (1.0 - it / n_iteraciones) + 1.0
+            padres = elite[rng.integers(0, n_elite, n_candidatos - n_elite)]
+            mascara = rng.random(padres.shape) < 0.5
+            salto = np.rint(rng.normal(0.0, 1.0, padres.shape) * escala).astype(int)
+            hijos = np.clip(padres + mascara * salto, lo, hi)
+            poblacion = np.vstack([elite, hijos])
+
+        res = self.evaluar(poblacion, requerido_m3)
+        mejor = int(np.argmin(res["puntuacion"]))
+        return self._resultado(poblacion[mejor], requerido_m3, historial)
+
+    def _resultado(self, indices: np.ndarray, requerido_m3: float, historial: List[float]) -> ResultadoDisposicion:
+        ev = self.evaluar(indices[None, :], requerido_m3)
+        bordes = self.cuadernas[indices]
+        tanques = pd.DataFrame({
+            "nombre": [t.nombre for t in self.tanques],
+            "tipo": [t.tipo for t in self.tanques],
+            "inicio_m": bordes[self._i],
+            "fin_m": bordes[self._f],
+            "volumen_m3": (bordes[self._f] - bordes[self._i]) * self._area,
+        })
+        condiciones = pd.DataFrame({
+            "condicion": [c.nombre for c in self.condiciones],
+            "desplazamiento_t": ev["desplazamiento_t"][0],
+            "trimado_m": ev["trimado_m"][0],
+            "kg_corregido_m": ev["kg_m"][0],
+            "gm_corregido_m": ev["gm_m"][0],
+        })
+        return ResultadoDisposicion(
+            bordes_m=bordes,
+            tanques=tanques,
+            condiciones=condiciones,
+            capacidad_combustible_m3=float(ev["capacidad_m3"][0]),
+            requerido_m3=requerido_m3,
+            factible=bool(ev["violacion"][0] <= 1e-9),
+            puntuacion=float(ev["puntuacion"][0]),
+            historial=historial,
+        )
+
+    @classmethod
+    def desde_limites(
+        cls,
+        limites: Sequence[Tuple[str, str, float, float, Dict[str, float]]],
+        margen_m: float = 6.0,
+        mamparos_m: Sequence[float] = MAMPAROS_M,
+        cuadernas_m: Optional[Sequence[float]] = None,
+        **kwargs,
+    ) -> "OptimizadorDisposicionTanques":
+        """
+        Construir el optimizador a partir de tanques definidos por sus límites.
+
+        Los límites que coinciden entre tanques (p. ej. dos tanques de doble
+        fondo contiguos) se comparten; los que caen sobre un mamparo quedan
+        fijos y el resto se mueve ±margen_m sin cruzar los mamparos que
+        encierran a sus tanques.
+
+        Args:
+            limites: (nombre, tipo, inicio_m, fin_m, datos) por tanque; datos
+                con area_seccion_m2, alto_m y opcionalmente z_fondo_m,
+                y_centro_m, ancho_m y densidad_tm3
+            margen_m: Recorrido máximo de cada límite móvil
+            mamparos_m: Mamparos transversales (m desde PP de popa)
+            cuadernas_m: Cadena de cuadernas (por defecto, `cadena_cuadernas()`)
+            **kwargs: Resto de argumentos del constructor (tabla, rosca...)
+        """
+        bordes: List[float] = []
+        usos: List[List[int]] = []
+
+        def _borde(x: float, tanque: int) -> int:
+            for i, b in enumerate(bordes):
+                if abs(b - x) < 1e-6:
+                    usos[i].append(tanque)
+                    return i
+            bordes.append(x)
+            usos.append([tanque])
+            return len(bordes) - 1
+
+        tanques = []
+        for k, (nombre, tipo, inicio, fin, datos) in enumerate(limites):
+            tanques.append(TanqueAjustable(
+                nombre=nombre,
+                tipo=tipo,
+                borde_inicio=_borde(inicio, k),
+                borde_fin=_borde(fin, k),
+                **datos,
+            ))
+
+        mamparos = np.asarray(sorted(mamparos_m), dtype=float)
+        margenes = []
+        for b, uso in zip(bordes, usos):
+            if np.any(np.abs(mamparos - b) < 1e-6):
+                margenes.append((b, b))
+                continue
+            extremo_popa = min(limites[t][2] for t in uso)
+            extremo_proa = max(limites[t][3] for t in uso)
+            popa = mamparos[mamparos <= extremo_popa + 1e-6]
+            proa = mamparos[mamparos >= extremo_proa - 1e-6]
+            minimo = popa.max() if len(popa) else -np.inf
+            maximo = proa.min() if len(proa) else np.inf
+            margenes.append((max(b - margen_m, minimo), min(b + margen_m, maximo)))
+
+        if cuadernas_m is None:
+            cuadernas_m = cadena_cuadernas()
+        return cls(tanques, bordes, margenes, cuadernas_m, **kwargs)
+
+    @classmethod
+    def desde_disposicion(
+        cls,
+        tanques,
+        manga_m: float = 15.99,
+        puntal_m: float = 7.9,
+        tipos: Optional[Dict[str, str]] = None,
+        densidades: Optional[Dict[str, float]] = None,
+        **kwargs,
+    ) -> "OptimizadorDisposicionTanques":
+        """
+        Construir el optimizador desde `generar_disposicion_general.TANKS`.
+
+        La sección útil de cada tanque se toma de su volumen tabulado por
+        metro de eslora. Los tanques de doble fondo ("DB ...") apoyan en la
+        base; los wing tanks llegan a 1 m bajo cubierta y el resto apoya en
+        el techo del doble fondo.
+
+        Args:
+            tanques: Lista de `Tank` (nombre, servicio, inicio_m, fin_m,
+                volumen_m3, altura_media_m, ancho_efectivo_m)
+            manga_m: Manga del buque (m)
+            puntal_m: Puntal del buque (m)
+            tipos: Tipo por nombre de tanque (por defecto se deduce del
+                servicio: combustible/FO → fuel_oil, lastre → lastre)
+            densidades: Densidad por tipo (t/m³)
+            **kwargs: Argumentos de `desde_limites` y del constructor
+        """
+        densidades = {"fuel_oil": 0.90, "lastre": 1.025, "agua_dulce": 1.0, **(densidades or {})}
+        tipos = tipos or {}
+        altura_db = min(
+            (t.altura_media_m for t in tanques if t.nombre.startswith("DB") and t.altura_media_m),
+            default=0.0,
+        )
+        limites = []
+        for t in tanques:
+            servicio = t.servicio.lower()
+            tipo = tipos.get(t.nombre)
+            if tipo is None:
+                if any(c in servicio for c in ("combustible", "fuel", " fo", "motor")):
+                    tipo = "fuel_oil"
+                elif "lastre" in servicio:
+                    tipo = "lastre"
+                else:
+                    tipo = "otros"
+            alto = t.altura_media_m or 1.0
+            nombre = t.nombre.lower()
+            if nombre.startswith("db"):
+                z_fondo = 0.0
+            elif "wing" in nombre:
+                z_fondo = puntal_m - 1.0 - alto
+            else:
+                z_fondo = altura_db
+            ancho = t.ancho_efectivo_m or 1.0
+            y = 0.0
+            if "wing" in nombre:
+                y = (1.0 if "babor" in nombre else -1.0) * 0.5 * (manga_m - ancho)
+            limites.append((t.nombre, tipo, t.inicio_m, t.fin_m, {
+                "area_seccion_m2": t.volumen_m3 / (t.fin_m - t.inicio_m),
+                "alto_m": alto,
+                "z_fondo_m": z_fondo,
+                "y_centro_m": y,
+                "ancho_m": ancho,
+                "densidad_tm3": densidades.get(tipo, 1.0),
+            }))
+        return cls.desde_limites(limites, **kwargs)
+
+
+def aplicar_a_disposicion(tanques, resultado: ResultadoDisposicion) -> list:
+    """
+    Copias de los tanques de la disposición general con los nuevos límites y volúmenes.
+
+    Args:
+        tanques: Objetos con `nombre`, `inicio_m`, `fin_m` y `volumen_m3`
+            (`Tank` de generar_disposicion_general u otro objeto con esos atributos)
+        resultado: Disposición optimizada
+
+    Returns:
+        Lista de copias (los tanques que no están en el resultado se devuelven tal cual)
+    """
+    filas = resultado.tanques.set_index("nombre")
+    nuevos = []
+    for t in tanques:
+        if t.nombre in filas.index:
+            fila = filas.loc[t.nombre]
+            cambios = {
+                "inicio_m": float(fila["inicio_m"]),
+                "fin_m": float(fila["fin_m"]),
+                "volumen_m3": float(fila["volumen_m3"]),
+            }
+            if is_dataclass(t):
+                t = replace(t, **cambios)
+            else:
+                t = copy.copy(t)
+                for nombre, valor in cambios.items():
+                    setattr(t, nombre, valor)
+        nuevos.append(t)
+    return nuevos
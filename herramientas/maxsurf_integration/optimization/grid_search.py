@@ -3,12 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from itertools import product
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from maxsurf_integration.hull_design.resistencia import RHO_AGUA_MAR, ModeloResistencia, ParametrosCasco
 from maxsurf_integration.reports.report_generator import ReportGenerator
 from maxsurf_integration.visualization.plots import plot_gz_curve, save_figure
 import matplotlib
@@ -61,7 +62,15 @@ class GridSearchOptimizer:
         gz_max = float(max(gz) if len(gz) else 0.0)
         return OptimizationResult(params={"L": L, "B": B, "T": T, "Cb": Cb}, displacement=disp, gz_max=gz_max)
 
-    def search(self, L_vals: Iterable[float], B_vals: Iterable[float], T_vals: Iterable[float], Cb_vals: Iterable[float]) -> pd.DataFrame:
+    def search(
+        self,
+        L_vals: Iterable[float],
+        B_vals: Iterable[float],
+        T_vals: Iterable[float],
+        Cb_vals: Iterable[float],
+        velocidad_kn: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """Busca em grade; com `velocidad_kn` adiciona a potência ao freio (Holtrop–Mennen)."""
         registros: List[Dict] = []
         t0 = datetime.now()
         for L, B, T, Cb in product(L_vals, B_vals, T_vals, Cb_vals):
@@ -70,6 +79,8 @@ class GridSearchOptimizer:
             registro = {**res.params, "displacement": res.displacement, "gz_max": res.gz_max, "feasible": feasible}
             registros.append(registro)
         df = pd.DataFrame(registros)
+        if velocidad_kn is not None:
+            df["potencia_kw"] = self.potencia_freno(df, velocidad_kn)
         df["pareto"] = self._pareto_flags(df)
         self._last_meta = {
             "started": t0.isoformat(timespec="seconds"),
@@ -79,6 +90,67 @@ class GridSearchOptimizer:
         }
         return df
 
+    @staticmethod
+    def potencia_freno(df: pd.DataFrame, velocidad_kn: float, **kwargs) -> np.ndarray:
+        """Potência ao freio (kW) de todas as linhas (L, B, T, Cb) numa só avaliação vetorizada."""
+        casco = ParametrosCasco(
+            lpp_m=df["L"].to_numpy(dtype=float),
+            manga_m=df["B"].to_numpy(dtype=float),
+            calado_m=df["T"].to_numpy(dtype=float),
+            cb=df["Cb"].to_numpy(dtype=float),
+        )
+        return ModeloResistencia(casco, **kwargs).potencia_freno_kw(velocidad_kn)
+
+    def search_potencia(
+        self,
+        L_vals: Iterable[float],
+        B_vals: Iterable[float],
+        T_vals: Iterable[float],
+        Cb_vals: Iterable[float],
+        velocidad_kn: float,
+        deslocamento_min_t: float = 0.0,
+    ) -> pd.DataFrame:
+        """Busca em grade analítica (sem conector) com a potência requerida como objetivo.
+
+        Deslocamento (ρ·Cb·L·B·T) e potência ao freio Holtrop–Mennen são
+        calculados para todo o produto cartesiano de uma vez, o que permite
+        milhões de candidatos. Pareto: mínima potência e máximo deslocamento.
+        """
+        grade = np.meshgrid(
+            *(np.asarray(list(v), dtype=float) for v in (L_vals, B_vals, T_vals, Cb_vals)), indexing="ij"
+        )
+        df = pd.DataFrame({k: g.ravel() for k, g in zip(("L", "B", "T", "Cb"), grade)})
+        df["displacement"] = RHO_AGUA_MAR * df["Cb"] * df["L"] * df["B"] * df["T"]
+        df["potencia_kw"] = self.potencia_freno(df, velocidad_kn)
+        L, B, T, Cb = (df[c].to_numpy() for c in ("L", "B", "T", "Cb"))
+        df["feasible"] = (
+            (0.55 <= Cb) & (Cb <= 0.85) & (T <= 0.12 * L) & (0.1 <= B / L) & (B / L <= 0.25)
+            & (df["displacement"].to_numpy() >= deslocamento_min_t) & np.isfinite(df["potencia_kw"].to_numpy())
+        )
+        df["pareto"] = self._pareto_potencia(df["potencia_kw"].to_numpy(), df["displacement"].to_numpy(),
+                                             df["feasible"].to_numpy())
+        self._last_meta = {
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "n_rows": str(len(df)),
+            "n_feasible": str(int(df["feasible"].sum())),
+        }
+        return df
+
+    @staticmethod
+    def _pareto_potencia(potencia: np.ndarray, deslocamento: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Fronteira (mín. potência, máx. deslocamento) por ordenação, O(n log n)."""
+        flags = np.zeros(len(potencia), dtype=bool)
+        idx = np.flatnonzero(mask)
+        if idx.size == 0:
+            return flags
+        # Ordenar por potência crescente (desempate: deslocamento decrescente)
+        ordem = idx[np.lexsort((-deslocamento[idx], potencia[idx]))]
+        d = deslocamento[ordem]
+        anterior = np.concatenate([[-np.inf], np.maximum.accumulate(d)[:-1]])
+        flags[ordem[d > anterior]] = True
+        return flags
+
     @staticmethod
     def _pareto_flags(df: pd.DataFrame) -> List[bool]:
         # Minimizar displacement, maximizar gz_max, somente soluções viáveis
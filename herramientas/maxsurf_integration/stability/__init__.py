@@ -1,4 +1,15 @@
 """Stability Analysis Module"""
 from .stability_analyzer import StabilityAnalyzer
+from .hidrostatica import TablaHidrostatica
+from .criterio_meteorologico import PerfilViento, evaluar_criterio_meteorologico
+from .simulacion_balance import ParametrosBalance, ResultadoBalance, SimuladorBalance
 
-__all__ = ['StabilityAnalyzer']
+__all__ = [
+    'StabilityAnalyzer',
+    'TablaHidrostatica',
+    'PerfilViento',
+    'evaluar_criterio_meteorologico',
+    'ParametrosBalance',
+    'ResultadoBalance',
+    'SimuladorBalance',
+]
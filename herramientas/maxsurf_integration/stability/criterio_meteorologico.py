@@ -0,0 +1,256 @@
+"""
+Criterio de viento y balance intensos (criterio meteorológico)
+==============================================================
+
+Implementación vectorizada del criterio meteorológico del Código IS 2008
+(Parte A, 2.3) para lotes de condiciones de carga y de presiones de viento:
+
+    - Brazos escorantes lw1 (viento constante) y lw2 = 1.5·lw1 (ráfaga)
+    - Ángulo de escora de equilibrio φ0 bajo lw1
+    - Ángulo de balance a barlovento φ1 = 109·k·X1·X2·√(r·s)
+    - Áreas a (entre φ0 − φ1 y la primera intersección con lw2) y
+      b (hasta φ2 = mín(φf, 50°, φc)); se exige b ≥ a
+
+El perfil lateral expuesto al viento se modela como un conjunto de
+rectángulos (x, z) sobre la línea base; el del Buque Grupo 9 se deriva de
+las dimensiones de `generar_plano_longitudinal_detallado.py`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+G = 9.81  # m/s²
+PRESION_VIENTO_IMO_PA = 504.0
+
+# Tablas 2.3.4-1 a 2.3.4-4 del Código IS 2008
+_TABLA_X1 = ([2.4, 2.5, 2.6, 2.7, 2.8, 2.9, 3.0, 3.1, 3.2, 3.4, 3.5],
+             [1.0, 0.98, 0.96, 0.95, 0.93, 0.91, 0.90, 0.88, 0.86, 0.82, 0.80])
+_TABLA_X2 = ([0.45, 0.50, 0.55, 0.60, 0.65, 0.70],
+             [0.75, 0.82, 0.89, 0.95, 0.97, 1.0])
+_TABLA_K = ([0.0, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0],
+            [1.0, 0.98, 0.95, 0.88, 0.79, 0.74, 0.72, 0.70])
+_TABLA_S = ([6.0, 7.0, 8.0, 12.0, 14.0, 16.0, 18.0, 20.0],
+            [0.100, 0.098, 0.093, 0.065, 0.053, 0.044, 0.038, 0.035])
+
+
+@dataclass
+class PerfilViento:
+    """Perfil lateral expuesto al viento como rectángulos (x0, x1, z0, z1) desde línea base."""
+
+    rectangulos: List[Tuple[float, float, float, float]] = field(default_factory=list)
+
+    @classmethod
+    def desde_plano_longitudinal(
+        cls,
+        altura_superestructura_m: float = 11.0,
+        altura_brazolas_m: float = 1.5,
+    ) -> "PerfilViento":
+        """
+        Perfil del Buque Grupo 9 a partir de `generar_plano_longitudinal_detallado`.
+
+        El plano longitudinal solo define el casco y la cámara de máquinas; la
+        acomodación sobre la cámara de máquinas y las brazolas de escotilla
+        sobre las bodegas se añaden con alturas estimadas.
+
+        Args:
+            altura_superestructura_m: Altura de la acomodación sobre cubierta
+            altura_brazolas_m: Altura de brazolas sobre las bodegas
+        """
+        try:
+            import generar_plano_longitudinal_detallado as plano  # type: ignore
+
+            lpp, depth = plano.LPP, plano.MAIN_DECK_HEIGHT
+            er_ini, er_fin = plano.ENGINE_ROOM_START, plano.ENGINE_ROOM_END
+        except Exception:  # pragma: no cover - script no accesible en sys.path
+            lpp, depth, er_ini, er_fin = 105.2, 7.90, 8.20, 23.20
+
+        return cls(
+            rectangulos=[
+                (0.0, lpp, 0.0, depth),
+                (er_ini, er_fin, depth, depth + altura_superestructura_m),
+                (er_fin, 0.94 * lpp, depth, depth + altura_brazolas_m),
+            ]
+        )
+
+    def area_y_palanca(self, calados_m) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Área lateral sobre la flotación y brazo vertical Z (vectorizado).
+
+        Z se mide desde el centroide del área expuesta hasta T/2
+        (centro aproximado del área lateral sumergida), según IS 2.3.3.
+
+        Returns:
+            (A en m², Z en m), arrays con la forma de `calados_m`
+        """
+        t = np.asarray(calados_m, dtype=float)
+        r = np.asarray(self.rectangulos, dtype=float)
+        largo = (r[:, 1] - r[:, 0])
+        z0 = np.maximum(r[:, 2], t[..., None])
+        z1 = r[:, 3]
+        alto = np.clip(z1 - z0, 0.0, None)
+        area = largo * alto
+        a_total = area.sum(axis=-1)
+        zc = (area * (z0 + z1) / 2.0).sum(axis=-1) / np.where(a_total > 0, a_total, 1.0)
+        return a_total, zc - t / 2.0
+
+
+def _gz_malla_simetrica(angulos_deg: np.ndarray, gz: np.ndarray, paso_deg: float):
+    """Remuestrear GZ (condiciones × ángulos) en malla fina y extender a escora negativa."""
+    amax = float(angulos_deg[-1])
+    phi = np.arange(-amax, amax + paso_deg / 2, paso_deg)
+    a = np.abs(phi)
+    idx = np.clip(np.searchsorted(angulos_deg, a, side="right") - 1, 0, len(angulos_deg) - 2)
+    w = (a - angulos_deg[idx]) / (angulos_deg[idx + 1] - angulos_deg[idx])
+    g = gz[:, idx] * (1.0 - w) + gz[:, idx + 1] * w
+    return phi, g * np.sign(phi)
+
+
+def _primer_cruce(phi: np.ndarray, dif: np.ndarray, desde: np.ndarray, asc: bool) -> np.ndarray:
+    """Primer ángulo ≥ `desde` donde `dif` cambia de signo (interpolado); NaN si no existe."""
+    mask = (dif >= 0) if asc else (dif < 0)
+    mask &= phi >= desde[..., None]
+    hay = mask.any(axis=-1)
+    i = np.argmax(mask, axis=-1)
+    i0 = np.maximum(i - 1, 0)
+    d0 = np.take_along_axis(dif, i0[..., None], axis=-1)[..., 0]
+    d1 = np.take_along_axis(dif, i[..., None], axis=-1)[..., 0]
+    den = np.where(d1 != d0, d1 - d0, 1.0)
+    frac = np.clip(-d0 / den, 0.0, 1.0)
+    ang = phi[i0] + frac * (phi[i] - phi[i0])
+    ang = np.where(i == 0, phi[i], ang)
+    return np.where(hay, ang, np.nan)
+
+
+def evaluar_criterio_meteorologico(
+    angulos_deg: Sequence[float],
+    gz_m,
+    desplazamiento_t,
+    calado_m,
+    kg_m,
+    gm_m,
+    perfil: PerfilViento,
+    manga_m: float,
+    eslora_flotacion_m: float,
+    cb: float,
+    presiones_pa: Sequence[float] = (PRESION_VIENTO_IMO_PA,),
+    area_quillas_balance_m2: float = 0.0,
+    angulo_inundacion_deg: float = 50.0,
+    angulo_inmersion_cubierta_deg=None,
+    paso_deg: float = 0.1,
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluar el criterio meteorológico para condiciones × presiones de viento.
+
+    Args:
+        angulos_deg: Ángulos de la curva GZ (crecientes, desde 0°)
+        gz_m: Matriz (condiciones × ángulos) de brazos GZ
+        desplazamiento_t, calado_m, kg_m, gm_m: Arrays (condiciones,)
+        perfil: Perfil lateral expuesto al viento
+        manga_m, eslora_flotacion_m, cb: Datos de carena
+        presiones_pa: Presiones de viento a barrer (IMO: 504 Pa)
+        area_quillas_balance_m2: Área total de quillas de balance (Ak)
+        angulo_inundacion_deg: Ángulo de inundación φf
+        angulo_inmersion_cubierta_deg: Ángulo de inmersión del canto de
+            cubierta por condición (None: no se aplica el límite del 80%)
+        paso_deg: Resolución de la integración
+
+    Returns:
+        Dict con arrays (condiciones × presiones): lw1_m, lw2_m, phi0_deg,
+        phi1_deg, phi2_deg, area_a_mrad, area_b_mrad, cumple_escora,
+        cumple_areas y cumple; y (condiciones,): periodo_balance_s
+    """
+    ang = np.asarray(angulos_deg, dtype=float)
+    gz = np.atleast_2d(np.asarray(gz_m, dtype=float))
+    disp = np.asarray(desplazamiento_t, dtype=float).reshape(-1)
+    t = np.asarray(calado_m, dtype=float).reshape(-1)
+    kg = np.asarray(kg_m, dtype=float).reshape(-1)
+    gm = np.asarray(gm_m, dtype=float).reshape(-1)
+    p = np.asarray(presiones_pa, dtype=float).reshape(-1)
+
+    # Brazos escorantes (condiciones × presiones)
+    area, palanca = perfil.area_y_palanca(t)
+    lw1 = p[None, :] * (area * palanca)[:, None] / (1000.0 * G * disp[:, None])
+    lw2 = 1.5 * lw1
+
+    # Ángulo de balance φ1
+    x1 = np.interp(manga_m / t, *_TABLA_X1)
+    x2 = np.interp(cb, *_TABLA_X2)
+    k = np.interp(area_quillas_balance_m2 * 100.0 / (eslora_flotacion_m * manga_m), *_TABLA_K)
+    og = kg - t
+    r = 0.73 + 0.6 * og / t
+    c = 0.373 + 0.023 * (manga_m / t) - 0.043 * (eslora_flotacion_m / 100.0)
+    periodo = 2.0 * c * manga_m / np.sqrt(np.clip(gm, 1e-6, None))
+    s = np.interp(periodo, *_TABLA_S)
+    phi1 = 109.0 * k * x1 * x2 * np.sqrt(np.clip(r * s, 0.0, None))
+
+    # Curva GZ en malla fina (condiciones × 1 × ángulos) para cruzar con lw1/lw2
+    phi, g = _gz_malla_simetrica(ang, gz, paso_deg)
+    g = g[:, None, :]
+    cero = np.zeros(lw1.shape)
+    phi0 = _primer_cruce(phi, g - lw1[..., None], cero, asc=True)
+    dif2 = g - lw2[..., None]
+    phic1 = _primer_cruce(phi, dif2, cero, asc=True)
+    phic2 = _primer_cruce(phi, dif2, np.nan_to_num(phic1, nan=np.inf), asc=False)
+    phi2 = np.fmin(np.fmin(phic2, angulo_inundacion_deg), 50.0)
+    inicio = phi0 - phi1[:, None]
+
+    d = np.radians(paso_deg)
+    en_a = (phi >= inicio[..., None]) & (phi < phic1[..., None])
+    en_b = (phi >= phic1[..., None]) & (phi < phi2[..., None])
+    area_a = np.where(en_a, -dif2, 0.0).sum(axis=-1) * d
+    area_b = np.where(en_b, dif2, 0.0).sum(axis=-1) * d
+
+    limite_escora = np.full(lw1.shape, 16.0)
+    if angulo_inmersion_cubierta_deg is not None:
+        inm = np.asarray(angulo_inmersion_cubierta_deg, dtype=float).reshape(-1, 1)
+        limite_escora = np.minimum(limite_escora, 0.8 * inm)
+    cumple_escora = np.nan_to_num(phi0, nan=np.inf) <= limite_escora
+    cumple_areas = np.isfinite(phic1) & (area_b >= area_a)
+
+    return {
+        "lw1_m": lw1,
+        "lw2_m": lw2,
+        "phi0_deg": phi0,
+        "phi1_deg": np.broadcast_to(phi1[:, None], lw1.shape).copy(),
+        "phi2_deg": phi2,
+        "area_a_mrad": area_a,
+        "area_b_mrad": area_b,
+        "cumple_escora": cumple_escora,
+        "cumple_areas": cumple_areas,
+        "cumple": cumple_escora & cumple_areas,
+        "periodo_balance_s": periodo,
+    }
+
+
+def areas_bajo_gz(angulos_deg: Sequence[float], gz_m, limites_deg: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """
+    Áreas bajo la curva GZ entre pares de ángulos para un lote de curvas.
+
+    Args:
+        angulos_deg: Ángulos (crecientes) de la curva
+        gz_m: Matriz (condiciones × ángulos)
+        limites_deg: Pares (inicio, fin) en grados
+
+    Returns:
+        Array (condiciones × intervalos) en m·rad
+    """
+    ang = np.asarray(angulos_deg, dtype=float)
+    gz = np.atleast_2d(np.asarray(gz_m, dtype=float))
+    # Integral acumulada trapezoidal interpolada en los límites
+    acum = np.concatenate(
+        [np.zeros((gz.shape[0], 1)),
+         np.cumsum((gz[:, 1:] + gz[:, :-1]) / 2.0 * np.radians(np.diff(ang)), axis=1)],
+        axis=1,
+    )
+
+    def _acum_en(a: float) -> np.ndarray:
+        j = int(np.clip(np.searchsorted(ang, a, side="right") - 1, 0, len(ang) - 2))
+        da = np.radians(a - ang[j])
+        pendiente = (gz[:, j + 1] - gz[:, j]) / np.radians(ang[j + 1] - ang[j])
+        return acum[:, j] + gz[:, j] * da + 0.5 * pendiente * da**2
+
+    return np.stack([_acum_en(b) - _acum_en(a) for a, b in limites_deg], axis=1)
@@ -0,0 +1,155 @@
+"""
+Tabla hidrostática paramétrica
+==============================
+
+Curvas hidrostáticas (desplazamiento, KB, BMt, KMt, LCB, LCF, MTC, TPC)
+tabuladas frente al calado a partir de las dimensiones principales y de los
+coeficientes de forma. Sirve como sustituto offline de la tabla que Maxsurf
+Stability entrega vía COM y se interpola de forma vectorizada sobre
+cualquier número de condiciones de carga.
+
+Modelo:
+    - Área de flotación  Awp(z) = Cwp · L · B · (z/T)^k, con k = Cwp/Cb − 1,
+      de modo que el volumen a calado de proyecto reproduce Cb.
+    - Inercias de la flotación por las aproximaciones habituales de
+      anteproyecto: IT = (0.096 + 0.89·Cwp²)/12 · L·B³ e IL = 0.076·Cwp² · B·L³.
+    - LCB y LCF constantes (fracción de Lpp medida desde la PP de popa).
+
+Es una aproximación de anteproyecto sin calibrar contra Maxsurf (calado,
+TPC y MTC difieren del orden del 10–25 % en el Buque 9).
+
+Valores por defecto: Buque Grupo 9 (`datos_buque_correctos.py`) con el
+Cwp = 0.879 leído de `tablas_datos/maxsurf_table.csv`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+RHO_AGUA_MAR = 1.025  # t/m³
+
+
+@dataclass
+class TablaHidrostatica:
+    """Curvas hidrostáticas tabuladas por calado (coordenada x desde PP de popa)."""
+
+    lpp_m: float
+    calados_m: np.ndarray
+    desplazamiento_t: np.ndarray
+    kb_m: np.ndarray
+    bmt_m: np.ndarray
+    kmt_m: np.ndarray
+    lcb_m: np.ndarray
+    lcf_m: np.ndarray
+    mtc_tm: np.ndarray
+    tpc_t: np.ndarray
+
+    @classmethod
+    def desde_parametros(
+        cls,
+        lpp_m: float = 105.2,
+        manga_m: float = 15.99,
+        calado_diseno_m: float = 6.20,
+        puntal_m: float = 7.90,
+        cb: float = 0.7252,
+        cwp: float = 0.879,
+        lcb_frac: float = 0.51,
+        lcf_frac: float = 0.49,
+        rho: float = RHO_AGUA_MAR,
+        n_calados: int = 80,
+    ) -> "TablaHidrostatica":
+        """
+        Construir la tabla desde dimensiones principales.
+
+        Args:
+            lpp_m: Eslora entre perpendiculares (m)
+            manga_m: Manga de trazado (m)
+            calado_diseno_m: Calado al que corresponden Cb y Cwp (m)
+            puntal_m: Puntal; la tabla se extiende hasta este calado (m)
+            cb: Coeficiente de bloque a calado de proyecto
+            cwp: Coeficiente de flotación a calado de proyecto
+            lcb_frac: LCB como fracción de Lpp desde la PP de popa
+            lcf_frac: LCF como fracción de Lpp desde la PP de popa
+            rho: Densidad del agua (t/m³)
+            n_calados: Número de puntos de la tabla
+
+        Returns:
+            TablaHidrostatica
+        """
+        if cwp <= cb:
+            raise ValueError("Cwp debe ser mayor que Cb para el modelo de flotación")
+
+        k = cwp / cb - 1.0
+        t = np.linspace(puntal_m / n_calados, puntal_m, n_calados)
+        rel = t / calado_diseno_m
+        cwp_t = cwp * rel**k
+        volumen = cwp * lpp_m * manga_m * calado_diseno_m * rel ** (k + 1.0) / (k + 1.0)
+        kb = t * (k + 1.0) / (k + 2.0)
+        it = (0.096 + 0.89 * cwp_t**2) / 12.0 * lpp_m * manga_m**3
+        il = 0.076 * cwp_t**2 * manga_m * lpp_m**3
+        bmt = it / volumen
+        bml = il / volumen
+        desplazamiento = rho * volumen
+
+        return cls(
+            lpp_m=float(lpp_m),
+            calados_m=t,
+            desplazamiento_t=desplazamiento,
+            kb_m=kb,
+            bmt_m=bmt,
+            kmt_m=kb + bmt,
+            lcb_m=np.full_like(t, lcb_frac * lpp_m),
+            lcf_m=np.full_like(t, lcf_frac * lpp_m),
+            mtc_tm=desplazamiento * bml / (100.0 * lpp_m),
+            tpc_t=rho * cwp_t * lpp_m * manga_m / 100.0,
+        )
+
+    def interpolar(self, desplazamiento_t) -> Dict[str, np.ndarray]:
+        """
+        Interpolar todas las curvas para uno o varios desplazamientos.
+
+        Args:
+            desplazamiento_t: Escalar o array de desplazamientos (t)
+
+        Returns:
+            Dict con arrays de la misma forma que la entrada
+        """
+        d = np.asarray(desplazamiento_t, dtype=float)
+        columnas = {
+            "calado_m": self.calados_m,
+            "kb_m": self.kb_m,
+            "bmt_m": self.bmt_m,
+            "kmt_m": self.kmt_m,
+            "lcb_m": self.lcb_m,
+            "lcf_m": self.lcf_m,
+            "mtc_tm": self.mtc_tm,
+            "tpc_t": self.tpc_t,
+        }
+        return {k: np.interp(d, self.desplazamiento_t, v) for k, v in columnas.items()}
+
+    def equilibrio(self, desplazamiento_t, lcg_m) -> Dict[str, np.ndarray]:
+        """
+        Calado medio, trimado y calados en perpendiculares (vectorizado).
+
+        El trimado es positivo por popa: trim = Δ·(LCB − LCG) / (100·MTC).
+
+        Args:
+            desplazamiento_t: Desplazamiento(s) (t)
+            lcg_m: LCG desde la PP de popa (m), misma forma que el desplazamiento
+
+        Returns:
+            Dict con calado_m, trimado_m, calado_popa_m, calado_proa_m y kmt_m
+        """
+        d = np.asarray(desplazamiento_t, dtype=float)
+        h = self.interpolar(d)
+        trimado = d * (h["lcb_m"] - np.asarray(lcg_m, dtype=float)) / (100.0 * h["mtc_tm"])
+        return {
+            "calado_m": h["calado_m"],
+            "trimado_m": trimado,
+            "calado_popa_m": h["calado_m"] + trimado * h["lcf_m"] / self.lpp_m,
+            "calado_proa_m": h["calado_m"] - trimado * (self.lpp_m - h["lcf_m"]) / self.lpp_m,
+            "kmt_m": h["kmt_m"],
+        }
@@ -0,0 +1,247 @@
+"""
+Simulación del balance no lineal en olas irregulares
+===================================================
+
+Integra en el dominio del tiempo la ecuación de balance de un grado de
+libertad con la curva GZ real como momento adrizante:
+
+    (I44 + A44)·φ'' + B1·φ' + B2·φ'·|φ'| + Δ·g·GZ(φ) = Δ·g·GM·r·α(t)
+
+donde α(t) es la pendiente de la ola irregular (mar de través) y r el
+factor de pendiente efectiva. Dividiendo por (I44 + A44):
+
+    φ'' = −2ζω0·φ' − b2·φ'·|φ'| − (ω0²/GM)·GZ(φ) + ω0²·r·α(t)
+
+Miles de realizaciones de mar (fases aleatorias, distintos estados de mar)
+se integran a la vez con un RK4 de paso fijo sobre arrays (realizaciones ×
+tiempo). La excitación de cada bloque temporal se obtiene con dos productos
+matriciales (realizaciones × componentes) @ (componentes × instantes).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+G = 9.81  # m/s²
+
+
+@dataclass
+class ParametrosBalance:
+    """Parámetros de inercia y amortiguamiento en balance."""
+
+    gm_m: float
+    manga_m: float = 15.99
+    radio_giro_frac: float = 0.40       # kxx / B
+    masa_anadida_frac: float = 0.20     # A44 / I44
+    amortiguamiento_lineal: float = 0.05  # fracción del crítico ζ
+    amortiguamiento_cuadratico: float = 0.02  # b2 (1/rad)
+    factor_pendiente: float = 0.73      # r, pendiente efectiva de la ola
+
+    @property
+    def omega0(self) -> float:
+        """Frecuencia natural de balance (rad/s)."""
+        kxx = self.radio_giro_frac * self.manga_m
+        return float(np.sqrt(G * self.gm_m / ((1.0 + self.masa_anadida_frac) * kxx**2)))
+
+    @property
+    def periodo_natural_s(self) -> float:
+        return 2.0 * np.pi / self.omega0
+
+
+def espectro_jonswap(omega: np.ndarray, hs_m: float, tp_s: float, gamma: float = 3.3) -> np.ndarray:
+    """Espectro JONSWAP (gamma = 1 reproduce Pierson-Moskowitz), m²·s/rad."""
+    wp = 2.0 * np.pi / tp_s
+    sigma = np.where(omega <= wp, 0.07, 0.09)
+    pm = 5.0 / 16.0 * hs_m**2 * wp**4 * omega**-5.0 * np.exp(-1.25 * (wp / omega) ** 4)
+    pico = gamma ** np.exp(-((omega - wp) ** 2) / (2.0 * sigma**2 * wp**2))
+    return (1.0 - 0.287 * np.log(gamma)) * pm * pico
+
+
+@dataclass
+class ResultadoBalance:
+    """Resultados por realización de la simulación."""
+
+    estado_mar: np.ndarray          # índice del estado de mar de cada realización
+    estados_mar: Sequence[Tuple[float, float]]
+    phi_max_deg: np.ndarray
+    phi_rms_deg: np.ndarray         # hasta la zozobra; NaN si vuelca durante el transitorio
+    zozobra: np.ndarray
+    tiempo_zozobra_s: np.ndarray
+    tiempos_s: Optional[np.ndarray] = None
+    series_deg: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def estadisticas(self) -> pd.DataFrame:
+        """Probabilidad de zozobra y estadísticos de balance por estado de mar."""
+        df = pd.DataFrame({
+            "estado_mar": self.estado_mar,
+            "phi_max_deg": self.phi_max_deg,
+            "phi_rms_deg": self.phi_rms_deg,
+            "zozobra": self.zozobra,
+        })
+        g = df.groupby("estado_mar")
+        res = pd.DataFrame({
+            "n_realizaciones": g.size(),
+            "prob_zozobra": g["zozobra"].mean(),
+            "phi_rms_medio_deg": g["phi_rms_deg"].mean(),
+            "phi_max_medio_deg": g["phi_max_deg"].mean(),
+            "phi_max_p50_deg": g["phi_max_deg"].quantile(0.50),
+            "phi_max_p90_deg": g["phi_max_deg"].quantile(0.90),
+            "phi_max_p99_deg": g["phi_max_deg"].quantile(0.99),
+        })
+        res.insert(0, "hs_m", [self.estados_mar[i][0] for i in res.index])
+        res.insert(1, "tp_s", [self.estados_mar[i][1] for i in res.index])
+        return res.reset_index()
+
+
+class SimuladorBalance:
+    """
+    Simulador vectorizado de balance no lineal con curva GZ real.
+
+    Ejemplo:
+        sim = SimuladorBalance(angulos, gz, ParametrosBalance(gm_m=1.2))
+        res = sim.simular([(3.0, 9.0), (6.0, 12.0)], n_realizaciones=1000)
+        res.estadisticas()
+    """
+
+    def __init__(
+        self,
+        angulos_deg: Sequence[float],
+        gz_m: Sequence[float],
+        parametros: ParametrosBalance,
+        angulo_zozobra_deg: Optional[float] = None,
+    ):
+        """
+        Args:
+            angulos_deg: Ángulos de la curva GZ (crecientes, desde 0°)
+            gz_m: Brazos GZ (m)
+            parametros: Inercia, amortiguamiento y GM
+            angulo_zozobra_deg: Ángulo a partir del cual se considera
+                zozobra (por defecto, ángulo de estabilidad nula de la curva
+                o su último ángulo)
+        """
+        self.angulos = np.radians(np.asarray(angulos_deg, dtype=float))
+        self.gz = np.asarray(gz_m, dtype=float)
+        self.parametros = parametros
+        if angulo_zozobra_deg is None:
+            negativos = np.nonzero((self.gz <= 0) & (self.angulos > 0))[0]
+            angulo_zozobra = self.angulos[negativos[0]] if len(negativos) else self.angulos[-1]
+        else:
+            angulo_zozobra = np.radians(angulo_zozobra_deg)
+        self.angulo_zozobra = float(angulo_zozobra)
+
+    def _restitucion(self, phi: np.ndarray) -> np.ndarray:
+        return np.sign(phi) * np.interp(np.abs(phi), self.angulos, self.gz)
+
+    def simular(
+        self,
+        estados_mar: Sequence[Tuple[float, float]],
+        n_realizaciones: int = 1000,
+        duracion_s: float = 600.0,
+        dt_s: float = 0.1,
+        n_componentes: int = 120,
+        gamma: float = 3.3,
+        t_transitorio_s: float = 60.0,
+        semilla: Optional[int] = None,
+        guardar_series: bool = False,
+        bloque: int = 512,
+        phi_inicial_deg: float = 0.0,
+    ) -> ResultadoBalance:
+        """
+        Simular un conjunto de realizaciones para varios estados de mar.
+
+        Args:
+            estados_mar: Lista de (Hs en m, Tp en s)
+            n_realizaciones: Realizaciones por estado de mar
+            duracion_s: Duración de cada realización (s)
+            dt_s: Paso de integración RK4 (s)
+            n_componentes: Componentes armónicas del mar irregular
+            gamma: Factor de pico JONSWAP
+            t_transitorio_s: Tiempo inicial excluido de los estadísticos
+            semilla: Semilla del generador aleatorio
+            guardar_series: Si True, guarda φ(t) de todas las realizaciones
+            bloque: Número de pasos cuya excitación se calcula de una vez
+            phi_inicial_deg: Escora inicial (ensayo de extinción con Hs = 0)
+
+        Returns:
+            ResultadoBalance
+        """
+        rng = np.random.default_rng(semilla)
+        p = self.parametros
+        w0 = p.omega0
+        c_lin = 2.0 * p.amortiguamiento_lineal * w0
+        c_gz = w0**2 / p.gm_m
+        c_ola = w0**2 * p.factor_pendiente
+        b2 = p.amortiguamiento_cuadratico
+
+        # Componentes del mar (malla común con perturbación para evitar periodicidad)
+        d_omega = (2.5 - 0.2) / n_componentes
+        omega = 0.2 + d_omega * (np.arange(n_componentes) + rng.uniform(0.0, 1.0, n_componentes))
+        estado = np.repeat(np.arange(len(estados_mar)), n_realizaciones)
+        amplitud_pend = np.stack([
+            np.sqrt(2.0 * espectro_jonswap(omega, hs, tp, gamma) * d_omega) * omega**2 / G
+            for hs, tp in estados_mar
+        ])[estado]
+        fase = rng.uniform(0.0, 2.0 * np.pi, amplitud_pend.shape)
+        a_cos = amplitud_pend * np.cos(fase)
+        a_sin = amplitud_pend * np.sin(fase)
+
+        n_real = len(estado)
+        n_pasos = int(round(duracion_s / dt_s))
+        phi = np.full(n_real, np.radians(phi_inicial_deg))
+        vel = np.zeros(n_real)
+        activo = np.ones(n_real, dtype=bool)
+        t_zoz = np.full(n_real, np.nan)
+        phi_max = np.zeros(n_real)
+        suma_cuad = np.zeros(n_real)
+        n_est = np.zeros(n_real, dtype=int)
+        series = np.zeros((n_real, n_pasos + 1), dtype=np.float32) if guardar_series else None
+        if series is not None:
+            series[:, 0] = np.degrees(phi)
+
+        def _acel(ph, v, exc):
+            return -c_lin * v - b2 * v * np.abs(v) - c_gz * self._restitucion(ph) + c_ola * exc
+
+        for inicio in range(0, n_pasos, bloque):
+            pasos = min(bloque, n_pasos - inicio)
+            # Excitación en t, t + dt/2 y t + dt para todo el bloque: (realizaciones × 2·pasos+1)
+            t = (inicio + 0.5 * np.arange(2 * pasos + 1)) * dt_s
+            arg = np.outer(omega, t)
+            exc = a_cos @ np.cos(arg) - a_sin @ np.sin(arg)
+
+            for k in range(pasos):
+                e0, e1, e2 = exc[:, 2 * k], exc[:, 2 * k + 1], exc[:, 2 * k + 2]
+                k1p, k1v = vel, _acel(phi, vel, e0)
+                k2p, k2v = vel + 0.5 * dt_s * k1v, _acel(phi + 0.5 * dt_s * k1p, vel + 0.5 * dt_s * k1v, e1)
+                k3p, k3v = vel + 0.5 * dt_s * k2v, _acel(phi + 0.5 * dt_s * k2p, vel + 0.5 * dt_s * k2v, e1)
+                k4p, k4v = vel + dt_s * k3v, _acel(phi + dt_s * k3p, vel + dt_s * k3v, e2)
+                phi = np.where(activo, phi + dt_s / 6.0 * (k1p + 2 * k2p + 2 * k3p + k4p), phi)
+                vel = np.where(activo, vel + dt_s / 6.0 * (k1v + 2 * k2v + 2 * k3v + k4v), 0.0)
+
+                paso = inicio + k + 1
+                volcado = activo & (np.abs(phi) >= self.angulo_zozobra)
+                t_zoz[volcado] = paso * dt_s
+                if paso * dt_s >= t_transitorio_s:
+                    # Tras la zozobra φ queda congelado y no entra en los estadísticos
+                    phi_max = np.maximum(phi_max, np.abs(phi))
+                    suma_cuad += np.where(activo, phi**2, 0.0)
+                    n_est += activo
+                activo &= ~volcado
+                if series is not None:
+                    series[:, paso] = np.degrees(phi)
+
+        zozobra = ~activo
+        phi_max = np.where(zozobra, np.maximum(phi_max, self.angulo_zozobra), phi_max)
+        return ResultadoBalance(
+            estado_mar=estado,
+            estados_mar=list(estados_mar),
+            phi_max_deg=np.degrees(phi_max),
+            phi_rms_deg=np.degrees(np.sqrt(suma_cuad / np.where(n_est > 0, n_est, np.nan))),
+            zozobra=zozobra,
+            tiempo_zozobra_s=t_zoz,
+            tiempos_s=np.arange(n_pasos + 1) * dt_s if guardar_series else None,
+            series_deg=series,
+        )
@@ -12,13 +12,23 @@ Características:
     - Verificación de criterios de estabilidad
     - Cumplimiento SOLAS Cap. II-1
     - Cumplimiento DNV Rules
+    - Criterio meteorológico (viento y balance intensos, Código IS 2.3)
+    - Barrido vectorizado de criterios sobre lotes de condiciones
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 import json
 
+from .criterio_meteorologico import (
+    PRESION_VIENTO_IMO_PA,
+    PerfilViento,
+    areas_bajo_gz,
+    evaluar_criterio_meteorologico,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +61,21 @@ class StabilityAnalyzer:
             'GM_inicial_min': 0.15  # GM inicial mínimo (m)
         }
         
+        # Criterio meteorológico (Código IS 2008, Parte A 2.3)
+        self.criterios_meteorologicos = {
+            'presion_viento_pa': PRESION_VIENTO_IMO_PA,
+            'angulo_escora_max_deg': 16.0,
+            'angulo_inundacion_deg': 50.0,
+        }
+        
+        # Datos de carena para el criterio meteorológico (Buque Grupo 9)
+        self.datos_carena = {
+            'manga_m': 15.99,
+            'eslora_flotacion_m': 105.2,
+            'cb': 0.7252,
+            'area_quillas_balance_m2': 0.0,
+        }
+        
         logger.info("⚓ Stability Analyzer inicializado")
     
     def calcular_GM(self, calado: Optional[float] = None) -> float:
@@ -258,6 +283,152 @@ class StabilityAnalyzer:
             logger.error(f"❌ Error verificando criterios SOLAS: {e}")
             return {}
     
+    def verificar_criterios_lote(
+        self,
+        angulos: Sequence[float],
+        gz,
+        gm
+    ) -> pd.DataFrame:
+        """
+        Verificar los criterios SOLAS de estabilidad intacta para un lote
+        de curvas GZ (una por condición) en una sola pasada vectorizada.
+        
+        Args:
+            angulos: Ángulos de escora comunes a todas las curvas (grados)
+            gz: Matriz (condiciones × ángulos) de brazos GZ (m)
+            gm: GM por condición (m)
+            
+        Returns:
+            DataFrame con una fila por condición y las mismas claves de
+            cumplimiento que verificar_criterios_solas()
+        """
+        ang = np.asarray(angulos, dtype=float)
+        gz = np.atleast_2d(np.asarray(gz, dtype=float))
+        gm = np.broadcast_to(np.asarray(gm, dtype=float), (gz.shape[0],))
+        c = self.criterios_solas
+        
+        areas = areas_bajo_gz(ang, gz, [(0, 30), (0, 40), (30, 40)])
+        i_max = np.argmax(gz, axis=1)
+        gz_max = gz[np.arange(gz.shape[0]), i_max]
+        
+        df = pd.DataFrame({
+            'GM_m': gm,
+            'area_0_30': areas[:, 0],
+            'area_0_40': areas[:, 1],
+            'area_30_40': areas[:, 2],
+            'GZ_max_m': gz_max,
+            'angulo_GZ_max_deg': ang[i_max],
+        })
+        df['GM_suficiente'] = df['GM_m'] >= c['GM_min']
+        df['area_0_30_ok'] = df['area_0_30'] >= c['area_0_30']
+        df['area_0_40_ok'] = df['area_0_40'] >= c['area_0_40']
+        df['area_30_40_ok'] = df['area_30_40'] >= c['area_30_40']
+        df['GZ_max_suficiente'] = df['GZ_max_m'] >= c['GZ_max_min']
+        df['angulo_GZ_max_ok'] = df['angulo_GZ_max_deg'] >= c['angulo_GZ_max_min']
+        df['cumple_solas'] = df[[
+            'GM_suficiente', 'area_0_30_ok', 'area_0_40_ok',
+            'area_30_40_ok', 'GZ_max_suficiente', 'angulo_GZ_max_ok'
+        ]].all(axis=1)
+        return df
+    
+    def criterio_meteorologico(
+        self,
+        angulos: Sequence[float],
+        gz,
+        desplazamiento_t,
+        calado_m,
+        kg_m,
+        gm_m,
+        perfil: Optional[PerfilViento] = None,
+        presiones_pa: Optional[Sequence[float]] = None,
+        angulo_inmersion_cubierta_deg=None
+    ) -> pd.DataFrame:
+        """
+        Criterio de viento y balance intensos (Código IS 2008, 2.3).
+        
+        Vectorizado sobre condiciones y presiones de viento: brazos lw1/lw2,
+        ángulo de equilibrio φ0, ángulo de balance φ1 y comparación de
+        áreas a/b.
+        
+        Args:
+            angulos: Ángulos de la curva GZ (grados, desde 0°)
+            gz: Matriz (condiciones × ángulos) de brazos GZ (m)
+            desplazamiento_t, calado_m, kg_m, gm_m: Valores por condición
+            perfil: Perfil lateral de viento (por defecto, el del plano
+                    longitudinal del Buque Grupo 9)
+            presiones_pa: Presiones de viento a barrer (por defecto, 504 Pa)
+            angulo_inmersion_cubierta_deg: Ángulo de inmersión del canto de
+                    cubierta por condición (límite 80%)
+            
+        Returns:
+            DataFrame en formato largo (condición × presión)
+        """
+        logger.info("🌬️  Evaluando criterio meteorológico (IS 2.3)...")
+        
+        if perfil is None:
+            perfil = PerfilViento.desde_plano_longitudinal()
+        if presiones_pa is None:
+            presiones_pa = [self.criterios_meteorologicos['presion_viento_pa']]
+        
+        res = evaluar_criterio_meteorologico(
+            angulos, gz, desplazamiento_t, calado_m, kg_m, gm_m,
+            perfil=perfil,
+            manga_m=self.datos_carena['manga_m'],
+            eslora_flotacion_m=self.datos_carena['eslora_flotacion_m'],
+            cb=self.datos_carena['cb'],
+            presiones_pa=presiones_pa,
+            area_quillas_balance_m2=self.datos_carena['area_quillas_balance_m2'],
+            angulo_inundacion_deg=self.criterios_meteorologicos['angulo_inundacion_deg'],
+            angulo_inmersion_cubierta_deg=angulo_inmersion_cubierta_deg,
+        )
+        n_cond, n_pres = res['lw1_m'].shape
+        df = pd.DataFrame({
+            'condicion': np.repeat(np.arange(n_cond), n_pres),
+            'presion_pa': np.tile(np.asarray(presiones_pa, dtype=float), n_cond),
+            'periodo_balance_s': np.repeat(res['periodo_balance_s'], n_pres),
+        })
+        for clave in ['lw1_m', 'lw2_m', 'phi0_deg', 'phi1_deg', 'phi2_deg',
+                      'area_a_mrad', 'area_b_mrad', 'cumple_escora',
+                      'cumple_areas', 'cumple']:
+            df[clave] = res[clave].reshape(-1)
+        df = df.rename(columns={'cumple': 'cumple_meteorologico'})
+        
+        n_ok = int(df['cumple_meteorologico'].sum())
+        logger.info(f"✅ Criterio meteorológico: {n_ok}/{len(df)} casos cumplen")
+        return df
+    
+    def barrido_estabilidad(
+        self,
+        angulos: Sequence[float],
+        gz,
+        desplazamiento_t,
+        calado_m,
+        kg_m,
+        gm_m,
+        perfil: Optional[PerfilViento] = None,
+        presiones_pa: Optional[Sequence[float]] = None,
+        angulo_inmersion_cubierta_deg=None
+    ) -> pd.DataFrame:
+        """
+        Barrer criterios intactos y meteorológico en una sola pasada.
+        
+        Returns:
+            DataFrame (condición × presión) con los resultados de ambos
+            criterios y la columna 'cumple_total'
+        """
+        intacto = self.verificar_criterios_lote(angulos, gz, gm_m)
+        intacto.insert(0, 'condicion', np.arange(len(intacto)))
+        viento = self.criterio_meteorologico(
+            angulos, gz, desplazamiento_t, calado_m, kg_m, gm_m,
+            perfil=perfil,
+            presiones_pa=presiones_pa,
+            angulo_inmersion_cubierta_deg=angulo_inmersion_cubierta_deg,
+        )
+        df = viento.merge(intacto, on='condicion', how='left')
+        df['cumple_total'] = df['cumple_solas'] & df['cumple_meteorologico']
+        self.resultados['barrido_estabilidad'] = df
+        return df
+    
     def analisis_completo_buque9(self) -> Dict:
         """
         Realizar análisis completo de estabilidad para Buque 9.
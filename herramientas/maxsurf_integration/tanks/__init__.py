@@ -1,4 +1,15 @@
 """Tanks Design Module"""
 from .tank_designer import TankDesigner
+from .superficie_libre import GeometriaTanque, MotorSuperficieLibre
+from .calibracion import CalibradorTanques, TablaCalibracion
+from .simulacion_travesia import ResultadoTravesia, SimuladorTravesia
 
-__all__ = ['TankDesigner']
+__all__ = [
+    'TankDesigner',
+    'GeometriaTanque',
+    'MotorSuperficieLibre',
+    'CalibradorTanques',
+    'TablaCalibracion',
+    'ResultadoTravesia',
+    'SimuladorTravesia',
+]
@@ -0,0 +1,358 @@
+"""
+Tablas de calibración (sondas) de tanques
+=========================================
+
+Cubica cada tanque intersectando su contorno con los offsets del casco y
+genera la tabla de sondas a resolución milimétrica:
+
+    sonda → volumen, LCG, TCG, VCG y FSM
+
+junto con las tablas de corrección por trimado y por escora habituales en
+los libros de calibración (corrección a sumar a la sonda observada para
+entrar en la tabla a quilla par).
+
+Método: el tanque se discretiza en columnas verticales sobre una malla
+(x, y). Cada columna ocupa un intervalo [z_inf, z_sup], recortado por el
+fondo/techo del tanque, por sus costados inclinados y por el casco. Para un
+plano de líquido z = L + t(x, y) todas las sumas de la tabla son polinomios
+en L acumulados sobre las columnas ordenadas por su cota de entrada y de
+salida, por lo que una tabla completa cuesta O(n·log n) con independencia
+del número de sondas.
+
+Las tablas se guardan por tanque con la sonda implícita (paso fijo), el
+volumen en float64 para la búsqueda inversa (volumen → sonda, por
+bisección vectorizada) y el resto de columnas en float32.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from maxsurf_integration.hull_design.offsets import TablaOffsets
+from .superficie_libre import GeometriaTanque
+
+COLUMNAS_CALIBRACION = ("volumen_m3", "lcg_m", "tcg_m", "vcg_m", "fsm_tm")
+
+
+@dataclass
+class TablaCalibracion:
+    """Tabla de sondas de un tanque con correcciones por trimado y escora."""
+
+    nombre: str
+    paso_m: float
+    volumen_m3: np.ndarray
+    lcg_m: np.ndarray
+    tcg_m: np.ndarray
+    vcg_m: np.ndarray
+    fsm_tm: np.ndarray
+    densidad_tm3: float = 1.0
+    posicion_sonda: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    trimados_m: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    correccion_trimado_m: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)), repr=False)
+    escoras_deg: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    correccion_escora_m: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)), repr=False)
+    paso_correccion_m: float = 0.01
+
+    @property
+    def altura_m(self) -> float:
+        return self.paso_m * (len(self.volumen_m3) - 1)
+
+    @property
+    def capacidad_m3(self) -> float:
+        return float(self.volumen_m3[-1])
+
+    def _correccion(self, sonda: np.ndarray, trimado_m, escora_deg) -> np.ndarray:
+        corr = np.zeros_like(sonda)
+        pos = np.clip(sonda / self.paso_correccion_m, 0, None)
+        for valores, tabla, eje in (
+            (trimado_m, self.correccion_trimado_m, self.trimados_m),
+            (escora_deg, self.correccion_escora_m, self.escoras_deg),
+        ):
+            if len(eje) == 0:
+                continue
+            valores = np.broadcast_to(np.asarray(valores, dtype=float), sonda.shape)
+            if not np.any(valores):
+                continue
+            fa = np.interp(valores, eje, np.arange(len(eje)))
+            ia = np.minimum(fa.astype(int), len(eje) - 2) if len(eje) > 1 else np.zeros(sonda.shape, int)
+            wa = fa - ia
+            n = tabla.shape[1]
+            js = np.minimum(pos.astype(int), n - 2)
+            ws = np.clip(pos - js, 0.0, 1.0)
+            fila0 = tabla[ia, js] * (1 - ws) + tabla[ia, js + 1] * ws
+            if len(eje) > 1:
+                fila1 = tabla[ia + 1, js] * (1 - ws) + tabla[ia + 1, js + 1] * ws
+                fila0 = fila0 * (1 - wa) + fila1 * wa
+            corr = corr + fila0
+        return corr
+
+    def _interp(self, columna: np.ndarray, sonda: np.ndarray) -> np.ndarray:
+        pos = np.clip(sonda / self.paso_m, 0.0, len(columna) - 1)
+        i = np.minimum(pos.astype(int), len(columna) - 2)
+        w = pos - i
+        return columna[i] * (1.0 - w) + columna[i + 1] * w
+
+    def sonda_quilla_par(self, sonda_m, trimado_m=0.0, escora_deg=0.0) -> np.ndarray:
+        """Sonda observada corregida por trimado y escora (m)."""
+        sonda = np.asarray(sonda_m, dtype=float)
+        return np.clip(sonda + self._correccion(sonda, trimado_m, escora_deg), 0.0, self.altura_m)
+
+    def propiedades(self, sonda_m, trimado_m=0.0, escora_deg=0.0) -> Dict[str, np.ndarray]:
+        """
+        Volumen, centros y FSM para sondas observadas (vectorizado).
+
+        Args:
+            sonda_m: Sonda(s) observadas (m)
+            trimado_m: Trimado (m, positivo por popa)
+            escora_deg: Escora (grados, positiva a estribor)
+
+        Returns:
+            Dict con un array por columna de COLUMNAS_CALIBRACION y 'masa_t'
+        """
+        s = self.sonda_quilla_par(sonda_m, trimado_m, escora_deg)
+        res = {c: self._interp(getattr(self, c), s) for c in COLUMNAS_CALIBRACION}
+        res["masa_t"] = res["volumen_m3"] * self.densidad_tm3
+        return res
+
+    def volumen(self, sonda_m, trimado_m=0.0, escora_deg=0.0) -> np.ndarray:
+        """Volumen (m³) para sondas observadas."""
+        s = self.sonda_quilla_par(sonda_m, trimado_m, escora_deg)
+        return self._interp(self.volumen_m3, s)
+
+    def sonda(self, volumen_m3, trimado_m=0.0, escora_deg=0.0) -> np.ndarray:
+        """
+        Búsqueda inversa volumen → sonda observada (vectorizada).
+
+        Args:
+            volumen_m3: Volumen(es) de líquido (m³)
+            trimado_m: Trimado (m, positivo por popa)
+            escora_deg: Escora (grados, positiva a estribor)
+
+        Returns:
+            Sonda(s) que se leerían en el tubo de sonda (m)
+        """
+        v = np.clip(np.asarray(volumen_m3, dtype=float), 0.0, self.capacidad_m3)
+        tabla = self.volumen_m3
+        i = np.clip(np.searchsorted(tabla, v, side="left"), 1, len(tabla) - 1)
+        v0, v1 = tabla[i - 1], tabla[i]
+        frac = np.clip((v - v0) / np.where(v1 > v0, v1 - v0, 1.0), 0.0, 1.0)
+        s_par = (i - 1 + frac) * self.paso_m
+        if not (np.any(trimado_m) or np.any(escora_deg)):
+            return s_par
+        # La corrección depende de la sonda observada: punto fijo s = s_par − c(s)
+        s = s_par.copy()
+        for _ in range(4):
+            s = np.clip(s_par - self._correccion(s, trimado_m, escora_deg), 0.0, self.altura_m)
+        return s
+
+    def a_dataframe(self, paso_m: Optional[float] = None) -> pd.DataFrame:
+        """Tabla de sondas a quilla par (por defecto, a la resolución almacenada)."""
+        paso = paso_m or self.paso_m
+        sondas = np.arange(0.0, self.altura_m + 0.5 * paso, paso)
+        df = pd.DataFrame(self.propiedades(sondas))
+        df.insert(0, "sonda_m", sondas)
+        return df
+
+
+def _sumas_por_debajo(claves: np.ndarray, valores: np.ndarray, niveles: np.ndarray) -> np.ndarray:
+    """Σ valores[c] para las columnas con claves[c] < nivel (niveles × magnitudes)."""
+    orden = np.argsort(claves)
+    acum = np.vstack([np.zeros(valores.shape[1]), np.cumsum(valores[orden], axis=0)])
+    return acum[np.searchsorted(claves[orden], niveles, side="left")]
+
+
+class CalibradorTanques:
+    """
+    Generador de tablas de calibración a partir de los offsets del casco.
+
+    Ejemplo:
+        cal = CalibradorTanques(TablaOffsets.desde_parametros())
+        tabla = cal.calibrar(geometria)
+        tabla.sonda(120.0, trimado_m=1.5)
+    """
+
+    def __init__(
+        self,
+        offsets: Optional[TablaOffsets] = None,
+        n_x: int = 240,
+        n_y: int = 120,
+    ):
+        """
+        Args:
+            offsets: Offsets del casco (None: tanque sin recortar por el casco)
+            n_x: Columnas de la malla en eslora por tanque
+            n_y: Columnas de la malla en manga por tanque
+        """
+        self.offsets = offsets
+        self.n_x = n_x
+        self.n_y = n_y
+
+    def columnas(self, geom: GeometriaTanque) -> Dict[str, np.ndarray]:
+        """
+        Discretizar un tanque en columnas verticales.
+
+        Returns:
+            Dict con x, y, area (con permeabilidad), area_libre, z_inf y z_sup
+            de cada columna no vacía
+        """
+        b0, b1 = geom.ancho_fondo_m, geom._ancho_techo
+        ancho = max(b0, b1)
+        dx, dy = geom.largo_m / self.n_x, ancho / self.n_y
+        x = geom.x_centro_m - 0.5 * geom.largo_m + dx * (np.arange(self.n_x) + 0.5)
+        y = geom.y_centro_m - 0.5 * ancho + dy * (np.arange(self.n_y) + 0.5)
+        z_inf = np.full((self.n_x, self.n_y), geom.z_fondo_m)
+        z_sup = np.full((self.n_x, self.n_y), geom.z_fondo_m + geom.alto_m)
+
+        # Costados del tanque: |y − yc| ≤ ancho(z)/2 con ancho lineal en z
+        d = 2.0 * np.abs(y - geom.y_centro_m)
+        if b1 != b0:
+            z_lim = geom.z_fondo_m + (d - b0) / (b1 - b0) * geom.alto_m
+            if b1 > b0:
+                z_inf = np.maximum(z_inf, z_lim[None, :])
+            else:
+                z_sup = np.minimum(z_sup, z_lim[None, :])
+        if self.offsets is not None:
+            z_inf = np.maximum(z_inf, self.offsets.altura_minima(x, y))
+
+        xx, yy = np.meshgrid(x, y, indexing="ij")
+        dentro = z_sup > z_inf
+        area = dx * dy
+        return {
+            "x": xx[dentro],
+            "y": yy[dentro],
+            "area": np.full(dentro.sum(), area * geom.permeabilidad),
+            "area_libre": np.full(dentro.sum(), area),
+            "z_inf": z_inf[dentro],
+            "z_sup": z_sup[dentro],
+        }
+
+    @staticmethod
+    def _tabla(col: Dict[str, np.ndarray], inclinacion: np.ndarray, niveles: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Sumas de volumen y momentos para planos z = L + t(x, y).
+
+        Con t la inclinación del plano en cada columna, el líquido de la
+        columna llega a z = clip(L + t, z_inf, z_sup); cada suma es un
+        polinomio en L con coeficientes acumulados por debajo de
+        α = z_inf − t (columna mojada) y de β = z_sup − t (columna llena).
+        """
+        w, t, x, y = col["area"], inclinacion, col["x"], col["y"]
+        a, b, al = col["z_inf"], col["z_sup"], col["area_libre"]
+        alfa, beta = a - t, b - t
+        L = niveles
+
+        def _momentos(cota, z_borde):
+            # Términos de V, Mx, My (lineales) y Mz (cuadrático) y de la superficie libre
+            v = np.column_stack([
+                w, w * cota, w * x, w * x * cota, w * y, w * y * cota,
+                w, w * t, w * t**2, w * z_borde**2,
+                al, al * y, al * y**2,
+            ])
+            return _sumas_por_debajo(cota, v, L)
+
+        sa, sb = _momentos(alfa, a), _momentos(beta, b)
+
+        def _lineal(s, k):
+            # Σ q·(L − cota) = L·Σq − Σq·cota
+            return L * s[:, k] - s[:, k + 1]
+
+        vol = _lineal(sa, 0) - _lineal(sb, 0)
+        mx = _lineal(sa, 2) - _lineal(sb, 2)
+        my = _lineal(sa, 4) - _lineal(sb, 4)
+        # Σ w·[(L + t)² − z_borde²]/2
+        mz = 0.5 * (
+            (L**2 * sa[:, 6] + 2 * L * sa[:, 7] + sa[:, 8] - sa[:, 9])
+            - (L**2 * sb[:, 6] + 2 * L * sb[:, 7] + sb[:, 8] - sb[:, 9])
+        )
+        # Superficie libre: columnas mojadas y no llenas
+        area = sa[:, 10] - sb[:, 10]
+        sy = sa[:, 11] - sb[:, 11]
+        syy = sa[:, 12] - sb[:, 12]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            inercia = np.where(area > 0, syy - sy**2 / np.where(area > 0, area, 1.0), 0.0)
+            lcg = np.where(vol > 0, mx / np.where(vol > 0, vol, 1.0), np.nan)
+            tcg = np.where(vol > 0, my / np.where(vol > 0, vol, 1.0), np.nan)
+            vcg = np.where(vol > 0, mz / np.where(vol > 0, vol, 1.0), np.nan)
+        return {"volumen_m3": vol, "lcg_m": lcg, "tcg_m": tcg, "vcg_m": vcg, "inercia_m4": np.maximum(inercia, 0.0)}
+
+    def calibrar(
+        self,
+        geom: GeometriaTanque,
+        paso_m: float = 0.001,
+        posicion_sonda: Optional[Tuple[float, float]] = None,
+        trimados_m: Sequence[float] = (-1.0, -0.5, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0),
+        escoras_deg: Sequence[float] = (-5.0, -2.5, 2.5, 5.0),
+        paso_correccion_m: float = 0.01,
+        eslora_trimado_m: Optional[float] = None,
+    ) -> TablaCalibracion:
+        """
+        Generar la tabla de calibración de un tanque.
+
+        Args:
+            geom: Contorno del tanque (x desde PP de popa, z desde base)
+            paso_m: Resolución de la tabla de sondas (m), 1 mm por defecto
+            posicion_sonda: (x, y) del tubo de sonda; por defecto en el
+                extremo de popa del tanque, en su eje
+            trimados_m: Trimados de la tabla de corrección (m, + por popa)
+            escoras_deg: Escoras de la tabla de corrección (°, + a estribor)
+            paso_correccion_m: Resolución en sonda de las correcciones (m)
+            eslora_trimado_m: Eslora sobre la que se mide el trimado (por
+                defecto Lpp de los offsets o la eslora del tanque)
+
+        Returns:
+            TablaCalibracion
+        """
+        col = self.columnas(geom)
+        if posicion_sonda is None:
+            posicion_sonda = (geom.x_centro_m - 0.45 * geom.largo_m, geom.y_centro_m)
+        xs, ys = posicion_sonda
+        if eslora_trimado_m is None:
+            eslora_trimado_m = self.offsets.lpp_m if self.offsets is not None else geom.largo_m
+
+        sondas = np.arange(0.0, geom.alto_m + 0.5 * paso_m, paso_m)
+        base = self._tabla(col, np.zeros_like(col["x"]), geom.z_fondo_m + sondas)
+        vol = np.maximum.accumulate(np.maximum(base["volumen_m3"], 0.0))
+
+        tabla = TablaCalibracion(
+            nombre=geom.nombre,
+            paso_m=paso_m,
+            volumen_m3=vol,
+            lcg_m=base["lcg_m"].astype(np.float32),
+            tcg_m=base["tcg_m"].astype(np.float32),
+            vcg_m=base["vcg_m"].astype(np.float32),
+            fsm_tm=(geom.densidad_tm3 * base["inercia_m4"]).astype(np.float32),
+            densidad_tm3=geom.densidad_tm3,
+            posicion_sonda=(xs, ys, geom.z_fondo_m),
+            paso_correccion_m=paso_correccion_m,
+        )
+
+        sondas_c = np.arange(0.0, geom.alto_m + 0.5 * paso_correccion_m, paso_correccion_m)
+
+        def _correcciones(inclinaciones):
+            filas = []
+            for t in inclinaciones:
+                # Nivel del plano tal que pasa por la sonda observada en el tubo
+                t_tubo = t(np.array([xs]), np.array([ys]))[0]
+                v = self._tabla(col, t(col["x"], col["y"]), geom.z_fondo_m + sondas_c - t_tubo)["volumen_m3"]
+                filas.append(tabla.sonda(np.maximum(v, 0.0)) - sondas_c)
+            return np.array(filas, dtype=np.float32).reshape(len(filas), len(sondas_c))
+
+        # Trimado por popa: la superficie libre sube hacia popa (x decreciente)
+        tabla.trimados_m = np.sort(np.append(np.asarray(trimados_m, dtype=float), 0.0))
+        tabla.correccion_trimado_m = _correcciones(
+            [lambda x, y, tr=tr: -tr / eslora_trimado_m * x for tr in tabla.trimados_m]
+        )
+        # Escora a estribor (y negativa): la superficie libre sube hacia estribor
+        tabla.escoras_deg = np.sort(np.append(np.asarray(escoras_deg, dtype=float), 0.0))
+        tabla.correccion_escora_m = _correcciones(
+            [lambda x, y, e=e: -np.tan(np.radians(e)) * y for e in tabla.escoras_deg]
+        )
+        return tabla
+
+    def calibrar_tanques(self, geometrias: Sequence[GeometriaTanque], **kwargs) -> Dict[str, TablaCalibracion]:
+        """Calibrar varios tanques (mismos argumentos que `calibrar`)."""
+        return {g.nombre: self.calibrar(g, **kwargs) for g in geometrias}
@@ -0,0 +1,264 @@
+"""
+Simulación de consumo en travesía
+=================================
+
+Vacía los tanques de combustible paso a paso siguiendo una secuencia de uso
+y actualiza en cada paso desplazamiento, KG, superficie libre, trimado y GM
+para comprobar la estabilidad durante toda la travesía (p. ej. 30 días a
+resolución horaria, 720 condiciones).
+
+El consumo de cada paso sale del calculador que se inyecta, normalmente
+`CalculadorConsumo` de `herramientas/calculos_combustible_optimizados.py`
+(un script fuera del paquete), con `consumo_navegacion_batch` en una sola
+llamada. Entre pasos sólo cambian uno o dos
+tanques, así que las sumas de masa, momentos y FSM de la condición se
+actualizan restando la aportación anterior de esos tanques y sumando la
+nueva (`MotorSuperficieLibre.contribuciones`), sin recalcular el resto. El
+equilibrio hidrostático de todos los pasos se interpola al final en un solo
+lote.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..stability.hidrostatica import TablaHidrostatica
+from .superficie_libre import COLUMNAS_TABLA, MotorSuperficieLibre
+
+logger = logging.getLogger(__name__)
+
+Serie = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass
+class ResultadoTravesia:
+    """Condiciones de carga de cada paso de la travesía."""
+
+    condiciones: pd.DataFrame
+    llenados: np.ndarray  # (pasos + 1) × tanques
+    nombres_tanques: Sequence[str]
+
+    def resumen(self) -> Dict[str, float]:
+        """Valores extremos de la travesía."""
+        df = self.condiciones
+        peor = df.loc[df["gm_corregido_m"].idxmin()]
+        return {
+            "horas": float(df["hora"].iloc[-1]),
+            "distancia_nm": float(df["distancia_nm"].iloc[-1]),
+            "combustible_consumido_t": float(df["consumo_acumulado_t"].iloc[-1]),
+            "rob_final_t": float(df["rob_t"].iloc[-1]),
+            "gm_min_m": float(peor["gm_corregido_m"]),
+            "hora_gm_min": float(peor["hora"]),
+            "trimado_max_abs_m": float(df["trimado_m"].abs().max()),
+            "cumple_toda_travesia": bool(df["cumple"].all()),
+        }
+
+
+class SimuladorTravesia:
+    """
+    Simulador de vaciado de tanques con actualización incremental.
+
+    Ejemplo:
+        from calculos_combustible_optimizados import CalculadorConsumo
+        sim = SimuladorTravesia(motor, tabla, 1900.0, 4.5, 45.0, CalculadorConsumo())
+        res = sim.simular({"FUEL_A": 0.98, "FUEL_B": 0.98}, ["FUEL_A", "FUEL_B"])
+        res.resumen()
+    """
+
+    def __init__(
+        self,
+        motor: MotorSuperficieLibre,
+        tabla: TablaHidrostatica,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        calculador,
+    ):
+        """
+        Args:
+            motor: Motor de superficie libre con todos los tanques del buque
+            tabla: Tabla hidrostática
+            desplazamiento_rosca_t: Peso en rosca más pesos fijos (t)
+            kg_rosca_m: KG del peso en rosca (m)
+            lcg_rosca_m: LCG del peso en rosca desde PP de popa (m)
+            calculador: Objeto con `consumo_navegacion_batch` o
+                `consumo_navegacion`, p. ej. `CalculadorConsumo` de
+                calculos_combustible_optimizados
+        """
+        self.motor = motor
+        self.tabla = tabla
+        self.rosca = (desplazamiento_rosca_t, kg_rosca_m, lcg_rosca_m)
+        self.calculador = calculador
+        self._indice = {n: i for i, n in enumerate(motor.nombres)}
+        self._capacidad_t = np.array([t.volumen_m3 * t.densidad_tm3 for t in motor.tanques])
+
+    def consumos_horarios(self, velocidad_kn, temp_ambiente_c, meses_desde_limpieza, altura_ola_m) -> np.ndarray:
+        """
+        Consumo total (t/h) de cada paso.
+
+        Con `consumo_navegacion_batch` se evalúan todos los pasos de una vez;
+        si el calculador sólo tiene la versión escalar, se llama una vez por
+        combinación distinta de entradas.
+        """
+        if hasattr(self.calculador, "consumo_navegacion_batch"):
+            res = self.calculador.consumo_navegacion_batch(
+                velocidad_kn, temp_ambiente_c, meses_desde_limpieza, altura_ola_m
+            )
+            return np.asarray(res["consumo_total_kg_h"], dtype=float) / 1000.0
+        claves = np.column_stack([velocidad_kn, temp_ambiente_c, meses_desde_limpieza, altura_ola_m])
+        unicas, inversa = np.unique(claves, axis=0, return_inverse=True)
+        kg_h = np.array([
+            self.calculador.consumo_navegacion(
+                v, temp_ambiente_c=t, meses_desde_limpieza=int(m), altura_ola_m=h
+            )["consumo_total_kg_h"]
+            for v, t, m, h in unicas
+        ])
+        return kg_h[inversa.ravel()] / 1000.0
+
+    def simular(
+        self,
+        llenados_iniciales: Dict[str, float],
+        secuencia: Sequence[str],
+        horas: float = 720.0,
+        dt_h: float = 1.0,
+        velocidad_kn: Serie = 14.5,
+        temp_ambiente_c: Serie = 25.0,
+        meses_desde_limpieza: Serie = 6,
+        altura_ola_m: Serie = 1.5,
+        llenado_minimo: float = 0.02,
+        consumos_adicionales_t_h: Optional[Dict[str, float]] = None,
+        gm_min_m: float = 0.15,
+        trimado_max_m: Optional[float] = None,
+    ) -> ResultadoTravesia:
+        """
+        Simular la travesía.
+
+        Args:
+            llenados_iniciales: Llenado de salida por tanque (0-1); los
+                tanques no indicados salen vacíos
+            secuencia: Orden de uso de los tanques de combustible
+            horas: Duración de la travesía (h)
+            dt_h: Paso de la simulación (h)
+            velocidad_kn, temp_ambiente_c, meses_desde_limpieza,
+                altura_ola_m: Valor constante o serie con un valor por paso
+            llenado_minimo: Remanente no aspirable de cada tanque (0-1)
+            consumos_adicionales_t_h: Consumo fijo de otros tanques (p. ej.
+                agua dulce) en t/h por nombre de tanque
+            gm_min_m: GM corregido mínimo admisible
+            trimado_max_m: |trimado| máximo admisible (None: sin límite)
+
+        Returns:
+            ResultadoTravesia con una fila por condición (salida + pasos)
+        """
+        n_pasos = int(round(horas / dt_h))
+
+        def _serie(valor):
+            return np.broadcast_to(np.asarray(valor, dtype=float), (n_pasos,))
+
+        velocidad = _serie(velocidad_kn)
+        consumo_t = self.consumos_horarios(
+            velocidad, _serie(temp_ambiente_c), _serie(meses_desde_limpieza), _serie(altura_ola_m)
+        ) * dt_h
+
+        nombres = list(secuencia) + list(consumos_adicionales_t_h or {}) + list(llenados_iniciales)
+        faltan = [n for n in nombres if n not in self._indice]
+        if faltan:
+            raise ValueError(f"Tanques desconocidos: {faltan}")
+        orden = [self._indice[n] for n in secuencia]
+        adicionales = [(self._indice[n], q * dt_h) for n, q in (consumos_adicionales_t_h or {}).items()]
+
+        llenado = np.zeros(self.motor.n_tanques)
+        for nombre, f in llenados_iniciales.items():
+            llenado[self._indice[nombre]] = f
+        masa = llenado * self._capacidad_t
+        reserva = llenado_minimo * self._capacidad_t
+
+        # Sumas de la condición de salida (una sola evaluación completa)
+        sumas = self.motor.evaluar(llenado)
+        total = np.array([sumas[c][0] for c in COLUMNAS_TABLA])
+        aporte = self.motor.contribuciones(np.arange(self.motor.n_tanques), llenado)
+
+        historial = np.empty((n_pasos + 1, len(COLUMNAS_TABLA)))
+        historial[0] = total
+        llenados = np.empty((n_pasos + 1, self.motor.n_tanques))
+        llenados[0] = llenado
+        activo = np.empty(n_pasos + 1, dtype=int)
+        activo[0] = orden[0] if orden else -1
+        deficit = np.zeros(n_pasos + 1)
+        rob = np.empty(n_pasos + 1)
+        rob[0] = masa[np.unique(orden)].sum() if orden else 0.0
+        k = 0
+
+        for paso in range(n_pasos):
+            cambiados = []
+            pendiente = consumo_t[paso]
+            while pendiente > 1e-12 and k < len(orden):
+                i = orden[k]
+                disponible = masa[i] - reserva[i]
+                if disponible <= 1e-12:
+                    k += 1
+                    continue
+                retirado = min(disponible, pendiente)
+                masa[i] -= retirado
+                pendiente -= retirado
+                cambiados.append(i)
+            rob[paso + 1] = rob[paso] - (consumo_t[paso] - pendiente)
+            for i, q in adicionales:
+                masa[i] = max(0.0, masa[i] - q)
+                cambiados.append(i)
+            if cambiados:
+                cambiados = np.unique(cambiados)
+                llenado[cambiados] = masa[cambiados] / self._capacidad_t[cambiados]
+                nuevo = self.motor.contribuciones(cambiados, llenado[cambiados])
+                total += (nuevo - aporte[cambiados]).sum(axis=0)
+                aporte[cambiados] = nuevo
+            historial[paso + 1] = total
+            llenados[paso + 1] = llenado
+            activo[paso + 1] = orden[min(k, len(orden) - 1)] if orden else -1
+            deficit[paso + 1] = pendiente
+
+        return ResultadoTravesia(
+            condiciones=self._condiciones(historial, consumo_t, velocidad, dt_h, activo, deficit,
+                                          rob, gm_min_m, trimado_max_m),
+            llenados=llenados,
+            nombres_tanques=list(self.motor.nombres),
+        )
+
+    def _condiciones(self, historial, consumo_t, velocidad, dt_h, activo, deficit, rob, gm_min_m, trimado_max_m):
+        """Equilibrio y criterios de todas las condiciones en un solo lote."""
+        d0, kg0, lcg0 = self.rosca
+        s = {c: historial[:, j] for j, c in enumerate(COLUMNAS_TABLA)}
+        desplazamiento = d0 + s["masa_t"]
+        kg = (d0 * kg0 + s["momento_z_tm"]) / desplazamiento
+        lcg = (d0 * lcg0 + s["momento_x_tm"]) / desplazamiento
+        fsc = s["fsm_tm"] / desplazamiento
+        eq = self.tabla.equilibrio(desplazamiento, lcg)
+        gm = eq["kmt_m"] - kg - fsc
+
+        cumple = gm >= gm_min_m
+        if trimado_max_m is not None:
+            cumple &= np.abs(eq["trimado_m"]) <= trimado_max_m
+        cumple &= deficit <= 1e-9
+
+        nombres = np.array(list(self.motor.nombres) + [""])
+        return pd.DataFrame({
+            "hora": np.arange(len(historial)) * dt_h,
+            "distancia_nm": np.concatenate([[0.0], np.cumsum(velocidad * dt_h)]),
+            "consumo_acumulado_t": rob[0] - rob,
+            "rob_t": rob,
+            "deficit_t": deficit,
+            "tanque_activo": nombres[activo],
+            "desplazamiento_t": desplazamiento,
+            "kg_solido_m": kg,
+            "fsc_m": fsc,
+            "kmt_m": eq["kmt_m"],
+            "gm_corregido_m": gm,
+            "calado_m": eq["calado_m"],
+            "trimado_m": eq["trimado_m"],
+            "cumple": cumple,
+        })
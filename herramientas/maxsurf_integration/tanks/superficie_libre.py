@@ -0,0 +1,276 @@
+"""
+Superficie libre y centros de gravedad de tanques
+================================================
+
+Motor vectorizado para evaluar el efecto de los tanques sobre la
+estabilidad inicial en condiciones de llenado arbitrarias:
+
+    - VCG, LCG, TCG y masa de cada tanque en función del llenado
+    - Momento de superficie libre (FSM = ρ · i) de cada tanque
+    - KG sólido, corrección por superficie libre y GM corregido
+
+Las funciones de cada tanque se precalculan una sola vez sobre una malla de
+llenados volumétricos. Para un lote de condiciones (matriz condiciones ×
+tanques) se construye la matriz de pesos de interpolación lineal y todas
+las sumas de la condición se obtienen con un único producto matricial.
+
+Geometría: prisma de largo L con sección trapecial (ancho de fondo y de
+techo), suficiente para doble fondo, tanques laterales y tolvas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from maxsurf_integration.stability.hidrostatica import TablaHidrostatica
+
+# Columnas de la tabla precalculada por tanque y llenado
+COLUMNAS_TABLA = ("masa_t", "momento_z_tm", "momento_x_tm", "momento_y_tm", "fsm_tm")
+
+
+@dataclass
+class GeometriaTanque:
+    """Tanque prismático de sección trapecial (x desde PP de popa, z desde línea base)."""
+
+    nombre: str
+    largo_m: float
+    ancho_fondo_m: float
+    alto_m: float
+    x_centro_m: float
+    z_fondo_m: float = 0.0
+    ancho_techo_m: Optional[float] = None
+    y_centro_m: float = 0.0
+    densidad_tm3: float = 1.0
+    permeabilidad: float = 1.0
+
+    @property
+    def _ancho_techo(self) -> float:
+        return self.ancho_fondo_m if self.ancho_techo_m is None else self.ancho_techo_m
+
+    def _volumen_hasta(self, h: np.ndarray) -> np.ndarray:
+        b0, b1 = self.ancho_fondo_m, self._ancho_techo
+        return self.largo_m * (b0 * h + (b1 - b0) * h**2 / (2.0 * self.alto_m))
+
+    def _momento_z_hasta(self, h: np.ndarray) -> np.ndarray:
+        b0, b1 = self.ancho_fondo_m, self._ancho_techo
+        return self.largo_m * (b0 * h**2 / 2.0 + (b1 - b0) * h**3 / (3.0 * self.alto_m))
+
+    @property
+    def volumen_m3(self) -> float:
+        """Volumen neto (con permeabilidad) del tanque lleno."""
+        return float(self._volumen_hasta(np.array(self.alto_m))) * self.permeabilidad
+
+    def curvas_llenado(self, llenados: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calcular altura de líquido, VCG e inercia de la superficie libre.
+
+        Args:
+            llenados: Fracciones volumétricas de llenado (0-1)
+
+        Returns:
+            Dict con 'altura_m', 'vcg_m' e 'inercia_m4' para cada llenado
+        """
+        f = np.clip(np.asarray(llenados, dtype=float), 0.0, 1.0)
+        z = np.linspace(0.0, self.alto_m, 2001)
+        v = self._volumen_hasta(z)
+        h = np.interp(f * v[-1], v, z)
+        vol = self._volumen_hasta(h)
+        mz = self._momento_z_hasta(h)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vcg_rel = np.where(vol > 0, mz / np.where(vol > 0, vol, 1.0), 0.0)
+        ancho = self.ancho_fondo_m + (self._ancho_techo - self.ancho_fondo_m) * h / self.alto_m
+        inercia = self.largo_m * ancho**3 / 12.0
+        return {
+            "altura_m": h,
+            "vcg_m": self.z_fondo_m + vcg_rel,
+            "inercia_m4": inercia,
+        }
+
+
+class MotorSuperficieLibre:
+    """
+    Evaluador vectorizado de KG, FSM y GM corregido por llenado de tanques.
+
+    Ejemplo:
+        motor = MotorSuperficieLibre(geometrias)
+        llenados = np.array([[0.98, 0.5, 0.1], [0.5, 0.5, 0.5]])
+        res = motor.condiciones(llenados, 1900.0, 4.2, 46.0, tabla)
+        res['gm_corregido_m']
+    """
+
+    def __init__(
+        self,
+        tanques: Sequence[GeometriaTanque],
+        n_llenados: int = 101,
+        llenado_lleno: float = 0.98,
+    ):
+        """
+        Precalcular las funciones de llenado de todos los tanques.
+
+        Args:
+            tanques: Geometrías de los tanques
+            n_llenados: Puntos de la malla de llenado (0-1)
+            llenado_lleno: Llenado a partir del cual el tanque se considera
+                prensado (sin superficie libre), 98% según práctica IMO
+        """
+        if not tanques:
+            raise ValueError("Se requiere al menos un tanque")
+        self.tanques: List[GeometriaTanque] = list(tanques)
+        self.nombres = [t.nombre for t in self.tanques]
+        self.llenados = np.linspace(0.0, 1.0, n_llenados)
+
+        tabla = np.zeros((len(self.tanques), n_llenados, len(COLUMNAS_TABLA)))
+        vcg = np.zeros((len(self.tanques), n_llenados))
+        for i, t in enumerate(self.tanques):
+            curvas = t.curvas_llenado(self.llenados)
+            masa = t.volumen_m3 * t.densidad_tm3 * self.llenados
+            fsm = t.densidad_tm3 * curvas["inercia_m4"]
+            fsm = np.where((self.llenados > 0.0) & (self.llenados < llenado_lleno), fsm, 0.0)
+            tabla[i, :, 0] = masa
+            tabla[i, :, 1] = masa * curvas["vcg_m"]
+            tabla[i, :, 2] = masa * t.x_centro_m
+            tabla[i, :, 3] = masa * t.y_centro_m
+            tabla[i, :, 4] = fsm
+            vcg[i] = curvas["vcg_m"]
+
+        self._tabla_tanques = tabla
+        self._vcg = vcg
+        # Matriz (tanques·llenados) × columnas para el producto único
+        self._tabla = tabla.reshape(-1, len(COLUMNAS_TABLA))
+
+    @property
+    def n_tanques(self) -> int:
+        return len(self.tanques)
+
+    def _indices(self, llenados) -> tuple:
+        f = np.atleast_2d(np.asarray(llenados, dtype=float))
+        if f.shape[1] != self.n_tanques:
+            raise ValueError(
+                f"Se esperaban {self.n_tanques} llenados por condición, recibidos {f.shape[1]}"
+            )
+        n = len(self.llenados)
+        pos = np.clip(f, 0.0, 1.0) * (n - 1)
+        lo = np.minimum(pos.astype(int), n - 2)
+        w = pos - lo
+        return f.shape[0], lo, w
+
+    def matriz_pesos(self, llenados) -> np.ndarray:
+        """
+        Matriz de interpolación (condiciones × tanques·llenados).
+
+        Cada fila tiene dos pesos no nulos por tanque, los de los nodos de la
+        malla que rodean su llenado.
+        """
+        n_cond, lo, w = self._indices(llenados)
+        n = len(self.llenados)
+        pesos = np.zeros((n_cond, self.n_tanques * n))
+        filas = np.arange(n_cond)[:, None]
+        col = np.arange(self.n_tanques)[None, :] * n + lo
+        pesos[filas, col] = 1.0 - w
+        pesos[filas, col + 1] = w
+        return pesos
+
+    def evaluar(self, llenados) -> Dict[str, np.ndarray]:
+        """
+        Sumas de masa, momentos y FSM de los tanques por condición.
+
+        Args:
+            llenados: Matriz (condiciones × tanques) o vector de un solo caso
+
+        Returns:
+            Dict con un array (condiciones,) por cada columna de COLUMNAS_TABLA
+        """
+        sumas = self.matriz_pesos(llenados) @ self._tabla
+        return {c: sumas[:, j] for j, c in enumerate(COLUMNAS_TABLA)}
+
+    def por_tanque(self, llenados) -> Dict[str, np.ndarray]:
+        """Masa, VCG y FSM de cada tanque (matrices condiciones × tanques)."""
+        _, lo, w = self._indices(llenados)
+        idx = np.arange(self.n_tanques)[None, :]
+
+        def _interp(tabla: np.ndarray) -> np.ndarray:
+            return tabla[idx, lo] * (1.0 - w) + tabla[idx, lo + 1] * w
+
+        return {
+            "masa_t": _interp(self._tabla_tanques[:, :, 0]),
+            "vcg_m": _interp(self._vcg),
+            "fsm_tm": _interp(self._tabla_tanques[:, :, 4]),
+        }
+
+    def contribuciones(self, indices, llenados) -> np.ndarray:
+        """
+        Aportación de tanques sueltos a las sumas de la condición.
+
+        Permite actualizar las sumas de forma incremental cuando sólo cambia
+        el llenado de unos pocos tanques (restar la aportación anterior y
+        sumar la nueva).
+
+        Args:
+            indices: Índices de los tanques
+            llenados: Llenado de cada uno (0-1)
+
+        Returns:
+            Matriz (tanques × COLUMNAS_TABLA)
+        """
+        idx = np.atleast_1d(np.asarray(indices, dtype=int))
+        n = len(self.llenados)
+        pos = np.clip(np.atleast_1d(np.asarray(llenados, dtype=float)), 0.0, 1.0) * (n - 1)
+        lo = np.minimum(pos.astype(int), n - 2)
+        w = (pos - lo)[:, None]
+        return self._tabla_tanques[idx, lo] * (1.0 - w) + self._tabla_tanques[idx, lo + 1] * w
+
+    def condiciones(
+        self,
+        llenados,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        tabla: Optional[TablaHidrostatica] = None,
+        tcg_rosca_m: float = 0.0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluar condiciones completas (buque en rosca + tanques).
+
+        Args:
+            llenados: Matriz (condiciones × tanques) de llenados (0-1)
+            desplazamiento_rosca_t: Peso en rosca más pesos fijos (t)
+            kg_rosca_m: KG del peso en rosca (m)
+            lcg_rosca_m: LCG del peso en rosca desde PP de popa (m)
+            tabla: Tabla hidrostática para KMt y trimado (None: sin GM)
+            tcg_rosca_m: TCG del peso en rosca (m)
+
+        Returns:
+            Dict con arrays por condición: desplazamiento_t, kg_solido_m,
+            fsc_m, kg_corregido_m, lcg_m, tcg_m y, con tabla, kmt_m,
+            gm_solido_m, gm_corregido_m, calado_m y trimado_m
+        """
+        s = self.evaluar(llenados)
+        desplazamiento = desplazamiento_rosca_t + s["masa_t"]
+        kg = (desplazamiento_rosca_t * kg_rosca_m + s["momento_z_tm"]) / desplazamiento
+        lcg = (desplazamiento_rosca_t * lcg_rosca_m + s["momento_x_tm"]) / desplazamiento
+        tcg = (desplazamiento_rosca_t * tcg_rosca_m + s["momento_y_tm"]) / desplazamiento
+        fsc = s["fsm_tm"] / desplazamiento
+
+        resultado = {
+            "desplazamiento_t": desplazamiento,
+            "kg_solido_m": kg,
+            "fsc_m": fsc,
+            "kg_corregido_m": kg + fsc,
+            "lcg_m": lcg,
+            "tcg_m": tcg,
+        }
+        if tabla is not None:
+            eq = tabla.equilibrio(desplazamiento, lcg)
+            resultado.update(
+                {
+                    "kmt_m": eq["kmt_m"],
+                    "gm_solido_m": eq["kmt_m"] - kg,
+                    "gm_corregido_m": eq["kmt_m"] - kg - fsc,
+                    "calado_m": eq["calado_m"],
+                    "trimado_m": eq["trimado_m"],
+                }
+            )
+        return resultado
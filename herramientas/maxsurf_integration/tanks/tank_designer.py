@@ -11,16 +11,29 @@ Características:
     - Cálculo de consumos y autonomía
     - Verificación de capacidades
     - Optimización de distribución (KG)
+    - KG, superficie libre y GM corregido por llenado de tanques
+    - Tablas de calibración (sondas) recortadas por el casco
+    - Simulación de consumo en travesía con estabilidad paso a paso
 """
 
 import logging
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import json
 from pathlib import Path
 
+from .superficie_libre import GeometriaTanque, MotorSuperficieLibre
+from .calibracion import CalibradorTanques, TablaCalibracion
+from .simulacion_travesia import ResultadoTravesia, SimuladorTravesia
+from ..hull_design.offsets import TablaOffsets
+from ..stability.hidrostatica import TablaHidrostatica
+
 logger = logging.getLogger(__name__)
 
+# Formas del Buque 9 para la tabla hidrostática y los offsets paramétricos
+CASCO_BUQUE9 = dict(manga_m=14.3, calado_diseno_m=5.8, puntal_m=6.7, cb=0.703)
+
 
 class TankDesigner:
     """
@@ -39,6 +52,8 @@ class TankDesigner:
         """
         self.maxsurf = maxsurf_connector
         self.tanques = []
+        self.calibraciones: Dict[str, TablaCalibracion] = {}
+        self.lpp_calibracion_m = 96.2
         self.densidades = {
             'fuel_oil': 0.85,      # t/m³
             'diesel': 0.84,
@@ -171,7 +186,7 @@ class TankDesigner:
         })
         
         # Tanques 3 y 4: Wing tanks para ajuste fino
-        for lado in ['PORT', 'STBD']:
+        for lado, signo in [('PORT', 1.0), ('STBD', -1.0)]:
             tanques_diseñados.append({
                 'nombre': f'FUEL_WING_{lado}',
                 'tipo': 'fuel_oil',
@@ -181,6 +196,7 @@ class TankDesigner:
                 'altura_util_m': 0.8,
                 'volumen_m3': 15.0 * 1.2 * 0.8,
                 'posicion_x_desde_proa_m': 40.0,
+                'posicion_y_m': signo * (beam / 2 - 0.6),
                 'kg_estimado_m': 0.4,
                 'densidad_tm3': self.densidades['fuel_oil']
             })
@@ -275,6 +291,11 @@ class TankDesigner:
         """
         Cubicar tanques y obtener volúmenes y centroides.
         
+        Los volúmenes y centros salen de las tablas de calibración (contorno
+        del tanque recortado por el casco); si aún no existen se generan con
+        `calibrar_tanques()`. Como en el diseño de tanques, `lcg_m` se mide
+        desde proa (las tablas de calibración usan la PP de popa).
+        
         Returns:
             DataFrame con resultados de cubicación
         """
@@ -284,19 +305,31 @@ class TankDesigner:
             # Ejecutar cubicación en Maxsurf
             self.maxsurf.execute_command("TANKS CALCULATE")
             
-            # Obtener resultados
-            # Nota: Adaptar a API real para obtener resultados
+            if set(self.calibraciones) != {t['nombre'] for t in self.tanques}:
+                self.calibrar_tanques()
             
             resultados = []
             for tank in self.tanques:
-                # Aquí se obtendrían los valores reales de Maxsurf
+                cal = self.calibraciones[tank['nombre']]
+                lleno = cal.propiedades(cal.altura_m)
+                volumen = cal.capacidad_m3
+                if volumen < 0.9 * tank['volumen_m3']:
+                    logger.warning(
+                        f"⚠️  {tank['nombre']}: el casco reduce el volumen de "
+                        f"{tank['volumen_m3']:.1f} a {volumen:.1f} m³"
+                    )
                 resultados.append({
                     'nombre': tank['nombre'],
                     'tipo': tank['tipo'],
-                    'volumen_m3': tank['volumen_m3'],
-                    'masa_lleno_t': tank['volumen_m3'] * tank['densidad_tm3'],
-                    'kg_m': tank['kg_estimado_m'],
-                    'lcg_m': tank['posicion_x_desde_proa_m']
+                    'volumen_nominal_m3': tank['volumen_m3'],
+                    'volumen_m3': volumen,
+                    'masa_lleno_t': volumen * tank['densidad_tm3'],
+                    'kg_m': float(lleno['vcg_m']) if volumen > 0 else tank['kg_estimado_m'],
+                    'lcg_m': (
+                        self.lpp_calibracion_m - float(lleno['lcg_m']) if volumen > 0
+                        else tank['posicion_x_desde_proa_m']
+                    ),
+                    'tcg_m': float(lleno['tcg_m']) if volumen > 0 else np.nan,
                 })
             
             df_resultados = pd.DataFrame(resultados)
@@ -308,6 +341,34 @@ class TankDesigner:
             logger.error(f"❌ Error cubicando tanques: {e}")
             return pd.DataFrame()
     
+    def calibrar_tanques(
+        self,
+        offsets: Optional[TablaOffsets] = None,
+        lpp_m: float = 96.2,
+        **kwargs
+    ) -> Dict[str, TablaCalibracion]:
+        """
+        Generar las tablas de calibración (sondas) de todos los tanques.
+        
+        Args:
+            offsets: Offsets del casco (por defecto, paramétricos del Buque 9)
+            lpp_m: Eslora entre perpendiculares (m)
+            **kwargs: Argumentos de `CalibradorTanques.calibrar` (paso_m,
+                      trimados_m, escoras_deg...)
+            
+        Returns:
+            Dict nombre → TablaCalibracion (también en self.calibraciones)
+        """
+        if offsets is None:
+            offsets = TablaOffsets.desde_parametros(lpp_m=lpp_m, **CASCO_BUQUE9)
+        calibrador = CalibradorTanques(offsets)
+        self.lpp_calibracion_m = lpp_m
+        self.calibraciones = calibrador.calibrar_tanques(
+            self.geometrias_tanques(lpp_m=lpp_m), **kwargs
+        )
+        logger.info(f"✅ {len(self.calibraciones)} tablas de calibración generadas")
+        return self.calibraciones
+    
     def calcular_kg_con_tanques(
         self,
         condicion: str = 'llenos'
@@ -315,6 +376,9 @@ class TankDesigner:
         """
         Calcular KG (altura del CG) con tanques en condición especificada.
         
+        El VCG de cada tanque desciende con el nivel de líquido; se toma de
+        las curvas de llenado de `MotorSuperficieLibre`.
+        
         Args:
             condicion: 'llenos', 'vacios', '50%', etc.
             
@@ -332,15 +396,14 @@ class TankDesigner:
                 '75%': 0.75
             }.get(condicion, 1.0)
             
-            momento_total = 0.0
-            masa_total = 0.0
+            if not self.tanques:
+                logger.warning("⚠️  Masa total de tanques es cero")
+                return 0.0
             
-            for tank in self.tanques:
-                masa_tank = tank['volumen_m3'] * tank['densidad_tm3'] * factor_llenado
-                momento_tank = masa_tank * tank['kg_estimado_m']
-                
-                momento_total += momento_tank
-                masa_total += masa_tank
+            motor = self.motor_superficie_libre()
+            sumas = motor.evaluar(np.full(motor.n_tanques, factor_llenado))
+            masa_total = float(sumas['masa_t'][0])
+            momento_total = float(sumas['momento_z_tm'][0])
             
             if masa_total > 0:
                 kg = momento_total / masa_total
@@ -354,6 +417,222 @@ class TankDesigner:
             logger.error(f"❌ Error calculando KG: {e}")
             return 0.0
     
+    def geometrias_tanques(self, lpp_m: float = 96.2) -> List[GeometriaTanque]:
+        """
+        Convertir los tanques diseñados en geometrías para el motor de
+        superficie libre.
+        
+        Args:
+            lpp_m: Eslora entre perpendiculares para pasar la posición
+                   desde proa a coordenada desde PP de popa
+            
+        Returns:
+            List de GeometriaTanque (mismo orden que self.tanques)
+        """
+        geometrias = []
+        for tank in self.tanques:
+            geometrias.append(GeometriaTanque(
+                nombre=tank['nombre'],
+                largo_m=tank['longitud_m'],
+                ancho_fondo_m=tank['ancho_efectivo_m'],
+                alto_m=tank['altura_util_m'],
+                x_centro_m=lpp_m - tank['posicion_x_desde_proa_m'],
+                z_fondo_m=tank['kg_estimado_m'] - tank['altura_util_m'] / 2,
+                y_centro_m=tank.get('posicion_y_m', 0.0),
+                densidad_tm3=tank['densidad_tm3'],
+                permeabilidad=tank['volumen_m3'] / (
+                    tank['longitud_m'] * tank['ancho_efectivo_m'] * tank['altura_util_m']
+                ),
+            ))
+        return geometrias
+    
+    def motor_superficie_libre(self, lpp_m: float = 96.2) -> MotorSuperficieLibre:
+        """Motor de KG/FSM precalculado para los tanques actuales."""
+        return MotorSuperficieLibre(self.geometrias_tanques(lpp_m=lpp_m))
+    
+    def calcular_condiciones_tanques(
+        self,
+        llenados,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        tabla: Optional[TablaHidrostatica] = None,
+        lpp_m: float = 96.2
+    ) -> pd.DataFrame:
+        """
+        Evaluar KG sólido, superficie libre y GM corregido para un lote de
+        condiciones de llenado.
+        
+        Args:
+            llenados: Matriz (condiciones × tanques) de llenados 0-1, columnas
+                      en el orden de self.tanques
+            desplazamiento_rosca_t: Peso en rosca más pesos fijos (t)
+            kg_rosca_m: KG del peso en rosca (m)
+            lcg_rosca_m: LCG del peso en rosca desde PP de popa (m)
+            tabla: Tabla hidrostática (por defecto, paramétrica del Buque 9)
+            lpp_m: Eslora entre perpendiculares (m)
+            
+        Returns:
+            DataFrame con una fila por condición
+        """
+        if tabla is None:
+            tabla = TablaHidrostatica.desde_parametros(lpp_m=lpp_m, **CASCO_BUQUE9)
+        motor = self.motor_superficie_libre(lpp_m=lpp_m)
+        resultado = motor.condiciones(
+            llenados, desplazamiento_rosca_t, kg_rosca_m, lcg_rosca_m, tabla=tabla
+        )
+        return pd.DataFrame(resultado)
+    
+    def optimizar_disposicion(
+        self,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        autonomia_nm: float = 10000,
+        velocidad_kn: float = 14,
+        consumo_diario_ton: float = 5.0,
+        lpp_m: float = 96.2,
+        semilla: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        Ajustar los límites de los tanques a la cadena de cuadernas para
+        cubrir el combustible requerido con trimado, KG y GM en límites.
+
+        Los tanques de self.tanques se actualizan (longitud, volumen y
+        posición) con la mejor disposición encontrada.
+
+        Args:
+            desplazamiento_rosca_t: Peso en rosca más pesos fijos (t)
+            kg_rosca_m: KG del peso en rosca (m)
+            lcg_rosca_m: LCG del peso en rosca desde PP de popa (m)
+            autonomia_nm, velocidad_kn, consumo_diario_ton: Requerimiento de
+                combustible (ver calcular_volumen_combustible)
+            lpp_m: Eslora entre perpendiculares (m)
+            semilla: Semilla de la búsqueda
+            **kwargs: Argumentos de OptimizadorDisposicionTanques
+                      (condiciones, trimado_max_m, gm_min_m, kg_max_m,
+                      margen_m, mamparos_m...)
+
+        Returns:
+            ResultadoDisposicion
+        """
+        # Importación diferida: el optimizador depende del paquete tanks
+        from ..optimization.disposicion_tanques import (
+            OptimizadorDisposicionTanques,
+            cadena_cuadernas,
+        )
+
+        requerido = self.calcular_volumen_combustible(
+            autonomia_nm, velocidad_kn, consumo_diario_ton
+        )['volumen_con_margen_m3']
+
+        limites = []
+        for tank in self.tanques:
+            x_centro = lpp_m - tank['posicion_x_desde_proa_m']
+            limites.append((
+                tank['nombre'],
+                tank['tipo'],
+                round(x_centro - tank['longitud_m'] / 2, 3),
+                round(x_centro + tank['longitud_m'] / 2, 3),
+                {
+                    'area_seccion_m2': tank['volumen_m3'] / tank['longitud_m'],
+                    'alto_m': tank['altura_util_m'],
+                    'z_fondo_m': tank['kg_estimado_m'] - tank['altura_util_m'] / 2,
+                    'y_centro_m': tank.get('posicion_y_m', 0.0),
+                    'ancho_m': tank['ancho_efectivo_m'],
+                    'densidad_tm3': tank['densidad_tm3'],
+                },
+            ))
+
+        kwargs.setdefault('mamparos_m', (0.0, lpp_m))
+        kwargs.setdefault('cuadernas_m', cadena_cuadernas(lpp_m=lpp_m))
+        kwargs.setdefault('tabla', TablaHidrostatica.desde_parametros(lpp_m=lpp_m, **CASCO_BUQUE9))
+        optimizador = OptimizadorDisposicionTanques.desde_limites(
+            limites,
+            desplazamiento_rosca_t=desplazamiento_rosca_t,
+            kg_rosca_m=kg_rosca_m,
+            lcg_rosca_m=lcg_rosca_m,
+            **kwargs
+        )
+        resultado = optimizador.optimizar(requerido, semilla=semilla)
+
+        for tank, fila in zip(self.tanques, resultado.tanques.itertuples()):
+            tank['longitud_m'] = float(fila.fin_m - fila.inicio_m)
+            tank['volumen_m3'] = float(fila.volumen_m3)
+            tank['posicion_x_desde_proa_m'] = float(lpp_m - (fila.inicio_m + fila.fin_m) / 2)
+        self.calibraciones = {}
+
+        estado = "✅" if resultado.factible else "⚠️ "
+        logger.info(
+            f"{estado} Disposición optimizada: {resultado.capacidad_combustible_m3:.1f} m³ "
+            f"de combustible (requerido {requerido:.1f} m³)"
+        )
+        return resultado
+
+    def simular_travesia(
+        self,
+        desplazamiento_rosca_t: float,
+        kg_rosca_m: float,
+        lcg_rosca_m: float,
+        calculador,
+        secuencia: Optional[List[str]] = None,
+        llenados_iniciales: Optional[Dict[str, float]] = None,
+        dias: float = 30.0,
+        tabla: Optional[TablaHidrostatica] = None,
+        lpp_m: float = 96.2,
+        **kwargs
+    ) -> ResultadoTravesia:
+        """
+        Simular el vaciado de los tanques de combustible durante una
+        travesía con estabilidad paso a paso.
+
+        Args:
+            desplazamiento_rosca_t: Peso en rosca más pesos fijos (t)
+            kg_rosca_m: KG del peso en rosca (m)
+            lcg_rosca_m: LCG del peso en rosca desde PP de popa (m)
+            calculador: Calculador de consumos (`consumo_navegacion_batch` o
+                `consumo_navegacion`), p. ej. `CalculadorConsumo` de
+                calculos_combustible_optimizados
+            secuencia: Orden de uso (por defecto, tanques de fuel_oil en el
+                orden de self.tanques)
+            llenados_iniciales: Llenado de salida (por defecto, 98% en
+                combustible y agua dulce, lastre vacío)
+            dias: Duración de la travesía
+            tabla: Tabla hidrostática (por defecto, paramétrica del Buque 9)
+            lpp_m: Eslora entre perpendiculares (m)
+            **kwargs: Argumentos de `SimuladorTravesia.simular` (dt_h,
+                      velocidad_kn, altura_ola_m, gm_min_m...)
+
+        Returns:
+            ResultadoTravesia
+        """
+        if secuencia is None:
+            secuencia = [t['nombre'] for t in self.tanques if t['tipo'] == 'fuel_oil']
+        if llenados_iniciales is None:
+            llenados_iniciales = {
+                t['nombre']: 0.98 for t in self.tanques if t['tipo'] in ('fuel_oil', 'agua_dulce')
+            }
+        if tabla is None:
+            tabla = TablaHidrostatica.desde_parametros(lpp_m=lpp_m, **CASCO_BUQUE9)
+        simulador = SimuladorTravesia(
+            self.motor_superficie_libre(lpp_m=lpp_m),
+            tabla,
+            desplazamiento_rosca_t,
+            kg_rosca_m,
+            lcg_rosca_m,
+            calculador,
+        )
+        resultado = simulador.simular(llenados_iniciales, secuencia, horas=dias * 24.0, **kwargs)
+
+        resumen = resultado.resumen()
+        estado = "✅" if resumen['cumple_toda_travesia'] else "⚠️ "
+        logger.info(
+            f"{estado} Travesía de {dias:.0f} días: {len(resultado.condiciones)} condiciones, "
+            f"GM mínimo {resumen['gm_min_m']:.3f} m, ROB final {resumen['rob_final_t']:.1f} t"
+        )
+        return resultado
+
     def exportar_tanques(self, filepath: str, formato: str = 'csv') -> bool:
         """
         Exportar diseño de tanques.
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import ezdxf
+import pytest
+
+import analizador_plano_cuaderna as apc
+from analizador_plano_cuaderna import VERSION_INDICE, AnalizadorPlanoCuaderna, IndiceCapas, huella_dxf, ruta_cache_indice
+
+
+def _plano(ruta: Path, lineas: int = 3) -> Path:
+    doc = ezdxf.new("R2010")
+    doc.layers.add("MAMPAROS")
+    msp = doc.modelspace()
+    for i in range(lineas):
+        msp.add_line((i, 0), (i, 5), dxfattribs={"layer": "MAMPAROS"})
+    msp.add_circle((10, 2), 1.0, dxfattribs={"layer": "EJES"})
+    doc.saveas(ruta)
+    return ruta
+
+
+def _sin_reconstruir(monkeypatch):
+    def falla(*args, **kwargs):
+        raise AssertionError("el índice no debía reconstruirse")
+
+    monkeypatch.setattr(apc.IndiceCapas, "desde_archivo", classmethod(falla))
+    monkeypatch.setattr(apc.IndiceCapas, "construir", classmethod(falla))
+
+
+def test_indice_guardado_se_reutiliza_si_el_dxf_no_cambia(tmp_path: Path, monkeypatch):
+    ruta = _plano(tmp_path / "plano.dxf")
+    cache = ruta_cache_indice(ruta)
+    assert cache == tmp_path / ".plano.dxf.indice.json"
+
+    primero = AnalizadorPlanoCuaderna(str(ruta))
+    assert cache.exists()
+    assert json.loads(cache.read_text(encoding="utf-8"))["huella"] == huella_dxf(ruta)
+
+    _sin_reconstruir(monkeypatch)
+    segundo = AnalizadorPlanoCuaderna(str(ruta))
+    assert segundo.indice == primero.indice
+    assert segundo._doc is None  # el DXF no se ha cargado
+    assert segundo.indice.contar("MAMPAROS", ("LINE",)) == 3
+    assert segundo.indice.bbox() == pytest.approx([0.0, 0.0, 10.0, 5.0])
+
+
+def test_indice_se_reconstruye_si_cambia_el_dxf(tmp_path: Path):
+    ruta = _plano(tmp_path / "plano.dxf")
+    cache = ruta_cache_indice(ruta)
+    assert AnalizadorPlanoCuaderna(str(ruta)).indice.contar("MAMPAROS") == 3
+
+    _plano(ruta, lineas=5)
+    nuevo = AnalizadorPlanoCuaderna(str(ruta))
+    assert nuevo.indice.contar("MAMPAROS") == 5
+    assert nuevo.indice.huella == huella_dxf(ruta)
+    assert json.loads(cache.read_text(encoding="utf-8"))["huella"] == nuevo.indice.huella
+
+    # Con y sin streaming se obtiene el mismo índice
+    completo = AnalizadorPlanoCuaderna(str(ruta), usar_cache=False, streaming=False)
+    assert completo.indice == nuevo.indice
+
+
+def test_indice_de_otra_version_se_descarta(tmp_path: Path):
+    ruta = _plano(tmp_path / "plano.dxf")
+    cache = ruta_cache_indice(ruta)
+    AnalizadorPlanoCuaderna(str(ruta))
+
+    datos = json.loads(cache.read_text(encoding="utf-8"))
+    datos["version"] = VERSION_INDICE + 1
+    datos["entidades"] = {}
+    cache.write_text(json.dumps(datos), encoding="utf-8")
+    assert IndiceCapas.cargar(cache, huella_dxf(ruta)) is None
+
+    analizador = AnalizadorPlanoCuaderna(str(ruta))
+    assert analizador.indice.contar("MAMPAROS") == 3
+    assert json.loads(cache.read_text(encoding="utf-8"))["version"] == VERSION_INDICE
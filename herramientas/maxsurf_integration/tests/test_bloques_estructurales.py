@@ -0,0 +1,60 @@
+import ezdxf
+import pytest
+
+from bloques_estructurales import (
+    BibliotecaBloques,
+    biblioteca,
+    posiciones_por_zonas,
+    serie_cuadernas,
+    serie_longitudinales,
+)
+
+
+def test_biblioteca_reutiliza_definiciones_con_las_mismas_dimensiones():
+    doc = ezdxf.new("R2010")
+    lib = biblioteca(doc)
+    assert biblioteca(doc) is lib
+
+    a = lib.perfil_t(largo=1.1, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02)
+    b = lib.perfil_t(largo=1.1, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02)
+    c = lib.perfil_t(largo=1.1, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02, ala="abajo")
+    d = lib.perfil_t(largo=1.2, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02)
+    assert a == b and len({a, c, d}) == 3
+    assert len(doc.blocks.get(a)) == 3  # dos líneas de alma y el ala
+
+    # Otra biblioteca sobre el mismo documento encuentra la definición existente
+    assert BibliotecaBloques(doc).alma(0.8, 0.01) == lib.alma(0.8, 0.01)
+    assert len(doc.blocks.get(lib.alma(0.8, 0.01))) == 2
+    assert lib.marcador_longitudinal(0.2) == lib.marcador_longitudinal(0.2)
+    with pytest.raises(ValueError):
+        lib.perfil_t(1.0, 0.01, 0.1, 0.01, ala="lateral")
+
+
+def test_posiciones_por_zonas_encadena_zonas():
+    posiciones = posiciones_por_zonas([(0.0, 2.0, 0.5), (2.0, 5.0, 1.0), (5.0, 6.0, 0.5)])
+    assert posiciones == pytest.approx([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 5.5, 6.0])
+    # La segunda zona parte de la última posición de la primera (1.2), no de su propio inicio
+    assert posiciones_por_zonas([(0.0, 1.0, 0.6), (1.0, 2.2, 0.5)]) == pytest.approx([0.0, 0.6, 1.2, 1.7, 2.2])
+    for separacion in (0.0, -0.5):
+        with pytest.raises(ValueError):
+            posiciones_por_zonas([(0.0, 2.0, separacion)])
+
+
+def test_series_de_cuadernas_y_longitudinales():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    lib = biblioteca(doc)
+    cuaderna = lib.perfil_t(largo=1.1, alma_esp=0.012, ala_ancho=0.15, ala_esp=0.02)
+    marcador = lib.marcador_longitudinal(0.2)
+
+    cuadernas = serie_cuadernas(msp, cuaderna, [0.0, 0.6, 1.2], z=1.5, rotacion=90.0)
+    assert [(i.dxf.insert.x, i.dxf.insert.y) for i in cuadernas] == [(0.0, 1.5), (0.6, 1.5), (1.2, 1.5)]
+    assert all(i.dxf.name == cuaderna and i.dxf.rotation == 90.0 for i in cuadernas)
+    assert {i.dxf.layer for i in cuadernas} == {"ESTRUCTURA_PRIMARIA"}
+
+    fondo = serie_longitudinales(msp, marcador, [1.0, 2.0], fijo=0.8)
+    costado = serie_longitudinales(msp, marcador, [3.0, 4.0], fijo=7.5, transversal=False)
+    assert [(i.dxf.insert.x, i.dxf.insert.y) for i in fondo] == [(1.0, 0.8), (2.0, 0.8)]
+    assert [(i.dxf.insert.x, i.dxf.insert.y) for i in costado] == [(7.5, 3.0), (7.5, 4.0)]
+    assert {i.dxf.layer for i in fondo + costado} == {"ESTRUCTURA_SECUNDARIA"}
+    assert len(msp.query("INSERT")) == 7
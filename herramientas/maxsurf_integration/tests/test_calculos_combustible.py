@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from calculos_combustible_optimizados import (
+    MODOS_OPERACION,
+    CalculadorConsumo,
+    DespachoGeneradores,
+    GeneradorAuxiliar,
+    MotorPrincipal,
+)
+
+
+def test_sfoc_baja_carga_y_extremos():
+    motor = MotorPrincipal()
+    # Por debajo del primer punto de la curva (25 %) se toma el SFOC de baja carga
+    for carga in (0.0, 5.0, 24.9, 25.0):
+        assert motor.calcular_sfoc(carga) == pytest.approx(210.0)
+    assert motor.calcular_sfoc(37.5) == pytest.approx(202.5)
+    assert motor.calcular_sfoc(120.0) == pytest.approx(192.0)
+    assert motor.consumo_horario(0.0) == 0.0
+    assert motor.consumo_horario(10.0) == pytest.approx(850.0 * 210.0 / 1000.0)
+
+    cargas = np.array([0.0, 10.0, 25.0, 37.5, 80.0, 100.0])
+    assert np.allclose(motor.calcular_sfoc_batch(cargas), [motor.calcular_sfoc(c) for c in cargas])
+    assert np.allclose(
+        motor.consumo_horario_batch(cargas, 1.02, 1.05),
+        [motor.consumo_horario(c, 1.02, 1.05) for c in cargas],
+    )
+
+
+def test_generador_batch_igual_a_escalar_en_los_tramos():
+    gen = GeneradorAuxiliar()
+    cargas = np.array([0.0, 30.0, 59.9, 60.0, 79.9, 80.0, 100.0])
+    assert np.allclose(
+        gen.consumo_horario_batch(cargas, 1.01),
+        [gen.consumo_horario(c, factor_degradacion=1.01) for c in cargas],
+    )
+
+
+@pytest.mark.parametrize("demanda", [None, 650.0])
+def test_consumo_navegacion_batch_igual_a_escalar(demanda):
+    calc = CalculadorConsumo()
+    velocidades = np.array([6.0, 10.0, 12.0, 14.5, 16.0])
+    temps = np.array([5.0, 25.0, 35.0, 30.0, 15.0])
+    fouling = np.array([0, 6, 12, 24, 3])
+    olas = np.array([0.5, 1.5, 3.0, 4.5, 2.0])
+
+    lote = calc.consumo_navegacion_batch(velocidades, temps, fouling, olas, demanda_electrica_kw=demanda)
+    for k, v in enumerate(velocidades):
+        uno = calc.consumo_navegacion(
+            v, temp_ambiente_c=temps[k], meses_desde_limpieza=int(fouling[k]),
+            altura_ola_m=olas[k], demanda_electrica_kw=demanda,
+        )
+        assert lote["carga_motor_pct"][k] == pytest.approx(uno["carga_motor_pct"], abs=0.05)
+        for clave in ("consumo_motor_kg_h", "consumo_generadores_kg_h", "consumo_total_kg_h"):
+            assert lote[clave][k] == pytest.approx(uno[clave], abs=0.005)
+        assert lote["sfoc_efectivo_g_kwh"][k] == pytest.approx(uno["sfoc_efectivo_g_kwh"], abs=0.05)
+
+
+def test_despacho_respeta_grupos_minimos_y_limites_de_carga():
+    despacho = DespachoGeneradores(n_instalados=3, carga_min_pct=30.0, carga_max_pct=90.0)
+    gen = despacho.generador
+    demandas = np.array([0.0, 50.0, 120.0, 300.0, 450.0, 600.0, 850.0, 1200.0, 1300.0, 2000.0])
+    n_min = np.array([1, 1, 2, 1, 1, 2, 2, 1, 3, 1])
+    res = despacho.despachar(demandas, n_min)
+
+    assert (res["n_generadores"] >= n_min).all()
+    assert (res["carga_pct"][~res["sobrecarga"]] <= 90.0 + 1e-9).all()
+    assert res["sobrecarga"].tolist() == [False] * 9 + [True]
+    assert res["n_generadores"][-1] == 3
+
+    for k, (d, m) in enumerate(zip(demandas, n_min)):
+        opciones = []
+        for n in range(m, 4):
+            carga = d / (n * gen.potencia_nominal_kw) * 100.0
+            if carga <= 90.0:
+                opciones.append((carga, n * gen.consumo_horario(carga, factor_degradacion=1.01)))
+        con_minimo = [o for o in opciones if o[0] >= 30.0] or opciones
+        if not res["sobrecarga"][k]:
+            # Mínimo consumo entre las opciones admisibles (con carga mínima si alguna la cumple)
+            assert res["consumo_kg_h"][k] == pytest.approx(min(c for _, c in con_minimo))
+            if any(o[0] >= 30.0 for o in opciones):
+                assert res["carga_pct"][k] >= 30.0 - 1e-9
+
+        # El despacho por lotes coincide con el escalar
+        uno = despacho.despachar(d, m)
+        assert int(uno["n_generadores"]) == res["n_generadores"][k]
+        assert float(uno["consumo_kg_h"]) == pytest.approx(res["consumo_kg_h"][k])
+
+
+def test_perfil_operativo_maniobra_consume_en_motor_principal():
+    calc = CalculadorConsumo()
+    perfil = pd.DataFrame({"modo": ["navegacion", "maniobra", "puerto"], "horas": [100.0, 10.0, 50.0]})
+    df = calc.consumo_perfil_operativo(perfil)
+    assert df["velocidad_kn"].tolist() == [MODOS_OPERACION[m]["velocidad_kn"] for m in perfil["modo"]]
+    assert df.loc[1, "consumo_motor_kg"] > 0.0 and df.loc[2, "consumo_motor_kg"] == 0.0
+    assert df.loc[1, "n_generadores"] >= MODOS_OPERACION["maniobra"]["n_min"]
@@ -0,0 +1,81 @@
+import numpy as np
+
+from maxsurf_integration.hull_design import TablaOffsets
+from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.tanks import CalibradorTanques, GeometriaTanque, TankDesigner
+
+
+def _caja(**kw):
+    datos = dict(nombre="T", largo_m=10.0, ancho_fondo_m=6.0, alto_m=2.0, x_centro_m=30.0,
+                 z_fondo_m=1.0, densidad_tm3=0.9)
+    datos.update(kw)
+    return GeometriaTanque(**datos)
+
+
+def test_caja_tabla_y_busqueda_inversa():
+    tabla = CalibradorTanques(None).calibrar(_caja(), eslora_trimado_m=10.0)
+    assert len(tabla.volumen_m3) == 2001  # 1 mm
+    p = tabla.propiedades(1.0)
+    assert np.isclose(p["volumen_m3"], 60.0)
+    assert np.isclose(p["vcg_m"], 1.5, atol=1e-4)
+    assert np.isclose(p["lcg_m"], 30.0, atol=1e-4)
+    assert np.isclose(p["fsm_tm"], 0.9 * 10.0 * 6.0**3 / 12.0, rtol=1e-3)
+    volumenes = np.random.default_rng(0).uniform(0.0, tabla.capacidad_m3, 10000)
+    assert np.allclose(tabla.volumen(tabla.sonda(volumenes)), volumenes)
+    # Tanque con trapecio: el volumen coincide con la geometría analítica
+    tolva = _caja(ancho_techo_m=9.0)
+    assert np.isclose(CalibradorTanques(None).calibrar(tolva).capacidad_m3, tolva.volumen_m3, rtol=1e-3)
+
+
+def test_correcciones_trimado_y_escora():
+    tabla = CalibradorTanques(None).calibrar(_caja(), eslora_trimado_m=10.0)
+    # Tubo a 4.5 m a popa del centro: con 0.5 m de trimado por popa la
+    # sonda observada excede a la de quilla par en 0.05 · 4.5 m
+    assert np.isclose(tabla.sonda_quilla_par(1.0, trimado_m=0.5), 1.0 - 0.225, atol=2e-3)
+    assert np.isclose(tabla.sonda_quilla_par(1.0, escora_deg=2.5), 1.0, atol=1e-3)
+    v = tabla.volumen(0.8, trimado_m=0.5)
+    assert np.isclose(tabla.sonda(v, trimado_m=0.5), 0.8, atol=2e-3)
+
+
+def test_casco_recorta_tanques_buque9():
+    offsets = TablaOffsets.desde_parametros(lpp_m=96.2, manga_m=14.3, calado_diseno_m=5.8,
+                                            puntal_m=6.7, cb=0.703)
+    assert offsets.semimanga(48.1, 6.0) == 7.15
+    with MaxsurfConnector(visible=False) as mx:
+        designer = TankDesigner(mx)
+        designer.diseñar_tanques_buque9()
+        designer.calibrar_tanques(offsets, trimados_m=(1.0,), escoras_deg=(5.0,), paso_m=0.01)
+        df = designer.cubicar_tanques()
+        assert len(df) == len(designer.tanques)
+        assert (df["volumen_m3"] <= df["volumen_nominal_m3"] + 1e-6).all()
+        assert (df.loc[df["volumen_m3"] > 0, "kg_m"] > 0).all()
+
+
+def test_offsets_parametricos_reproducen_coeficientes():
+    lpp, b, t = 96.2, 14.3, 5.8
+    offsets = TablaOffsets.desde_parametros(lpp_m=lpp, manga_m=b, calado_diseno_m=t, puntal_m=6.7,
+                                            cb=0.703, n_estaciones=201, n_lineas=400)
+    x, z = np.linspace(0.0, lpp, 801), np.linspace(0.0, t, 801)
+    y = offsets.semimanga(x[:, None], z[None, :])
+    areas = 2.0 * np.trapezoid(y, z, axis=1)
+    assert np.isclose(np.trapezoid(areas, x) / (lpp * b * t), 0.703, atol=2e-3)
+    assert np.isclose(areas.max() / (b * t), 0.98, atol=2e-3)
+    assert np.isclose(2.0 * np.trapezoid(y[:, -1], x) / (lpp * b), 0.879, atol=2e-3)
+    # Fondo plano en la maestra hasta el arranque del pantoque
+    radio = TablaOffsets.radio_pantoque(b, t, 0.98)
+    assert np.isclose(offsets.semimanga(lpp / 2, 0.0), b / 2 - radio, rtol=1e-3)
+
+
+def test_capacidad_combustible_cubre_requerimiento():
+    with MaxsurfConnector(visible=False) as mx:
+        designer = TankDesigner(mx)
+        designer.diseñar_tanques_buque9("realista")
+        df = designer.cubicar_tanques()
+    requerido = designer.calcular_volumen_combustible(10000, 14, 5.0)["volumen_con_margen_m3"]
+    assert df.loc[df["tipo"] == "fuel_oil", "volumen_m3"].sum() >= requerido
+    # El doble fondo de popa (zona de la maestra) apenas se recorta
+    popa = df.set_index("nombre").loc["FUEL_CENTRAL_AFT"]
+    assert popa["volumen_m3"] > 0.9 * popa["volumen_nominal_m3"]
+    # LCG desde proa, como la posición del diseño
+    agua = df.set_index("nombre").loc["FRESH_WATER"]
+    assert np.isclose(agua["lcg_m"], 72.0, atol=1e-3)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalogo_motores import CatalogoMotores
+from integracion_autocad_motores import ENGINE_LIBRARY, EngineRoomDesigner
+from maxsurf_integration.workflows import CADIntegrationConfig
+
+
+def _catalogo(n: int = 3000, semilla: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(semilla)
+    df = pd.DataFrame({
+        "model": [f"M{i % 700}" for i in range(n)],
+        "manufacturer": rng.choice(["MAN Energy", "Wärtsilä", "Caterpillar"], n),
+        # Valores redondeados: muchos empates justo en los extremos de los rangos
+        "power_kw": rng.integers(5, 120, n) * 100.0,
+        "rpm": rng.choice([100.0, 500.0, 750.0, 1800.0], n),
+        "length_m": np.round(rng.uniform(2.0, 16.0, n), 1),
+        "width_m": np.round(rng.uniform(1.0, 6.0, n), 1),
+        "height_m": np.round(rng.uniform(1.5, 9.0, n), 1),
+        "sfoc_g_kwh": np.round(rng.uniform(160.0, 215.0, n)),
+        "cylinders": rng.integers(4, 20, n),
+    })
+    df.loc[rng.choice(n, n // 15, replace=False), "height_m"] = np.nan
+    return df
+
+
+def _fuerza_bruta(df: pd.DataFrame, **filtros) -> set:
+    mascara = np.ones(len(df), dtype=bool)
+    for columna, (minimo, maximo) in filtros.items():
+        valores = df[columna].to_numpy(float)
+        mascara &= ~np.isnan(valores)
+        if minimo is not None:
+            mascara &= valores >= minimo
+        if maximo is not None:
+            mascara &= valores <= maximo
+    return set(np.nonzero(mascara)[0])
+
+
+@pytest.mark.parametrize("filtros", [
+    {"power_kw": (5000.0, 9000.0)},
+    {"power_kw": (5000.0, 9000.0), "length_m": (None, 9.0), "sfoc_g_kwh": (None, 190.0)},
+    {"rpm": (500.0, 750.0), "height_m": (3.0, None), "cylinders": (6, 12)},
+    {"huella_m2": (10.0, 20.0), "width_m": (2.5, 2.5)},
+    {"cylinders": (8, 8)},
+])
+def test_consultas_de_rango_coinciden_con_fuerza_bruta(filtros):
+    df = _catalogo()
+    cat = CatalogoMotores(df)
+    df["huella_m2"] = df["length_m"] * df["width_m"]
+    posiciones = cat.buscar(**filtros)
+    assert len(posiciones) == len(set(posiciones))
+    assert set(posiciones) == _fuerza_bruta(df, **filtros)
+
+
+def test_extremos_inclusivos_y_valores_que_faltan():
+    cat = CatalogoMotores(_catalogo())
+    potencia = cat.columnas["power_kw"]
+    assert set(cat.rango("power_kw", 5000.0, 5000.0)) == set(np.nonzero(potencia == 5000.0)[0])
+    assert set(cat.rango("power_kw", 11900.0)) == set(np.nonzero(potencia == 11900.0)[0])
+    assert cat.rango("power_kw", 9000.0, 8000.0).size == 0
+    # Las alturas que faltan no cumplen ningún rango, ni siquiera abierto
+    alturas = cat.columnas["height_m"][cat.rango("height_m")]
+    assert len(alturas) == len(cat) - len(cat) // 15 and not np.isnan(alturas).any()
+
+
+def test_claves_unicas_normalizadas():
+    df = pd.DataFrame({"model": ["16V26", "16V26", "3512C"], "manufacturer": ["Wärtsilä", "Wärtsilä", "CAT"],
+                       "power_kw": [5440, 5440, 500], "rpm": [1000, 1000, 1800],
+                       "length_m": [6.8, 6.8, 3.5], "width_m": [2.9, 2.9, 1.8]})
+    assert list(CatalogoMotores(df).columnas["key"]) == ["WARTSILA_16V26", "WARTSILA_16V26_2", "CAT_3512C"]
+
+
+def test_filtros_del_usuario_no_amplian_la_envolvente_de_la_sala():
+    df = _catalogo()
+    cat = CatalogoMotores(df)
+    config = CADIntegrationConfig()
+    # Envolvente por defecto: 15 m − 2·1 m, 15.99·0.6 − 2 m y 7.90 − 1.2 − 1 m
+    envolvente = {"length_m": (None, 13.0), "width_m": (None, 15.99 * 0.6 - 2.0), "height_m": (None, 5.7)}
+    sala = cat.filtrar_por_sala(config)
+    assert set(sala["key"]) == set(cat.columnas["key"][list(_fuerza_bruta(df, **envolvente))])
+
+    # Un máximo más holgado que la envolvente no la sustituye
+    holgado = cat.filtrar_por_sala(config, length_m=(None, 20.0), height_m=(None, 9.0))
+    assert set(holgado["key"]) == set(sala["key"])
+
+    # Un máximo más estricto y un mínimo se combinan con ella
+    estricto = cat.filtrar_por_sala(config, length_m=(6.0, 9.0), power_kw=(5000.0, None))
+    esperado = _fuerza_bruta(df, **{**envolvente, "length_m": (6.0, 9.0), "power_kw": (5000.0, None)})
+    assert set(estricto["key"]) == set(cat.columnas["key"][list(esperado)])
+    assert estricto["length_m"].between(6.0, 9.0).all() and (estricto["height_m"] <= 5.7).all()
+
+
+def test_registro_en_engine_room_designer():
+    cat = CatalogoMotores.desde_biblioteca()
+    assert set(cat.columnas["key"]) == set(ENGINE_LIBRARY)
+    for clave, cfg in ENGINE_LIBRARY.items():
+        assert cat.configuracion(clave).power_kw == cfg.power_kw
+        assert cat.configuracion(clave).length_m == cfg.length_m
+
+    nuevos = CatalogoMotores(_catalogo(50, semilla=1))
+    claves = nuevos.consultar(power_kw=(5000.0, None))["key"]
+    designer = EngineRoomDesigner()
+    registrados = nuevos.registrar_en(designer, claves)
+    assert set(registrados) == set(claves) and len(claves) > 0
+    assert set(ENGINE_LIBRARY) | set(claves) == set(designer.engine_configs)
+    for clave in claves:
+        assert designer.engine_configs[clave] is registrados[clave]
+        assert designer.engine_configs[clave].power_kw >= 5000.0
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from maxsurf_integration.workflows import Artefacto, GrafoConstruccion
+
+
+def _grafo(tmp_path: Path, llamadas: list) -> GrafoConstruccion:
+    fuente = tmp_path / "generador.py"
+    resumen = tmp_path / "resumen.json"
+    plano = tmp_path / "plano.dxf"
+    figura = tmp_path / "plano.png"
+
+    def construir_plano():
+        llamadas.append("plano")
+        plano.write_text(fuente.read_text() + resumen.read_text())
+
+    def construir_figura():
+        llamadas.append("figura")
+        figura.write_text(plano.read_text().upper())
+
+    grafo = GrafoConstruccion(tmp_path / "estado.json")
+    # Se declaran en orden inverso: el grafo ordena por dependencias
+    grafo.agregar(Artefacto("figura", [figura], [], construir_figura, depende_de=("plano",)))
+    grafo.agregar(Artefacto("plano", [plano], [fuente, resumen], construir_plano, parametros={"lpp": 105.2}))
+    return grafo
+
+
+def test_solo_se_regenera_lo_obsoleto(tmp_path: Path):
+    (tmp_path / "generador.py").write_text("v1")
+    (tmp_path / "resumen.json").write_text('{"tanque": 113.31}')
+    llamadas: list = []
+
+    assert _grafo(tmp_path, llamadas).construir() == {"plano": "construido", "figura": "construido"}
+    assert llamadas == ["plano", "figura"]
+
+    # Estado persistente: un grafo nuevo no reconstruye nada
+    llamadas.clear()
+    grafo = _grafo(tmp_path, llamadas)
+    assert grafo.obsoletos() == {}
+    assert set(grafo.construir().values()) == {"al día"}
+    assert llamadas == []
+
+    # Cambia un volumen en el JSON: se regeneran el plano y la figura que depende de él
+    (tmp_path / "resumen.json").write_text('{"tanque": 113.32}')
+    grafo = _grafo(tmp_path, llamadas)
+    assert grafo.obsoletos() == {"plano": "entradas modificadas", "figura": "depende de plano"}
+    grafo.construir()
+    assert llamadas == ["plano", "figura"]
+
+    # Falta una salida: sólo se regenera ese artefacto
+    llamadas.clear()
+    (tmp_path / "plano.png").unlink()
+    assert _grafo(tmp_path, llamadas).construir(["figura"])["figura"] == "construido"
+    assert llamadas == ["figura"]
+
+
+def test_dependencias_desconocidas_o_circulares(tmp_path: Path):
+    grafo = GrafoConstruccion(tmp_path / "estado.json")
+    grafo.agregar(Artefacto("a", [], [], lambda: None, depende_de=("b",)))
+    with pytest.raises(KeyError):
+        grafo.orden()
+    grafo.agregar(Artefacto("b", [], [], lambda: None, depende_de=("a",)))
+    with pytest.raises(ValueError):
+        grafo.orden()
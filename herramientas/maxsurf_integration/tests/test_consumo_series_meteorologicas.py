@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from consumo_series_meteorologicas import DIAS_POR_MES, VELOCIDAD_PUERTO_KN, ConsumoSeriesTemporales
+
+
+def _serie(n: int = 600, semilla: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(semilla)
+    # Pasos de 10 min con huecos irregulares de hasta 1 h
+    pasos = rng.choice([10, 10, 10, 20, 60], n - 1)
+    tiempo = pd.Timestamp("2015-03-01") + pd.to_timedelta(np.concatenate([[0], np.cumsum(pasos)]), unit="min")
+    velocidad = rng.uniform(8.0, 15.0, n)
+    velocidad[100:160] = 0.0  # escala en puerto
+    return pd.DataFrame({
+        "tiempo": tiempo,
+        "velocidad_kn": velocidad,
+        "temp_ambiente_c": rng.uniform(10.0, 35.0, n),
+        "altura_ola_m": rng.uniform(0.0, 6.0, n),
+    })
+
+
+@pytest.mark.parametrize("filas_por_bloque", [600, 97, 7])
+def test_resultado_no_depende_del_tamano_de_bloque(tmp_path: Path, filas_por_bloque: int):
+    ruta = tmp_path / "serie.csv"
+    _serie().to_csv(ruta, index=False)
+
+    def _procesar(filas):
+        # ROB pequeño para que el agotamiento caiga en mitad de la serie
+        proc = ConsumoSeriesTemporales(rob_inicial_t=60.0, reserva_t=5.0, dt_min=10.0, fecha_limpieza="2014-06-01")
+        salida = tmp_path / f"resultado_{filas}.csv"
+        resumen = proc.procesar(ruta, salida, filas_por_bloque=filas)
+        return pd.read_csv(salida), resumen
+
+    referencia, resumen_ref = _procesar(10_000)
+    resultado, resumen = _procesar(filas_por_bloque)
+    pd.testing.assert_frame_equal(resultado, referencia, check_exact=False, rtol=1e-9)
+    agotamiento, agotamiento_ref = resumen.pop("agotamiento"), resumen_ref.pop("agotamiento")
+    assert resumen == resumen_ref and resumen["registros"] == 600
+    assert agotamiento["tiempo"] == agotamiento_ref["tiempo"]
+    assert agotamiento["hora"] == pytest.approx(agotamiento_ref["hora"])
+    assert agotamiento["distancia_nm"] == pytest.approx(agotamiento_ref["distancia_nm"])
+
+
+def test_conversion_de_tiempo_a_intervalos():
+    df = _serie(50)
+    proc = ConsumoSeriesTemporales(rob_inicial_t=300.0, dt_min=10.0)
+    res = proc.procesar_bloque(df)
+    # Cada registro cubre desde el anterior; el primero, el paso nominal
+    dt_h = np.diff(res["horas"].to_numpy(), prepend=0.0)
+    esperado = df["tiempo"].diff().fillna(pd.Timedelta(minutes=10)) / pd.Timedelta(hours=1)
+    assert np.allclose(dt_h, esperado)
+    assert np.allclose(np.diff(res["consumo_acumulado_t"], prepend=0.0), res["consumo_kg_h"] * dt_h / 1000.0)
+
+    # El bloque siguiente arrastra el último instante
+    siguiente = df.iloc[[-1]].assign(tiempo=df["tiempo"].iloc[-1] + pd.Timedelta(minutes=30))
+    assert proc.procesar_bloque(siguiente)["horas"].iloc[0] == pytest.approx(res["horas"].iloc[-1] + 0.5)
+
+    # Sin columna tiempo se usa el paso nominal
+    sin_tiempo = ConsumoSeriesTemporales(rob_inicial_t=300.0, dt_min=15.0).procesar_bloque(df.drop(columns="tiempo"))
+    assert np.allclose(sin_tiempo["horas"], 0.25 * np.arange(1, 51))
+    assert "tiempo" not in sin_tiempo
+
+
+def test_fouling_desde_la_fecha_de_limpieza():
+    df = _serie(40).assign(velocidad_kn=12.0)
+    df.loc[:9, "tiempo"] = pd.Timestamp("2015-02-20") + pd.to_timedelta(np.arange(10), unit="h")
+    df = df.sort_values("tiempo", ignore_index=True)
+    proc = ConsumoSeriesTemporales(rob_inicial_t=300.0, fecha_limpieza="2015-02-21")
+    res = proc.procesar_bloque(df)
+
+    dias = (df["tiempo"] - pd.Timestamp("2015-02-21")) / pd.Timedelta(days=1)
+    meses = np.maximum(dias.to_numpy(), 0.0) / DIAS_POR_MES
+    esperado = proc.calculador.consumo_navegacion_batch(
+        df["velocidad_kn"].to_numpy(), df["temp_ambiente_c"].to_numpy(), meses, df["altura_ola_m"].to_numpy(),
+        velocidad_servicio_kn=proc.velocidad_servicio_kn,
+    )["consumo_total_kg_h"]
+    assert np.allclose(res["consumo_kg_h"], esperado)
+    assert meses[0] == 0.0 and meses[-1] > 0.25  # antes de la limpieza, casco limpio
+
+    # Una columna explícita tiene prioridad sobre la fecha
+    constante = proc.procesar_bloque(df.assign(meses_desde_limpieza=0.0))
+    limpio = ConsumoSeriesTemporales(rob_inicial_t=300.0, meses_desde_limpieza=0.0).procesar_bloque(df)
+    assert np.allclose(constante["consumo_kg_h"], limpio["consumo_kg_h"])
+    assert res["consumo_kg_h"].iloc[-1] > limpio["consumo_kg_h"].iloc[-1]
+
+
+def test_umbral_de_puerto_anula_la_propulsion():
+    df = pd.DataFrame({"velocidad_kn": [0.0, VELOCIDAD_PUERTO_KN - 1e-3, VELOCIDAD_PUERTO_KN, 12.0]})
+    proc = ConsumoSeriesTemporales(rob_inicial_t=300.0, dt_min=60.0)
+    res = proc.procesar_bloque(df)
+
+    puerto = res.iloc[:2]
+    assert (puerto["consumo_kg_h"] == proc.calculador.generador.consumo_horario(40.0)).all()
+    assert (puerto["carga_motor_pct"] == 0.0).all() and puerto["autonomia_nm"].isna().all()
+    assert (puerto["distancia_nm"] == 0.0).all()
+
+    navegando = res.iloc[2:]
+    assert (navegando["carga_motor_pct"] > 0.0).all()
+    assert (navegando["consumo_kg_h"] > proc.consumo_puerto_kg_h).all()
+    assert res["distancia_nm"].iloc[-1] == pytest.approx(VELOCIDAD_PUERTO_KN + 12.0)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from maxsurf_integration.stability import PerfilViento, StabilityAnalyzer
+
+ANGULOS = np.arange(0.0, 91.0, 5.0)
+
+
+def _gz(gm: float) -> np.ndarray:
+    r = np.radians(ANGULOS)
+    pared = gm * np.sin(r) + 0.75 * np.sin(r) * np.tan(np.minimum(r, np.radians(30))) ** 2
+    return pared * np.clip(1 - (ANGULOS / 75) ** 2, -1, 1)
+
+
+def test_lw1_segun_formula_is():
+    perfil = PerfilViento(rectangulos=[(0.0, 100.0, 0.0, 8.0)])
+    area, z = perfil.area_y_palanca(6.0)
+    assert np.isclose(area, 200.0)
+    assert np.isclose(z, 7.0 - 3.0)
+    an = StabilityAnalyzer(None)
+    df = an.criterio_meteorologico(ANGULOS, [_gz(1.0)], [8000.0], [6.0], [6.5], [1.0], perfil=perfil)
+    assert np.isclose(df.loc[0, "lw1_m"], 504.0 * 200.0 * 4.0 / (1000 * 9.81 * 8000.0))
+    assert np.isclose(df.loc[0, "lw2_m"], 1.5 * df.loc[0, "lw1_m"])
+
+
+def test_barrido_lote_igual_a_casos_individuales():
+    gms = np.array([0.05, 0.4, 1.2])
+    gz = np.stack([_gz(g) for g in gms])
+    kwargs = dict(desplazamiento_t=[7500.0] * 3, calado_m=[6.2] * 3, kg_m=[6.9, 6.6, 5.8], gm_m=gms)
+    an = StabilityAnalyzer(None)
+    lote = an.barrido_estabilidad(ANGULOS, gz, presiones_pa=[504.0, 900.0], **kwargs)
+    assert len(lote) == 6
+    for i in range(3):
+        uno = an.barrido_estabilidad(
+            ANGULOS, gz[i:i + 1], presiones_pa=[504.0, 900.0],
+            **{k: [v[i]] for k, v in kwargs.items()},
+        )
+        fila = lote[lote["condicion"] == i].reset_index(drop=True)
+        assert np.allclose(fila["area_b_mrad"], uno["area_b_mrad"])
+        assert (fila["cumple_total"] == uno["cumple_total"]).all()
+    # El caso de GM casi nulo no cumple; el de GM holgado sí
+    assert not lote.loc[lote["condicion"] == 0, "cumple_total"].any()
+    assert lote.loc[lote["condicion"] == 2, "cumple_total"].all()
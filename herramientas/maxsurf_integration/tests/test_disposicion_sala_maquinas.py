@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import ezdxf
+import numpy as np
+import pytest
+
+from maxsurf_integration.optimization import (
+    Equipo,
+    IndiceRejilla,
+    OptimizadorSalaMaquinas,
+    equipos_por_defecto,
+    verificar_colisiones,
+)
+from maxsurf_integration.optimization.disposicion_sala_maquinas import _solape
+from maxsurf_integration.workflows import CADIntegrationConfig, build_dxf_from_cad_systems
+
+
+def test_indice_rejilla_igual_a_fuerza_bruta():
+    rng = np.random.default_rng(3)
+    esquinas = rng.uniform(0, 30, (200, 2))
+    cajas = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(esquinas, rng.uniform(0.2, 4, (200, 2)))]
+    indice = IndiceRejilla(celda_m=1.5)
+    for i, caja in enumerate(cajas):
+        indice.insertar(i, caja)
+    indice.eliminar(7)
+    for i in range(0, 200, 13):
+        esperado = {j for j in range(200) if j not in (i, 7) and _solape(cajas[i], cajas[j]) > 0}
+        assert set(indice.solapes(cajas[i], excluir=[i])) == esperado
+
+    a = Equipo("A", "generador", 3.0, 2.0, holgura_m=0.0, x_m=0.0)
+    b = Equipo("B", "generador", 3.0, 2.0, holgura_m=0.0, x_m=2.5)
+    assert verificar_colisiones([a, b]) == [("A", "B", pytest.approx(1.0))]
+    b.holgura_m = 0.8
+    a.x_m = -0.5
+    assert verificar_colisiones([a, b])  # sólo chocan las holguras
+
+
+def test_disposicion_valida_y_reproducible():
+    cfg = CADIntegrationConfig()
+    opt = OptimizadorSalaMaquinas.desde_config(cfg)
+    res = opt.optimizar(semilla=1)
+    assert res.valido
+    motor = res.equipo("MOTOR 16V26")
+    assert motor.y_m == 0.0
+    # Línea de ejes corta: la cara de popa del motor cerca del mamparo (con holgura)
+    assert cfg.engine_room_limits[1] - (motor.x_m + motor.largo_m / 2) < 1.5
+    assert res.coste == pytest.approx(opt.coste())
+    otra = OptimizadorSalaMaquinas.desde_config(cfg).optimizar(semilla=1)
+    assert otra.tabla().equals(res.tabla())
+
+
+def test_dxf_usa_la_disposicion(tmp_path: Path):
+    cfg = CADIntegrationConfig(output_dir=tmp_path)
+    res = OptimizadorSalaMaquinas.desde_config(cfg, equipos_por_defecto()).optimizar(semilla=2)
+    ruta = build_dxf_from_cad_systems(cfg, disposicion=res)
+    msp = ezdxf.readfile(ruta).modelspace()
+    rectangulos = {
+        tuple(np.round(np.array(p.get_points("xy")).min(axis=0), 3))
+        for p in msp.query("LWPOLYLINE")
+    }
+    for equipo in res.equipos:
+        x0, y0, _, _ = equipo.caja()
+        assert (round(x0, 3), round(y0, 3)) in rectangulos
+    meta = json.loads((tmp_path / "metadata_sala_maquinas.json").read_text(encoding="utf-8"))
+    assert len(meta["engine_room"]["layout"]) == len(res.equipos)
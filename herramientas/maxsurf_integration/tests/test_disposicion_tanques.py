@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import numpy as np
+
+from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.optimization import CondicionCarga, OptimizadorDisposicionTanques, cadena_cuadernas
+from maxsurf_integration.optimization.disposicion_tanques import aplicar_a_disposicion
+from maxsurf_integration.stability import TablaHidrostatica
+from maxsurf_integration.tanks import TankDesigner
+
+
+def _tanques_disposicion():
+    # Mismos campos que generar_disposicion_general.Tank
+    def tank(nombre, servicio, inicio, fin, volumen, alto, ancho):
+        return SimpleNamespace(nombre=nombre, servicio=servicio, inicio_m=inicio, fin_m=fin,
+                               volumen_m3=volumen, altura_media_m=alto, ancho_efectivo_m=ancho)
+    return [
+        tank("DB Proa", "Lastre de ajuste y reserva FO", 72.2, 99.2, 269.9, 0.8, 13.6),
+        tank("DB Centro", "Combustible pesado / lastre", 45.2, 72.2, 269.9, 0.8, 13.6),
+        tank("DB Aft", "Combustible y lastre", 23.2, 45.2, 219.9, 0.8, 13.6),
+        tank("DB Máquina", "Servicio motor principal", 8.2, 23.2, 150.0, 0.8, 13.6),
+        tank("Wing tank babor", "Fuel oil alimentación", 10.2, 22.2, 113.3, 6.1, 3.5),
+        tank("Wing tank estribor", "Fuel oil alimentación", 10.2, 22.2, 113.3, 6.1, 3.5),
+    ]
+
+
+def _optimizador(**kw):
+    condiciones = [
+        CondicionCarga("Salida", {"fuel_oil": 0.98}, peso_t=4000.0, kg_m=4.5, lcg_m=58.0),
+        CondicionCarga("Llegada", {"fuel_oil": 0.0, "DB Máquina": 0.5}, peso_t=4000.0, kg_m=4.5, lcg_m=58.0),
+    ]
+    return OptimizadorDisposicionTanques.desde_disposicion(
+        _tanques_disposicion(),
+        tabla=TablaHidrostatica.desde_parametros(),
+        desplazamiento_rosca_t=2600.0, kg_rosca_m=5.6, lcg_rosca_m=49.0,
+        condiciones=condiciones, trimado_max_m=0.5,
+        cuadernas_m=cadena_cuadernas(lpp_m=105.2), **kw,
+    )
+
+
+def test_lote_igual_a_evaluacion_individual():
+    opt = _optimizador()
+    rng = np.random.default_rng(2)
+    lote = rng.integers(opt.indice_min, opt.indice_max + 1, size=(64, len(opt.indice_min)))
+    res = opt.evaluar(lote, 1000.0)
+    for k in (0, 17, 63):
+        uno = opt.evaluar(lote[k], 1000.0)
+        for clave in ("capacidad_m3", "trimado_m", "gm_m", "puntuacion"):
+            assert np.allclose(res[clave][k], uno[clave][0])
+    # Disposición inicial: capacidad = suma de volúmenes tabulados
+    inicial = opt.evaluar(opt.borde_inicial, 1000.0)
+    assert np.isclose(inicial["capacidad_m3"][0], sum(t.volumen_m3 for t in _tanques_disposicion()), rtol=1e-2)
+
+
+def test_optimizador_cumple_requerimiento_y_mamparos():
+    opt = _optimizador()
+    res = opt.optimizar(1020.0, n_candidatos=512, n_iteraciones=20, semilla=0)
+    assert res.factible
+    assert res.capacidad_combustible_m3 >= 1020.0
+    assert (res.condiciones["trimado_m"].abs() <= 0.5 + 1e-9).all()
+    limites = res.limites()
+    assert limites["DB Máquina"][0] == 8.2 and limites["DB Proa"][1] == 99.2
+    assert limites["DB Máquina"][1] == 23.2  # mamparo de cámara de máquinas
+    assert limites["DB Aft"][1] == limites["DB Centro"][0]
+    assert np.isin(res.bordes_m, np.append(cadena_cuadernas(lpp_m=105.2), 23.2)).all()
+
+
+@dataclass
+class _Tank:
+    nombre: str
+    servicio: str
+    inicio_m: float
+    fin_m: float
+    volumen_m3: float
+
+
+def test_aplicar_a_disposicion_copia_tanques():
+    opt = _optimizador()
+    res = opt.optimizar(1020.0, n_candidatos=256, n_iteraciones=5, semilla=0)
+    limites = res.limites()
+    volumenes = res.tanques.set_index("nombre")["volumen_m3"]
+
+    originales = _tanques_disposicion() + [SimpleNamespace(nombre="Agua dulce", inicio_m=1.0, fin_m=2.0, volumen_m3=5.0)]
+    nuevos = aplicar_a_disposicion(originales, res)
+    for t, nuevo in zip(originales, nuevos):
+        if t.nombre in limites:
+            assert nuevo is not t
+            assert (nuevo.inicio_m, nuevo.fin_m) == limites[t.nombre]
+            assert nuevo.volumen_m3 == volumenes[t.nombre]
+            assert nuevo.servicio == t.servicio
+        else:
+            assert nuevo is t
+    assert originales[0].inicio_m == 72.2  # los originales no se modifican
+
+    db = _Tank("DB Proa", "Lastre", 72.2, 99.2, 269.9)
+    (copia,) = aplicar_a_disposicion([db], res)
+    assert isinstance(copia, _Tank) and copia.fin_m == limites["DB Proa"][1] and db.volumen_m3 == 269.9
+
+
+def test_tank_designer_optimizar_disposicion():
+    with MaxsurfConnector(visible=False) as mx:
+        designer = TankDesigner(mx)
+        designer.diseñar_tanques_buque9()
+        condiciones = [
+            CondicionCarga("Salida", {"fuel_oil": 0.98, "agua_dulce": 0.98}, peso_t=2500.0, kg_m=4.0, lcg_m=50.0),
+            CondicionCarga("Llegada", {"FUEL_CENTRAL_AFT": 0.3, "lastre": 0.98}, peso_t=2500.0, kg_m=4.0, lcg_m=50.0),
+        ]
+        res = designer.optimizar_disposicion(1900.0, 4.5, 45.0, semilla=1, condiciones=condiciones)
+        assert res.factible
+        fuel = sum(t["volumen_m3"] for t in designer.tanques if t["tipo"] == "fuel_oil")
+        assert np.isclose(fuel, res.capacidad_combustible_m3)
+        assert fuel >= res.requerido_m3
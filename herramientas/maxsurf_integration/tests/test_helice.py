@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from maxsurf_integration.hull_design import SelectorHelice, coeficientes_kt_kq
+
+
+def test_serie_b_aguas_libres():
+    # B4-70, P/D = 1.0: valores de las curvas publicadas de la serie B
+    r = coeficientes_kt_kq(0.7, 1.0, 0.70, 4)
+    assert float(r["kt"]) == pytest.approx(0.178, abs=0.005)
+    assert float(r["kq"]) == pytest.approx(0.0308, abs=0.001)
+    j = np.linspace(0.05, 1.0, 20)
+    curva = coeficientes_kt_kq(j, 1.0, 0.70, 4)
+    assert np.all(np.diff(curva["kt"]) < 0)
+    assert 0.65 < curva["eta_0"].max() < 0.72
+
+
+def test_seleccion_helice_motor_man():
+    selector = SelectorHelice.desde_motor("MAN_6S50ME-C")
+    res = selector.seleccionar(14.5, palas=(4, 5))
+    assert res.n_factibles > 0
+    h = res.helice
+    assert h["diametro_m"] <= selector.diametro_max_m + 1e-9
+    assert h["rpm"] <= 127.0 + 1e-9
+    assert h["empuje_kn"] >= h["empuje_necesario_kn"]
+    assert h["cumple_cavitacion"]
+    assert h["eta_0"] == res.alternativas["eta_0"].max()
+    # El candidato elegido coincide con la evaluación puntual
+    punto = coeficientes_kt_kq(h["j"], h["paso_diametro"], h["area_expandida"], h["palas"])
+    assert float(punto["kt"]) == pytest.approx(h["kt"])
+    assert float(punto["eta_0"]) == pytest.approx(h["eta_0"])
@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+
+import ezdxf
+import pytest
+
+from maxsurf_integration.__main__ import main as cli_main
+from maxsurf_integration.__main__ import build_parser
+from maxsurf_integration.autocad_integration.interferencias import (
+    REGLAS_POR_DEFECTO,
+    DetectorInterferencias,
+    ReglaChoque,
+    detectar_interferencias,
+)
+
+
+def _rect(msp, x0, y0, x1, y1, capa):
+    return msp.add_lwpolyline([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], close=True, dxfattribs={"layer": capa})
+
+
+def _plano():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    _rect(msp, 0, 0, 40, 20, "ESTRUCTURA")           # límite del local: no choca con lo que contiene
+    msp.add_line((10, 0), (10, 20), dxfattribs={"layer": "ESTRUCTURA"})  # mamparo que atraviesa la bomba
+    bomba = _rect(msp, 8, 5, 12, 8, "EQUIPOS")
+    _rect(msp, 20, 5, 24, 8, "EQUIPOS")               # libre
+    motor = _rect(msp, 26, 2, 32, 6, "MAQUINAS")
+    tanque = _rect(msp, 30, 0, 36, 3, "TANQUES")     # solapa 2 x 1 m con el motor
+    _rect(msp, 32, 6, 36, 9, "TANQUES")              # sólo toca el motor por una esquina
+    return doc, bomba, motor, tanque
+
+
+def test_choques_entre_capas():
+    doc, bomba, motor, tanque = _plano()
+    det = DetectorInterferencias(doc.modelspace(), celda_m=2.0)
+    choques = det.choques([ReglaChoque("EQUIPOS", "ESTRUCTURA", macizo=False), ("MAQUINAS", "TANQUES")])
+
+    assert {(c.handle_a, c.handle_b) for c in choques} == {
+        (bomba.dxf.handle, next(e.dxf.handle for e in doc.modelspace().query("LINE"))),
+        (motor.dxf.handle, tanque.dxf.handle),
+    }
+    por_capa = {c.capa_b: c for c in choques}
+    assert por_capa["ESTRUCTURA"].magnitud == pytest.approx(3.0)   # longitud del mamparo dentro de la bomba
+    assert por_capa["TANQUES"].magnitud == pytest.approx(2.0)      # área común motor-tanque
+
+    # Como contorno macizo, el límite del local contiene a los dos equipos
+    assert len(det.choques([("EQUIPOS", "ESTRUCTURA")])) == 3
+
+
+def test_duplicadas_y_textos():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (5, 0), dxfattribs={"layer": "CASCO"})
+    msp.add_line((5, 0), (0, 0), dxfattribs={"layer": "ESTRUCTURA"})   # misma línea invertida
+    _rect(msp, 0, 0, 5, 2, "TANQUES")                                    # comparte el tramo inferior
+    msp.add_line((0, 10), (5, 10))
+    msp.add_text("TANQUE", height=0.5, dxfattribs={"layer": "TEXTO", "insert": (1, 9.9)})
+    msp.add_text("TANQUE DB", height=0.5, dxfattribs={"layer": "TEXTO", "insert": (1.5, 9.9)})
+    msp.add_text("LIBRE", height=0.5, dxfattribs={"layer": "TEXTO", "insert": (20, 20)})
+
+    informe = detectar_interferencias(doc, reglas=())
+    assert informe.resumen() == {"duplicada": 2, "texto_sobre_geometria": 2, "texto_sobre_texto": 1}
+    assert all(d.magnitud == pytest.approx(5.0) for d in informe.de_tipo("duplicada"))
+    assert {d.capa_b for d in informe.de_tipo("duplicada")} == {"ESTRUCTURA", "TANQUES"}
+    assert informe.de_tipo("texto_sobre_texto")[0].capa_a == "TEXTO"
+
+
+def test_duplicadas_sin_redondeo_y_solapes_colineales():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    # A ambos lados de un límite de redondeo de 1 mm: siguen siendo la misma línea
+    a = msp.add_line((0.0004, 1), (5, 1), dxfattribs={"layer": "CASCO"})
+    msp.add_line((0.0006, 1), (5, 1), dxfattribs={"layer": "ESTRUCTURA"})
+    # Colineales de distinta longitud, una dentro de otra y otra desplazada
+    b = msp.add_line((0, 0), (10, 0), dxfattribs={"layer": "CASCO"})
+    msp.add_line((0, 0), (5, 0), dxfattribs={"layer": "TANQUES"})
+    msp.add_line((15, 0), (8, 0), dxfattribs={"layer": "MAMPAROS"})
+    # Paralela a 1 cm, perpendicular y a continuación: no son duplicados
+    msp.add_line((0, 2), (5, 2))
+    msp.add_line((0, 2.01), (5, 2.01))
+    msp.add_line((3, -1), (3, 1))
+    msp.add_line((10, 3), (20, 3))
+    msp.add_line((20, 3), (30, 3))
+
+    duplicadas = DetectorInterferencias(msp).duplicadas()
+    por_capa = {d.capa_b: d for d in duplicadas}
+    assert sorted(por_capa) == ["ESTRUCTURA", "MAMPAROS", "TANQUES"]
+    assert por_capa["ESTRUCTURA"].handle_a == a.dxf.handle
+    assert por_capa["ESTRUCTURA"].magnitud == pytest.approx(5.0, abs=1e-3)
+    assert por_capa["TANQUES"].handle_a == b.dxf.handle
+    assert por_capa["TANQUES"].magnitud == pytest.approx(5.0)
+    assert por_capa["TANQUES"].punto == pytest.approx((2.5, 0.0))
+    assert por_capa["MAMPAROS"].magnitud == pytest.approx(2.0)  # sólo el tramo 8-10 está repetido
+
+
+def test_reglas_por_defecto_incluyen_mamparos():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    _rect(msp, 0, 0, 20, 10, "MAMPAROS")              # contorno del local: no choca con lo que contiene
+    bomba = _rect(msp, 2, 2, 4, 4, "EQUIPOS")
+    motor = _rect(msp, 9, 2, 13, 5, "MAQUINAS")
+    msp.add_line((11, 0), (11, 10), dxfattribs={"layer": "MAMPAROS"})  # atraviesa el motor
+
+    choques = DetectorInterferencias(msp).choques()
+    assert [(c.handle_a, c.capa_b, c.magnitud) for c in choques] == [(motor.dxf.handle, "MAMPAROS", pytest.approx(3.0))]
+    assert bomba.dxf.handle not in {c.handle_a for c in choques}
+    assert {("EQUIPOS", "MAMPAROS"), ("MAQUINAS", "MAMPAROS")} <= {
+        (r.capa_a, r.capa_b) for r in REGLAS_POR_DEFECTO if not r.macizo
+    }
+
+
+def test_cli_interferencias(tmp_path: Path, capsys):
+    doc, *_ = _plano()
+    ruta = tmp_path / "plano.dxf"
+    doc.saveas(ruta)
+    salida = tmp_path / "informe.json"
+
+    rc = cli_main([
+        "interferencias", str(ruta), "--regla", "MAQUINAS:TANQUES", "--sin-textos", "--sin-duplicadas",
+        "--json", str(salida),
+    ])
+    assert rc == 0
+    informe = json.loads(salida.read_text(encoding="utf-8"))[0]
+    assert informe["resumen"] == {"choque": 1}
+    assert "plano.dxf" in capsys.readouterr().out
+
+    assert cli_main(["interferencias", str(ruta), "--estricto"]) == 1
+
+
+def test_cli_regla_valida_el_formato(capsys):
+    parser = build_parser()
+    args = parser.parse_args(["interferencias", "p.dxf", "--regla", "A:B", "--regla", "EQUIPOS:MAMPAROS:lineas"])
+    assert args.regla == [("A", "B", True), ("EQUIPOS", "MAMPAROS", False)]
+
+    for regla in ("EQUIPOS", "A:B:linea", "A::lineas", "A:B:lineas:x"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["interferencias", "p.dxf", "--regla", regla])
+        assert f"regla '{regla}' no válida" in capsys.readouterr().err
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from calculos_combustible_optimizados import CalculadorConsumo
+from maxsurf_integration.hull_design import ModeloResistencia, ParametrosCasco
+from montecarlo_consumo import Distribucion, MonteCarloConsumo
+
+CONSTANTES = {
+    "temp_ambiente_c": Distribucion("constante", (25.0,)),
+    "meses_desde_limpieza": Distribucion("constante", (6.0,)),
+    "altura_ola_m": Distribucion("constante", (1.5,)),
+    "factor_degradacion": Distribucion("constante", (1.02,)),
+}
+
+
+def test_semilla_reproduce_resultados_con_y_sin_pool():
+    mc = MonteCarloConsumo(capacidad_tanques_m3=377.6)
+    a = mc.simular(20_000, semilla=7, tam_bloque=6_000, procesos=1)
+    b = mc.simular(20_000, semilla=7, tam_bloque=6_000, procesos=2)
+    pd.testing.assert_frame_equal(a.muestras, b.muestras)
+    assert len(a.muestras) == 20_000
+    assert not mc.simular(20_000, semilla=8, tam_bloque=6_000, procesos=1).muestras.equals(a.muestras)
+
+
+@pytest.mark.parametrize("modelo", [None, ModeloResistencia(ParametrosCasco.desde_datos_buque())])
+@pytest.mark.parametrize("demanda", [None, 650.0])
+def test_sin_varianza_igual_al_calculo_determinista(modelo, demanda):
+    mc = MonteCarloConsumo(
+        capacidad_tanques_m3=377.6, distribuciones=CONSTANTES, modelo_resistencia=modelo, demanda_electrica_kw=demanda,
+    )
+    res = mc.simular(1_000, semilla=1, procesos=1)
+    assert res.muestras["autonomia_nm"].nunique() == 1
+
+    calc = CalculadorConsumo(modelo_resistencia=modelo)
+    uno = calc.consumo_navegacion(14.5, demanda_electrica_kw=demanda)
+    assert res.muestras["consumo_total_kg_h"].iloc[0] == pytest.approx(uno["consumo_total_kg_h"], abs=0.005)
+    if demanda is None:
+        determinista = calc.autonomia_estimada(377.6)
+        assert res.muestras["autonomia_nm"].iloc[0] == pytest.approx(determinista["autonomia_nm"], abs=1.0)
+    else:
+        # El despacho óptimo sustituye a la regla fija de 2 grupos al 60%
+        fijo = calc.consumo_navegacion(14.5)["consumo_generadores_kg_h"]
+        assert uno["consumo_generadores_kg_h"] != pytest.approx(fijo)
+
+
+def test_percentiles_ordenados_y_probabilidad():
+    res = MonteCarloConsumo(capacidad_tanques_m3=377.6).simular(50_000, semilla=3, procesos=1)
+    tabla = res.percentiles()
+    assert list(tabla.index) == ["P5", "P10", "P25", "P50", "P75", "P90", "P95"]
+    assert (np.diff(tabla.to_numpy(), axis=0) >= 0).all()
+    assert tabla.loc["P5", "autonomia_nm"] < tabla.loc["P95", "autonomia_nm"]
+
+    mediana = tabla.loc["P50", "autonomia_nm"]
+    assert res.probabilidad_autonomia(mediana) == pytest.approx(0.5, abs=0.01)
+    assert res.probabilidad_autonomia(0.0) == 1.0
+
+
+def test_modelo_y_calculador_no_se_combinan():
+    with pytest.raises(ValueError):
+        MonteCarloConsumo(377.6, modelo_resistencia=object(), calculador=CalculadorConsumo())
@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from optimizacion_perfil_velocidad import OptimizadorPerfilVelocidad
+
+
+@pytest.mark.parametrize("eta_min_h, eta_max_h", [(8.0, 9.0), (8.6, 9.0), (9.5, 10.0), (10.0, 12.0)])
+def test_llegada_real_dentro_de_la_ventana(eta_min_h, eta_max_h):
+    # Duraciones que no son múltiplo del paso de tiempo
+    tramos = pd.DataFrame({"distancia_nm": [37.0, 41.0, 29.0], "altura_ola_m": [1.0, 2.5, 1.5]})
+    res = OptimizadorPerfilVelocidad(paso_tiempo_h=1.0).optimizar(tramos, eta_min_h, eta_max_h)
+    assert res.factible
+    llegada = res.tramos["llegada_h"].iloc[-1]
+    assert eta_min_h - 1e-9 <= llegada <= eta_max_h + 1e-9
+    assert llegada == pytest.approx((tramos["distancia_nm"] / res.tramos["velocidad_kn"]).sum())
+
+
+def test_llegada_anticipada_no_es_factible():
+    # A 14 kn o más un tramo de 25 nm dura menos de 1.8 h: en pasos de 1 h sólo
+    # cabría en 1 h (25 kn, por encima de la velocidad máxima) y no hay perfil
+    tramos = pd.DataFrame({"distancia_nm": [25.0, 25.0, 25.0], "v_min_kn": [14.0, 14.0, 14.0]})
+    res = OptimizadorPerfilVelocidad(paso_tiempo_h=1.0).optimizar(tramos, 6.0, 6.5)
+    assert not res.factible and np.isnan(res.horas)
+
+    tramos["v_min_kn"] = [14.0, 8.0, 8.0]
+    res = OptimizadorPerfilVelocidad(paso_tiempo_h=0.25).optimizar(tramos, 6.0, 7.0)
+    assert res.factible and 6.0 <= res.horas <= 7.0
+    assert res.tramos["velocidad_kn"].iloc[0] >= 14.0 - 1e-9
+
+
+def _fuerza_bruta(opt, tramos, eta_min_h, eta_max_h):
+    """Mínimo combustible entre todas las combinaciones de duraciones de la malla."""
+    paso = opt.paso_tiempo_h
+    opciones = []
+    for d, ola in zip(tramos["distancia_nm"], tramos["altura_ola_m"]):
+        pasos = np.unique(np.ceil(d / opt.velocidades / paso - 1e-9).astype(int))
+        v = d / (pasos * paso)
+        pasos, v = pasos[v >= opt.velocidades[0] - 1e-9], v[v >= opt.velocidades[0] - 1e-9]
+        kg_h = opt.calculador.consumo_navegacion_batch(v, 25.0, opt.meses_desde_limpieza, ola)["consumo_total_kg_h"]
+        opciones.append(list(zip(pasos * paso, kg_h * pasos * paso / 1000.0)))
+    mejor = np.inf
+    for combinacion in itertools.product(*opciones):
+        horas = sum(h for h, _ in combinacion)
+        if eta_min_h - 1e-9 <= horas <= eta_max_h + 1e-9:
+            mejor = min(mejor, sum(c for _, c in combinacion))
+    return mejor
+
+
+@pytest.mark.parametrize("eta_min_h, eta_max_h", [(7.0, 7.5), (21.0, 24.0), (9.0, 9.0)])
+def test_ventana_de_eta_es_restriccion_exacta(eta_min_h, eta_max_h):
+    tramos = pd.DataFrame({"distancia_nm": [31.0, 43.0, 23.0], "altura_ola_m": [1.0, 3.0, 0.5]})
+    opt = OptimizadorPerfilVelocidad(v_min_kn=4.0, paso_tiempo_h=0.25, paso_velocidad_kn=0.5)
+    libre = opt.optimizar(tramos, 0.0, 40.0)
+    res = opt.optimizar(tramos, eta_min_h, eta_max_h)
+
+    assert res.factible
+    # La ventana excluye el óptimo sin restricciones, así que la restricción es activa
+    assert not eta_min_h <= libre.horas <= eta_max_h
+    assert res.combustible_t > libre.combustible_t
+    assert eta_min_h - 1e-9 <= res.horas <= eta_max_h + 1e-9
+    assert res.horas == pytest.approx((tramos["distancia_nm"] / res.tramos["velocidad_kn"]).sum())
+    assert res.combustible_t == pytest.approx(_fuerza_bruta(opt, tramos, eta_min_h, eta_max_h))
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import ezdxf
+import pytest
+
+from maxsurf_integration.autocad_integration.generador_planos_auto import GeneradorPlanosAuto
+from maxsurf_integration.autocad_integration.planificador import PlanificadorPlanos
+
+
+def _falla(nombre: str) -> None:
+    raise RuntimeError(nombre)
+
+
+def test_planos_en_paralelo_iguales_que_en_serie(tmp_path: Path):
+    params = {"eslora_total": 30.0, "manga_maxima": 7.0, "calado": 2.0}
+    serie = GeneradorPlanosAuto().generar_planos_completos(params, out_dir=tmp_path / "serie", procesos=1)
+    paralelo = GeneradorPlanosAuto().generar_planos_completos(params, out_dir=tmp_path / "paralelo", procesos=3)
+
+    assert list(paralelo) == ["plano_construccion", "plano_lineas", "plano_cuadernas"]
+    for clave, ruta in serie.items():
+        assert Path(paralelo[clave]).parent == tmp_path / "paralelo"
+        entidades_serie = sorted(e.dxftype() + e.dxf.layer for e in ezdxf.readfile(ruta).modelspace())
+        entidades_paralelo = sorted(e.dxftype() + e.dxf.layer for e in ezdxf.readfile(paralelo[clave]).modelspace())
+        assert entidades_serie == entidades_paralelo
+
+
+def test_planificador_propaga_errores_y_rechaza_duplicados():
+    plan = PlanificadorPlanos(procesos=2)
+    plan.agregar("ok", max, 1, 2)
+    with pytest.raises(ValueError):
+        plan.agregar("ok", min, 1, 2)
+    plan.agregar("mal", _falla, "mal")
+    with pytest.raises(RuntimeError, match="mal"):
+        plan.ejecutar()
+    assert PlanificadorPlanos(procesos=1).agregar("ok", max, 1, 2).ejecutar() == {"ok": 2}
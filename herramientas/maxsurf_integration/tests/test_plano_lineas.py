@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import ezdxf
+import numpy as np
+import pytest
+
+from maxsurf_integration.autocad_integration.planos_navales import GeneradorPlanosNavales
+from maxsurf_integration.hull_design import MotorLineas, SuperficieBSpline, TablaOffsets
+
+
+@pytest.mark.parametrize("bspline", [False, True])
+def test_intersecciones_sobre_la_superficie(bspline: bool):
+    tabla = TablaOffsets.desde_parametros()
+    sup = SuperficieBSpline.desde_offsets(tabla) if bspline else tabla
+    plano = MotorLineas(sup, resolucion=300).calcular(
+        estaciones=101, lineas_agua=[1.0, 3.0, 6.2], diagonales=[(5.5, 40.0), (3.5, 25.0)]
+    )
+    assert plano.secciones.shape == (101, 300)
+    # Sección maestra: semimanga B/2 a calado de proyecto
+    assert sup.semimanga(52.6, 6.2) == pytest.approx(15.99 / 2, rel=1e-3)
+    assert plano.lineas_agua[-1].max() == pytest.approx(15.99 / 2, rel=1e-3)
+
+    # Longitudinales: el casco tiene semimanga y_b a la altura calculada
+    # (tolerancia de malla: junto a la quilla la sección es casi horizontal);
+    # donde el fondo plano es más ancho que y_b el longitudinal va por la base
+    for y_b, z_b in zip(plano.longitudinales_y, plano.longitudinales):
+        ok = np.isfinite(z_b)
+        assert ok.sum() > 200
+        base = ok & (z_b == 0.0)
+        assert (sup.semimanga(plano.x_m[base], 0.0) >= y_b - 0.05).all()
+        ok &= ~base
+        assert np.abs(sup.semimanga(plano.x_m[ok], z_b[ok]) - y_b).max() < 0.1
+
+    # Diagonales: el punto a distancia s está sobre la superficie
+    for (z0, ang), s in zip(plano.diagonales, plano.diagonales_s):
+        ok = np.isfinite(s)
+        c, sn = np.cos(np.radians(ang)), np.sin(np.radians(ang))
+        assert np.abs(sup.semimanga(plano.x_m[ok], z0 - s[ok] * sn) - s[ok] * c).max() < 0.02
+
+
+def test_plano_lineas_dxf(tmp_path: Path):
+    ruta = GeneradorPlanosNavales().crear_plano_lineas(
+        eslora=105.2, manga=15.99, calado=6.2, out_dir=tmp_path, n_estaciones=21
+    )
+    msp = ezdxf.readfile(ruta).modelspace()
+    # Las estaciones de las perpendiculares tienen semimanga nula y no se dibujan
+    assert len(msp.query("SPLINE[layer=='C-CUAD']")) == 19
+    assert len(msp.query("SPLINE[layer=='C-LFLOT']")) == 5
+    assert len(msp.query("SPLINE[layer=='C-PERF']")) == 3
+    assert len(msp.query("SPLINE[layer=='C-DIAG']")) == 2
+
+    ruta = GeneradorPlanosNavales().crear_plano_lineas(
+        eslora=20.0, manga=5.0, calado=2.0, out_dir=tmp_path / "poli", curvas="polilinea"
+    )
+    msp = ezdxf.readfile(ruta).modelspace()
+    assert not msp.query("SPLINE") and len(msp.query("LWPOLYLINE")) == 29
@@ -0,0 +1,46 @@
+import pytest
+
+from maxsurf_integration.autocad_integration.estilos_navales import ConfiguradorEstilos
+from maxsurf_integration.autocad_integration.plantillas import (
+    CONJUNTOS_CAPAS,
+    CachePlantillas,
+    EstiloCapa,
+)
+
+
+def test_documentos_independientes_con_capas_del_conjunto():
+    cache = CachePlantillas()
+    a = cache.documento("sala_maquinas_detallado")
+    b = cache.documento("sala_maquinas_detallado")
+    assert len(cache) == 1
+
+    for nombre, estilo in CONJUNTOS_CAPAS["sala_maquinas_detallado"].items():
+        capa = a.layers.get(nombre)
+        assert capa.color == estilo.color
+        assert capa.dxf.linetype == estilo.tipo_linea
+        assert capa.dxf.lineweight == estilo.grosor
+    assert "DASHED" in a.linetypes and a.header["$INSUNITS"] == 6
+
+    a.modelspace().add_line((0, 0), (1, 1), dxfattribs={"layer": "CASCO"})
+    a.layers.add("SOLO_A")
+    assert len(b.modelspace()) == 0 and "SOLO_A" not in b.layers
+    assert len(cache.documento("sala_maquinas_detallado").modelspace()) == 0
+    assert a.header["$FINGERPRINTGUID"] != b.header["$FINGERPRINTGUID"]
+
+
+def test_capas_adicionales_y_conjunto_desconocido():
+    cache = CachePlantillas()
+    doc = cache.documento("naval", capas={"C-EXTRA": EstiloCapa(40, "CENTER")})
+    assert doc.layers.get("C-EXTRA").dxf.linetype == "CENTER"
+    assert doc.layers.get("C-CASC").color == 1
+    assert len(cache) == 1
+    cache.documento("naval")
+    assert len(cache) == 2
+    with pytest.raises(KeyError):
+        cache.documento("inexistente")
+
+
+def test_colores_navales_desde_registro():
+    colores = ConfiguradorEstilos._colores_por_tipo()
+    assert colores == {n: e.color for n, e in CONJUNTOS_CAPAS["naval"].items()}
+    assert colores["C-DIAG"] == 30
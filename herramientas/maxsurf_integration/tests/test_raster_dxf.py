@@ -0,0 +1,97 @@
+import os
+from pathlib import Path
+
+import ezdxf
+import numpy as np
+
+from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
+
+from maxsurf_integration.visualization import raster_dxf
+from maxsurf_integration.visualization.raster_dxf import RasterizadorDXF, previsualizar_directorio
+
+
+def _plano(ruta: Path) -> Path:
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    for i in range(40):
+        msp.add_line((i, 0), (i, 10), dxfattribs={"color": 1 + i % 5})
+    msp.add_lwpolyline([(0, 0), (40, 0), (40, 10), (0, 10)], close=True)
+    msp.add_circle((20, 5), 3)
+    msp.add_text("CUADERNA MAESTRA", dxfattribs={"height": 0.8}).set_placement((18, 5))
+    doc.saveas(ruta)
+    return ruta
+
+
+def test_teselas_cosidas_iguales_que_una_sola(tmp_path: Path):
+    dxf = _plano(tmp_path / "plano.dxf")
+    teselado = RasterizadorDXF(dxf, ancho_px=600, tesela_px=96, procesos=1)
+    unico = RasterizadorDXF(dxf, ancho_px=600, tesela_px=1024, procesos=1)
+    assert len(teselado.teselas()) > 10 and len(unico.teselas()) == 1
+
+    a = np.asarray(teselado.renderizar())
+    b = np.asarray(unico.renderizar())
+    assert a.shape == b.shape == (teselado.alto_px, teselado.ancho_px, 3)
+    assert (a < 128).any()  # el color 7 se dibuja en negro sobre fondo blanco
+    # Sólo el redondeo del antialiasing en los bordes de tesela puede diferir (un nivel de gris)
+    assert np.abs(a.astype(int) - b.astype(int)).max() <= 1
+
+    # Cada tesela sólo recibe las entidades que la tocan
+    assert max(len(teselado.entidades_en(t)) for t in teselado.teselas()) < len(teselado.cajas)
+
+
+def test_lineas_agrupadas_igual_que_backend_de_ezdxf(tmp_path: Path, monkeypatch):
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    for i in range(20):
+        msp.add_line((0, i * 0.5), (20, i * 0.5), dxfattribs={"color": 1 + i // 7, "lineweight": 35})
+        if i % 6 == 0:
+            # Primitivas intercaladas: el orden de dibujo con las líneas debe conservarse
+            msp.add_solid([(i, 0), (i + 3, 0), (i, 6), (i + 3, 6)], dxfattribs={"color": 5})
+            msp.add_point((i + 1, i * 0.5))
+    msp.add_line((2, 2), (2, 2), dxfattribs={"color": 3})
+    msp.add_circle((10, 5), 3, dxfattribs={"color": 6})
+    dxf = tmp_path / "capas.dxf"
+    doc.saveas(dxf)
+
+    agrupado = np.asarray(RasterizadorDXF(dxf, ancho_px=500, tesela_px=1024, procesos=1).renderizar())
+    monkeypatch.setattr(raster_dxf, "_BackendTesela", lambda ax: MatplotlibBackend(ax, adjust_figure=False))
+    original = np.asarray(RasterizadorDXF(dxf, ancho_px=500, tesela_px=1024, procesos=1).renderizar())
+    assert np.array_equal(agrupado, original)
+
+
+def test_paralelo_y_salidas(tmp_path: Path):
+    dxf = _plano(tmp_path / "plano.dxf")
+    rast = RasterizadorDXF(dxf, ancho_px=400, tesela_px=128, procesos=2)
+    serie = np.asarray(RasterizadorDXF(dxf, ancho_px=400, tesela_px=128, procesos=1).renderizar())
+    assert np.array_equal(np.asarray(rast.renderizar()), serie)
+
+    assert Path(rast.guardar_pdf(tmp_path / "plano.pdf")).read_bytes().startswith(b"%PDF")
+    n = rast.guardar_xyz(tmp_path / "xyz", lado_px=128)
+    assert n == len(list((tmp_path / "xyz").rglob("*.png")))
+    assert sorted(p.name for p in (tmp_path / "xyz").iterdir()) == ["0", "1", "2"]
+
+
+def test_previsualizar_directorio_solo_obsoletos(tmp_path: Path):
+    raiz = tmp_path / "salidas"
+    (raiz / "sub").mkdir(parents=True)
+    _plano(raiz / "a.dxf")
+    _plano(raiz / "sub" / "b.dxf")
+    destino = raiz / "previews"
+
+    generadas = previsualizar_directorio(raiz, destino, ancho_px=300, procesos=1)
+    assert sorted(Path(p).relative_to(destino).as_posix() for p in generadas.values()) == ["a.png", "sub/b.png"]
+    assert previsualizar_directorio(raiz, destino, ancho_px=300, procesos=1) == {}
+
+    os.utime(raiz / "a.dxf", (1e10, 1e10))
+    assert list(previsualizar_directorio(raiz, destino, ancho_px=300, procesos=1)) == [str(raiz / "a.dxf")]
+
+
+def test_procesos_no_vuelven_a_leer_el_dxf(tmp_path: Path):
+    dxf = _plano(tmp_path / "plano.dxf")
+    serie = np.asarray(RasterizadorDXF(dxf, ancho_px=400, tesela_px=128, procesos=1).renderizar())
+    rast = RasterizadorDXF(dxf, ancho_px=400, tesela_px=128, procesos=2)
+    dxf.unlink()  # cada tesela recibe sus primitivas ya grabadas
+    assert np.array_equal(np.asarray(rast.renderizar()), serie)
+
+    teselas = rast.teselas()
+    assert sum(len(rast.primitivas_en(t)) for t in teselas) < len(teselas) * len(rast._grabadora.records)
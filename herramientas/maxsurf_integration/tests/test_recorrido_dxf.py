@@ -0,0 +1,82 @@
+import io
+from collections import Counter
+from pathlib import Path
+from xml.etree import ElementTree
+
+import ezdxf
+import pytest
+
+from recorrido_dxf import (
+    CajaEnvolvente,
+    ConteoCapas,
+    ConteoTipos,
+    EmisorSVG,
+    LectorDXF,
+    puntos_extremos,
+    recorrer_modelspace,
+)
+
+
+def _plano(ruta: Path) -> Path:
+    doc = ezdxf.new("R2010", setup=True)
+    doc.layers.add("CASCO", color=5, linetype="DASHED")
+    doc.layers.add("COTAS", color=3)
+    bloque = doc.blocks.new("BOMBA")
+    bloque.add_circle((0, 0), 50.0)  # no debe ampliar la caja: el INSERT no se explota
+
+    msp = doc.modelspace()
+    msp.add_line((-2, -1), (12, 3), dxfattribs={"layer": "CASCO"})
+    msp.add_circle((20, 5), 2.5, dxfattribs={"layer": "CASCO"})
+    msp.add_arc((0, 8), 1.0, 0, 90)
+    msp.add_lwpolyline([(0, 0), (4, 0), (4, 30)], dxfattribs={"layer": "CASCO"})
+    msp.add_blockref("BOMBA", (5, 5), dxfattribs={"layer": "EQUIPOS"})
+    msp.add_linear_dim(base=(0, -5), p1=(0, 0), p2=(10, 0), dxfattribs={"layer": "COTAS"}).render()
+    msp.add_mtext("SALA DE\\PMÁQUINAS", dxfattribs={"layer": "TEXTO", "insert": (1, 1)})
+    msp.add_text("A < B & C", height=0.5, dxfattribs={"layer": "TEXTO", "insert": (3, 4)})
+    doc.saveas(ruta)
+    return ruta
+
+
+def test_visitantes_coinciden_con_readfile(tmp_path: Path):
+    ruta = _plano(tmp_path / "plano.dxf")
+    msp = ezdxf.readfile(ruta).modelspace()
+
+    capas, tipos, caja = ConteoCapas(), ConteoTipos(), CajaEnvolvente()
+    with LectorDXF(ruta) as lector:
+        assert lector.version == "AC1024"
+        assert lector.recorrer([capas, tipos, caja]) == len(msp)
+        tabla = lector.capas()
+
+    assert capas.resultado() == dict(Counter(e.dxf.layer for e in msp))
+    assert tipos.resultado() == dict(Counter(e.dxftype() for e in msp))
+    assert {"INSERT", "DIMENSION", "MTEXT"} <= set(tipos.resultado())
+
+    puntos = [p for e in msp for p in puntos_extremos(e)]
+    esperada = [min(x for x, _ in puntos), min(y for _, y in puntos), max(x for x, _ in puntos), max(y for _, y in puntos)]
+    assert caja.resultado() == pytest.approx(esperada)
+    assert caja.resultado() == pytest.approx([-2.0, -1.0, 22.5, 9.0])
+
+    assert tabla == {c.dxf.name: {"color": c.dxf.color, "tipo_linea": c.dxf.linetype} for c in msp.doc.layers}
+    assert tabla["CASCO"] == {"color": 5, "tipo_linea": "DASHED"}
+
+
+def test_visitantes_filtran_por_tipo(tmp_path: Path):
+    ruta = _plano(tmp_path / "plano.dxf")
+    circulos = CajaEnvolvente(tipos=["CIRCLE"])
+    assert recorrer_modelspace(ruta, [circulos]) == 1  # sólo se construyen los tipos pedidos
+    assert circulos.resultado() == pytest.approx([17.5, 2.5, 22.5, 7.5])
+
+
+def test_emisor_svg_escapa_textos(tmp_path: Path):
+    ruta = _plano(tmp_path / "plano.dxf")
+    emisor = EmisorSVG(lambda aci: "#000000")
+    recorrer_modelspace(ruta, [emisor])
+    assert emisor.resultado() == 4  # LINE, CIRCLE, LWPOLYLINE y TEXT
+
+    salida = io.StringIO()
+    emisor.escribir(salida)
+    svg = salida.getvalue()
+    assert "A &lt; B &amp; C" in svg
+    raiz = ElementTree.fromstring(svg)  # XML válido
+    textos = [e.text for e in raiz.iter("{http://www.w3.org/2000/svg}text")]
+    assert textos == ["A < B & C"]
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from maxsurf_integration.hull_design import HullDesigner, ModeloResistencia, ParametrosCasco, resistencia_holtrop
+from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.optimization import GridSearchOptimizer
+
+
+def test_ejemplo_holtrop_mennen_1984():
+    # Ejemplo numérico del artículo de 1984 (L = 205 m, ∇ = 37500 m³, V = 25 kn)
+    casco = ParametrosCasco(
+        lpp_m=205.0, eslora_flotacion_m=205.0, manga_m=32.0, calado_m=10.0, cb=37500.0 / (205 * 32 * 10),
+        cm=0.98, cwp=0.75, lcb_pct=-0.75, area_bulbo_m2=20.0, altura_bulbo_m=4.0, area_espejo_m2=16.0,
+        c_popa=10.0, superficie_apendices_m2=50.0, k2_apendices=1.5, diametro_helice_m=8.0,
+    )
+    r = resistencia_holtrop(25.0, casco)
+    assert r["superficie_mojada_m2"] == pytest.approx(7381.45, rel=1e-4)
+    assert r["rf_kn"] == pytest.approx(869.63, rel=1e-3)
+    assert r["rapp_kn"] == pytest.approx(8.83, rel=1e-2)
+    assert r["rw_kn"] == pytest.approx(557.11, rel=0.01)
+    assert r["ra_kn"] == pytest.approx(221.64, rel=0.01)
+
+
+def test_lote_de_variantes_igual_a_evaluacion_individual():
+    esloras = np.array([95.0, 105.2, 112.0])
+    cbs = np.array([0.62, 0.7252, 0.78])
+    velocidades = np.array([10.0, 14.5, 17.0])
+    lote = ModeloResistencia(
+        ParametrosCasco(lpp_m=esloras[:, None, None], manga_m=15.99, calado_m=6.2, cb=cbs[None, :, None])
+    ).potencia_freno_kw(velocidades[None, None, :])
+    assert lote.shape == (3, 3, 3)
+    for i, j, k in [(0, 0, 0), (1, 1, 1), (2, 2, 2), (2, 0, 1)]:
+        uno = ModeloResistencia(
+            ParametrosCasco(lpp_m=esloras[i], manga_m=15.99, calado_m=6.2, cb=cbs[j])
+        ).potencia_freno_kw(velocidades[k])
+        assert lote[i, j, k] == pytest.approx(float(uno))
+    assert np.all(np.diff(lote, axis=2) > 0)  # potencia creciente con la velocidad
+
+    modelo = ModeloResistencia(ParametrosCasco.desde_datos_buque())
+    v = modelo.velocidad_para_potencia(modelo.potencia_freno_kw(13.0))
+    assert v == pytest.approx(13.0, abs=0.05)
+
+
+def test_potencia_con_fouling_y_factor_de_mar():
+    modelo = ModeloResistencia(ParametrosCasco.desde_datos_buque())
+    v = np.array([10.0, 14.5])
+    limpio = modelo.potencia_freno_kw(v)
+    assert np.allclose(modelo(v), limpio)
+    assert np.allclose(modelo(v, factor_mar=[1.05, 1.12]), limpio * [1.05, 1.12])
+    sucio = modelo(v, meses_desde_limpieza=12)
+    assert np.all(sucio > limpio) and np.all(sucio < 1.12 * limpio)  # sólo crece la fricción
+    assert np.allclose(modelo(v, meses_desde_limpieza=40), modelo(v, meses_desde_limpieza=25))
+
+
+def test_optimizar_para_velocidad_reduce_potencia():
+    with MaxsurfConnector(visible=False) as mx:
+        designer = HullDesigner(mx)
+        designer.crear_casco_buque9()
+        volumen = 0.703 * 96.2 * 14.3 * 5.8
+        assert designer.optimizar_para_velocidad(14.0)
+        res = designer.resultado_velocidad
+        assert res["potencia_optima_kw"] < res["potencia_inicial_kw"]
+        p = designer.get_parametros_actuales()
+        assert p["Cb"] * p["Lpp"] * p["beam"] * p["draft"] == pytest.approx(volumen, rel=1e-3)
+        assert not designer.optimizar_para_velocidad(14.0, potencia_disponible_kw=100.0)
+
+
+def test_grid_search_potencia_pareto(tmp_path: Path):
+    opt = GridSearchOptimizer(None, tmp_path)
+    df = opt.search_potencia(np.linspace(90, 115, 12), np.linspace(14, 17, 7), [5.8, 6.2], np.linspace(0.6, 0.8, 9), 14.5)
+    assert len(df) == 12 * 7 * 2 * 9
+    f = df[df["feasible"]]
+    for _, fila in f[f["pareto"]].iterrows():
+        domina = (f["potencia_kw"] <= fila["potencia_kw"]) & (f["displacement"] >= fila["displacement"]) & (
+            (f["potencia_kw"] < fila["potencia_kw"]) | (f["displacement"] > fila["displacement"])
+        )
+        assert not domina.any()
+    assert np.allclose(df["potencia_kw"].iloc[:5], opt.potencia_freno(df.iloc[:5], 14.5))
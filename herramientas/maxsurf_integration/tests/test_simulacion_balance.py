@@ -0,0 +1,60 @@
+import numpy as np
+
+from maxsurf_integration.stability import ParametrosBalance, SimuladorBalance
+
+ANGULOS = np.arange(0.0, 91.0, 5.0)
+
+
+def _gz(gm: float, a_nula: float = 75.0) -> np.ndarray:
+    r = np.radians(ANGULOS)
+    pared = gm * np.sin(r) + 0.75 * np.sin(r) * np.tan(np.minimum(r, np.radians(30))) ** 2
+    return pared * np.clip(1 - (ANGULOS / a_nula) ** 2, -1, 1)
+
+
+def test_extincion_periodo_natural():
+    p = ParametrosBalance(gm_m=1.0, amortiguamiento_lineal=0.0, amortiguamiento_cuadratico=0.0)
+    sim = SimuladorBalance(ANGULOS, 1.0 * np.sin(np.radians(ANGULOS)), p)
+    res = sim.simular([(0.0, 10.0)], n_realizaciones=1, duracion_s=3 * p.periodo_natural_s,
+                      dt_s=0.05, phi_inicial_deg=2.0, guardar_series=True, semilla=0)
+    serie = res.series_deg[0]
+    cruces = np.nonzero((serie[:-1] > 0) & (serie[1:] <= 0))[0]
+    periodo = np.diff(res.tiempos_s[cruces]).mean()
+    assert abs(periodo - p.periodo_natural_s) / p.periodo_natural_s < 0.01
+    assert np.isclose(np.abs(serie).max(), 2.0, atol=0.01)
+
+
+def test_zozobra_crece_con_hs_y_curva_corta():
+    p = ParametrosBalance(gm_m=1.0)
+    sim = SimuladorBalance(ANGULOS, _gz(1.0, 30.0), p)
+    res = sim.simular([(0.5, 8.0), (12.0, 16.0)], n_realizaciones=100, duracion_s=300, semilla=3)
+    est = res.estadisticas()
+    assert len(est) == 2 and (est["n_realizaciones"] == 100).all()
+    assert est.loc[0, "prob_zozobra"] == 0.0
+    assert est.loc[1, "prob_zozobra"] > 0.1
+    assert np.all(np.isnan(res.tiempo_zozobra_s[~res.zozobra]))
+    assert np.all(res.phi_max_deg[res.zozobra] >= 30.0)
+
+    robusto = SimuladorBalance(ANGULOS, _gz(1.0, 75.0), p)
+    res = robusto.simular([(12.0, 16.0)], n_realizaciones=100, duracion_s=300, semilla=3)
+    assert res.estadisticas().loc[0, "prob_zozobra"] < est.loc[1, "prob_zozobra"]
+
+
+def test_rms_excluye_angulos_congelados_tras_zozobra():
+    p = ParametrosBalance(gm_m=1.0)
+    sim = SimuladorBalance(ANGULOS, _gz(1.0, 30.0), p)
+    res = sim.simular([(12.0, 16.0)], n_realizaciones=50, duracion_s=300, t_transitorio_s=20.0,
+                      semilla=3, guardar_series=True)
+    assert res.zozobra.any() and (~res.zozobra).any()
+
+    for i in range(len(res.zozobra)):
+        validos = res.tiempos_s >= 20.0
+        if res.zozobra[i]:
+            validos &= res.tiempos_s <= res.tiempo_zozobra_s[i]
+        serie = res.series_deg[i][validos].astype(float)
+        if len(serie):
+            assert np.isclose(res.phi_rms_deg[i], np.sqrt(np.mean(serie**2)), rtol=1e-4)
+        else:
+            assert np.isnan(res.phi_rms_deg[i])
+    assert np.all(np.isfinite(res.phi_rms_deg[~res.zozobra]))
+    # Los ángulos congelados tras volcar inflarían el RMS hasta el ángulo de zozobra
+    assert np.nanmax(res.phi_rms_deg[res.zozobra]) < 30.0
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from calculos_combustible_optimizados import CalculadorConsumo
+from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.stability import TablaHidrostatica
+from maxsurf_integration.tanks import GeometriaTanque, MotorSuperficieLibre, SimuladorTravesia, TankDesigner
+
+
+class _ConsumoFijo:
+    """Consumo constante proporcional a la velocidad (kg/h)."""
+
+    def consumo_navegacion(self, velocidad_kn, **kwargs):
+        return {"consumo_total_kg_h": 100.0 * velocidad_kn}
+
+
+def _simulador():
+    motor = MotorSuperficieLibre([
+        GeometriaTanque("FO1", 10.0, 8.0, 1.0, 30.0, densidad_tm3=0.85),
+        GeometriaTanque("FO2", 10.0, 8.0, 1.0, 60.0, densidad_tm3=0.85),
+        GeometriaTanque("FW", 5.0, 4.0, 1.0, 80.0),
+    ])
+    tabla = TablaHidrostatica.desde_parametros()
+    return SimuladorTravesia(motor, tabla, 2600.0, 5.0, 50.0, calculador=_ConsumoFijo())
+
+
+def test_actualizacion_incremental_igual_a_evaluacion_completa():
+    sim = _simulador()
+    res = sim.simular({"FO1": 0.98, "FO2": 0.98, "FW": 0.9}, ["FO1", "FO2"], horas=100, velocidad_kn=10.0,
+                      consumos_adicionales_t_h={"FW": 0.1})
+    df = res.condiciones
+    assert len(df) == 101
+    completo = sim.motor.condiciones(res.llenados, *sim.rosca, tabla=sim.tabla)
+    assert np.allclose(df["kg_solido_m"], completo["kg_solido_m"])
+    assert np.allclose(df["fsc_m"], completo["fsc_m"])
+    assert np.allclose(df["gm_corregido_m"], completo["gm_corregido_m"])
+
+    # Balance: 1 t/h del combustible de la secuencia
+    assert np.allclose(df["consumo_acumulado_t"], np.arange(101) * 1.0)
+    assert np.allclose(df["rob_t"] + df["consumo_acumulado_t"], df["rob_t"].iloc[0])
+    # Se vacía FO1 hasta la reserva antes de pasar a FO2
+    cambio = df.index[df["tanque_activo"] == "FO2"][0]
+    assert res.llenados[cambio, 0] == pytest.approx(0.02)
+    assert np.all(res.llenados[:cambio, 1] == 0.98)
+
+
+def test_deficit_cuando_se_agota_el_combustible():
+    sim = _simulador()
+    res = sim.simular({"FO1": 0.5}, ["FO1"], horas=720, velocidad_kn=10.0)
+    resumen = res.resumen()
+    assert resumen["rob_final_t"] == pytest.approx(0.02 * 68.0)
+    assert not resumen["cumple_toda_travesia"]
+    assert res.condiciones["deficit_t"].iloc[-1] > 0
+    with pytest.raises(ValueError):
+        sim.simular({"FO1": 0.5}, ["FO3"])
+
+
+def test_tank_designer_simular_travesia():
+    with MaxsurfConnector(visible=False) as mx:
+        designer = TankDesigner(mx)
+        designer.diseñar_tanques_buque9()
+        res = designer.simular_travesia(1900.0, 4.5, 45.0, CalculadorConsumo(), dias=10, velocidad_kn=12.0)
+        df = res.condiciones
+        assert len(df) == 241
+        assert df["consumo_acumulado_t"].is_monotonic_increasing
+        assert df["desplazamiento_t"].iloc[-1] < df["desplazamiento_t"].iloc[0]
@@ -0,0 +1,60 @@
+import numpy as np
+
+from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.stability.hidrostatica import TablaHidrostatica
+from maxsurf_integration.tanks import GeometriaTanque, MotorSuperficieLibre, TankDesigner
+
+
+def _caja(nombre="T", **kw):
+    datos = dict(largo_m=10.0, ancho_fondo_m=6.0, alto_m=2.0, x_centro_m=30.0, densidad_tm3=0.9)
+    datos.update(kw)
+    return GeometriaTanque(nombre=nombre, **datos)
+
+
+def test_tabla_hidrostatica_reproduce_cb():
+    tabla = TablaHidrostatica.desde_parametros()
+    h = tabla.interpolar(1.025 * 105.2 * 15.99 * 6.2 * 0.7252)
+    assert abs(float(h["calado_m"]) - 6.2) < 0.05
+    assert 6.0 < float(h["kmt_m"]) < 8.5
+
+
+def test_caja_vcg_y_fsm():
+    motor = MotorSuperficieLibre([_caja()])
+    res = motor.por_tanque([[0.5]])
+    assert np.isclose(res["vcg_m"][0, 0], 0.5)  # h = 1.0 m -> VCG = 0.5 m
+    assert np.isclose(res["fsm_tm"][0, 0], 0.9 * 10.0 * 6.0**3 / 12.0)
+    assert motor.por_tanque([[1.0]])["fsm_tm"][0, 0] == 0.0
+
+
+def test_producto_matricial_igual_a_bucle():
+    tanques = [
+        _caja("A"),
+        _caja("B", x_centro_m=60.0, ancho_techo_m=3.0, z_fondo_m=1.2, y_centro_m=5.0),
+        _caja("C", x_centro_m=80.0, alto_m=1.2, densidad_tm3=1.025),
+    ]
+    motor = MotorSuperficieLibre(tanques)
+    rng = np.random.default_rng(1)
+    llenados = rng.uniform(0.0, 1.0, size=(50, 3))
+    lote = motor.evaluar(llenados)
+    for i in range(len(llenados)):
+        uno = motor.evaluar(llenados[i])
+        for clave, valor in uno.items():
+            assert np.isclose(lote[clave][i], valor[0])
+
+
+def test_gm_corregido_tank_designer():
+    with MaxsurfConnector(visible=False) as mx:
+        designer = TankDesigner(mx)
+        designer.diseñar_tanques_buque9()
+        n = len(designer.tanques)
+        df = designer.calcular_condiciones_tanques(
+            np.array([np.full(n, 1.0), np.full(n, 0.5)]),
+            desplazamiento_rosca_t=1900.0,
+            kg_rosca_m=4.5,
+            lcg_rosca_m=45.0,
+        )
+        assert len(df) == 2
+        assert df.loc[0, "fsc_m"] == 0.0
+        assert df.loc[1, "fsc_m"] > 0.0
+        assert df.loc[1, "gm_corregido_m"] < df.loc[1, "gm_solido_m"]
+        assert abs(designer.calcular_kg_con_tanques("llenos") - designer.calcular_kg_con_tanques("50%") * 2) < 1e-6
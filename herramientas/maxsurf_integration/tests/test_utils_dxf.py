@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import ezdxf
+import pytest
+from ezdxf import bbox
+
+from utils_dxf import DEFAULT_MARGIN_MIN, _layout_bounds, patch_header_extents, save_dxf_with_extents
+
+
+def _doc():
+    doc = ezdxf.new("R2010")
+    msp = doc.modelspace()
+    msp.add_line((-3.0, 1.0), (40.0, 2.0))
+    msp.add_lwpolyline([(0.0, 0.0), (10.0, 0.0), (10.0, 5.0)])
+    msp.add_lwpolyline([(20.0, 0.0, 0.0, 0.0, 1.0), (24.0, 0.0)])  # semicírculo (bulge): va por ezdxf.bbox
+    msp.add_circle((30.0, -4.0), 2.5)
+    msp.add_point((12.0, 18.0))
+    msp.add_text("CUADERNA 40", height=0.8, dxfattribs={"insert": (-6.0, 8.0)})
+    bloque = doc.blocks.new("MARCA")
+    bloque.add_line((0.0, 0.0), (1.0, 3.0))
+    msp.add_blockref("MARCA", (45.0, 10.0))
+    return doc
+
+
+def test_limites_del_layout_coinciden_con_ezdxf_bbox():
+    msp = _doc().modelspace()
+    caja = bbox.extents(msp, fast=True)
+    assert _layout_bounds(msp) == pytest.approx((caja.extmin.x, caja.extmin.y, caja.extmax.x, caja.extmax.y))
+    assert _layout_bounds(ezdxf.new().modelspace()) is None
+
+
+def test_guardar_fija_extmin_extmax_en_el_archivo(tmp_path):
+    doc = _doc()
+    ruta = tmp_path / "plano.dxf"
+    extmin, extmax = save_dxf_with_extents(doc, ruta)
+
+    caja = bbox.extents(doc.modelspace(), fast=True)
+    ancho, alto = caja.extmax.x - caja.extmin.x, caja.extmax.y - caja.extmin.y
+    mx, my = max(0.05 * ancho, DEFAULT_MARGIN_MIN), max(0.05 * alto, DEFAULT_MARGIN_MIN)
+
+    leido = ezdxf.readfile(ruta)
+    for var in ("$EXTMIN", "$PEXTMIN"):
+        assert tuple(leido.header[var]) == pytest.approx((caja.extmin.x - mx, caja.extmin.y - my, 0.0))
+    for var in ("$EXTMAX", "$PEXTMAX"):
+        assert tuple(leido.header[var]) == pytest.approx((caja.extmax.x + mx, caja.extmax.y + my, 0.0))
+    assert tuple(leido.header["$EXTMIN"]) == pytest.approx(extmin)
+    assert tuple(leido.header["$EXTMAX"]) == pytest.approx(extmax)
+    assert leido.header["$INSUNITS"] == 6
+
+
+def test_plano_vacio_usa_limites_por_defecto(tmp_path):
+    extmin, extmax = save_dxf_with_extents(ezdxf.new("R2010"), tmp_path / "vacio.dxf", default_bounds=(0, 0, 50, 20))
+    leido = ezdxf.readfile(tmp_path / "vacio.dxf")
+    assert tuple(leido.header["$EXTMIN"]) == pytest.approx((-2.5, -1.0, 0.0))
+    assert tuple(leido.header["$EXTMAX"]) == pytest.approx((52.5, 21.0, 0.0))
+
+
+def test_nuevo_documento_no_importa_el_paquete_completo():
+    herramientas = Path(__file__).resolve().parents[2]
+    codigo = (
+        "import sys, utils_dxf; doc = utils_dxf.nuevo_documento('corte_transversal'); "
+        "print('CASCO_EXTERIOR' in doc.layers, 'pandas' in sys.modules)"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=herramientas, capture_output=True, text=True, check=True)
+    assert salida.stdout.split() == ["True", "False"]
+
+
+def test_patch_header_extents_solo_reescribe_el_header(tmp_path: Path):
+    ruta = tmp_path / "plano.dxf"
+    doc = _doc()
+    del doc.header["$PEXTMIN"]  # las variables que faltan se añaden al final del HEADER
+    doc.saveas(ruta)
+    original = ruta.read_bytes()
+    inicio_tablas = original.index(b"CLASSES")
+
+    assert patch_header_extents(ruta, (-1.0, -2.0, 0.0), (50.0, 60.0, 0.0))
+    parcheado = ruta.read_bytes()
+    # Todo lo que sigue al HEADER se copia byte a byte
+    assert parcheado[parcheado.index(b"CLASSES"):] == original[inicio_tablas:]
+
+    header = ezdxf.readfile(ruta).header
+    for nombre, esperado in (("$EXTMIN", (-1.0, -2.0, 0.0)), ("$EXTMAX", (50.0, 60.0, 0.0)),
+                             ("$PEXTMIN", (-1.0, -2.0, 0.0)), ("$PEXTMAX", (50.0, 60.0, 0.0))):
+        assert tuple(header[nombre]) == pytest.approx(esperado)
+
+
+def test_patch_header_extents_no_interpreta_las_entidades(tmp_path: Path):
+    ruta = tmp_path / "plano.dxf"
+    _doc().saveas(ruta)
+    texto = ruta.read_bytes()
+    # Una sección ENTITIES ilegible no impide parchear: sólo se lee el HEADER
+    corrupto = texto[:texto.index(b"ENTITIES")] + b"ENTITIES\n  0\n\xff\xfe basura sin pares de grupo"
+    ruta.write_bytes(corrupto)
+
+    assert patch_header_extents(ruta, (0.0, 0.0, 0.0), (7.0, 8.0, 0.0), include_paper=False)
+    parcheado = ruta.read_bytes()
+    assert parcheado.endswith(b"\xff\xfe basura sin pares de grupo")
+    header = parcheado[:parcheado.index(b"ENDSEC")].decode()
+    assert "$EXTMAX\n 10\n7.0\n 20\n8.0" in header
+
+    assert not patch_header_extents(tmp_path / "no_existe.dxf", (0, 0, 0), (1, 1, 0))
+    vacio = tmp_path / "vacio.dxf"
+    vacio.write_bytes(b"  0\nSECTION\n")
+    assert not patch_header_extents(vacio, (0, 0, 0), (1, 1, 0))
+    assert vacio.read_bytes() == b"  0\nSECTION\n" and len(list(tmp_path.glob("*.tmp"))) == 0
@@ -5,6 +5,7 @@ from .plots import (
     plot_displacement_curve,
     save_figure,
 )
+from .raster_dxf import RasterizadorDXF, Tesela, exportar_png, previsualizar_directorio
 
 __all__ = [
     "plot_gz_curve",
@@ -12,4 +13,8 @@ __all__ = [
     "plot_profile_view",
     "plot_displacement_curve",
     "save_figure",
+    "RasterizadorDXF",
+    "Tesela",
+    "exportar_png",
+    "previsualizar_directorio",
 ]
@@ -0,0 +1,382 @@
+"""Rasterizado por teselas de planos DXF (vistas previas PNG, PDF y pirámides XYZ).
+
+Renderizar un plano completo de una vez con el backend matplotlib de ezdxf
+mantiene en memoria todas las entidades dibujadas del plano y una única
+figura gigante. Aquí el espacio modelo se divide en teselas de tamaño fijo en
+píxeles; cada entidad se indexa por su caja envolvente en una rejilla
+(`IndiceRejilla`, celda = tesela) y cada tesela dibuja sólo las entidades que
+la tocan. El DXF se lee y se procesa con el frontend de ezdxf una sola vez:
+sus primitivas (líneas, trayectorias, rellenos...) se graban por entidad con
+el `Recorder` de ezdxf y cada tesela recibe sólo las de sus entidades, que se
+reproducen en un backend matplotlib. Las teselas se reparten en un pool de
+procesos y se cosen en una imagen final o se cortan en una pirámide
+`{z}/{x}/{y}.png`. Las primitivas de una entidad que cruza varias teselas
+viajan a cada una de ellas; a cambio, ningún proceso vuelve a leer el DXF.
+
+Ejemplo:
+    rast = RasterizadorDXF("plano.dxf", ancho_px=3600)
+    rast.guardar_png("plano.png")
+    rast.guardar_xyz("teselas/plano")
+    previsualizar_directorio("salidas", "salidas/previews")
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import ezdxf
+    from ezdxf import bbox
+    from ezdxf.addons.drawing import Frontend, RenderContext
+    from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
+    from ezdxf.addons.drawing.properties import LayoutProperties
+    from ezdxf.addons.drawing.recorder import Player, Recorder
+except Exception:  # pragma: no cover
+    ezdxf = None  # type: ignore
+
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from PIL import Image
+
+from ..autocad_integration.planificador import PlanificadorPlanos
+from ..optimization.disposicion_sala_maquinas import IndiceRejilla
+
+Caja = Tuple[float, float, float, float]
+
+_DPI = 100
+_HOLGURA_TESELA = 0.02  # fracción de la tesela: cajas de texto aproximadas
+
+# Estado de cada proceso de renderizado (configuración y propiedades de las primitivas)
+_TRABAJO: Dict[str, object] = {}
+
+
+@dataclass
+class Tesela:
+    """Tesela de la imagen: columna/fila (fila 0 arriba), caja en metros y tamaño en píxeles."""
+
+    columna: int
+    fila: int
+    caja: Caja
+    ancho_px: int
+    alto_px: int
+
+
+class _BackendTesela(MatplotlibBackend if ezdxf is not None else object):
+    """Backend matplotlib que agrupa las líneas consecutivas con el mismo color y grosor.
+
+    ezdxf crea un `Line2D` (y recalcula los límites de los ejes) por cada
+    LINE; en planos con decenas de miles de líneas ese es el coste dominante.
+    Aquí las líneas se acumulan y se añaden como una sola `LineCollection` en
+    cuanto cambia el estilo o llega otra primitiva.
+
+    El backend de ezdxf da a cada primitiva el zorder siguiente (0, 1, 2...);
+    cada colección recibe un zorder intermedio entre la primitiva anterior y
+    la siguiente, de modo que el orden de dibujo se conserva.
+    """
+
+    def __init__(self, ax):
+        super().__init__(ax, adjust_figure=False)
+        self._estilo = None
+        self._segmentos: List = []
+        self._primitivas = 0
+
+    def _volcar(self) -> None:
+        if self._segmentos:
+            color, grosor = self._estilo
+            self.ax.add_collection(
+                LineCollection(
+                    self._segmentos, linewidths=grosor, colors=color,
+                    zorder=self._primitivas - 0.5,
+                    capstyle=rcParams["lines.solid_capstyle"],  # el mismo remate que Line2D
+                ),
+                autolim=False,
+            )
+            self._segmentos = []
+
+    def _antes_de_primitiva(self) -> None:
+        self._volcar()
+        self._primitivas += 1
+
+    def draw_line(self, start, end, properties):
+        if start.isclose(end):
+            return self.draw_point(start, properties)
+        estilo = (properties.color, self.get_lineweight(properties))
+        if estilo != self._estilo:
+            self._volcar()
+            self._estilo = estilo
+        self._segmentos.append(((start.x, start.y), (end.x, end.y)))
+
+    def draw_point(self, pos, properties):
+        self._antes_de_primitiva()
+        super().draw_point(pos, properties)
+
+    def draw_solid_lines(self, lines, properties):
+        self._antes_de_primitiva()
+        super().draw_solid_lines(lines, properties)
+
+    def draw_path(self, path, properties):
+        self._antes_de_primitiva()
+        super().draw_path(path, properties)
+
+    def draw_filled_paths(self, paths, properties):
+        self._antes_de_primitiva()
+        super().draw_filled_paths(paths, properties)
+
+    def draw_filled_polygon(self, points, properties):
+        self._antes_de_primitiva()
+        super().draw_filled_polygon(points, properties)
+
+    def draw_image(self, image_data, properties):
+        self._antes_de_primitiva()
+        super().draw_image(image_data, properties)
+
+    def finalize(self):
+        self._volcar()
+        super().finalize()
+
+
+def _grabar(doc, fondo: str) -> Tuple["Recorder", List[int]]:
+    """
+    Primitivas del espacio modelo grabadas una vez y posición de la primera
+    primitiva de cada entidad (la entidad i ocupa registros[inicios[i]:inicios[i + 1]]).
+    """
+    msp = doc.modelspace()
+    ctx = RenderContext(doc)
+    ctx.set_current_layout(msp)
+    propiedades = LayoutProperties.from_layout(msp)
+    propiedades.set_colors(fondo)
+    ctx.current_layout_properties = propiedades
+    grabadora = Recorder()
+    frontend = Frontend(ctx, grabadora)
+    inicios = []
+    for entidad in msp:
+        inicios.append(len(grabadora.records))
+        frontend.draw_entities([entidad])
+    inicios.append(len(grabadora.records))
+    return grabadora, inicios
+
+
+def _cargar(config, propiedades: Dict, fondo: str) -> None:
+    _TRABAJO.update(config=config, propiedades=propiedades, fondo=fondo)
+
+
+def _dibujar_tesela(caja: Caja, registros: Sequence, ancho_px: int, alto_px: int) -> np.ndarray:
+    """Reproduce las primitivas `registros` recortadas a `caja` (RGB uint8)."""
+    fondo = _TRABAJO["fondo"]
+    fig = Figure(figsize=(ancho_px / _DPI, alto_px / _DPI), dpi=_DPI, facecolor=fondo)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    if registros:
+        reproductor = Player()
+        reproductor.config = _TRABAJO["config"]
+        reproductor.background = fondo
+        reproductor.properties = _TRABAJO["propiedades"]
+        reproductor.records = list(registros)
+        reproductor.replay(_BackendTesela(ax))
+    ax.set_xlim(caja[0], caja[2])
+    ax.set_ylim(caja[1], caja[3])
+    ax.set_aspect("auto")
+    ax.set_axis_off()
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[:alto_px, :ancho_px, :3].copy()
+
+
+def _dibujar(args: Tuple[Caja, Sequence, int, int]) -> np.ndarray:
+    return _dibujar_tesela(*args)
+
+
+class RasterizadorDXF:
+    """Rasteriza el espacio modelo de un DXF por teselas, en serie o en paralelo."""
+
+    def __init__(
+        self,
+        ruta_dxf: str | Path,
+        ancho_px: int = 3600,
+        px_por_m: Optional[float] = None,
+        tesela_px: int = 1024,
+        fondo: str = "#ffffff",
+        margen: float = 0.02,
+        procesos: Optional[int] = None,
+    ):
+        """
+        Args:
+            ruta_dxf: Plano a rasterizar
+            ancho_px: Ancho de la imagen final (si no se da `px_por_m`)
+            px_por_m: Resolución fija en píxeles por metro de dibujo
+            tesela_px: Lado de las teselas de renderizado
+            fondo: Color de fondo (las entidades de color 7 se adaptan a él)
+            margen: Margen alrededor de la extensión, en fracción de su lado mayor
+            procesos: Procesos del pool (por defecto, núcleos disponibles); 1 = en serie
+        """
+        if ezdxf is None:
+            raise RuntimeError("ezdxf no disponible para rasterizar DXF")
+        self.ruta = Path(ruta_dxf)
+        self.tesela_px = int(tesela_px)
+        self.fondo = fondo
+        self.procesos = procesos or os.cpu_count() or 1
+
+        doc = ezdxf.readfile(self.ruta)
+        self.cajas = self._cajas_entidades(doc.modelspace())
+        self._grabadora, self._inicios = _grabar(doc, fondo)
+        self.sin_caja = [i for i, c in enumerate(self.cajas) if c is None]
+        validas = [c for c in self.cajas if c is not None]
+        if validas:
+            x0, y0 = min(c[0] for c in validas), min(c[1] for c in validas)
+            x1, y1 = max(c[2] for c in validas), max(c[3] for c in validas)
+        else:
+            x0, y0, x1, y1 = 0.0, 0.0, 1.0, 1.0
+        m = margen * max(x1 - x0, y1 - y0, 1e-9)
+        self.extension: Caja = (x0 - m, y0 - m, x1 + m, y1 + m)
+
+        ancho_m = self.extension[2] - self.extension[0]
+        alto_m = self.extension[3] - self.extension[1]
+        self.px_por_m = float(px_por_m) if px_por_m else ancho_px / ancho_m
+        self.ancho_px = max(1, int(round(ancho_m * self.px_por_m)))
+        self.alto_px = max(1, int(round(alto_m * self.px_por_m)))
+
+        # Rejilla alineada con las teselas (x desde la izquierda, y desde arriba);
+        # las cajas se amplían con la holgura para que las entidades junto a un
+        # borde se dibujen también en la tesela vecina
+        self.indice = IndiceRejilla(self.tesela_px / self.px_por_m)
+        self._origen = ox, oy = (self.extension[0], self.extension[3])
+        h = _HOLGURA_TESELA * self.indice.celda_m
+        for i, c in enumerate(self.cajas):
+            if c is not None:
+                self.indice.insertar(i, (c[0] - ox - h, oy - c[3] - h, c[2] - ox + h, oy - c[1] + h))
+
+    @staticmethod
+    def _cajas_entidades(msp) -> List[Optional[Caja]]:
+        cajas: List[Optional[Caja]] = []
+        for caja in bbox.multi_flat(msp, cache=bbox.Cache()):
+            if caja.has_data:
+                cajas.append((caja.extmin.x, caja.extmin.y, caja.extmax.x, caja.extmax.y))
+            else:
+                cajas.append(None)
+        return cajas
+
+    # ------------------------------------------------------------------
+    def teselas(self) -> List[Tesela]:
+        """Teselas que cubren la imagen, por filas de arriba abajo."""
+        t, s = self.tesela_px, self.px_por_m
+        x0, y1 = self._origen
+        res = []
+        for fila in range(math.ceil(self.alto_px / t)):
+            alto = min(t, self.alto_px - fila * t)
+            for col in range(math.ceil(self.ancho_px / t)):
+                ancho = min(t, self.ancho_px - col * t)
+                caja = (x0 + col * t / s, y1 - (fila * t + alto) / s, x0 + (col * t + ancho) / s, y1 - fila * t / s)
+                res.append(Tesela(col, fila, caja, ancho, alto))
+        return res
+
+    def entidades_en(self, tesela: Tesela) -> List[int]:
+        """Índices (en orden del espacio modelo) de las entidades que pueden verse en la tesela."""
+        t = self.indice.celda_m
+        centro = ((tesela.columna + 0.5) * t, (tesela.fila + 0.5) * t)
+        return sorted(self.indice.candidatos(centro + centro).union(self.sin_caja))
+
+    def primitivas_en(self, tesela: Tesela) -> List:
+        """Primitivas grabadas de las entidades de la tesela, en orden de dibujo."""
+        registros, inicios = self._grabadora.records, self._inicios
+        return [r for i in self.entidades_en(tesela) for r in registros[inicios[i]:inicios[i + 1]]]
+
+    def renderizar(self) -> Image.Image:
+        """Imagen RGB completa cosida a partir de las teselas."""
+        teselas = self.teselas()
+        trabajos = [(t.caja, self.primitivas_en(t), t.ancho_px, t.alto_px) for t in teselas]
+        comun = (self._grabadora.config, self._grabadora.properties, self.fondo)
+        n = min(self.procesos, len(trabajos))
+        if n <= 1:
+            _cargar(*comun)
+            try:
+                imagenes = [_dibujar(tr) for tr in trabajos]
+            finally:
+                _TRABAJO.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=n, initializer=_cargar, initargs=comun) as pool:
+                imagenes = list(pool.map(_dibujar, trabajos, chunksize=max(1, len(trabajos) // (4 * n))))
+
+        lienzo = Image.new("RGB", (self.ancho_px, self.alto_px), self.fondo)
+        for t, img in zip(teselas, imagenes):
+            lienzo.paste(Image.fromarray(img), (t.columna * self.tesela_px, t.fila * self.tesela_px))
+        return lienzo
+
+    # ------------------------------------------------------------------
+    def guardar_png(self, ruta: str | Path) -> str:
+        ruta = Path(ruta)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        self.renderizar().save(ruta, optimize=False)
+        return str(ruta)
+
+    def guardar_pdf(self, ruta: str | Path, dpi: float = 150.0) -> str:
+        """PDF de una página con la imagen rasterizada (tamaño de página = píxeles / dpi)."""
+        ruta = Path(ruta)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        self.renderizar().save(ruta, "PDF", resolution=dpi)
+        return str(ruta)
+
+    def guardar_xyz(self, directorio: str | Path, lado_px: int = 256) -> int:
+        """
+        Pirámide de teselas `{z}/{x}/{y}.png` (z máximo = resolución completa).
+
+        Returns:
+            Número de teselas escritas
+        """
+        directorio = Path(directorio)
+        imagen = self.renderizar()
+        z_max = max(0, math.ceil(math.log2(max(imagen.size) / lado_px)))
+        total = 0
+        for z in range(z_max, -1, -1):
+            if z < z_max:
+                imagen = imagen.resize((max(1, math.ceil(imagen.width / 2)), max(1, math.ceil(imagen.height / 2))), Image.LANCZOS)
+            for x in range(math.ceil(imagen.width / lado_px)):
+                carpeta = directorio / str(z) / str(x)
+                carpeta.mkdir(parents=True, exist_ok=True)
+                for y in range(math.ceil(imagen.height / lado_px)):
+                    x0, y0 = x * lado_px, y * lado_px
+                    recorte = Image.new("RGB", (lado_px, lado_px), self.fondo)
+                    recorte.paste(imagen.crop((x0, y0, min(x0 + lado_px, imagen.width), min(y0 + lado_px, imagen.height))))
+                    recorte.save(carpeta / f"{y}.png")
+                    total += 1
+        return total
+
+
+def exportar_png(ruta_dxf: str | Path, ruta_png: str | Path, ancho_px: int = 3600, procesos: Optional[int] = None) -> str:
+    """Rasteriza `ruta_dxf` en `ruta_png` (función de módulo para el planificador)."""
+    return RasterizadorDXF(ruta_dxf, ancho_px=ancho_px, procesos=procesos).guardar_png(ruta_png)
+
+
+def previsualizar_directorio(
+    raiz: str | Path,
+    destino: str | Path,
+    ancho_px: int = 1600,
+    procesos: Optional[int] = None,
+    forzar: bool = False,
+) -> Dict[str, str]:
+    """
+    Vistas previas PNG de todos los DXF bajo `raiz` (misma estructura de carpetas en `destino`).
+
+    Sólo se regeneran las vistas previas más antiguas que su DXF. Los planos
+    se reparten entre procesos (cada uno rasteriza sus teselas en serie).
+
+    Returns:
+        {ruta DXF: ruta PNG} de las vistas previas generadas
+    """
+    raiz, destino = Path(raiz), Path(destino)
+    plan = PlanificadorPlanos(procesos)
+    for dxf in sorted(raiz.rglob("*.dxf")):
+        if destino in dxf.parents:
+            continue
+        png = destino / dxf.relative_to(raiz).with_suffix(".png")
+        if not forzar and png.exists() and png.stat().st_mtime >= dxf.stat().st_mtime:
+            continue
+        plan.agregar(str(dxf), exportar_png, dxf, png, ancho_px, 1)
+    return plan.ejecutar()
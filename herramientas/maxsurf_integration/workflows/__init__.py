@@ -3,6 +3,7 @@
 from .base_ship import ParametrosBuqueBase, generar_buque_base  # noqa: F401
 from .windows_bundle import ejecutar_bundle_windows  # noqa: F401
 from .auto_base import generar_planos_informacion_base, DEFAULT_DIR_NAME  # noqa: F401
+from .construccion_incremental import Artefacto, GrafoConstruccion, huella_archivo  # noqa: F401
 from .cad_pipeline import (  # noqa: F401
 	CADIntegrationConfig,
 	build_dxf_from_cad_systems,
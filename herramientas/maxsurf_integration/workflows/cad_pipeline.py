@@ -22,7 +22,12 @@ except Exception:  # pragma: no cover - entorno sin COM
 else:  # pragma: no cover - alias coherente
     win32com = win32com.client  # type: ignore
 
+from maxsurf_integration.autocad_integration.plantillas import nuevo_documento
 from maxsurf_integration.maxsurf_connector import MaxsurfConnector
+from maxsurf_integration.optimization.disposicion_sala_maquinas import (
+    OptimizadorSalaMaquinas,
+    ResultadoSalaMaquinas,
+)
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -320,14 +325,22 @@ def _add_text(msp: Any, text: str, insert: Tuple[float, float], layer: str, heig
         logger.debug("⚠️  No se pudo añadir texto '%s': %s", text, exc)
 
 
-def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) -> Path:
-    """Genera el DXF principal integrando datos reales de Maxsurf."""
+def build_dxf_from_cad_systems(
+    config: Optional[CADIntegrationConfig] = None,
+    disposicion: Optional[ResultadoSalaMaquinas] = None,
+) -> Path:
+    """
+    Genera el DXF principal integrando datos reales de Maxsurf.
+
+    Los equipos de la cámara de máquinas se dibujan en las posiciones de
+    `disposicion`; sin ella se calcula con OptimizadorSalaMaquinas sobre
+    `engine_room_limits` (semilla fija, resultado reproducible).
+    """
 
     cfg = config or load_config()
     cfg.output_dir.mkdir(parents=True, exist_ok=True)
 
     _ensure_ezdxf()
-    from ezdxf import units as ez_units  # import local para evitar fallo global
 
     logger.info("🚀 Generando DXF integrado con sistemas CAD...")
 
@@ -340,22 +353,9 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         bulkheads = list(cfg.fallback_bulkheads)
     extractor.disconnect()
 
-    doc = ezdxf.new("R2010")
-    doc.units = ez_units.M
+    doc = nuevo_documento("cad_pipeline")
     msp = doc.modelspace()
 
-    for layer_name, color in [
-        ("CASCO", 1),
-        ("ESTRUCTURA", 3),
-        ("MAQUINAS", 2),
-        ("TANQUES", 6),
-        ("EQUIPOS", 5),
-        ("TEXTOS", 4),
-        ("COTAS", 7),
-    ]:
-        if layer_name not in doc.layers:
-            doc.layers.add(layer_name, color=color)
-
     lpp = float(hull_data.get("lpp", cfg.fallback_hull_data["lpp"]))
     beam = float(hull_data.get("beam", cfg.fallback_hull_data["beam"]))
     depth = float(hull_data.get("depth", cfg.fallback_hull_data["depth"]))
@@ -369,7 +369,7 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         (lpp, half_beam),
         (lpp, -half_beam),
     ]
-    msp.add_lwpolyline(plan_outline, dxfattribs={"layer": "CASCO", "closed": True})
+    msp.add_lwpolyline(plan_outline, close=True, dxfattribs={"layer": "CASCO"})
 
     for name, pos in bulkheads:
         msp.add_line((pos, -half_beam), (pos, half_beam), dxfattribs={"layer": "ESTRUCTURA"})
@@ -381,24 +381,15 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         (engine_end, half_beam),
         (engine_end, -half_beam),
     ]
-    msp.add_lwpolyline(engine_rect, dxfattribs={"layer": "MAQUINAS", "closed": True})
-
-    motor_length, motor_width = 8.5, 3.2
-    motor_center_x = engine_start + ((engine_end - engine_start) - motor_length) / 2.0
-    motor_rect = [
-        (motor_center_x, -motor_width / 2.0),
-        (motor_center_x + motor_length, -motor_width / 2.0),
-        (motor_center_x + motor_length, motor_width / 2.0),
-        (motor_center_x, motor_width / 2.0),
-    ]
-    msp.add_lwpolyline(motor_rect, dxfattribs={"layer": "EQUIPOS", "closed": True})
-    _add_text(
-        msp,
-        "MOTOR 16V26",
-        (motor_center_x + motor_length / 2.0, motor_width / 2.0 + 0.4),
-        layer="TEXTOS",
-        height=0.25,
-    )
+    msp.add_lwpolyline(engine_rect, close=True, dxfattribs={"layer": "MAQUINAS"})
+
+    if disposicion is None:
+        disposicion = OptimizadorSalaMaquinas.desde_config(cfg).optimizar(semilla=0)
+    for equipo in disposicion.equipos:
+        x0, y0, x1, y1 = equipo.caja()
+        layer = "TANQUES" if equipo.tipo == "tanque" else "EQUIPOS"
+        msp.add_lwpolyline([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], close=True, dxfattribs={"layer": layer})
+        _add_text(msp, equipo.nombre, (equipo.x_m, y1 + 0.4), layer="TEXTOS", height=0.25)
 
     section_offset_x = lpp + 8.0
     section_points = [
@@ -412,7 +403,7 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         (half_beam, 0),
     ]
     section_points_offset = [(x + section_offset_x, y) for x, y in section_points]
-    msp.add_lwpolyline(section_points_offset, dxfattribs={"layer": "CASCO", "closed": True})
+    msp.add_lwpolyline(section_points_offset, close=True, dxfattribs={"layer": "CASCO"})
 
     db_height = 1.2
     db_section = [
@@ -422,7 +413,7 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         ((half_beam - 1.8), 0),
     ]
     db_section_offset = [(x + section_offset_x, y) for x, y in db_section]
-    msp.add_lwpolyline(db_section_offset, dxfattribs={"layer": "TANQUES", "closed": True})
+    msp.add_lwpolyline(db_section_offset, close=True, dxfattribs={"layer": "TANQUES"})
 
     elevation_offset_y = depth + 6.0
     profile_points = [
@@ -431,7 +422,7 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         (lpp, elevation_offset_y + draft),
         (lpp, elevation_offset_y),
     ]
-    msp.add_lwpolyline(profile_points, dxfattribs={"layer": "CASCO", "closed": True})
+    msp.add_lwpolyline(profile_points, close=True, dxfattribs={"layer": "CASCO"})
 
     _add_text(
         msp,
@@ -447,6 +438,8 @@ def build_dxf_from_cad_systems(config: Optional[CADIntegrationConfig] = None) ->
         "engine_room": {
             "start": engine_start,
             "end": engine_end,
+            "layout": disposicion.tabla().to_dict(orient="records"),
+            "clashes": disposicion.colisiones,
         },
     }
     snapshot_path = cfg.output_dir / "metadata_sala_maquinas.json"
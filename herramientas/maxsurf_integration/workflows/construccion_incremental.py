@@ -0,0 +1,193 @@
+"""Reconstrucción incremental (estilo make) de planos, figuras e informes.
+
+Cada artefacto declara sus archivos de entrada (código fuente del generador,
+JSON de resumen, módulos compartidos...), sus parámetros y los artefactos de
+los que depende. La huella de un artefacto es un SHA-256 del contenido de
+esas entradas, de los parámetros y de las salidas de sus dependencias; se
+guarda en un JSON de estado tras construirlo y sólo se regenera cuando la
+huella cambia o falta alguna de sus salidas.
+
+Ejemplo:
+    grafo = GrafoConstruccion("salidas/.estado_construccion.json")
+    grafo.agregar(Artefacto("corte", [dxf], [script, utils], construir=generar_corte))
+    grafo.agregar(Artefacto("corte_png", [png], [exportador], construir=exportar, depende_de=("corte",)))
+    grafo.construir()  # {"corte": "al día", "corte_png": "construido"}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONSTRUIDO = "construido"
+AL_DIA = "al día"
+
+_BLOQUE = 1 << 20
+
+
+def huella_archivo(ruta: str | Path) -> str:
+    """SHA-256 del contenido de un archivo ('ausente' si no existe)."""
+    ruta = Path(ruta)
+    if not ruta.is_file():
+        return "ausente"
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(_BLOQUE), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+@dataclass
+class Artefacto:
+    """Nodo del grafo: `construir()` genera `salidas` a partir de `entradas`.
+
+    Attributes:
+        nombre: Identificador único en el grafo
+        salidas: Archivos que produce el generador
+        entradas: Archivos cuyo contenido determina las salidas
+        construir: Función sin argumentos que regenera las salidas
+        parametros: Valores adicionales (serializables en JSON) que afectan al resultado
+        depende_de: Artefactos cuyas salidas consume
+    """
+
+    nombre: str
+    salidas: List[Path]
+    entradas: List[Path]
+    construir: Callable[[], Any]
+    parametros: Dict[str, Any] = field(default_factory=dict)
+    depende_de: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        self.salidas = [Path(p) for p in self.salidas]
+        self.entradas = [Path(p) for p in self.entradas]
+        self.depende_de = tuple(self.depende_de)
+
+
+class GrafoConstruccion:
+    """Grafo de artefactos con estado persistente de huellas."""
+
+    def __init__(self, estado: str | Path):
+        """
+        Args:
+            estado: JSON donde se guardan las huellas de la última construcción
+        """
+        self.ruta_estado = Path(estado)
+        self.artefactos: Dict[str, Artefacto] = {}
+        self.estado: Dict[str, Dict[str, Any]] = {}
+        if self.ruta_estado.exists():
+            try:
+                self.estado = json.loads(self.ruta_estado.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.estado = {}
+
+    def agregar(self, artefacto: Artefacto) -> "GrafoConstruccion":
+        if artefacto.nombre in self.artefactos:
+            raise ValueError(f"Artefacto duplicado: {artefacto.nombre}")
+        self.artefactos[artefacto.nombre] = artefacto
+        return self
+
+    # ------------------------------------------------------------------
+    def orden(self, objetivos: Optional[Iterable[str]] = None) -> List[str]:
+        """Orden topológico de los objetivos y sus dependencias (todos por defecto)."""
+        pendientes = list(objetivos) if objetivos is not None else list(self.artefactos)
+        orden: List[str] = []
+        en_curso: set = set()
+
+        def visitar(nombre: str) -> None:
+            if nombre in orden:
+                return
+            if nombre not in self.artefactos:
+                raise KeyError(f"Artefacto desconocido: {nombre}")
+            if nombre in en_curso:
+                raise ValueError(f"Dependencia circular en {nombre}")
+            en_curso.add(nombre)
+            for dep in self.artefactos[nombre].depende_de:
+                visitar(dep)
+            en_curso.discard(nombre)
+            orden.append(nombre)
+
+        for nombre in pendientes:
+            visitar(nombre)
+        return orden
+
+    def huella(self, nombre: str) -> str:
+        """Huella actual de las entradas, parámetros y salidas de dependencias."""
+        art = self.artefactos[nombre]
+        h = hashlib.sha256()
+        h.update(json.dumps(art.parametros, sort_keys=True, default=str).encode())
+        for ruta in art.entradas:
+            h.update(f"\0{ruta.name}\0{huella_archivo(ruta)}".encode())
+        for dep in art.depende_de:
+            for ruta in self.artefactos[dep].salidas:
+                h.update(f"\0{dep}/{ruta.name}\0{huella_archivo(ruta)}".encode())
+        return h.hexdigest()
+
+    def motivo(self, nombre: str) -> Optional[str]:
+        """Por qué el artefacto está obsoleto (None si está al día)."""
+        art = self.artefactos[nombre]
+        previo = self.estado.get(nombre)
+        if previo is None:
+            return "sin construir"
+        faltan = [p.name for p in art.salidas if not p.exists()]
+        if faltan:
+            return "faltan salidas: " + ", ".join(faltan)
+        if previo.get("huella") != self.huella(nombre):
+            return "entradas modificadas"
+        return None
+
+    def obsoletos(self, objetivos: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """{nombre: motivo} de los artefactos que hay que regenerar.
+
+        Un artefacto cuyas dependencias están obsoletas también lo está: su
+        huella cambiará en cuanto se regeneren.
+        """
+        res: Dict[str, str] = {}
+        for nombre in self.orden(objetivos):
+            motivo = self.motivo(nombre)
+            if motivo is None:
+                deps = [d for d in self.artefactos[nombre].depende_de if d in res]
+                motivo = f"depende de {', '.join(deps)}" if deps else None
+            if motivo is not None:
+                res[nombre] = motivo
+        return res
+
+    # ------------------------------------------------------------------
+    def construir(self, objetivos: Optional[Sequence[str]] = None, forzar: bool = False) -> Dict[str, str]:
+        """Regenerar sólo los artefactos obsoletos, en orden de dependencias.
+
+        La huella se registra después de construir, de modo que las entradas
+        que el propio generador reescribe (p. ej. el JSON de resumen) no lo
+        marcan como obsoleto en la siguiente pasada. El estado se guarda tras
+        cada artefacto; si un generador falla, su excepción se propaga y los
+        ya construidos quedan registrados.
+
+        Args:
+            objetivos: Artefactos a construir (con sus dependencias); todos por defecto
+            forzar: Regenerar aunque estén al día
+
+        Returns:
+            {nombre: "construido" | "al día"}
+        """
+        resultado: Dict[str, str] = {}
+        for nombre in self.orden(objetivos):
+            art = self.artefactos[nombre]
+            if not forzar and self.motivo(nombre) is None:
+                resultado[nombre] = AL_DIA
+                continue
+            art.construir()
+            self.estado[nombre] = {
+                "huella": self.huella(nombre),
+                "salidas": [str(p) for p in art.salidas],
+            }
+            self._guardar_estado()
+            resultado[nombre] = CONSTRUIDO
+        return resultado
+
+    def _guardar_estado(self) -> None:
+        self.ruta_estado.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.ruta_estado.with_suffix(self.ruta_estado.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.estado, indent=2, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.ruta_estado)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incertidumbre de consumo y autonomía por Monte Carlo
+----------------------------------------------------
+
+`CalculadorConsumo.autonomia_estimada` da un único valor determinista. Este
+módulo muestrea las condiciones de operación (temperatura ambiente, meses
+desde la limpieza del casco, altura de ola y degradación del motor) desde
+distribuciones configurables, evalúa consumo y autonomía de cada muestra de
+forma vectorizada (10⁶ muestras en bloques) y devuelve percentiles de la
+autonomía en días y millas.
+
+Cada muestra se evalúa con `CalculadorConsumo.consumo_navegacion_batch`, el
+mismo modelo que el cálculo determinista (correcciones ambientales y, con
+`demanda_electrica_kw`, despacho óptimo de generadores). Con un modelo de
+resistencia del casco (objeto con `potencia_freno_kw(velocidad_kn)`, como el
+de `CalculadorConsumo`) la carga del motor sale de esa potencia en lugar de
+la ley cúbica; como ese modelo suele ser más caro, los bloques se reparten en
+un pool de procesos. El modelo debe poder serializarse.
+
+Uso rápido:
+  python herramientas/montecarlo_consumo.py --capacidad-m3 377.6 --muestras 1000000 \
+    --ola "gamma 2 0.8" --temp "normal 25 6"
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from calculos_combustible_optimizados import CalculadorConsumo
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+
+@dataclass
+class Distribucion:
+    """
+    Distribución de una variable de entrada.
+
+    Tipos: 'constante' (valor), 'uniforme' (a, b), 'normal' (media, sigma),
+    'lognormal' (mu, sigma), 'triangular' (a, moda, b), 'gamma' (k, theta).
+    Las muestras se recortan a [minimo, maximo].
+    """
+
+    tipo: str
+    parametros: Tuple[float, ...]
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+
+    def muestrear(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        p = self.parametros
+        if self.tipo == "constante":
+            x = np.full(n, float(p[0]))
+        elif self.tipo == "uniforme":
+            x = rng.uniform(p[0], p[1], n)
+        elif self.tipo == "normal":
+            x = rng.normal(p[0], p[1], n)
+        elif self.tipo == "lognormal":
+            x = rng.lognormal(p[0], p[1], n)
+        elif self.tipo == "triangular":
+            x = rng.triangular(p[0], p[1], p[2], n)
+        elif self.tipo == "gamma":
+            x = rng.gamma(p[0], p[1], n)
+        else:
+            raise ValueError(f"Distribución no soportada: {self.tipo}")
+        if self.minimo is not None or self.maximo is not None:
+            x = np.clip(x, self.minimo, self.maximo)
+        return x
+
+
+def distribuciones_por_defecto() -> Dict[str, Distribucion]:
+    """Condiciones típicas de una travesía oceánica del Buque 9."""
+    return {
+        "temp_ambiente_c": Distribucion("normal", (25.0, 6.0), -5.0, 45.0),
+        "meses_desde_limpieza": Distribucion("uniforme", (0.0, 24.0)),
+        "altura_ola_m": Distribucion("gamma", (2.0, 0.8), 0.0, 12.0),
+        "factor_degradacion": Distribucion("triangular", (1.00, 1.02, 1.05)),
+    }
+
+
+@dataclass
+class ResultadoMonteCarlo:
+    """Muestras evaluadas y estadísticos."""
+
+    muestras: pd.DataFrame
+    velocidad_kn: float
+    percentiles_usados: Sequence[float] = field(default=PERCENTILES)
+
+    def percentiles(self, percentiles: Optional[Sequence[float]] = None) -> pd.DataFrame:
+        """Percentiles de consumo y autonomía (filas: P5, P10...)."""
+        p = list(percentiles or self.percentiles_usados)
+        cols = ["consumo_total_kg_h", "consumo_por_nm_kg", "autonomia_nm", "autonomia_dias"]
+        valores = np.percentile(self.muestras[cols].to_numpy(), p, axis=0)
+        return pd.DataFrame(valores, index=[f"P{q:g}" for q in p], columns=cols)
+
+    def probabilidad_autonomia(self, autonomia_nm: float) -> float:
+        """Probabilidad de alcanzar al menos la autonomía indicada (nm)."""
+        return float((self.muestras["autonomia_nm"] >= autonomia_nm).mean())
+
+
+def _evaluar_bloque(
+    semilla: np.random.SeedSequence,
+    n: int,
+    distribuciones: Dict[str, Distribucion],
+    velocidad_kn: float,
+    combustible_util_kg: float,
+    demanda_electrica_kw: Optional[float],
+    calculador: CalculadorConsumo,
+) -> pd.DataFrame:
+    """Muestrear y evaluar un bloque (función de módulo para el pool)."""
+    rng = np.random.default_rng(semilla)
+    x = {nombre: d.muestrear(rng, n) for nombre, d in distribuciones.items()}
+    consumo = calculador.consumo_navegacion_batch(
+        np.full(n, velocidad_kn), x["temp_ambiente_c"], x["meses_desde_limpieza"], x["altura_ola_m"],
+        factor_degradacion=x["factor_degradacion"],
+        demanda_electrica_kw=demanda_electrica_kw,
+    )
+    consumo_kg_h = consumo["consumo_total_kg_h"]
+    consumo_por_nm = consumo_kg_h / velocidad_kn
+    autonomia_nm = combustible_util_kg / consumo_por_nm
+    return pd.DataFrame({
+        **x,
+        "carga_motor_pct": consumo["carga_motor_pct"],
+        "consumo_total_kg_h": consumo_kg_h,
+        "consumo_por_nm_kg": consumo_por_nm,
+        "autonomia_nm": autonomia_nm,
+        "autonomia_dias": autonomia_nm / (velocidad_kn * 24.0),
+    })
+
+
+class MonteCarloConsumo:
+    """
+    Simulador Monte Carlo de consumo y autonomía.
+
+    Ejemplo:
+        mc = MonteCarloConsumo(capacidad_tanques_m3=377.6)
+        res = mc.simular(1_000_000, semilla=1)
+        res.percentiles()
+    """
+
+    def __init__(
+        self,
+        capacidad_tanques_m3: float,
+        densidad_fo_kg_m3: float = 950.0,
+        velocidad_crucero_kn: float = 14.5,
+        margen_seguridad: float = 0.15,
+        distribuciones: Optional[Dict[str, Distribucion]] = None,
+        modelo_resistencia=None,
+        calculador: Optional[CalculadorConsumo] = None,
+        demanda_electrica_kw: Optional[float] = None,
+    ):
+        """
+        Args:
+            capacidad_tanques_m3: Capacidad total de fuel oil
+            densidad_fo_kg_m3: Densidad del combustible
+            velocidad_crucero_kn: Velocidad de la travesía
+            margen_seguridad: Reserva (0.15 = 15%), como autonomia_estimada
+            distribuciones: Sustituye entradas de `distribuciones_por_defecto`
+            modelo_resistencia: Objeto con `potencia_freno_kw(velocidad_kn)`
+                para el CalculadorConsumo por defecto (opcional)
+            calculador: Calculador de consumos (por defecto
+                CalculadorConsumo(modelo_resistencia)); no se combina con
+                `modelo_resistencia`
+            demanda_electrica_kw: Demanda eléctrica para el despacho de
+                generadores del calculador (por defecto, su regla fija)
+        """
+        if calculador is not None and modelo_resistencia is not None:
+            raise ValueError("Indique el modelo de resistencia en el calculador, no por separado")
+        self.distribuciones = {**distribuciones_por_defecto(), **(distribuciones or {})}
+        self.combustible_util_kg = capacidad_tanques_m3 * densidad_fo_kg_m3 * (1 - margen_seguridad)
+        self.velocidad_kn = velocidad_crucero_kn
+        self.calculador = calculador or CalculadorConsumo(modelo_resistencia=modelo_resistencia)
+        self.demanda_electrica_kw = demanda_electrica_kw
+
+    def simular(
+        self,
+        n_muestras: int = 1_000_000,
+        semilla: Optional[int] = None,
+        tam_bloque: int = 250_000,
+        procesos: Optional[int] = None,
+    ) -> ResultadoMonteCarlo:
+        """
+        Evaluar n_muestras condiciones de operación.
+
+        Args:
+            n_muestras: Número de muestras
+            semilla: Semilla (resultados idénticos con o sin pool)
+            tam_bloque: Muestras por bloque
+            procesos: Procesos del pool; por defecto se usa pool sólo con
+                modelo de resistencia (1 = siempre en serie)
+
+        Returns:
+            ResultadoMonteCarlo
+        """
+        tamanos = [tam_bloque] * (n_muestras // tam_bloque)
+        if n_muestras % tam_bloque:
+            tamanos.append(n_muestras % tam_bloque)
+        semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+        args = [
+            (s, n, self.distribuciones, self.velocidad_kn, self.combustible_util_kg,
+             self.demanda_electrica_kw, self.calculador)
+            for s, n in zip(semillas, tamanos)
+        ]
+
+        usar_pool = (procesos or 0) > 1 or (procesos is None and self.calculador.modelo_resistencia is not None)
+        if usar_pool and len(args) > 1:
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                bloques = list(pool.map(_evaluar_bloque, *zip(*args)))
+        else:
+            bloques = [_evaluar_bloque(*a) for a in args]
+
+        return ResultadoMonteCarlo(pd.concat(bloques, ignore_index=True), self.velocidad_kn)
+
+
+def _leer_distribucion(texto: str) -> Distribucion:
+    """'normal 25 6' -> Distribucion('normal', (25.0, 6.0))."""
+    partes = texto.split()
+    return Distribucion(partes[0], tuple(float(p) for p in partes[1:]))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Monte Carlo de consumo y autonomía")
+    ap.add_argument('--capacidad-m3', type=float, required=True, help='Capacidad de fuel oil (m3)')
+    ap.add_argument('--densidad', type=float, default=950.0, help='Densidad del combustible (kg/m3)')
+    ap.add_argument('--velocidad', type=float, default=14.5, help='Velocidad de crucero (kn)')
+    ap.add_argument('--margen', type=float, default=0.15, help='Margen de seguridad (0-1)')
+    ap.add_argument('--demanda-kw', type=float, default=None, help='Demanda eléctrica para el despacho de generadores (kW)')
+    ap.add_argument('--muestras', type=int, default=1_000_000, help='Número de muestras')
+    ap.add_argument('--semilla', type=int, default=None, help='Semilla aleatoria')
+    ap.add_argument('--temp', default=None, help='Distribución de temperatura, p. ej. "normal 25 6"')
+    ap.add_argument('--fouling', default=None, help='Distribución de meses desde limpieza')
+    ap.add_argument('--ola', default=None, help='Distribución de altura de ola')
+    ap.add_argument('--degradacion', default=None, help='Distribución del factor de degradación')
+    args = ap.parse_args()
+
+    distribuciones = {}
+    for nombre, texto in (("temp_ambiente_c", args.temp), ("meses_desde_limpieza", args.fouling),
+                          ("altura_ola_m", args.ola), ("factor_degradacion", args.degradacion)):
+        if texto:
+            distribuciones[nombre] = _leer_distribucion(texto)
+
+    mc = MonteCarloConsumo(
+        args.capacidad_m3, args.densidad, args.velocidad, args.margen, distribuciones=distribuciones,
+        demanda_electrica_kw=args.demanda_kw,
+    )
+    res = mc.simular(args.muestras, semilla=args.semilla)
+    print(res.percentiles().round(2).to_string())
+    determinista = mc.calculador.autonomia_estimada(args.capacidad_m3, args.densidad, args.velocidad, args.margen)
+    print(f"Determinista: {determinista['autonomia_nm']:,.0f} NM ({determinista['autonomia_dias']} días)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perfil de velocidad de mínimo consumo con ventana de llegada (ETA)
+------------------------------------------------------------------
+
+Elige la velocidad de cada tramo de la ruta para minimizar el combustible
+total llegando dentro de la ventana [ETA mínima, ETA máxima]. Programación
+dinámica sobre una malla (tramo × tiempo acumulado):
+
+    C[i, τ] = min_v { C[i-1, τ - Δτ(v)] + F_i(v) }
+
+donde Δτ(v) es la duración del tramo en pasos de tiempo y F_i(v) el
+combustible del tramo con el consumo de `CalculadorConsumo` y la
+penalización por estado de la mar de `FactoresAmbientales` para la ola del
+tramo. Cada transición evalúa todas las velocidades y todos los tiempos con
+una sola operación de arrays.
+
+Cada velocidad candidata se ajusta a la que recorre el tramo en un número
+entero de pasos (la duración a la velocidad de la malla redondeada hacia
+arriba), de modo que la hora de cada casilla es la hora real de llegada de
+cualquier camino que llegue a ella. Las dos cotas de la ventana de ETA son
+así restricciones exactas de la malla y no una comprobación sobre el mejor
+camino.
+
+Archivo de tramos (CSV):
+- distancia_nm       Longitud del tramo (obligatoria)
+- altura_ola_m       Ola prevista en el tramo (opcional, 1.5 m)
+- temp_ambiente_c    Temperatura prevista (opcional, 25 °C)
+- nombre, v_min_kn, v_max_kn (opcionales; p. ej. límites en canales)
+
+Uso rápido:
+  python herramientas/optimizacion_perfil_velocidad.py ruta.csv --eta-min-h 160 --eta-max-h 168
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from calculos_combustible_optimizados import CalculadorConsumo
+
+
+@dataclass
+class ResultadoPerfil:
+    """Perfil óptimo y comparación con velocidad constante."""
+
+    tramos: pd.DataFrame
+    combustible_t: float
+    horas: float
+    factible: bool
+    combustible_velocidad_constante_t: Optional[float] = None
+
+    def resumen(self) -> Dict[str, float]:
+        ahorro = None
+        if self.factible and self.combustible_velocidad_constante_t:
+            ahorro = 100.0 * (1.0 - self.combustible_t / self.combustible_velocidad_constante_t)
+        return {
+            "factible": self.factible,
+            "combustible_t": round(self.combustible_t, 3),
+            "horas": round(self.horas, 2),
+            "combustible_velocidad_constante_t": self.combustible_velocidad_constante_t,
+            "ahorro_pct": None if ahorro is None else round(ahorro, 2),
+        }
+
+
+class OptimizadorPerfilVelocidad:
+    """
+    Optimizador de velocidad por tramo (programación dinámica).
+
+    Ejemplo:
+        opt = OptimizadorPerfilVelocidad()
+        res = opt.optimizar(tramos_df, eta_min_h=160, eta_max_h=168)
+        res.tramos[['distancia_nm', 'velocidad_kn', 'combustible_t']]
+    """
+
+    def __init__(
+        self,
+        calculador: Optional[CalculadorConsumo] = None,
+        v_min_kn: float = 8.0,
+        v_max_kn: Optional[float] = None,
+        paso_velocidad_kn: float = 0.1,
+        paso_tiempo_h: float = 0.25,
+        meses_desde_limpieza: float = 6.0,
+        velocidad_servicio_kn: float = 14.5,
+    ):
+        """
+        Args:
+            calculador: Calculador de consumos (por defecto CalculadorConsumo)
+            v_min_kn: Velocidad mínima admisible
+            v_max_kn: Velocidad máxima (por defecto la de 100% MCR)
+            paso_velocidad_kn: Resolución de las velocidades candidatas
+            paso_tiempo_h: Resolución de la malla de tiempo acumulado
+            meses_desde_limpieza: Fouling del casco
+            velocidad_servicio_kn: Velocidad a 85% MCR
+        """
+        self.calculador = calculador or CalculadorConsumo()
+        if v_max_kn is None:
+            # La carga se satura al 100% MCR: más velocidad no es alcanzable
+            v_max_kn = velocidad_servicio_kn * (100.0 / 85.0) ** (1.0 / 3.0)
+        self.velocidades = np.arange(v_min_kn, v_max_kn + 1e-9, paso_velocidad_kn)
+        self.paso_tiempo_h = paso_tiempo_h
+        self.meses_desde_limpieza = meses_desde_limpieza
+        self.velocidad_servicio_kn = velocidad_servicio_kn
+
+    def _consumo_kg_h(self, velocidades, temp, olas) -> np.ndarray:
+        return self.calculador.consumo_navegacion_batch(
+            velocidades, temp, self.meses_desde_limpieza, olas,
+            velocidad_servicio_kn=self.velocidad_servicio_kn,
+        )["consumo_total_kg_h"]
+
+    def optimizar(self, tramos: pd.DataFrame, eta_min_h: float, eta_max_h: float) -> ResultadoPerfil:
+        """
+        Calcular el perfil de velocidades de mínimo consumo.
+
+        Args:
+            tramos: DataFrame de tramos (ver docstring del módulo)
+            eta_min_h: Llegada más temprana admisible (h desde la salida)
+            eta_max_h: Llegada más tardía admisible (h desde la salida)
+
+        Returns:
+            ResultadoPerfil con una fila por tramo
+        """
+        if eta_max_h < eta_min_h:
+            raise ValueError("eta_max_h debe ser mayor o igual que eta_min_h")
+        n = len(tramos)
+        d = tramos["distancia_nm"].to_numpy(dtype=float)
+        olas = tramos.get("altura_ola_m", pd.Series(1.5, index=tramos.index)).to_numpy(dtype=float)
+        temp = tramos.get("temp_ambiente_c", pd.Series(25.0, index=tramos.index)).to_numpy(dtype=float)
+        v = self.velocidades
+
+        # Duración (pasos enteros), velocidad ajustada a esa duración y combustible (t)
+        # de cada tramo a cada velocidad de la malla: (tramos × velocidades)
+        pasos = np.ceil(d[:, None] / v[None, :] / self.paso_tiempo_h - 1e-9).astype(int)
+        horas = pasos * self.paso_tiempo_h
+        v = d[:, None] / horas
+        combustible = self._consumo_kg_h(v, temp[:, None], olas[:, None]) * horas / 1000.0
+        permitida = v >= self.velocidades[0] - 1e-9
+        if "v_min_kn" in tramos:
+            permitida &= ~(v < tramos["v_min_kn"].to_numpy(dtype=float)[:, None] - 1e-9)
+        if "v_max_kn" in tramos:
+            permitida &= ~(v > tramos["v_max_kn"].to_numpy(dtype=float)[:, None] + 1e-9)
+        combustible = np.where(permitida, combustible, np.inf)
+
+        n_t = int(np.floor(eta_max_h / self.paso_tiempo_h + 1e-9)) + 1
+        tau = np.arange(n_t)
+        coste = np.full(n_t, np.inf)
+        coste[0] = 0.0
+        eleccion = np.zeros((n, n_t), dtype=np.int32)
+        for i in range(n):
+            origen = tau[None, :] - pasos[i][:, None]  # velocidades × tiempos
+            previo = np.maximum(origen, 0)
+            candidatos = np.where(origen >= 0, coste[previo], np.inf) + combustible[i][:, None]
+            eleccion[i] = np.argmin(candidatos, axis=0)
+            coste = candidatos[eleccion[i], tau]
+
+        ventana = np.arange(int(np.ceil(eta_min_h / self.paso_tiempo_h - 1e-9)), n_t)
+        constante = self._velocidad_constante(d, temp, olas, eta_min_h, eta_max_h)
+        if ventana.size == 0 or not np.isfinite(coste[ventana]).any():
+            return ResultadoPerfil(tramos.assign(velocidad_kn=np.nan), np.inf, np.nan, False, constante)
+
+        # Reconstrucción hacia atrás desde el mejor tiempo de llegada
+        t = ventana[np.argmin(coste[ventana])]
+        k = np.empty(n, dtype=int)
+        for i in range(n - 1, -1, -1):
+            k[i] = eleccion[i, t]
+            t -= pasos[i, k[i]]
+
+        filas = np.arange(n)
+        df = tramos.copy()
+        df["velocidad_kn"] = v[filas, k]
+        df["horas"] = horas[filas, k]
+        df["llegada_h"] = np.cumsum(df["horas"].to_numpy())
+        df["consumo_kg_h"] = combustible[filas, k] * 1000.0 / horas[filas, k]
+        df["combustible_t"] = combustible[filas, k]
+        return ResultadoPerfil(
+            tramos=df,
+            combustible_t=float(df["combustible_t"].sum()),
+            horas=float(df["llegada_h"].iloc[-1]),
+            factible=True,
+            combustible_velocidad_constante_t=constante,
+        )
+
+    def _velocidad_constante(self, d, temp, olas, eta_min_h, eta_max_h) -> Optional[float]:
+        """Combustible navegando toda la ruta a la velocidad media para la ETA central."""
+        v = d.sum() / (0.5 * (eta_min_h + eta_max_h))
+        if not (self.velocidades[0] - 1e-9 <= v <= self.velocidades[-1] + 1e-9):
+            return None
+        return round(float((self._consumo_kg_h(v, temp, olas) * d / v).sum() / 1000.0), 3)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Perfil de velocidad de mínimo consumo con ventana de ETA")
+    ap.add_argument('tramos', help='CSV de tramos (distancia_nm, altura_ola_m, temp_ambiente_c...)')
+    ap.add_argument('--eta-min-h', type=float, required=True, help='Llegada más temprana (h)')
+    ap.add_argument('--eta-max-h', type=float, required=True, help='Llegada más tardía (h)')
+    ap.add_argument('--paso-h', type=float, default=0.25, help='Resolución de tiempo (h)')
+    ap.add_argument('--v-min', type=float, default=8.0, help='Velocidad mínima (kn)')
+    ap.add_argument('--meses-desde-limpieza', type=float, default=6.0, help='Fouling del casco (meses)')
+    ap.add_argument('--salida', default=None, help='CSV con el perfil óptimo')
+    args = ap.parse_args()
+
+    opt = OptimizadorPerfilVelocidad(
+        v_min_kn=args.v_min, paso_tiempo_h=args.paso_h, meses_desde_limpieza=args.meses_desde_limpieza
+    )
+    res = opt.optimizar(pd.read_csv(args.tramos), args.eta_min_h, args.eta_max_h)
+    print(res.tramos.to_string(index=False))
+    print(res.resumen())
+    if args.salida:
+        res.tramos.to_csv(args.salida, index=False)
+        print(f'Perfil: {args.salida}')
+
+
+if __name__ == '__main__':
+    main()
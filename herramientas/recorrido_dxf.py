@@ -0,0 +1,296 @@
+"""Recorrido en streaming de planos DXF para validadores y analizadores.
+
+`ezdxf.readfile` carga el documento completo (todas las entidades, bloques y
+objetos enlazados) antes de poder contar una sola línea. Aquí el espacio
+modelo se lee entidad a entidad con `ezdxf.addons.iterdxf` y cada entidad se
+entrega a una lista de visitantes en una única pasada; sólo se mantiene en
+memoria el índice de posiciones del archivo y lo que acumula cada visitante.
+
+Cada visitante declara los tipos DXF que necesita (`tipos`); las entidades
+que ningún visitante pide no llegan a construirse.
+
+Limitaciones de iterdxf: sólo se leen los tipos de `iterdxf.SUPPORTED_TYPES`
+(los INSERT se visitan como referencia, sin explotar el bloque) y las
+entidades no tienen documento asociado.
+
+Ejemplo:
+    capas, tipos, caja = ConteoCapas(), ConteoTipos(), CajaEnvolvente()
+    recorrer_modelspace("plano.dxf", [capas, tipos, caja])
+    print(capas.resultado(), caja.resultado())
+"""
+
+from __future__ import annotations
+
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, TextIO, Tuple
+from xml.sax.saxutils import escape
+
+from ezdxf.addons import iterdxf
+
+Punto = Tuple[float, float]
+
+
+class VisitanteDXF:
+    """Base de los visitantes: `visitar(entidad)` por entidad y `resultado()` al final."""
+
+    tipos: Optional[FrozenSet[str]] = None  # None = todos los tipos
+
+    def visitar(self, entidad) -> None:
+        raise NotImplementedError
+
+    def resultado(self):
+        raise NotImplementedError
+
+
+class LectorDXF:
+    """Lector en streaming de un DXF (el índice del archivo se construye una sola vez).
+
+    Ejemplo:
+        with LectorDXF("plano.dxf") as lector:
+            capas = lector.capas()
+            lector.recorrer([ConteoTipos()])
+    """
+
+    def __init__(self, ruta: str | Path):
+        self.ruta = Path(ruta)
+        self._doc = iterdxf.opendxf(str(self.ruta))
+
+    def __enter__(self) -> "LectorDXF":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        self._doc.close()
+
+    @property
+    def version(self) -> str:
+        return self._doc.dxfversion
+
+    def capas(self) -> Dict[str, Dict[str, object]]:
+        """Tabla de capas {nombre: {'color', 'tipo_linea'}}."""
+        if "TABLES" not in self._doc.sections:
+            return {}
+        return {
+            capa.dxf.name: {"color": capa.dxf.color, "tipo_linea": capa.dxf.linetype}
+            for capa in self._doc.load_entities(self._doc.sections["TABLES"] + 1, {"LAYER"})
+        }
+
+    def recorrer(self, visitantes: Iterable[VisitanteDXF]) -> int:
+        """
+        Recorre el espacio modelo una sola vez entregando cada entidad a los visitantes.
+
+        Returns:
+            Número de entidades leídas
+        """
+        visitantes = list(visitantes)
+        if any(v.tipos is None for v in visitantes):
+            tipos = None
+        else:
+            tipos = sorted(set().union(*(v.tipos for v in visitantes)))
+        n = 0
+        for entidad in self._doc.modelspace(types=tipos):
+            n += 1
+            tipo = entidad.dxftype()
+            for v in visitantes:
+                if v.tipos is None or tipo in v.tipos:
+                    v.visitar(entidad)
+        return n
+
+
+def recorrer_modelspace(ruta: str | Path, visitantes: Iterable[VisitanteDXF]) -> int:
+    """Atajo: abre el DXF, lo recorre con los visitantes y lo cierra."""
+    with LectorDXF(ruta) as lector:
+        return lector.recorrer(visitantes)
+
+
+# ----------------------------------------------------------------------
+# Visitantes
+# ----------------------------------------------------------------------
+class ConteoCapas(VisitanteDXF):
+    """Entidades por capa."""
+
+    def __init__(self):
+        self.conteo: Counter = Counter()
+
+    def visitar(self, entidad) -> None:
+        self.conteo[entidad.dxf.layer] += 1
+
+    def resultado(self) -> Dict[str, int]:
+        return dict(self.conteo)
+
+
+class ConteoTipos(VisitanteDXF):
+    """Entidades por tipo DXF."""
+
+    def __init__(self):
+        self.conteo: Counter = Counter()
+
+    def visitar(self, entidad) -> None:
+        self.conteo[entidad.dxftype()] += 1
+
+    def resultado(self) -> Dict[str, int]:
+        return dict(self.conteo)
+
+
+def puntos_extremos(entidad) -> List[Punto]:
+    """Extremos de líneas (start/end) o caja de círculos y arcos (center ± radius)."""
+    dxf = entidad.dxf
+    if dxf.is_supported("start"):
+        puntos = [(dxf.start.x, dxf.start.y)]
+        if dxf.is_supported("end"):
+            puntos.append((dxf.end.x, dxf.end.y))
+        return puntos
+    if dxf.is_supported("center") and dxf.is_supported("radius"):
+        c, r = dxf.center, dxf.radius
+        return [(c.x - r, c.y - r), (c.x + r, c.y + r)]
+    return []
+
+
+def puntos_geometria(entidad) -> List[Punto]:
+    """Puntos de LINE, CIRCLE y vértices de LWPOLYLINE (sin textos ni cotas)."""
+    tipo = entidad.dxftype()
+    if tipo == "LWPOLYLINE":
+        return [(x, y) for x, y in entidad.get_points("xy")]
+    if tipo in ("LINE", "CIRCLE"):
+        return puntos_extremos(entidad)
+    return []
+
+
+class CajaEnvolvente(VisitanteDXF):
+    """Caja envolvente [min_x, min_y, max_x, max_y] de los puntos que devuelve `puntos(entidad)`."""
+
+    def __init__(self, puntos: Callable[[object], Iterable[Punto]] = puntos_extremos, tipos: Optional[Iterable[str]] = None):
+        self.puntos = puntos
+        self.tipos = frozenset(tipos) if tipos is not None else None
+        self.caja: Optional[List[float]] = None
+
+    def visitar(self, entidad) -> None:
+        try:
+            puntos = self.puntos(entidad)
+        except Exception:
+            return
+        for x, y in puntos:
+            c = self.caja
+            if c is None:
+                self.caja = [x, y, x, y]
+            else:
+                c[0], c[1] = min(c[0], x), min(c[1], y)
+                c[2], c[3] = max(c[2], x), max(c[3], y)
+
+    def resultado(self) -> Optional[List[float]]:
+        return self.caja
+
+
+def color_entidad(entidad):
+    """Color ACI de la entidad ('N/A' si el tipo no tiene color)."""
+    return entidad.dxf.color if entidad.dxf.is_supported("color") else "N/A"
+
+
+class HistogramaColores(VisitanteDXF):
+    """Entidades por (tipo, capa, color ACI)."""
+
+    def __init__(self):
+        self.conteo: Counter = Counter()
+
+    def visitar(self, entidad) -> None:
+        self.conteo[(entidad.dxftype(), entidad.dxf.layer, color_entidad(entidad))] += 1
+
+    def resultado(self) -> Dict[Tuple[str, str, object], int]:
+        return dict(self.conteo)
+
+
+class MuestraTextos(VisitanteDXF):
+    """Cuenta los TEXT y guarda los `limite` primeros (texto, capa, color, posición)."""
+
+    tipos = frozenset({"TEXT"})
+
+    def __init__(self, limite: int = 10, largo: int = 30):
+        self.limite = limite
+        self.largo = largo
+        self.total = 0
+        self.muestra: List[Dict[str, object]] = []
+
+    def visitar(self, entidad) -> None:
+        self.total += 1
+        if len(self.muestra) < self.limite:
+            texto = entidad.dxf.text
+            self.muestra.append({
+                "text": texto[:self.largo],
+                "layer": entidad.dxf.layer,
+                "color": color_entidad(entidad),
+                "pos": (entidad.dxf.insert.x, entidad.dxf.insert.y),
+            })
+
+    def resultado(self) -> List[Dict[str, object]]:
+        return self.muestra
+
+
+class EmisorSVG(VisitanteDXF):
+    """
+    SVG de LINE, CIRCLE, LWPOLYLINE y TEXT emitido en una sola pasada.
+
+    Los elementos se escriben en coordenadas del dibujo (y invertida) en un
+    archivo temporal según llegan; al final `escribir()` antepone la cabecera
+    con el viewBox de la extensión acumulada y copia el cuerpo, sin tener
+    nunca el SVG completo en memoria.
+    """
+
+    tipos = frozenset({"LINE", "CIRCLE", "LWPOLYLINE", "TEXT"})
+
+    def __init__(self, color_rgb: Callable[[int], str], grosor_px: float = 1.5, escala_texto: float = 0.7):
+        self.color_rgb = color_rgb
+        self.grosor_px = grosor_px
+        self.escala_texto = escala_texto
+        self.emitidas = 0
+        self.caja = CajaEnvolvente(puntos_geometria)
+        self._cuerpo: TextIO = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def visitar(self, entidad) -> None:
+        dxf = entidad.dxf
+        stroke = self.color_rgb(dxf.color if dxf.is_supported("color") else 256)
+        tipo = entidad.dxftype()
+        if tipo == "LINE":
+            s, e = dxf.start, dxf.end
+            elemento = f'<line x1="{s.x:g}" y1="{-s.y:g}" x2="{e.x:g}" y2="{-e.y:g}" stroke="{stroke}"/>'
+        elif tipo == "CIRCLE":
+            c = dxf.center
+            elemento = f'<circle cx="{c.x:g}" cy="{-c.y:g}" r="{dxf.radius:g}" stroke="{stroke}" fill="none"/>'
+        elif tipo == "LWPOLYLINE":
+            puntos = entidad.get_points("xy")
+            if len(puntos) < 2:
+                return
+            d = "M " + " L ".join(f"{x:g} {-y:g}" for x, y in puntos) + (" Z" if entidad.closed else "")
+            elemento = f'<path d="{d}" stroke="{stroke}" fill="none"/>'
+        else:
+            p = dxf.insert
+            elemento = (
+                f'<text x="{p.x:g}" y="{-p.y:g}" font-size="{dxf.height * self.escala_texto:g}" '
+                f'fill="{stroke}" font-family="Arial">{escape(dxf.text)}</text>'
+            )
+        self.caja.visitar(entidad)
+        self._cuerpo.write(elemento)
+        self.emitidas += 1
+
+    def resultado(self) -> int:
+        return self.emitidas
+
+    def escribir(self, salida: TextIO, ancho_px: int = 1800, margen: float = 5.0) -> None:
+        """Escribe el SVG completo en `salida` y libera el archivo temporal."""
+        caja = self.caja.resultado() or [0.0, 0.0, 1.0, 1.0]
+        x0, y0 = caja[0] - margen, -caja[3] - margen
+        ancho, alto = caja[2] - caja[0] + 2 * margen, caja[3] - caja[1] + 2 * margen
+        salida.write(
+            f'<svg width="{ancho_px}" height="{int(ancho_px * alto / ancho)}" '
+            f'viewBox="{x0:g} {y0:g} {ancho:g} {alto:g}" xmlns="http://www.w3.org/2000/svg">'
+            f'<style>line,circle,path{{stroke-width:{self.grosor_px}px;vector-effect:non-scaling-stroke}}</style>'
+            f'<rect x="{x0:g}" y="{y0:g}" width="{ancho:g}" height="{alto:g}" fill="white"/>'
+        )
+        self._cuerpo.seek(0)
+        for bloque in iter(lambda: self._cuerpo.read(1 << 20), ""):
+            salida.write(bloque)
+        salida.write("</svg>")
+        self._cuerpo.close()
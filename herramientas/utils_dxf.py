@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
 from ezdxf import bbox, units, zoom
 from ezdxf.layouts import Layout
@@ -11,6 +14,15 @@ from ezdxf.math import Vec3
 
 DEFAULT_MARGIN_MIN = 1.0
 
+Point3 = Tuple[float, float, float]
+
+
+def nuevo_documento(conjunto: Optional[str] = None, capas: Optional[Mapping] = None, dxfversion: str = "R2010"):
+    """Documento DXF de la caché de plantillas (ver `autocad_integration.plantillas.nuevo_documento`)."""
+    from maxsurf_integration.autocad_integration.plantillas import nuevo_documento as _nuevo
+
+    return _nuevo(conjunto, capas, dxfversion)
+
 
 def _sanitize_defaults(
     default_bounds: Optional[Tuple[float, float, float, float]],
@@ -25,19 +37,62 @@ def _sanitize_defaults(
     return tuple(map(float, default_bounds))  # type: ignore[return-value]
 
 
+def _layout_bounds(layout: Layout) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Límites en planta del layout.
+
+    LINE, LWPOLYLINE sin bulges, CIRCLE y POINT se acotan directamente con
+    sus coordenadas (son la mayoría de entidades de los planos); el resto
+    (textos, cotas, arcos, bloques...) pasa por `ezdxf.bbox`.
+    """
+    xs: list = []
+    ys: list = []
+    others = []
+    for entity in layout:
+        kind = entity.dxftype()
+        if kind == "LINE":
+            start, end = entity.dxf.start, entity.dxf.end
+            xs += (start.x, end.x)
+            ys += (start.y, end.y)
+        elif kind == "LWPOLYLINE" and not entity.has_arc and entity.dxf.extrusion.isclose((0, 0, 1)):
+            for x, y in entity.vertices():
+                xs.append(x)
+                ys.append(y)
+        elif kind == "CIRCLE" and entity.dxf.extrusion.isclose((0, 0, 1)):
+            center, radius = entity.dxf.center, entity.dxf.radius
+            xs += (center.x - radius, center.x + radius)
+            ys += (center.y - radius, center.y + radius)
+        elif kind == "POINT":
+            xs.append(entity.dxf.location.x)
+            ys.append(entity.dxf.location.y)
+        else:
+            others.append(entity)
+
+    if others:
+        try:
+            box = bbox.extents(others, fast=True)
+        except Exception:
+            box = None
+        if box and box.has_data:
+            xs += (box.extmin.x, box.extmax.x)
+            ys += (box.extmin.y, box.extmax.y)
+    if not xs:
+        return None
+    return float(min(xs)), float(min(ys)), float(max(xs)), float(max(ys))
+
+
 def _compute_layout_extents(
     layout: Layout,
     default_bounds: Optional[Tuple[float, float, float, float]] = None,
-) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+) -> Tuple[Point3, Point3]:
     """Calcula los límites del layout aplicando márgenes de seguridad."""
     try:
-        box = bbox.extents(layout, fast=True)
+        bounds = _layout_bounds(layout)
     except Exception:
-        box = None
+        bounds = None
 
-    if box and box.has_data:
-        xmin, ymin = float(box.extmin.x), float(box.extmin.y)
-        xmax, ymax = float(box.extmax.x), float(box.extmax.y)
+    if bounds:
+        xmin, ymin, xmax, ymax = bounds
     else:
         xmin, ymin, xmax, ymax = _sanitize_defaults(default_bounds)
 
@@ -52,41 +107,95 @@ def _compute_layout_extents(
     return extmin, extmax
 
 
-def _rewrite_extents(
-    lines: list[str],
-    var_name: str,
-    values: Tuple[float, float, float],
+def _apply_extents(
+    doc,
+    extmin: Point3,
+    extmax: Point3,
+    include_paper: bool = True,
 ) -> None:
-    for idx, line in enumerate(lines):
-        if line.strip() == var_name and idx + 6 < len(lines):
-            lines[idx + 2] = f"{values[0]}"
-            lines[idx + 4] = f"{values[1]}"
-            lines[idx + 6] = f"{values[2]}"
-            break
+    """
+    Fija los límites en memoria antes de guardar.
+
+    ezdxf reescribe $EXTMIN/$EXTMAX y $PEXTMIN/$PEXTMAX al guardar con los
+    valores de los propios layouts, así que se fijan también ahí.
+    """
+    msp = doc.modelspace()
+    msp.dxf.extmin = Vec3(*extmin)
+    msp.dxf.extmax = Vec3(*extmax)
+    doc.header["$EXTMIN"] = Vec3(*extmin)
+    doc.header["$EXTMAX"] = Vec3(*extmax)
+    if include_paper:
+        paper = doc.active_layout()
+        paper.dxf.extmin = Vec3(*extmin)
+        paper.dxf.extmax = Vec3(*extmax)
+        doc.header["$PEXTMIN"] = Vec3(*extmin)
+        doc.header["$PEXTMAX"] = Vec3(*extmax)
 
 
-def _rewrite_extents_in_file(
+def patch_header_extents(
     path: Path,
-    extmin: Tuple[float, float, float],
-    extmax: Tuple[float, float, float],
+    extmin: Point3,
+    extmax: Point3,
     include_paper: bool = True,
-) -> None:
+) -> bool:
+    """
+    Reescribe $EXTMIN/$EXTMAX (y $PEXTMIN/$PEXTMAX) de un DXF ASCII existente.
+
+    Sólo se interpreta la sección HEADER, línea a línea; el resto del archivo
+    se copia por bloques sin decodificar, así que la memoria no depende del
+    tamaño del plano. Las variables que falten se añaden al final del HEADER.
+
+    Returns:
+        True si el archivo se ha reescrito
+    """
+    path = Path(path)
     if not path.exists():
-        return
-
-    try:
-        lines = path.read_text().splitlines()
-    except OSError:
-        return
-
-    _rewrite_extents(lines, "$EXTMIN", extmin)
-    _rewrite_extents(lines, "$EXTMAX", extmax)
+        return False
 
+    values: Dict[bytes, Point3] = {b"$EXTMIN": extmin, b"$EXTMAX": extmax}
     if include_paper:
-        _rewrite_extents(lines, "$PEXTMIN", extmin)
-        _rewrite_extents(lines, "$PEXTMAX", extmax)
+        values.update({b"$PEXTMIN": extmin, b"$PEXTMAX": extmax})
+    axis = {b"10": 0, b"20": 1, b"30": 2}
 
-    path.write_text("\n".join(lines) + "\n")
+    def _tag(code: bytes, value: bytes, eol: bytes) -> bytes:
+        return code.rjust(3) + eol + value + eol
+
+    fd, tmp_name = tempfile.mkstemp(prefix=path.stem, suffix=".dxf.tmp", dir=path.parent)
+    try:
+        with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            in_header = False
+            current: Optional[bytes] = None
+            pending = dict(values)
+            while True:
+                code_line = src.readline()
+                value_line = src.readline()
+                if not code_line or not value_line:
+                    return False  # DXF binario o sin HEADER: no se toca
+                eol = b"\r\n" if value_line.endswith(b"\r\n") else b"\n"
+                code, value = code_line.strip(), value_line.strip()
+
+                if code == b"2" and value == b"HEADER":
+                    in_header = True
+                elif in_header and code == b"9":
+                    current = value if value in values else None
+                    pending.pop(value, None)
+                elif in_header and current is not None and code in axis:
+                    value_line = repr(float(values[current][axis[code]])).encode() + eol
+                elif in_header and code == b"0" and value == b"ENDSEC":
+                    for name, point in pending.items():
+                        dst.write(_tag(b"9", name, eol))
+                        for c, i in axis.items():
+                            dst.write(_tag(c, repr(float(point[i])).encode(), eol))
+                    dst.write(code_line + value_line)
+                    break
+                dst.write(code_line + value_line)
+
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp_name, path)
+        return True
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
 
 
 def save_dxf_with_extents(
@@ -95,16 +204,15 @@ def save_dxf_with_extents(
     layout: Optional[Layout] = None,
     default_bounds: Optional[Tuple[float, float, float, float]] = None,
     include_paper_space: bool = True,
-) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
-    """Guarda el DXF y fuerza los límites $EXTMIN/$EXTMAX."""
+) -> Tuple[Point3, Point3]:
+    """Guarda el DXF con los límites $EXTMIN/$EXTMAX ya fijados (una sola escritura)."""
     layout = layout or doc.modelspace()
     extmin, extmax = _compute_layout_extents(layout, default_bounds)
 
     doc.units = units.M
     doc.header["$INSUNITS"] = units.M
     doc.header["$MEASUREMENT"] = 1
-    doc.header["$EXTMIN"] = Vec3(*extmin)
-    doc.header["$EXTMAX"] = Vec3(*extmax)
+    _apply_extents(doc, extmin, extmax, include_paper=include_paper_space)
     try:
         zoom.window(layout, (extmin[0], extmin[1]), (extmax[0], extmax[1]))
     except Exception:
@@ -112,7 +220,4 @@ def save_dxf_with_extents(
 
     path.parent.mkdir(parents=True, exist_ok=True)
     doc.saveas(path)
-    _rewrite_extents_in_file(
-        path, extmin, extmax, include_paper=include_paper_space
-    )
     return extmin, extmax
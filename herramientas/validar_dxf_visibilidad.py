@@ -1,11 +1,18 @@
 """
 Validador de DXF - Verifica colores y visibilidad
+
+El plano se lee en streaming (recorrido_dxf): capas, tipos y extensión se
+calculan en una sola pasada sin cargar el documento completo.
 """
-import ezdxf
+import sys
 from pathlib import Path
 
+from recorrido_dxf import CajaEnvolvente, ConteoCapas, ConteoTipos, LectorDXF
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-DXF_FILE = PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
+DXF_FILE = Path(sys.argv[1]) if len(sys.argv) > 1 else (
+    PROJECT_ROOT / "salidas" / "disposicion_general" / "Plano_Longitudinal_Sala_Maquinas_Detallado.dxf"
+)
 
 print("=" * 80)
 print("   VALIDACIÓN DEL PLANO DXF - VERIFICACIÓN DE VISIBILIDAD")
@@ -13,11 +20,14 @@ print("=" * 80)
 print()
 
 try:
-    doc = ezdxf.readfile(DXF_FILE)
-    msp = doc.modelspace()
+    with LectorDXF(DXF_FILE) as lector:
+        capas = lector.capas()
+        conteo_capas, conteo_tipos, extension = ConteoCapas(), ConteoTipos(), CajaEnvolvente()
+        lector.recorrer([conteo_capas, conteo_tipos, extension])
+        version = lector.version
     
     print(f"✓ Archivo leído: {DXF_FILE.name}")
-    print(f"✓ Versión DXF: {doc.dxfversion}")
+    print(f"✓ Versión DXF: {version}")
     print()
     
     # Analizar capas
@@ -26,17 +36,12 @@ try:
     print(f"{'Capa':<25} {'Color':<10} {'Tipo Línea':<15} {'Entidades':<10}")
     print("-" * 80)
     
-    layer_counts = {}
-    for entity in msp:
-        layer = entity.dxf.layer
-        layer_counts[layer] = layer_counts.get(layer, 0) + 1
+    layer_counts = conteo_capas.resultado()
     
-    layer_names = [layer.dxf.name for layer in doc.layers]
-    for layer_name in sorted(layer_names):
-        layer = doc.layers.get(layer_name)
+    for layer_name in sorted(capas):
         count = layer_counts.get(layer_name, 0)
-        color = layer.dxf.color
-        linetype = layer.dxf.linetype
+        color = capas[layer_name]['color']
+        linetype = capas[layer_name]['tipo_linea']
         
         # Advertir sobre colores problemáticos
         warning = ""
@@ -52,10 +57,7 @@ try:
     print("📊 RESUMEN DE ENTIDADES:")
     print("-" * 80)
     
-    entity_types = {}
-    for entity in msp:
-        etype = entity.dxftype()
-        entity_types[etype] = entity_types.get(etype, 0) + 1
+    entity_types = conteo_tipos.resultado()
     
     total = 0
     for etype, count in sorted(entity_types.items()):
@@ -70,32 +72,10 @@ try:
     print("📏 EXTENSIÓN DEL DIBUJO:")
     print("-" * 80)
     
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-    
-    for entity in msp:
-        try:
-            if hasattr(entity, 'dxf') and hasattr(entity.dxf, 'start'):
-                min_x = min(min_x, entity.dxf.start.x)
-                max_x = max(max_x, entity.dxf.start.x)
-                min_y = min(min_y, entity.dxf.start.y)
-                max_y = max(max_y, entity.dxf.start.y)
-                
-                if hasattr(entity.dxf, 'end'):
-                    min_x = min(min_x, entity.dxf.end.x)
-                    max_x = max(max_x, entity.dxf.end.x)
-                    min_y = min(min_y, entity.dxf.end.y)
-                    max_y = max(max_y, entity.dxf.end.y)
-            
-            elif hasattr(entity, 'dxf') and hasattr(entity.dxf, 'center'):
-                min_x = min(min_x, entity.dxf.center.x - entity.dxf.radius)
-                max_x = max(max_x, entity.dxf.center.x + entity.dxf.radius)
-                min_y = min(min_y, entity.dxf.center.y - entity.dxf.radius)
-                max_y = max(max_y, entity.dxf.center.y + entity.dxf.radius)
-        except:
-            pass
+    caja = extension.resultado()
     
-    if min_x != float('inf'):
+    if caja is not None:
+        min_x, min_y, max_x, max_y = caja
         print(f"  X: {min_x:.2f} a {max_x:.2f} m  (ancho: {max_x - min_x:.2f} m)")
         print(f"  Y: {min_y:.2f} a {max_y:.2f} m  (alto: {max_y - min_y:.2f} m)")
     else: